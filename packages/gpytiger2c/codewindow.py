@@ -13,9 +13,9 @@ from gpytiger2c.xmlwidget import XMLWidget
 
 class CodeWindow(XMLWidget):
     
-    def __init__(self, data_dir, c_filename):
+    def __init__(self, data_dir, code):
         super(CodeWindow, self).__init__(data_dir, 'code_window')
-        self._c_filename = c_filename
+        self._code = code
         self._init_code_view()
         self._widget.show_all()
         
@@ -40,5 +40,4 @@ class CodeWindow(XMLWidget):
         scrolledwindow = self._builder.get_object('scrolledwindow')
         scrolledwindow.add(code_view)
         # Setting the text of the buffer.
-        with open(self._c_filename) as fd:
-            code_buffer.set_text(fd.read())
+        code_buffer.set_text(self._code)
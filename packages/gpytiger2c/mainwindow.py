@@ -13,6 +13,10 @@ from gpytiger2c.xmlwidget import XMLWidget
 from gpytiger2c.aboutdialog import AboutDialog
 from gpytiger2c.codewindow import CodeWindow
 from gpytiger2c.astwindow import ASTWindow
+from pytiger2c import compile_string
+from pytiger2c.grammar import IncrementalParser
+from pytiger2c.incremental import IncrementalChecker
+from pytiger2c.errors import SyntacticError, SemanticError
 
 
 PYTHON = '/usr/bin/python'
@@ -30,7 +34,10 @@ class MainWindow(XMLWidget):
         self._filename = None
         self._init_filenames()
         self._data_dir = data_dir
+        self._parser = IncrementalParser()
+        self._checker = IncrementalChecker(self._parser)
         self._init_accelerators()
+        self._init_statusbar()
         self._init_source_view()
         self._init_output_view()
         self._init_errors_view()
@@ -86,6 +93,8 @@ class MainWindow(XMLWidget):
         self._source_buffer = gtksourceview.Buffer()
         self._source_buffer.connect('changed', self.on_source_buffer_changed)
         self._source_buffer.connect('modified-changed', self.on_source_buffer_modified_changed)
+        self._source_buffer.connect('insert-text', self.on_source_buffer_insert_text)
+        self._source_buffer.connect('delete-range', self.on_source_buffer_delete_range)
         self._source_buffer.set_highlight_matching_brackets(True)
         manager = gtksourceview.LanguageManager()
         manager.set_search_path([os.path.join(self._data_dir, 'gtksourceview')])
@@ -106,6 +115,10 @@ class MainWindow(XMLWidget):
         scrolledwindow = self._builder.get_object('source_scrolledwindow')
         scrolledwindow.add(self._source_view)
         
+    def _init_statusbar(self):
+        self._statusbar = self._builder.get_object('statusbar')
+        self._statusbar_context = self._statusbar.get_context_id('syntax')
+        
     def _init_errors_view(self):
         self._errors_buffer = gtk.TextBuffer()
         errors_view = self._builder.get_object('errors_textview')
@@ -125,12 +138,10 @@ class MainWindow(XMLWidget):
                 prefix = self._filename[:last_dot]
             else:
                 prefix = self._filename
-            self._c_filename = prefix + '.c'
             self._bin_filename = prefix + '.exe'
             self._dot_filename = prefix + '.dot'
             self._jpg_filename = prefix + '.jpg'
         else:
-            self._c_filename = None
             self._bin_filename = None
             self._dot_filename = None
             self._jpg_filename = None            
@@ -167,6 +178,15 @@ class MainWindow(XMLWidget):
     def on_source_buffer_changed(self, widget=None):
         self._update_undo_redo()
         
+    def on_source_buffer_insert_text(self, widget, location, text, length):
+        # The text is received encoded in UTF-8 and the offsets of the 
+        # buffer are counted in characters.
+        offset = location.get_offset()
+        self._update_syntax(offset, offset, text.decode('utf-8'))
+        
+    def on_source_buffer_delete_range(self, widget, start, end):
+        self._update_syntax(start.get_offset(), end.get_offset(), u'')
+        
     def on_source_buffer_modified_changed(self, widget=None):
         if self._filename is None:
             self._widget.set_title('*Unsaved file - PyTiger2C')
@@ -188,17 +208,16 @@ class MainWindow(XMLWidget):
         self._source_buffer.paste_clipboard(clipboard, None, self._source_view.get_editable())
         
     def on_code_menuitem_activate(self, widget=None):
-        if not (self._filename is None or self._source_buffer.get_modified()):
-            pytiger2c_cmd = [PYTHON, PYTIGER2C, self._filename, '-t', 'c', '-o', self._c_filename]
-            pytiger2c_process = subprocess.Popen(pytiger2c_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            pytiger2c_ret = pytiger2c_process.wait()
-            if pytiger2c_ret == PYTIGER2C_EXIT_SUCCESS:
-                code_window = CodeWindow(self._data_dir, self._c_filename)
-                code_window.show()
-            else:
-                self._error_dialog('Build error', 'The program has errors.')
+        # The code is generated in memory, so the file does not need to be saved.
+        text = self._source_buffer.get_text(*self._source_buffer.get_bounds())
+        result = compile_string(text)
+        if result.succeeded:
+            code_window = CodeWindow(self._data_dir, result.code)
+            code_window.show()
         else:
-            self._error_dialog('Build error', 'File is not saved.')
+            self._builder.get_object('notebook').set_current_page(1)
+            self._errors_buffer.set_text('\n'.join([str(d) for d in result.diagnostics]))
+            self._error_dialog('Build error', 'The program has errors.')
     
     def on_ast_menuitem_activate(self, widget=None):
         if not (self._filename is None or self._source_buffer.get_modified()):
@@ -295,6 +314,22 @@ class MainWindow(XMLWidget):
         menubar_redo.set_sensitive(can_redo)
         toolbar_redo.set_sensitive(can_redo)
         
+    def _update_syntax(self, start, end, text):
+        # The handlers of the buffer signals run before the buffer is
+        # modified, so only the edited region is parsed again. The semantic
+        # check is also incremental, so only the edited functions are checked.
+        try:
+            self._parser.edit(start, end, text)
+            self._checker.check()
+        except SyntacticError, error:
+            message = str(error)
+        except SemanticError, error:
+            message = str(error).splitlines()[0]
+        else:
+            message = 'Syntax OK.'
+        self._statusbar.pop(self._statusbar_context)
+        self._statusbar.push(self._statusbar_context, message)
+        
     def _load_source_buffer(self):
         try:
             with open(self._filename) as fd:
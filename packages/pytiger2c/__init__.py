@@ -13,12 +13,18 @@ que implemente dicho standard.
 """
 
 import codecs
+from cStringIO import StringIO
 
-from pytiger2c.grammar import parser
+from pytiger2c.grammar import Parser, DEFAULT_LEXER, DEFAULT_PARSER
+from pytiger2c.ast.traversal import run
 from pytiger2c.scope import RootScope
+from pytiger2c.recovery import ErrorRecovery, get_messages
+from pytiger2c.timing import measure, TimeReport
+from pytiger2c.compilation import CompilationOptions, CompilationResult, Diagnostic
 from pytiger2c.dot import DotGenerator
 from pytiger2c.code import CodeGenerator
-from pytiger2c.errors import PyTiger2CError, SemanticError, CodeGenerationError
+from pytiger2c.serialization import write_binary, write_json
+from pytiger2c.errors import PyTiger2CError, SyntacticError, SemanticError, CodeGenerationError
 
 
 __version__ = '1.0.0'
@@ -29,7 +35,8 @@ __authors__ = (
 )
 
 
-def syntactic_analysis(input_fd):
+def syntactic_analysis(input_fd, lexer_name=DEFAULT_LEXER, parser_name=DEFAULT_PARSER,
+                       recover=False, spans=False):
     """
     Realiza análisis léxico-gráfico y sintáctico de un programa Tiger. 
     
@@ -37,6 +44,27 @@ def syntactic_analysis(input_fd):
     @param input_fd: Descriptor de fichero del programa Tiger al cual se le debe
         realizar el análisis sintáctico.
     
+    @type lexer_name: C{str}
+    @param lexer_name: Nombre del analizador léxico-gráfico que se debe utilizar:
+        C{table} para el analizador dirigido por tablas (valor por defecto) o
+        C{ply} para el analizador construido con PLY.
+    
+    @type parser_name: C{str}
+    @param parser_name: Nombre del analizador sintáctico que se debe utilizar:
+        C{compact} para el analizador LR compacto (valor por defecto) o C{ply}
+        para el analizador construido con PLY.
+    
+    @type recover: C{bool}
+    @param recover: Indica si el analizador sintáctico se debe recuperar de los
+        errores para reportar todos los errores de sintáxis del programa. Solamente
+        el analizador sintáctico C{compact} permite recuperarse de los errores.
+    
+    @type spans: C{bool}
+    @param spans: Indica si se debe asignar la propiedad C{span} de los nodos
+        del árbol de sintáxis abstracta con la posición en el programa de la 
+        estructura que representan. Solamente el analizador sintáctico 
+        C{compact} permite calcular las posiciones.
+    
     @rtype: C{LanguageNode}
     @return: Como resultado del análsis sintáctico se obtiene el árbol de sintáxis 
         abstracta correspondiente al programa Tiger recibido como argumento. El 
@@ -45,35 +73,133 @@ def syntactic_analysis(input_fd):
     @raise SyntacticError: Esta excepción se lanzará si se encuentra algún error de
         sintáxis durante el análisis del programa. La excepción contendrá información
         acerca del error, como por ejemplo, la línea y/o columna donde se encontró 
-        el error.
+        el error. Si el analizador se recuperó de los errores, la excepción 
+        contendrá los mensajes de todos los errores y el árbol de sintáxis 
+        abstracta parcial formado por las partes del programa sin errores, sobre 
+        el cual se puede realizar la comprobación semántica.
+    """
+    with measure('syntactic_analysis'):
+        data = input_fd.read()
+        ast = Parser(lexer_name, parser_name).parse(data, spans, recover)
+    return ast
+
+
+def syntactic_analysis_file(tiger_filename, lexer_name=DEFAULT_LEXER, 
+                            parser_name=DEFAULT_PARSER, recover=False, spans=False):
+    """
+    Realiza análisis léxico-gráfico y sintáctico de un programa Tiger almacenado
+    en un archivo codificado en UTF-8.
+    
+    A diferencia de la función C{syntactic_analysis}, el archivo no se lee 
+    completo en memoria antes de comenzar el análisis. Si se utiliza el analizador
+    léxico-gráfico dirigido por tablas, el archivo se proyecta en memoria y se 
+    analiza directamente. Consulte la documentación del método C{parse_file} de 
+    la clase C{Parser}.
+    
+    @type tiger_filename: C{str}
+    @param tiger_filename: Ruta al archivo que contiene el código fuente del 
+        programa Tiger.
+    
+    @type lexer_name: C{str}
+    @param lexer_name: Nombre del analizador léxico-gráfico que se debe utilizar.
+        Consulte la documentación de la función C{syntactic_analysis}.
+    
+    @type parser_name: C{str}
+    @param parser_name: Nombre del analizador sintáctico que se debe utilizar.
+        Consulte la documentación de la función C{syntactic_analysis}.
+    
+    @type recover: C{bool}
+    @param recover: Indica si el analizador sintáctico se debe recuperar de los 
+        errores. Consulte la documentación de la función C{syntactic_analysis}.
+    
+    @type spans: C{bool}
+    @param spans: Indica si se deben calcular las posiciones de los nodos. 
+        Consulte la documentación de la función C{syntactic_analysis}.
+    
+    @rtype: C{LanguageNode}
+    @return: Nodo raíz del árbol de sintáxis abstracta correspondiente al 
+        programa Tiger.
+    
+    @raise IOError: Esta excepción se lanzará si no es posible leer el archivo.
+    
+    @raise SyntacticError: Esta excepción se lanzará si se encuentra algún error de
+        sintáxis durante el análisis del programa. Consulte la documentación de
+        la función C{syntactic_analysis}.
     """
-    data = input_fd.read()
-    ast = parser.parse(data)
+    with measure('syntactic_analysis'):
+        ast = Parser(lexer_name, parser_name).parse_file(tiger_filename, spans, recover)
     return ast
 
 
-def check_semantics(ast):
+def check_semantics(ast, recover=False, max_errors=None):
     """
     Realiza comprobación semántica de un programa Tiger representado por su árbol de
-    sintáxis abstracta. 
+    sintáxis abstracta. El árbol se recorre con la función C{run} del módulo 
+    C{pytiger2c.ast.traversal}, por lo que su profundidad no está limitada por la
+    pila de Python.
     
     @type ast: C{LanguageNode}
     @param ast: Árbol de sintáxis asbtracta correspondiente a un programa Tiger.
     
+    @type recover: C{bool}
+    @param recover: Indica si la comprobación semántica se debe recuperar de 
+        los errores para reportar todos los errores independientes del programa,
+        utilizando la clase C{ErrorRecovery}. Por defecto, la comprobación de 
+        cada estructura C{let-in-end} se detiene en la primera declaración con
+        errores.
+    
+    @type max_errors: C{int}
+    @param max_errors: Cantidad máxima de errores que se reportan cuando la
+        comprobación semántica se recupera de los errores. Si es C{None}, se
+        reportan todos los errores.
+    
     @raise SemanticError: Esta excepción se lanzará si se encuentra un error semántico
         en el árbol de sintáxis abstracta. La excepción contendrá información
         acerca del error.
     """
     errors = []
-    scope = RootScope()
-    ast.check_semantics(scope, errors)
-    if errors:
-        raise SemanticError(errors)
+    if recover:
+        with ErrorRecovery(max_errors):
+            _check_tree(ast, errors)
+        if errors:
+            raise SemanticError(get_messages(errors, max_errors))
+    else:
+        _check_tree(ast, errors)
+        if errors:
+            raise SemanticError(errors)
+
+
+def _check_tree(ast, errors):
+    """
+    Comprueba semánticamente el árbol de sintáxis abstracta en el ámbito raíz,
+    añadiendo a la lista los errores encontrados. Consulte la documentación
+    de la función C{check_semantics}.
+    """
+    with measure('semantic_check'):
+        scope = RootScope()
+        run(ast.check_semantics(scope, errors))
+
+
+def _check_partial_ast(error, max_errors):
+    """
+    Comprueba semánticamente, recuperándose de los errores, el árbol de 
+    sintáxis abstracta parcial obtenido durante el análisis sintáctico con
+    recuperación de errores, de forma que se reporten también los errores
+    semánticos de las partes del programa sin errores de sintáxis. Los
+    errores encontrados se asignan al atributo C{semantic_error} de la
+    excepción C{SyntacticError}.
+    """
+    if error.ast is not None:
+        try:
+            check_semantics(error.ast, True, max_errors)
+        except SemanticError, semantic_error:
+            error.semantic_error = semantic_error
 
 
 def generate_code(ast, output_fd):
     """
-    Realiza la generación de código.
+    Realiza la generación de código. Al igual que en la comprobación semántica,
+    el árbol se recorre con la función C{run} del módulo C{pytiger2c.ast.traversal}.
     
     @type ast: C{LanguageNode}
     @param ast: Árbol de sintáxis asbtracta correspondiente a un programa Tiger.
@@ -87,16 +213,20 @@ def generate_code(ast, output_fd):
         durante la generación de código. La excepción contendrá información acerca
         del error.
     """
-    generator = CodeGenerator()
-    ast.generate_code(generator)
-    generator.close()
-    generator.write(output_fd)
+    with measure('code_generation'):
+        generator = CodeGenerator()
+        run(ast.generate_code(generator))
+        generator.close()
+    with measure('code_output'):
+        generator.write(output_fd)
 
 
-def generate_dot(ast, output_fd):
+def generate_dot(ast, output_fd, max_depth=None, max_nodes=None, 
+                 collapse=False, subgraphs=False):
     """
     Escribe un árbol de sintáxis abstracta correspondiente a un programa Tiger
-    en un archivo con formato DOT de Graphviz.
+    en un archivo con formato DOT de Graphviz. El grafo se escribe a medida que
+    se recorre el árbol.
     
     @type ast: C{LanguageNode}
     @param ast: Árbol de sintáxis asbtracta correspondiente a un programa Tiger.
@@ -104,18 +234,38 @@ def generate_dot(ast, output_fd):
     @type output_fd: C{file}
     @param output_fd: Descriptor de fichero del archivo donde se debe escribir el
         árbol de sintáxis abstracta en formato DOT de Graphviz.
+    
+    @type max_depth: C{int}
+    @param max_depth: Profundidad máxima de los nodos que se incluyen en el 
+        grafo. Consulte la documentación de la clase C{DotGenerator}.
+    
+    @type max_nodes: C{int}
+    @param max_nodes: Cantidad máxima aproximada de nodos del grafo. Consulte 
+        la documentación de la clase C{DotGenerator}.
+    
+    @type collapse: C{bool}
+    @param collapse: Indica si los subárboles que superan la profundidad máxima
+        se representan con un único nodo. Consulte la documentación de la 
+        clase C{DotGenerator}.
+    
+    @type subgraphs: C{bool}
+    @param subgraphs: Indica si se agrupan en un subgrafo los nodos de cada 
+        función o procedimiento.
     """
-    generator = DotGenerator()
-    ast.generate_dot(generator)
-    generator.write(output_fd)
+    with measure('dot_generation'):
+        generator = DotGenerator(output_fd, max_depth, max_nodes, collapse, subgraphs)
+        run(generator.visit(ast))
+        generator.close()
 
 
-def tiger2dot(tiger_filename, dot_filename):
+def tiger2dot(tiger_filename, dot_filename, lexer_name=DEFAULT_LEXER,
+              parser_name=DEFAULT_PARSER, recover=False, max_depth=None,
+              max_nodes=None, collapse=False, subgraphs=False):
     """
     Genera un archivo en el formato DOT de Graphviz con el árbol de sintáxis
     abstracta correspondiente a un programa Tiger.
     
-    Se utiliza la función auxiliar C{syntactic_analysis} para realizar el
+    Se utiliza la función auxiliar C{syntactic_analysis_file} para realizar el
     análisis léxico-gráfico y sintáctico durante el cual se reportará cualquier
     error en el programa Tiger. Luego, se utiliza la función auxiliar
     C{generate_dot} para escribir el árbol de sintáxis abstracta en el 
@@ -130,6 +280,35 @@ def tiger2dot(tiger_filename, dot_filename):
         DOT resultante. Si existe un archivo en la ruta especificada este será
         sobreescrito.
     
+    @type lexer_name: C{str}
+    @param lexer_name: Nombre del analizador léxico-gráfico que se debe utilizar.
+        Consulte la documentación de la función C{syntactic_analysis}.
+
+    @type parser_name: C{str}
+    @param parser_name: Nombre del analizador sintáctico que se debe utilizar.
+        Consulte la documentación de la función C{syntactic_analysis}.
+
+    @type recover: C{bool}
+    @param recover: Indica si el analizador sintáctico se debe recuperar de los 
+        errores. Consulte la documentación de la función C{syntactic_analysis}.
+    
+    @type max_depth: C{int}
+    @param max_depth: Profundidad máxima de los nodos que se incluyen en el 
+        grafo. Consulte la documentación de la función C{generate_dot}.
+    
+    @type max_nodes: C{int}
+    @param max_nodes: Cantidad máxima aproximada de nodos del grafo. Consulte 
+        la documentación de la función C{generate_dot}.
+    
+    @type collapse: C{bool}
+    @param collapse: Indica si los subárboles que superan la profundidad máxima
+        se representan con un único nodo. Consulte la documentación de la 
+        función C{generate_dot}.
+    
+    @type subgraphs: C{bool}
+    @param subgraphs: Indica si se agrupan en un subgrafo los nodos de cada 
+        función o procedimiento.
+    
     @raise PyTiger2CError: Además de las excepciones lanzadas por cada una de las
         funciones auxiliares, esta función puede lanzar esta excepción cuando
         se produce algún error al leer del archivo que contiene el programa
@@ -137,28 +316,94 @@ def tiger2dot(tiger_filename, dot_filename):
         resultante en el archivo DOT especificado.    
     """ 
     try:
-        with codecs.open(tiger_filename, encoding='utf-8', mode='rb') as input_fd: 
-            ast = syntactic_analysis(input_fd)
+        ast = syntactic_analysis_file(tiger_filename, lexer_name, parser_name, recover)
     except IOError:
         raise PyTiger2CError(message='Could not open the Tiger input file')
     try:
         with codecs.open(dot_filename, encoding='utf-8', mode='wb') as output_fd:
-            generate_dot(ast, output_fd)
+            generate_dot(ast, output_fd, max_depth, max_nodes, collapse, subgraphs)
     except IOError:
         raise PyTiger2CError(error_msg='Could not open the output file')
     
 
-def tiger2c(tiger_filename, c_filename):
+def tiger2ast(tiger_filename, ast_filename, lexer_name=DEFAULT_LEXER,
+              parser_name=DEFAULT_PARSER, recover=False, binary=True, spans=True):
+    """
+    Exporta el árbol de sintáxis abstracta correspondiente a un programa Tiger,
+    incluyendo los atributos de los nodos y sus posiciones, en un archivo que 
+    puede ser cargado con la función C{load_ast} del módulo 
+    C{pytiger2c.serialization}.
+    
+    Se utiliza la función auxiliar C{syntactic_analysis_file} para realizar el
+    análisis léxico-gráfico y sintáctico y luego las funciones C{write_binary}
+    o C{write_json} del módulo C{pytiger2c.serialization} para escribir el
+    árbol en el archivo.
+    
+    @type tiger_filename: C{str}
+    @param tiger_filename: Ruta absoluta al archivo que contiene el código
+        fuente del programa Tiger.
+        
+    @type ast_filename: C{str}
+    @param ast_filename: Ruta absoluta al archivo donde se escribirá el árbol
+        de sintáxis abstracta. Si existe un archivo en la ruta especificada 
+        este será sobreescrito.
+    
+    @type lexer_name: C{str}
+    @param lexer_name: Nombre del analizador léxico-gráfico que se debe utilizar.
+        Consulte la documentación de la función C{syntactic_analysis}.
+
+    @type parser_name: C{str}
+    @param parser_name: Nombre del analizador sintáctico que se debe utilizar.
+        Consulte la documentación de la función C{syntactic_analysis}.
+
+    @type recover: C{bool}
+    @param recover: Indica si el analizador sintáctico se debe recuperar de los 
+        errores. Consulte la documentación de la función C{syntactic_analysis}.
+    
+    @type binary: C{bool}
+    @param binary: Indica si el árbol se debe escribir en el formato binario.
+        En caso contrario se escribe en el formato JSON delimitado por líneas.
+    
+    @type spans: C{bool}
+    @param spans: Indica si se deben calcular las posiciones de los nodos 
+        para incluirlas en el archivo. Solamente el analizador sintáctico 
+        C{compact} permite calcularlas, por lo que se debe especificar 
+        C{False} si se utiliza otro analizador.
+    
+    @raise PyTiger2CError: Además de las excepciones lanzadas por la función
+        C{syntactic_analysis_file}, esta función puede lanzar esta excepción 
+        cuando se produce algún error al leer del archivo que contiene el 
+        programa Tiger o al escribir el archivo especificado.
+    """
+    try:
+        ast = syntactic_analysis_file(tiger_filename, lexer_name, parser_name, recover, 
+                                      spans)
+    except IOError:
+        raise PyTiger2CError(message='Could not open the Tiger input file')
+    try:
+        with open(ast_filename, 'wb') as output_fd:
+            if binary:
+                write_binary(ast, output_fd)
+            else:
+                write_json(ast, output_fd)
+    except IOError:
+        raise PyTiger2CError(message='Could not open the output file')
+    
+
+def tiger2c(tiger_filename, c_filename, lexer_name=DEFAULT_LEXER,
+            parser_name=DEFAULT_PARSER, recover=False, cache=None, max_errors=None):
     """
     Traduce un programa Tiger a un programa C equivalente.
     
-    Se utiliza las funciones auxiliares C{syntactic_analysis}, C{check_semantics} 
+    Se utiliza las funciones auxiliares C{syntactic_analysis_file}, C{check_semantics} 
     y C{generate_code} para llevar a cabo cada una de las fases de la compilación 
     del programa: análisis léxico-gráfico y sintáctico, comprobación semántica y
     generación de código respectivamente. Cada una de estas funciones lanzará
     las excepciones C{SyntacticError}, C{SemanticError} y C{CodeGenerationError} si
     se produce un error durante alguna de las fases. Consulte la documentación 
-    de cada función para conocer los detalles.
+    de cada función para conocer los detalles. El tiempo y la memoria utilizados
+    en cada fase se pueden obtener con la clase C{TimeReport} del módulo
+    C{pytiger2c.timing}.
     
     @type tiger_filename: C{str}
     @param tiger_filename: Ruta absoluta al archivo que contiene el código
@@ -168,6 +413,35 @@ def tiger2c(tiger_filename, c_filename):
     @param c_filename: Ruta absoluta al archivo donde se generará el código
         C resultante. Si existe un archivo en la ruta especificada este será
         sobreescrito.
+    
+    @type lexer_name: C{str}
+    @param lexer_name: Nombre del analizador léxico-gráfico que se debe utilizar.
+        Consulte la documentación de la función C{syntactic_analysis}.
+
+    @type parser_name: C{str}
+    @param parser_name: Nombre del analizador sintáctico que se debe utilizar.
+        Consulte la documentación de la función C{syntactic_analysis}.
+
+    @type recover: C{bool}
+    @param recover: Indica si el analizador sintáctico y la comprobación 
+        semántica se deben recuperar de los errores. Consulte la documentación
+        de las funciones C{syntactic_analysis} y C{check_semantics}. Si hay
+        errores de sintáxis, el árbol de sintáxis abstracta parcial también
+        se comprueba semánticamente y la excepción C{SyntacticError} incluye
+        los errores semánticos encontrados en su atributo C{semantic_error}.
+    
+    @type cache: C{ASTCache}
+    @param cache: Cache de árboles de sintáxis abstracta comprobados 
+        semánticamente. Si el programa se encuentra en la cache, se omiten el
+        análisis sintáctico y la comprobación semántica y se genera el código
+        del árbol cargado. En caso contrario, el árbol se almacena en la cache
+        después de la comprobación semántica. Si no se especifica, no se 
+        utiliza ninguna cache.
+    
+    @type max_errors: C{int}
+    @param max_errors: Cantidad máxima de errores semánticos que se reportan
+        si la comprobación semántica se recupera de los errores. Consulte la
+        documentación de la función C{check_semantics}.
         
     @raise PyTiger2CError: Además de las excepciones lanzadas por cada una de las
         funciones auxiliares, esta función puede lanzar esta excepción cuando
@@ -175,14 +449,83 @@ def tiger2c(tiger_filename, c_filename):
         Tiger que se quiere traducir o al escribir el código C resultante
         en el archivo especificado.
     """
-    try:
-        with codecs.open(tiger_filename, encoding='utf-8', mode='rb') as input_fd: 
-            ast = syntactic_analysis(input_fd)
-    except IOError:
-        raise PyTiger2CError(message='Could not open the Tiger input file')
-    check_semantics(ast)
+    ast = None
+    if cache is not None:
+        try:
+            with open(tiger_filename, 'rb') as input_fd:
+                key = cache.key(input_fd.read())
+        except IOError:
+            raise PyTiger2CError(message='Could not open the Tiger input file')
+        ast = cache.load(key)
+    if ast is None:
+        try:
+            ast = syntactic_analysis_file(tiger_filename, lexer_name, parser_name, recover)
+        except IOError:
+            raise PyTiger2CError(message='Could not open the Tiger input file')
+        except SyntacticError, error:
+            if recover:
+                _check_partial_ast(error, max_errors)
+            raise
+        check_semantics(ast, recover, max_errors)
+        if cache is not None:
+            # The tree is stored before generating its code, which modifies 
+            # the scopes and the types.
+            cache.store(key, ast)
     try:
         with codecs.open(c_filename, encoding='utf-8', mode='wb') as output_fd:
             generate_code(ast, output_fd)
     except IOError:
         raise PyTiger2CError(error_msg='Could not open the output file')
+
+
+def compile_string(source, options=None):
+    """
+    Traduce a C un programa Tiger almacenado en memoria, sin leer ni escribir
+    ningún archivo.
+    
+    Se utilizan las funciones auxiliares C{syntactic_analysis}, C{check_semantics}
+    y C{generate_code}, igual que en la función C{tiger2c}, pero los errores
+    de cada fase no se lanzan como excepciones sino que se retornan en el 
+    resultado junto con el código C generado, el árbol de sintáxis abstracta
+    y las mediciones de las fases. Si se recupera de los errores y hay errores
+    de sintáxis, el árbol de sintáxis abstracta parcial también se comprueba
+    semánticamente y sus errores se añaden a los errores de sintáxis.
+    
+    @type source: C{str}
+    @param source: Código fuente del programa Tiger. Si es una instancia de
+        C{unicode}, se codifica en UTF-8.
+    
+    @type options: C{CompilationOptions}
+    @param options: Opciones de la compilación. Si no se especifica, se 
+        utilizan las opciones por defecto.
+    
+    @rtype: C{CompilationResult}
+    @return: Resultado de la compilación. Consulte la documentación de la 
+        clase C{CompilationResult} del módulo C{pytiger2c.compilation}.
+    """
+    if options is None:
+        options = CompilationOptions()
+    if isinstance(source, unicode):
+        source = source.encode('utf-8')
+    ast, code, diagnostics = None, None, []
+    with TimeReport() as report:
+        try:
+            ast = syntactic_analysis(StringIO(source), options.lexer_name, 
+                                     options.parser_name, options.recover, options.spans)
+            check_semantics(ast, options.recover, options.max_errors)
+            output = StringIO()
+            generate_code(ast, codecs.getwriter('utf-8')(output))
+            code = output.getvalue()
+        except SyntacticError, error:
+            ast = error.ast
+            diagnostics = [Diagnostic(error.error, message) for message in error.messages]
+            if options.recover:
+                _check_partial_ast(error, options.max_errors)
+                if error.semantic_error is not None:
+                    diagnostics.extend([Diagnostic(error.semantic_error.error, message) 
+                                        for message in error.semantic_error.messages])
+        except SemanticError, error:
+            diagnostics = [Diagnostic(error.error, message) for message in error.messages]
+        except PyTiger2CError, error:
+            diagnostics = [Diagnostic(error.error, error.message)]
+    return CompilationResult(code, ast, diagnostics, report.phases)
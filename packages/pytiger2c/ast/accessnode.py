@@ -17,6 +17,8 @@ class AccessNode(ValuedExpressionNode):
     C{VariableAccessNode}, C{RecordAccessNode} y C{ArrayAccessNode}.
     """
     
+    __slots__ = ('_read_only',)
+    
     def _get_read_only(self):
         """
         Método para obtener el valor de la propiedad C{read_only}.
@@ -6,6 +6,8 @@ Clase C{AliasTypeDeclarationNode} del árbol de sintáxis abstracta.
 
 from pytiger2c.ast.typedeclarationnode import TypeDeclarationNode
 from pytiger2c.types.aliastype import AliasType
+from pytiger2c.types.errortype import ErrorType
+from pytiger2c.recovery import get_active_recovery, POISONED
 
 class AliasTypeDeclarationNode(TypeDeclarationNode):
     """
@@ -17,6 +19,8 @@ class AliasTypeDeclarationNode(TypeDeclarationNode):
     superior. 
     """
     
+    __slots__ = ('_alias_typename',)
+    
     def _get_alias_typename(self):
         """
         Método para obtener el valor de la propiedad C{alias_typename}.
@@ -59,12 +63,16 @@ class AliasTypeDeclarationNode(TypeDeclarationNode):
         si se forma un ciclo durante la definición de una secuencia de
         alias, reportándose este hecho como un error semántico. Igualmente
         se reportará un error si un alias se define en función de un
-        tipo que no se encuentra definido anteriormente.
+        tipo que no se encuentra definido anteriormente. Si se realiza 
+        recuperación de errores, los errores que corresponden a otro alias 
+        del mismo grupo de declaraciones, que los reportará al comprobarse, 
+        no se reportan en este alias.
 	    """
         self._scope = scope
         alias_type = None
         
         erros_before = len(errors)
+        recovering = get_active_recovery() is not None
         try:
             alias_type = self._scope.get_type_definition(self._alias_typename)
         except KeyError:
@@ -80,15 +88,24 @@ class AliasTypeDeclarationNode(TypeDeclarationNode):
         while isinstance(alias_type, AliasType):
             name = alias_type.alias_typename
             if name in aliases_names:
+                if recovering and name != self._name:
+                    # The cycle is reported by the aliases that form it.
+                    errors.append(POISONED)
+                    break
                 message = 'Infinite recursive alias definition ' \
                           'of {name} at line {line}'
                 errors.append(message.format(name=self._name,
-                                             line=self._line_number))
+                                             line=self.line_number))
                 break
             else:
                 try:
                     alias_type = self._scope.get_type_definition(name)
                 except KeyError:
+                    if recovering:
+                        # The alias that references the undefined type 
+                        # reports the error.
+                        errors.append(POISONED)
+                        break
                     message = 'Undefined alias_type {alias_type} in ' \
                               'the alias {name} declaration at line {line}'
                     errors.append(message.format(alias_type=name, name=self._name, 
@@ -97,11 +114,13 @@ class AliasTypeDeclarationNode(TypeDeclarationNode):
                 aliases_names.add(name)
         
         if erros_before != len(errors):
+            if recovering:
+                self._scope.parent._types[self._name] = ErrorType()
             return
         
         # Ugly hack! Modifying dictionary of the parent scope of the fake scope.
         for alias_name in aliases_names:
-            self.scope.parent._types[alias_name] = alias_type
+            self._scope.parent._types[alias_name] = alias_type
     
     def generate_dot(self, generator):
         """
@@ -13,6 +13,8 @@ class ArithmeticOperatorNode(BinaryOperatorNode):
     Clase C{ArithmeticOperatorNode} del árbol de sintáxis abstracta.
     """
     
+    __slots__ = ('_operator',)
+    
     def __init__(self, left, right):
         """
         Inicializa la clase C{ArithmeticOperatorNode}.
@@ -30,14 +32,14 @@ class ArithmeticOperatorNode(BinaryOperatorNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        self.right.generate_code(generator)
-        self.left.generate_code(generator)
+        self._scope.generate_code(generator)
+        yield self._right.generate_code(generator)
+        yield self._left.generate_code(generator)
         int_code_type = IntegerType().code_type
         local_var = generator.define_local(int_code_type)
         statement = '{var} = {left} {operator} {right};'.format(var = local_var,
-                                                                left = self.left.code_name,
+                                                                left = self._left.code_name,
                                                                 operator = self._operator,
-                                                                right = self.right.code_name)
+                                                                right = self._right.code_name)
         generator.add_statement(statement)
         self._code_name = local_var
\ No newline at end of file
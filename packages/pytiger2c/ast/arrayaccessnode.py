@@ -7,6 +7,8 @@ Clase C{ArrayAccessNode} del árbol de sintáxis abstracta.
 from pytiger2c.ast.accessnode import AccessNode
 from pytiger2c.types.arraytype import ArrayType
 from pytiger2c.types.integertype import IntegerType
+from pytiger2c.types.errortype import ErrorType
+from pytiger2c.recovery import POISONED
 
 
 class ArrayAccessNode(AccessNode):
@@ -21,6 +23,8 @@ class ArrayAccessNode(AccessNode):
     posición que se quiere acceder. 
     """
     
+    __slots__ = ('_array', '_position')
+    
     def _get_array(self):
         """
         Método para obtener el valor de la propiedad array.
@@ -73,23 +77,25 @@ class ArrayAccessNode(AccessNode):
         C{return_type} y C{read_only}
         """
         self._scope = scope
-        self.array.check_semantics(self.scope, errors)
+        yield self._array.check_semantics(self._scope, errors)
             
-        if self.array.has_return_value():
-            array_type = self.array.return_type
+        if self._array.has_return_value():
+            array_type = self._array.return_type
             if isinstance(array_type, ArrayType):
                 self._return_type = array_type.fields_types[0]
+                if self._return_type is ErrorType():
+                    errors.append(POISONED)
             else:
                 self._return_type = None
                 message = 'Invalid array access on a non array type at line {line}'
                 errors.append(message.format(line=self.line_number))
 
-            self.position.check_semantics(self.scope, errors)
-            if not self.position.has_return_value():
+            yield self._position.check_semantics(self._scope, errors)
+            if not self._position.has_return_value():
                 message = 'The expression for the position in the array does ' \
                           'not have a return value at line {line}'
                 errors.append(message.format(line=self.line_number))
-            elif self.position.return_type != IntegerType():
+            elif self._position.return_type is not IntegerType():
                 message = 'Invalid non integer position for array access at line {line}'
                 errors.append(message.format(line=self.line_number))
         else:
@@ -106,11 +112,11 @@ class ArrayAccessNode(AccessNode):
         de la clase C{LanguageNode}.
         """
         me = generator.add_node(str(self.__class__.__name__))
-        array = self.array.generate_dot(generator)
-        position = self.position.generate_dot(generator)
+        array = yield generator.visit(self.array)
+        position = yield generator.visit(self.position)
         generator.add_edge(me, array)
         generator.add_edge(me, position)
-        return me
+        yield me
     
     def generate_code(self, generator):
         """
@@ -124,12 +130,12 @@ class ArrayAccessNode(AccessNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        self.array.generate_code(generator)
-        self.position.generate_code(generator)
+        self._scope.generate_code(generator)
+        yield self._array.generate_code(generator)
+        yield self._position.generate_code(generator)
         stmt = 'pytiger2c_validate_index({array}->length, {pos});'
-        stmt = stmt.format(pos=self.position.code_name, array=self.array.code_name) 
+        stmt = stmt.format(pos=self._position.code_name, array=self._array.code_name) 
         generator.add_statement(stmt)
         stmt = '{array}->data[{pos}]'
-        self._code_name = stmt.format(pos=self.position.code_name, 
-                                      array=self.array.code_name)
+        self._code_name = stmt.format(pos=self._position.code_name, 
+                                      array=self._array.code_name)
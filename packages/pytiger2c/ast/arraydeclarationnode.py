@@ -6,6 +6,7 @@ Clase C{ArrayDeclarationNode} del árbol de sintáxis abstracta.
 
 from pytiger2c.ast.typedeclarationnode import TypeDeclarationNode
 from pytiger2c.types.arraytype import ArrayType
+from pytiger2c.types.errortype import ErrorType
 
 
 class ArrayDeclarationNode(TypeDeclarationNode):
@@ -18,6 +19,8 @@ class ArrayDeclarationNode(TypeDeclarationNode):
     tener los valores.    
     """
     
+    __slots__ = ('_values_typename',)
+    
     def _get_values_typename(self):
         """
         Método para obtener el valor de la propiedad C{values_typename}.
@@ -65,15 +68,16 @@ class ArrayDeclarationNode(TypeDeclarationNode):
         elem_type_name = self.type.fields_typenames[0]
         
         try:
-            elem_type = self.scope.get_type_definition(elem_type_name)
+            elem_type = self._scope.get_type_definition(elem_type_name)
         except KeyError:
             message = 'Undefined type {type} in the array {name} ' \
                       'declaration at line {line}'
-            errors.append(message.format(type=elem_type_name, name=self.name, 
+            errors.append(message.format(type=elem_type_name, name=self._name, 
                                          line=self.line_number))
-        if elem_type == self._type:
+            elem_type = ErrorType()
+        if elem_type is self._type:
             message = 'Invalid recursive definition of the array {name} at line {line}' 
-            errors.append(message.format(name=self.name, line=self.line_number))
+            errors.append(message.format(name=self._name, line=self.line_number))
 
         self.type.fields_types = [elem_type]
 
@@ -102,6 +106,6 @@ class ArrayDeclarationNode(TypeDeclarationNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        values_type = self.scope.get_type_definition(self.values_typename)
+        self._scope.generate_code(generator)
+        values_type = self._scope.get_type_definition(self._values_typename)
         generator.define_array(self.type.code_name, values_type.code_type)
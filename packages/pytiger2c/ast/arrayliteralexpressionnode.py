@@ -9,6 +9,8 @@ from pytiger2c.types.arraytype import ArrayType
 from pytiger2c.types.integertype import IntegerType
 from pytiger2c.types.recordtype import RecordType
 from pytiger2c.types.niltype import NilType
+from pytiger2c.types.errortype import ErrorType
+from pytiger2c.recovery import POISONED
 
 
 class ArrayLiteralExpressionNode(ValuedExpressionNode):
@@ -23,6 +25,8 @@ class ArrayLiteralExpressionNode(ValuedExpressionNode):
     todos los miembros de este nuevo array.
     """
     
+    __slots__ = ('_type_name', '_count', '_value')
+    
     def _get_type_name(self):
         """
         Método para obtener el valor de la propiedad C{type_name}.
@@ -93,39 +97,44 @@ class ArrayLiteralExpressionNode(ValuedExpressionNode):
         errors_before = len(errors)
         
         try:
-            self._return_type = self.scope.get_type_definition(self.type_name)
+            self._return_type = self._scope.get_type_definition(self._type_name)
         except KeyError:
             message = 'Undefined type {type} at line {line}'
             errors.append(message.format(type=self._type_name, line=self.line_number))
             return
             
-        if isinstance(self.return_type, ArrayType):
+        if self._return_type is ErrorType():
+            errors.append(POISONED)
+        elif isinstance(self._return_type, ArrayType):
             
-            self.count.check_semantics(self.scope, errors)
+            yield self._count.check_semantics(self._scope, errors)
             if errors_before != len(errors):
                 return            
             
-            if not self.count.has_return_value():
+            if not self._count.has_return_value():
                 message = 'Non value expression for the array length at line {line}'
                 errors.append(message.format(line=self.line_number))
                 return
-            elif self.count.return_type != IntegerType():
+            elif self._count.return_type is not IntegerType():
                 message = 'Non integer expression for the array length at line {line}'
                 errors.append(message.format(line=self.line_number))
                 return
                 
-            self.value.check_semantics(self.scope, errors)
+            yield self._value.check_semantics(self._scope, errors)
             if errors_before != len(errors):
                 return
                         
-            if not self.value.has_return_value():
+            if self._return_type.fields_types[0] is ErrorType():
+                # The declaration of the array reported the error.
+                pass
+            elif not self._value.has_return_value():
                 message = 'Non valued expression for the array value at line {line}'
                 errors.append(message.format(line=self.line_number))
-            elif self.value.return_type == NilType():
-                if not isinstance(self.return_type.fields_types[0], RecordType):
+            elif self._value.return_type is NilType():
+                if not isinstance(self._return_type.fields_types[0], RecordType):
                     message = 'Invalid nil value for the array value at line {line}'
                     errors.append(message.format(line=self.line_number))
-            elif self.value.return_type != self.return_type.fields_types[0]:
+            elif self._value.return_type is not self._return_type.fields_types[0]:
                 message = 'Incompatible type for the array value at line {line}'
                 errors.append(message.format(line=self.line_number))
         else:
@@ -145,11 +154,11 @@ class ArrayLiteralExpressionNode(ValuedExpressionNode):
         me = generator.add_node(str(self.__class__.__name__))
         type_name = generator.add_node(self.type_name)
         generator.add_edge(me, type_name)
-        count = self.count.generate_dot(generator)
+        count = yield generator.visit(self.count)
         generator.add_edge(me, count)
-        value = self.value.generate_dot(generator)
+        value = yield generator.visit(self.value)
         generator.add_edge(me, value)        
-        return me
+        yield me
 
     def generate_code(self, generator):
         """
@@ -160,10 +169,10 @@ class ArrayLiteralExpressionNode(ValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        self.count.generate_code(generator)
-        self.value.generate_code(generator)
-        array_code_type = self.return_type.code_type
+        self._scope.generate_code(generator)
+        yield self._count.generate_code(generator)
+        yield self._value.generate_code(generator)
+        array_code_type = self._return_type.code_type
         local_var = generator.define_local(array_code_type)
         # Allocate memory for the struct and the data.
         statement = '{local_var} = pytiger2c_malloc(sizeof({type}));'
@@ -171,24 +180,24 @@ class ArrayLiteralExpressionNode(ValuedExpressionNode):
                                      type = array_code_type[:-1])
         generator.add_statement(statement)
         value_type = None   
-        if isinstance(self.value.return_type, IntegerType):
-            value_type = self.value.return_type.code_type
+        if isinstance(self._value.return_type, IntegerType):
+            value_type = self._value.return_type.code_type
         else:
-            value_type = self.value.return_type.code_type[:-1]
+            value_type = self._value.return_type.code_type[:-1]
         statement = '{local_var}->data = pytiger2c_malloc(sizeof({type})*{value});'
         statement = statement.format(local_var = local_var, 
                                      type = value_type, 
-                                     value = self.count.code_name)
+                                     value = self._count.code_name)
         generator.add_statement(statement)
-        generator.add_statement('{0}->length = {1};'.format(local_var, self.count.code_name))
+        generator.add_statement('{0}->length = {1};'.format(local_var, self._count.code_name))
         # Initializa the data.
         statement = 'for(int tiger_index = 0; tiger_index < {0}-> length; tiger_index++)'
         statement = statement.format(local_var)
         generator.add_statement(statement)
         generator.add_statement('{')
         statement = '{local_var}->data[tiger_index] = {value};'
-        statement = statement.format(type=self.value.return_type.code_type, 
-                                     local_var=local_var, value=self.value.code_name)
+        statement = statement.format(type=self._value.return_type.code_type, 
+                                     local_var=local_var, value=self._value.code_name)
         generator.add_statement(statement)
         generator.add_statement('}')
         self._code_name = local_var 
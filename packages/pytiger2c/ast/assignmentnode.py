@@ -19,6 +19,8 @@ class AssignmentNode(NonValuedExpressionNode):
     asignará a este acceso.
     """
     
+    __slots__ = ('_lvalue', '_expression')
+    
     def _get_lvalue(self):
         """
         Método para obtener el valor de la propiedad C{lvalue}.
@@ -72,30 +74,30 @@ class AssignmentNode(NonValuedExpressionNode):
         
         errors_before = len(errors)        
         
-        self.lvalue.check_semantics(self.scope, errors)
+        yield self._lvalue.check_semantics(self._scope, errors)
         
         if errors_before != len(errors):
             return           
         
-        self.expression.check_semantics(self.scope, errors)
+        yield self._expression.check_semantics(self._scope, errors)
         
         if errors_before != len(errors):
             return        
         
-        if self.lvalue.read_only:
+        if self._lvalue.read_only:
             message = 'Invalid use of assignment to a read only variable at line {line}'
             errors.append(message.format(line=self.line_number))
-        elif not self.lvalue.has_return_value():
+        elif not self._lvalue.has_return_value():
             message = 'Invalid use of assignment to a non valued variable at line {line}'
             errors.append(message.format(line=self.line_number))
-        elif not self.expression.has_return_value():
+        elif not self._expression.has_return_value():
             message = 'Invalid assignment of a non valued expression at line {line}'
             errors.append(message.format(line=self.line_number))
-        elif self.expression.return_type == NilType():
-            if not isinstance(self.lvalue.return_type, RecordType):
+        elif self._expression.return_type is NilType():
+            if not isinstance(self._lvalue.return_type, RecordType):
                 message = 'Invalid nil value of assigment at line {line}'
                 errors.append(message.format(line=self.line_number))
-        elif self.lvalue.return_type != self.expression.return_type:
+        elif self._lvalue.return_type is not self._expression.return_type:
             message = 'Incompatible types in assigment at line {line}'
             errors.append(message.format(line=self.line_number))
 
@@ -109,11 +111,11 @@ class AssignmentNode(NonValuedExpressionNode):
         de la clase C{LanguageNode}.
         """
         me = generator.add_node(str(self.__class__.__name__))
-        lvalue = self.lvalue.generate_dot(generator)
-        expression = self.expression.generate_dot(generator)
+        lvalue = yield generator.visit(self.lvalue)
+        expression = yield generator.visit(self.expression)
         generator.add_edge(me, lvalue)
         generator.add_edge(me, expression)
-        return me
+        yield me
     
     def generate_code(self, generator):
         """
@@ -124,8 +126,8 @@ class AssignmentNode(NonValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        self.lvalue.generate_code(generator)
-        self.expression.generate_code(generator)
-        generator.add_statement('{0} = {1};'.format(self.lvalue.code_name, 
-                                                    self.expression.code_name))
\ No newline at end of file
+        self._scope.generate_code(generator)
+        yield self._lvalue.generate_code(generator)
+        yield self._expression.generate_code(generator)
+        generator.add_statement('{0} = {1};'.format(self._lvalue.code_name, 
+                                                    self._expression.code_name))
\ No newline at end of file
@@ -16,6 +16,8 @@ class BinaryOperatorNode(OperatorNode):
     aritméticos y lógicos.
     """
     
+    __slots__ = ('_left', '_right')
+    
     def _get_left(self):
         """
         Método para obtener el valor de la propiedad C{left}.
@@ -58,8 +60,8 @@ class BinaryOperatorNode(OperatorNode):
         de la clase C{LanguageNode}.
         """
         me = generator.add_node(str(self.__class__.__name__))
-        left = self.left.generate_dot(generator)
-        right = self.right.generate_dot(generator)
+        left = yield generator.visit(self.left)
+        right = yield generator.visit(self.right)
         generator.add_edge(me, left)
         generator.add_edge(me, right)
-        return me
+        yield me
@@ -18,6 +18,8 @@ class BreakStatementNode(NonValuedExpressionNode):
     termina la evaluación de las instrucciones C{while} y C{for}.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """
         Inicializa la clase C{BreakStatementNode}.
@@ -67,5 +69,5 @@ class BreakStatementNode(NonValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
+        self._scope.generate_code(generator)
         generator.add_statement('break ;')
@@ -6,6 +6,7 @@ Clase C{CallableDeclarationNode} del árbol de sintáxis abstracta.
 
 from pytiger2c.ast.declarationnode import DeclarationNode
 from pytiger2c.types.functiontype import FunctionType
+from pytiger2c.types.errortype import ErrorType
 
 
 class CallableDeclarationNode(DeclarationNode):
@@ -24,6 +25,8 @@ class CallableDeclarationNode(DeclarationNode):
     Para más información consulte la documentación de estos métodos.
     """
     
+    __slots__ = ('_name', '_parameters_names', '_parameters_typenames', '_body', '_type')
+    
     def _get_name(self):
         """
         Método para obtener el valor de la propiedad C{name}.
@@ -112,14 +115,14 @@ class CallableDeclarationNode(DeclarationNode):
                 message = 'The type {type} of the parameter #{index} of the ' \
                           'callable {name} defined at line {line} is not defined'
                 message = message.format(type=parameter_name, index=i + 1,
-                                         name=self.name, line=self.line_number)
+                                         name=self._name, line=self.line_number)
                 errors.append(message)
-            else:
-                parameters_types.append(tiger_type)
+                tiger_type = ErrorType()
+            parameters_types.append(tiger_type)
         if len(self._parameters_names) != len(set(self._parameters_names)):
             message = 'At least two parameters of the callable {name} ' \
                       'defined at line {line} have the same name'
-            message = message.format(type=parameter_name, name=self.name, 
+            message = message.format(type=parameter_name, name=self._name, 
                                      line=self.line_number)
             errors.append(message)            
         self.type.parameters_types = parameters_types
@@ -134,21 +137,21 @@ class CallableDeclarationNode(DeclarationNode):
         de la clase C{LanguageNode}.
         """
         generator.begin_function(self.type.code_name)
-        self.scope.generate_code(generator)
+        self._scope.generate_code(generator)
         stmt = '{scope}->parent = {parent};'
-        stmt = stmt.format(scope=self.scope.code_name, 
-                           parent=self.scope.parent.code_name)
+        stmt = stmt.format(scope=self._scope.code_name, 
+                           parent=self._scope.parent.code_name)
         generator.add_statement(stmt)        
-        for index, var_name in enumerate(self.parameters_names):
+        for index, var_name in enumerate(self._parameters_names):
             parameter_name = generator.get_function_parameter(index)
-            var_name = self.scope.get_variable_code(var_name)
+            var_name = self._scope.get_variable_code(var_name)
             stmt = '{var} = {param};'.format(var=var_name, param=parameter_name)
             generator.add_statement(stmt)
-        self.body.generate_code(generator)
-        if self.body.has_return_value():
-            return_var = generator.define_local(self.body.return_type.code_type)
+        yield self._body.generate_code(generator)
+        if self._body.has_return_value():
+            return_var = generator.define_local(self._body.return_type.code_type)
             stmt = '{return_var} = {body_var};'
-            stmt = stmt.format(return_var=return_var, body_var=self.body.code_name)
+            stmt = stmt.format(return_var=return_var, body_var=self._body.code_name)
             generator.add_statement(stmt)
         else:
             return_var = None
@@ -20,6 +20,8 @@ class DeclarationGroupNode(NonValuedExpressionNode):
     ya que si esto sucede se producen situaciones ambiguas.
     """
     
+    __slots__ = ('_declarations',)
+    
     def _get_declarations(self):
         """
         Método para obtener el valor de la propiedad C{declarations}.
@@ -66,6 +68,6 @@ class DeclarationGroupNode(NonValuedExpressionNode):
         """
         me = generator.add_node(str(self.__class__.__name__))
         for declaration in self.declarations:
-            declaration = declaration.generate_dot(generator)
+            declaration = yield generator.visit(declaration)
             generator.add_edge(me, declaration)
-        return me
+        yield me
@@ -12,6 +12,8 @@ class DeclarationNode(NonValuedExpressionNode):
     Clase C{DeclarationNode} del árbol de sintáxis abstracta.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """
         Inicializa la clase C{DeclarationNode}.
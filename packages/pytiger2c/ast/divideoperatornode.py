@@ -16,6 +16,8 @@ class DivideOperatorNode(ArithmeticOperatorNode):
     del lenguaje Tiger.
     """
     
+    __slots__ = ()
+    
     def __init__(self, left, right):
         """
         Inicializa la clase C{DivideOperatorNode}.
@@ -44,25 +46,25 @@ class DivideOperatorNode(ArithmeticOperatorNode):
         
         errors_before = len(errors)
         
-        self.right.check_semantics(scope, errors)
+        yield self._right.check_semantics(scope, errors)
         
         if errors_before == len(errors):
-            if not self.right.has_return_value():
+            if not self._right.has_return_value():
                 message = 'Invalid use of divide operator with a non-valued right expression at line {line}'
                 errors.append(message.format(line=self.line_number)) 
-            elif self.right.return_type != IntegerType():
+            elif self._right.return_type is not IntegerType():
                 message = 'Invalid use of divide operator with a non-integer right value at line {line}'
                 errors.append(message.format(line=self.line_number))
                 
         errors_before = len(errors)
         
-        self.left.check_semantics(scope, errors)
+        yield self._left.check_semantics(scope, errors)
         
         if errors_before == len(errors):
-            if not self.left.has_return_value():
+            if not self._left.has_return_value():
                 message = 'Invalid use of divide operator with a non-valued left expression at line {line}'
                 errors.append(message.format(line=self.line_number)) 
-            elif self.left.return_type != IntegerType():
+            elif self._left.return_type is not IntegerType():
                 message = 'Invalid use of divide operator with a non-integer left value at line {line}'
                 errors.append(message.format(line=self.line_number))
             
@@ -77,20 +79,20 @@ class DivideOperatorNode(ArithmeticOperatorNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        self.right.generate_code(generator)
-        self.left.generate_code(generator)
+        self._scope.generate_code(generator)
+        yield self._right.generate_code(generator)
+        yield self._left.generate_code(generator)
         # Check integer division by zero.
         statement = 'if({var} == 0) {{ pytiger2c_error("{msg}"); }}'
-        statement = statement.format(var=self.right.code_name, 
+        statement = statement.format(var=self._right.code_name, 
                                      msg="Integer division by zero.")       
         generator.add_statement(statement)
         int_code_type = IntegerType().code_type
         local_var = generator.define_local(int_code_type)
         statement = '{var} = {left} {operator} {right};'
         statement = statement.format(var=local_var, 
-                                     left=self.left.code_name, 
+                                     left=self._left.code_name, 
                                      operator=self._operator, 
-                                     right=self.right.code_name)
+                                     right=self._right.code_name)
         generator.add_statement(statement)
         self._code_name = local_var
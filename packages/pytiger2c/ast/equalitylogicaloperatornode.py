@@ -20,6 +20,8 @@ class EqualityLogicalOperatorNode(LogicalOperatorNode):
     siguientes: igual que C{=}, no igual que C{<>}.
     """
     
+    __slots__ = ('_code_operator',)
+    
     def __init__(self, left, right):
         """
         Inicializa la clase C{EqualityLogicalOperatorNode}.
@@ -51,29 +53,29 @@ class EqualityLogicalOperatorNode(LogicalOperatorNode):
         
         errors_before = len(errors)
         
-        self.right.check_semantics(scope, errors)
+        yield self._right.check_semantics(scope, errors)
         
         if errors_before == len(errors):
-            if not self.right.has_return_value():
+            if not self._right.has_return_value():
                 message = 'Invalid use of equality or inequality logical operator ' \
                           'with a non-valued right expression at line {line}'
                 errors.append(message.format(line=self.line_number))
             
-        self.left.check_semantics(scope, errors)
+        yield self._left.check_semantics(scope, errors)
         
         if errors_before == len(errors):
-            if not self.left.has_return_value():
+            if not self._left.has_return_value():
                 message = 'Invalid use of equality or inequality logical operator ' \
                           'with a non-valued left expression at line {line}'
                 errors.append(message.format(line=self.line_number))
         
         if errors_before == len(errors):
-            if self.right.return_type != self.left.return_type:
+            if self._right.return_type is not self._left.return_type:
                 # Check the special case of nil and records. nil can be assigned
                 # to any record type, then r <> nil and r = nil are legal.
                 valid_different_types = (RecordType, NilType)
-                record_and_nil = (isinstance(self.right.return_type, valid_different_types) and 
-                                  isinstance(self.left.return_type, valid_different_types))
+                record_and_nil = (isinstance(self._right.return_type, valid_different_types) and 
+                                  isinstance(self._left.return_type, valid_different_types))
                 if not record_and_nil:
                     message = 'Types of left and right operands of the equality or ' \
                               'inequality logical operator at line {line} does not match'
@@ -94,23 +96,23 @@ class EqualityLogicalOperatorNode(LogicalOperatorNode):
             algún error durante la generación del código correspondiente al nodo.
             La excepción contendrá información acerca del error.
         """
-        self.scope.generate_code(generator)
-        self.left.generate_code(generator)
-        self.right.generate_code(generator)
+        self._scope.generate_code(generator)
+        yield self._left.generate_code(generator)
+        yield self._right.generate_code(generator)
         result_var = generator.define_local(IntegerType().code_type)
-        if isinstance(self.left.return_type, StringType):
+        if isinstance(self._left.return_type, StringType):
             stmt = '{result} = (pytiger2c_strcmp({left}, {right}) {op} 0);'
-        elif isinstance(self.left, NilType):
+        elif isinstance(self._left, NilType):
             stmt = '{result} = ((({left_type}) {left}) {op} {right});'
-        elif isinstance(self.right, NilType):
+        elif isinstance(self._right, NilType):
             stmt = '{result} = ({left} {op} (({right_type}) {right}));'
         else:
             stmt = '{result} = ({left} {op} {right});'
         stmt = stmt.format(result=result_var, 
                            op=self._code_operator,
-                           left=self.left.code_name, 
-                           right=self.right.code_name,
-                           left_type=self.left.return_type.code_type,
-                           right_type=self.right.return_type.code_type)
+                           left=self._left.code_name, 
+                           right=self._right.code_name,
+                           left_type=self._left.return_type.code_type,
+                           right_type=self._right.return_type.code_type)
         generator.add_statement(stmt)
         self._code_name = result_var
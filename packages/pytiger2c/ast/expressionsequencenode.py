@@ -20,6 +20,8 @@ class ExpressionSequenceNode(ValuedExpressionNode):
     de expresiones vacía.
     """
     
+    __slots__ = ('_expressions', '_has_return_value')
+    
     def _get_expressions(self):
         """
         Método para obtener el valor de la propiedad C{expressions}.
@@ -55,19 +57,19 @@ class ExpressionSequenceNode(ValuedExpressionNode):
         # Check semantics of the expressions in the sequence.
         self._has_return_value = False
 
-        if len(self.expressions) > 0:
+        if len(self._expressions) > 0:
             errors_before_last = len(errors)
-            self.expressions[-1].check_semantics(scope, errors)
-            self._has_return_value = self.expressions[-1].has_return_value()
+            yield self._expressions[-1].check_semantics(scope, errors)
+            self._has_return_value = self._expressions[-1].has_return_value()
 
-        for expression in self.expressions[0:-1]:
+        for expression in self._expressions[0:-1]:
             errors_before_last = len(errors)
-            expression.check_semantics(scope, errors)
+            yield expression.check_semantics(scope, errors)
 
         if errors_before_last == len(errors):
             try:
-                if self.expressions[-1].has_return_value():
-                    self._return_type = self.expressions[-1].return_type
+                if self._expressions[-1].has_return_value():
+                    self._return_type = self._expressions[-1].return_type
             except IndexError:
                 # Ignore this exception, the node does not have a return value.
                 pass
@@ -95,9 +97,9 @@ class ExpressionSequenceNode(ValuedExpressionNode):
         """
         me = generator.add_node(str(self.__class__.__name__))
         for expression in self.expressions:
-            expression = expression.generate_dot(generator)
+            expression = yield generator.visit(expression)
             generator.add_edge(me, expression)
-        return me
+        yield me
 
     def generate_code(self, generator):
         """
@@ -108,8 +110,8 @@ class ExpressionSequenceNode(ValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        for expression in self.expressions:
-            expression.generate_code(generator)
+        self._scope.generate_code(generator)
+        for expression in self._expressions:
+            yield expression.generate_code(generator)
         if self.has_return_value():
-            self._code_name = self.expressions[-1].code_name
\ No newline at end of file
+            self._code_name = self._expressions[-1].code_name
\ No newline at end of file
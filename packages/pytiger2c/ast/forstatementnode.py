@@ -23,6 +23,8 @@ class ForStatementNode(NonValuedExpressionNode):
     y es un error cambiar su valor.
     """
     
+    __slots__ = ('_index_name', '_lower_expression', '_upper_expression', '_expression')
+    
     def _get_index_name(self):
         """
         Método para obtener el valor de la propiedad C{index_name}.        
@@ -103,37 +105,37 @@ class ForStatementNode(NonValuedExpressionNode):
         integer_type = IntegerType()
         
         self._scope = Scope(scope)
-        self.scope.define_variable(self.index_name, VariableType(integer_type, True))
+        self._scope.define_variable(self._index_name, VariableType(integer_type, True))
         
         errors_before = len(errors)
         
-        self.lower_expression.check_semantics(self.scope, errors)
+        yield self._lower_expression.check_semantics(self._scope, errors)
         
         if errors_before == len(errors): 
-            if not self.lower_expression.has_return_value(): 
+            if not self._lower_expression.has_return_value(): 
                 message = 'The expression for the lower bound of the for loop ' \
                           'at line {line} does not return a value'
                 errors.append(message.format(line=self.line_number))
-            elif self.lower_expression.return_type != integer_type:
+            elif self._lower_expression.return_type is not integer_type:
                 message = 'The return type of the expression for the lower bound ' \
                           'of the for loop at line {line} is not integer'
                 errors.append(message.format(line=self.line_number))
                 
         errors_before = len(errors)
             
-        self.upper_expression.check_semantics(self.scope, errors)
+        yield self._upper_expression.check_semantics(self._scope, errors)
         
         if errors_before == len(errors):
-            if not self.upper_expression.has_return_value(): 
+            if not self._upper_expression.has_return_value(): 
                 message = 'The expression for the upper bound of the for loop ' \
                           'at line {line} does not return a value'
                 errors.append(message.format(line=self.line_number))
-            elif self.upper_expression.return_type != integer_type:
+            elif self._upper_expression.return_type is not integer_type:
                 message = 'The return type of the expression for the upper bound ' \
                           'of the for loop at line {line} is not integer'
                 errors.append(message.format(line=self.line_number))
             
-        self.expression.check_semantics(self.scope, errors)
+        yield self._expression.check_semantics(self._scope, errors)
 
     def generate_dot(self, generator):
         """
@@ -146,14 +148,14 @@ class ForStatementNode(NonValuedExpressionNode):
         """
         me = generator.add_node(str(self.__class__.__name__))
         index_name = generator.add_node(self.index_name)
-        lower_expression = self.lower_expression.generate_dot(generator)
-        upper_expression = self.upper_expression.generate_dot(generator)
-        expression = self.expression.generate_dot(generator)
+        lower_expression = yield generator.visit(self.lower_expression)
+        upper_expression = yield generator.visit(self.upper_expression)
+        expression = yield generator.visit(self.expression)
         generator.add_edge(me, index_name)
         generator.add_edge(me, lower_expression)
         generator.add_edge(me, upper_expression)
         generator.add_edge(me, expression)
-        return me
+        yield me
 
     def generate_code(self, generator):
         """
@@ -164,24 +166,24 @@ class ForStatementNode(NonValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        if self.scope.parent:
+        self._scope.generate_code(generator)
+        if self._scope.parent:
             statement = '{scope}->parent = {parent};'
-            statement = statement.format(scope=self.scope.code_name, 
-                                         parent=self.scope.parent.code_name)
+            statement = statement.format(scope=self._scope.code_name, 
+                                         parent=self._scope.parent.code_name)
             generator.add_statement(statement)
         
-        self.lower_expression.generate_code(generator)
-        self.upper_expression.generate_code(generator)
+        yield self._lower_expression.generate_code(generator)
+        yield self._upper_expression.generate_code(generator)
         
-        index_code_name = self.scope.get_variable_code(self.index_name)
+        index_code_name = self._scope.get_variable_code(self._index_name)
         generator.add_statement('{0} = {1};'.format(index_code_name, 
-                                                    self.lower_expression.code_name))
+                                                    self._lower_expression.code_name))
         statement = 'while({0} <= {1})'.format(index_code_name, 
                                                self._upper_expression.code_name)
         generator.add_statement(statement)
         generator.add_statement('{')
-        self.expression.generate_code(generator)
+        yield self._expression.generate_code(generator)
         generator.add_statement('{0}++;'.format(index_code_name))
         generator.add_statement('}')
             
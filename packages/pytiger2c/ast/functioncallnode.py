@@ -7,6 +7,8 @@ Clase C{FunctionCallNode} del árbol de sintáxis abstracta.
 from pytiger2c.ast.valuedexpressionnode import ValuedExpressionNode
 from pytiger2c.types.recordtype import RecordType
 from pytiger2c.types.niltype import NilType
+from pytiger2c.types.errortype import ErrorType
+from pytiger2c.recovery import POISONED
 
 
 class FunctionCallNode(ValuedExpressionNode):
@@ -21,6 +23,8 @@ class FunctionCallNode(ValuedExpressionNode):
     en el caso de los procedimientos.
     """
     
+    __slots__ = ('_name', '_parameters')
+    
     def _get_name(self):
         """
         Método para obtener el valor de la propiedad C{name}.
@@ -79,7 +83,7 @@ class FunctionCallNode(ValuedExpressionNode):
         errors_before = len(errors)
         
         for expression in self._parameters:
-            expression.check_semantics(self._scope, errors)
+            yield expression.check_semantics(self._scope, errors)
 
         try:
             function_type = self._scope.get_function_definition(self._name)
@@ -102,7 +106,8 @@ class FunctionCallNode(ValuedExpressionNode):
                                                      index=index + 1, 
                                                      line=self.line_number)
                             errors.append(message)
-                        elif (param_type != param.return_type and 
+                        elif (param_type is not param.return_type and
+                              param_type is not ErrorType() and
                               not (isinstance(param_type, RecordType)
                                    and isinstance(param.return_type, NilType))):
                             message = 'Invalid type of the argument #{index} ' \
@@ -115,7 +120,9 @@ class FunctionCallNode(ValuedExpressionNode):
                 message = 'Calling function {name} with a wrong ' \
                           'number of arguments at line {line}'
                 errors.append(message.format(name=self._name, line=self.line_number))
-            self._return_type = function_type.return_type                
+            self._return_type = function_type.return_type
+            if self._return_type is ErrorType():
+                errors.append(POISONED)
 
     def generate_dot(self, generator):
         """
@@ -130,9 +137,9 @@ class FunctionCallNode(ValuedExpressionNode):
         name = generator.add_node(self.name)
         generator.add_edge(me, name)
         for parameter in self.parameters:
-            parameter = parameter.generate_dot(generator)
+            parameter = yield generator.visit(parameter)
             generator.add_edge(me, parameter)
-        return me
+        yield me
 
     def generate_code(self, generator):
         """
@@ -143,19 +150,19 @@ class FunctionCallNode(ValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        function_type = self.scope.get_function_definition(self._name)
-        self.scope.generate_code(generator)
-        for parameter in self.parameters:
-            parameter.generate_code(generator)
+        function_type = self._scope.get_function_definition(self._name)
+        self._scope.generate_code(generator)
+        for parameter in self._parameters:
+            yield parameter.generate_code(generator)
         # Constructing the function call.
         if function_type.scope_depth == -1:
             call = '{function}({params}'
         else:
             call = '{function}({scope}, {params}'
-        params = ', '.join([p.code_name for p in self.parameters])
+        params = ', '.join([p.code_name for p in self._parameters])
         # Constructing the scope parameter.
-        k = self.scope.depth - function_type.scope_depth
-        scope = self.scope.code_name
+        k = self._scope.depth - function_type.scope_depth
+        scope = self._scope.code_name
         while k > 0:
             scope += '->parent'
             k -= 1
@@ -5,6 +5,7 @@ Clase C{FunctionDeclarationGroupNode} del árbol de sintáxis abstracta.
 """
 
 from pytiger2c.ast.declarationgroupnode import DeclarationGroupNode
+from pytiger2c.recovery import must_stop
 
 
 class FunctionDeclarationGroupNode(DeclarationGroupNode):
@@ -12,6 +13,8 @@ class FunctionDeclarationGroupNode(DeclarationGroupNode):
     Clase C{FunctionDeclarationGroupNode} del árbol de sintáxis abstracta.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """
         Inicializa la clase C{FunctionDeclarationGroupNode}.
@@ -36,6 +39,7 @@ class FunctionDeclarationGroupNode(DeclarationGroupNode):
         @return: Conjunto con los nombres de las funciones definidas en este grupo.
         """
         definitions = set()
+        errors_before = len(errors)
         for declaration_node in self._declarations:
             try:
                 declaration_node.check_header_semantics(scope, errors)
@@ -45,7 +49,8 @@ class FunctionDeclarationGroupNode(DeclarationGroupNode):
                           'is already defined in this scope'
                 errors.append(message.format(name=declaration_node.name,
                                              line=declaration_node.line_number))
-                return definitions
+                if must_stop(errors, errors_before):
+                    return definitions
             else:
                 definitions.add(declaration_node.name)
         return definitions
@@ -75,12 +80,12 @@ class FunctionDeclarationGroupNode(DeclarationGroupNode):
         """
         self._scope  = scope
         errors_before = len(errors)
-        for declaration in self.declarations:
-            self.scope.current_member = declaration.name
-            declaration.check_semantics(self.scope, errors)
-            if errors_before != len(errors):
+        for declaration in self._declarations:
+            self._scope.current_member = declaration.name
+            yield declaration.check_semantics(self._scope, errors)
+            if must_stop(errors, errors_before):
                 return
-        self.scope.current_member = None
+        self._scope.current_member = None
         
     def generate_code(self, generator):
         """
@@ -91,5 +96,5 @@ class FunctionDeclarationGroupNode(DeclarationGroupNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        for declaration in self.declarations:
-            declaration.generate_code(generator)
+        for declaration in self._declarations:
+            yield declaration.generate_code(generator)
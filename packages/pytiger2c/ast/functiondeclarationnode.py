@@ -6,6 +6,7 @@ Clase C{FunctionDeclarationNode} del árbol de sintáxis abstracta.
 
 from pytiger2c.ast.callabledeclarationnode import CallableDeclarationNode
 from pytiger2c.types.variabletype import VariableType
+from pytiger2c.types.errortype import ErrorType
 from pytiger2c.scope import Scope
 
 
@@ -18,6 +19,8 @@ class FunctionDeclarationNode(CallableDeclarationNode):
     primera siempre tiene un valor de retorno.
     """
     
+    __slots__ = ('_return_typename',)
+    
     def _get_return_typename(self):
         """
         Método para obtener el valor de la propiedad C{return_typename}.
@@ -59,9 +62,10 @@ class FunctionDeclarationNode(CallableDeclarationNode):
         except KeyError:
             message = 'Undefined return type {type} of the ' \
                       'function {name} defined at line {line}'
-            message = message.format(name=self.name, type=self.return_typename, 
+            message = message.format(name=self._name, type=self._return_typename, 
                                      line=self.line_number)
             errors.append(message)
+            self.type.return_type = ErrorType()
 
     def check_semantics(self, scope, errors):
         """
@@ -84,26 +88,31 @@ class FunctionDeclarationNode(CallableDeclarationNode):
         
         # Create and populate the scope with the parameters.
         self._scope = Scope(scope)
-        for parameter_name, parameter_type in zip(self.parameters_names, 
+        for parameter_name, parameter_type in zip(self._parameters_names, 
                                                   self.type.parameters_types):
-            self.scope.define_variable(parameter_name, VariableType(parameter_type))
+            try:
+                self._scope.define_variable(parameter_name, VariableType(parameter_type))
+            except ValueError:
+                # The header reported the repeated parameter.
+                pass
         
         # Check semantics of the body.        
-        self.body.check_semantics(self.scope, errors)
+        yield self._body.check_semantics(self._scope, errors)
         
         if errors_before != len(errors):
             return
         
-        if not self.body.has_return_value():
+        if not self._body.has_return_value():
             message = 'The body of the function {name} defined at ' \
                       'line {line} does not return a value'
-            errors.append(message.format(name=self.name, line=self.line_number))
+            errors.append(message.format(name=self._name, line=self.line_number))
         else:
-            if self.type.return_type != self.body.return_type:
+            return_type = self.type.return_type
+            if return_type is not self._body.return_type and return_type is not ErrorType():
                 message = 'The return type of the body of the function {name} defined ' \
                           'at line {line} does not match the declared type {type}'
-                message = message.format(name=self.name,
-                                         type=self.return_typename,
+                message = message.format(name=self._name,
+                                         type=self._return_typename,
                                          line=self.line_number)
                 errors.append(message)
 
@@ -127,6 +136,6 @@ class FunctionDeclarationNode(CallableDeclarationNode):
             generator.add_edge(me, param_name)
             param_typename = generator.add_node(param_typename)
             generator.add_edge(param_name, param_typename)
-        body = self.body.generate_dot(generator)
+        body = yield generator.visit(self.body)
         generator.add_edge(me, body)
-        return me
+        yield me
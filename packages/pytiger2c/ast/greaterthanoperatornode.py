@@ -15,6 +15,8 @@ class GreaterThanOperatorNode(RelationalLogicalOperatorNode):
     cadenas de caracters del lenguaje Tiger.    
     """
     
+    __slots__ = ()
+    
     def __init__(self, left, right):
         """
         Inicializa la clase C{GreaterThanOperatorNode}.
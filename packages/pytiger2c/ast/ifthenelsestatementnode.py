@@ -26,6 +26,8 @@ class IfThenElseStatementNode(ValuedExpressionNode):
     de retorno o ambas no tener valor de retorno.
     """
     
+    __slots__ = ('_condition', '_then_expression', '_else_expression')
+    
     def _get_condition(self):
         """
         Método para obtener el valor de la propiedad C{condition}.
@@ -98,12 +100,12 @@ class IfThenElseStatementNode(ValuedExpressionNode):
         self._scope = scope
         
         # Check semantics of the condition expression.
-        self.condition.check_semantics(scope, errors)
-        if not self.condition.has_return_value():
+        yield self._condition.check_semantics(scope, errors)
+        if not self._condition.has_return_value():
             message = 'The condition of the if-then-else statement at line {line} ' \
                        'does not return a value'
             errors.append(message.format(line=self.line_number))
-        elif self.condition.return_type != IntegerType():
+        elif self._condition.return_type is not IntegerType():
             message = 'The condition of the if-then-else statement at line {line} ' \
                       'does not return an integer value'
             errors.append(message.format(line=self.line_number))
@@ -111,18 +113,18 @@ class IfThenElseStatementNode(ValuedExpressionNode):
         # Check semantics of the then and else expressions.
         errors_before = len(errors)
         
-        self.then_expression.check_semantics(scope, errors)
-        self.else_expression.check_semantics(scope, errors)
+        yield self._then_expression.check_semantics(scope, errors)
+        yield self._else_expression.check_semantics(scope, errors)
         
         if errors_before == len(errors):
-            then_returns = self.then_expression.has_return_value()
-            else_returns = self.else_expression.has_return_value()
+            then_returns = self._then_expression.has_return_value()
+            else_returns = self._else_expression.has_return_value()
             if then_returns and else_returns:
-                if self.then_expression.return_type != self.else_expression.return_type:
+                if self._then_expression.return_type is not self._else_expression.return_type:
                     # Check the special case of nil and records. 
                     valid_different_types = (RecordType, NilType)
-                    record_and_nil = (isinstance(self.then_expression.return_type, valid_different_types) and 
-                                      isinstance(self.else_expression.return_type, valid_different_types))
+                    record_and_nil = (isinstance(self._then_expression.return_type, valid_different_types) and 
+                                      isinstance(self._else_expression.return_type, valid_different_types))
                     if not record_and_nil:                    
                         message = 'The return type of the expressions of the if-then-else ' \
                                   'statement at line {line} is not the same'
@@ -134,7 +136,7 @@ class IfThenElseStatementNode(ValuedExpressionNode):
                         
             # Set the return type of the expression (if any).
             if then_returns and else_returns:
-                self._return_type = self.then_expression.return_type
+                self._return_type = self._then_expression.return_type
 
     def has_return_value(self):
         """
@@ -146,7 +148,11 @@ class IfThenElseStatementNode(ValuedExpressionNode):
         cambiar la implementación provista por la clase C{ValuedExpressionNode} que
         siempre retorna C{True}.   
         """
-        return self.then_expression.has_return_value()
+        # Follow the chains of nested if-then-else expressions without recursion.
+        expression = self._then_expression
+        while isinstance(expression, IfThenElseStatementNode):
+            expression = expression._then_expression
+        return expression.has_return_value()
 
     def generate_dot(self, generator):
         """
@@ -158,13 +164,13 @@ class IfThenElseStatementNode(ValuedExpressionNode):
         de la clase C{LanguageNode}.
         """
         me = generator.add_node(str(self.__class__.__name__))
-        condition = self.condition.generate_dot(generator)
-        then_expression = self.then_expression.generate_dot(generator)
-        else_expression = self.else_expression.generate_dot(generator)
+        condition = yield generator.visit(self.condition)
+        then_expression = yield generator.visit(self.then_expression)
+        else_expression = yield generator.visit(self.else_expression)
         generator.add_edge(me, condition)
         generator.add_edge(me, then_expression)
         generator.add_edge(me, else_expression)
-        return me
+        yield me
 
     def generate_code(self, generator):
         """
@@ -175,27 +181,27 @@ class IfThenElseStatementNode(ValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
+        self._scope.generate_code(generator)
         
-        self.condition.generate_code(generator)
+        yield self._condition.generate_code(generator)
         local_var = None
         if self.has_return_value():
-            code_type = self.return_type.code_type
+            code_type = self._return_type.code_type
             local_var = generator.define_local(code_type)
             
-        generator.add_statement('if({0})'.format(self.condition.code_name))
+        generator.add_statement('if({0})'.format(self._condition.code_name))
         generator.add_statement('{')
-        self.then_expression.generate_code(generator)
+        yield self._then_expression.generate_code(generator)
         if local_var:
             generator.add_statement('{0} = {1};'.format(local_var, 
-                                                        self.then_expression.code_name))
+                                                        self._then_expression.code_name))
         generator.add_statement('}')
         generator.add_statement('else')
         generator.add_statement('{')
-        self.else_expression.generate_code(generator)
+        yield self._else_expression.generate_code(generator)
         if local_var:
             generator.add_statement('{0} = {1};'.format(local_var, 
-                                                        self.else_expression.code_name))
+                                                        self._else_expression.code_name))
         generator.add_statement('}')
         if local_var:
             self._code_name = local_var
\ No newline at end of file
@@ -20,6 +20,8 @@ class IfThenStatementNode(NonValuedExpressionNode):
     de retorno. 
     """
     
+    __slots__ = ('_condition', '_then_expression')
+    
     def _get_condition(self):
         """
         Método para obtener el valor de la propiedad C{condition}.
@@ -74,19 +76,19 @@ class IfThenStatementNode(NonValuedExpressionNode):
         self._scope = scope
         
         # Check semantics of the condition expression.
-        self.condition.check_semantics(scope, errors)
-        if not self.condition.has_return_value():
+        yield self._condition.check_semantics(scope, errors)
+        if not self._condition.has_return_value():
             message = 'The condition of the if-then statement at line {line} ' \
                        'does not return a value'
             errors.append(message.format(line=self.line_number))
-        elif self.condition.return_type != IntegerType():
+        elif self._condition.return_type is not IntegerType():
             message = 'The condition of the if-then statement at line {line} ' \
                       'does not return an integer value'
             errors.append(message.format(line=self.line_number))
 
         # Check semantics of the then expression.
-        self.then_expression.check_semantics(scope, errors)
-        if self.then_expression.has_return_value():
+        yield self._then_expression.check_semantics(scope, errors)
+        if self._then_expression.has_return_value():
             message = 'The then expression of the if-then statement ' \
                       'at line {line} should not return a value'
             errors.append(message.format(line=self.line_number))
@@ -101,11 +103,11 @@ class IfThenStatementNode(NonValuedExpressionNode):
         de la clase C{LanguageNode}.
         """
         me = generator.add_node(str(self.__class__.__name__))
-        condition = self.condition.generate_dot(generator)
-        then_expression = self.then_expression.generate_dot(generator)
+        condition = yield generator.visit(self.condition)
+        then_expression = yield generator.visit(self.then_expression)
         generator.add_edge(me, condition)
         generator.add_edge(me, then_expression)
-        return me
+        yield me
 
     def generate_code(self, generator):
         """
@@ -116,10 +118,10 @@ class IfThenStatementNode(NonValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
+        self._scope.generate_code(generator)
         
-        self.condition.generate_code(generator)
-        generator.add_statement('if({0})'.format(self.condition.code_name))
+        yield self._condition.generate_code(generator)
+        generator.add_statement('if({0})'.format(self._condition.code_name))
         generator.add_statement('{')
-        self.then_expression.generate_code(generator)
+        yield self._then_expression.generate_code(generator)
         generator.add_statement('}')
\ No newline at end of file
@@ -18,6 +18,8 @@ class InferredVariableDeclarationNode(VariableDeclarationNode):
     recibe una expresión cuyo valor se le asignará a la variable y el 
     tipo de la variable se infiere del tipo de esta expresión.
     """
+    
+    __slots__ = ()
 
     def __init__(self, name, value):
         """
@@ -55,25 +57,27 @@ class InferredVariableDeclarationNode(VariableDeclarationNode):
         
         errors_before = len(errors)
         
-        self.value.check_semantics(self.scope, errors)
+        yield self._value.check_semantics(self._scope, errors)
         
         if errors_before != len(errors):
+            self._define_poisoned()
             return
         
-        if not self.value.has_return_value():
+        if not self._value.has_return_value():
             message = 'Non-valued expression assigned to a variable at line {line}'
             errors.append(message.format(line=self.line_number))
-        elif self.value.return_type == NilType():
+        elif self._value.return_type is NilType():
             message = 'Invalid nil assignment to a variable at line {line}'
             errors.append(message.format(line=self.line_number))
         else:
-            self._type = VariableType(self.value.return_type)
+            self._type = VariableType(self._value.return_type)
             
         if errors_before != len(errors):
+            self._define_poisoned()
             return            
         
         try:
-            self.scope.define_variable(self.name, self._type)
+            self._scope.define_variable(self._name, self._type)
         except ValueError:
             message = 'Could not hide a variable defined in the same scope at line {line}'
             errors.append(message.format(line=self.line_number))
@@ -89,7 +93,7 @@ class InferredVariableDeclarationNode(VariableDeclarationNode):
         """
         me = generator.add_node(str(self.__class__.__name__))
         name = generator.add_node(self.name)
-        value = self.value.generate_dot(generator)
+        value = yield generator.visit(self.value)
         generator.add_edge(me, name)
         generator.add_edge(me, value)
-        return me
+        yield me
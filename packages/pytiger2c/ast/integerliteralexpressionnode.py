@@ -16,6 +16,8 @@ class IntegerLiteralExpressionNode(ValuedExpressionNode):
     de retorno de esta expresión siempre será C{IntegerType}.
     """
     
+    __slots__ = ('_integer',)
+    
     def _get_integer(self):
         """
         Método para obtener el valor de la propiedad C{integer}.
@@ -56,8 +58,8 @@ class IntegerLiteralExpressionNode(ValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
+        self._scope.generate_code(generator)
         int_code_type = IntegerType().code_type
         local_var = generator.define_local(int_code_type)
-        generator.add_statement('{0} = {1};'.format(local_var, self.integer))
+        generator.add_statement('{0} = {1};'.format(local_var, self._integer))
         self._code_name = local_var
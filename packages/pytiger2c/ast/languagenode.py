@@ -5,6 +5,38 @@ Clase base de la jerarquía de los nodos del árbol de sintáxis abstracta.
 """
 
 
+# Attributes of the nodes that do not reference their children.
+_NON_FIELD_ATTRIBUTES = frozenset(['parent_node', '_scope'])
+
+# Names of the fields of each class of nodes, computed on first use.
+_field_names = {}
+
+
+def get_field_names(node_class):
+    """
+    Retorna los nombres de los atributos de una clase de nodos del árbol de 
+    sintáxis abstracta que pueden contener sus nodos hijos, es decir, los 
+    atributos declarados en C{__slots__} por la clase y sus clases base, 
+    excepto C{parent_node} y C{scope}.
+    
+    @type node_class: C{type}
+    @param node_class: Clase descendiente de C{LanguageNode}.
+    
+    @rtype: C{tuple}
+    @return: Nombres de los atributos, comenzando por los declarados en la 
+        clase base de la jerarquía.
+    """
+    names = _field_names.get(node_class)
+    if names is None:
+        names = []
+        for cls in reversed(node_class.__mro__):
+            for name in cls.__dict__.get('__slots__', ()):
+                if name not in _NON_FIELD_ATTRIBUTES:
+                    names.append(name)
+        names = _field_names[node_class] = tuple(names)
+    return names
+
+
 class LanguageNode(object):
     """
     Clase base de la jerarquía de los nodos del árbol de sintáxis abstracta.
@@ -12,49 +44,39 @@ class LanguageNode(object):
     Todas las clases deben heredar de la clase base C{LanguageNode} e implementar 
     los métodos C{check_semantics} y C{generate_code} según corresponda a la estructura 
     del lenguaje que representa.
-    """
     
-    def _get_line_number(self):
-        """
-        Método para obtener el valor de la propiedad C{line_number}.
-        
-        @rtype: C{int}
-        @return: Línea del flujo de caracteres de entrada donde se definió la
-            estructura representada por el nodo del árbol de sintáxis abstracta.
-        """
-        return self._line_number
+    Los métodos C{check_semantics}, C{generate_code} y C{generate_dot} de los nodos
+    que tienen hijos no llaman directamente a los métodos de sus hijos, sino que 
+    producen con C{yield} las tareas correspondientes y deben ejecutarse con la 
+    función C{run} del módulo C{pytiger2c.ast.traversal}. Consulte la 
+    documentación de este módulo.
     
-    def _set_line_number(self, line_number):
-        """
-        Método para cambiar el valor de la propiedad C{line_number}.
-        
-        @type line_number: C{int}
-        @param line_number: Línea del flujo de caracteres de entrada donde se definió
-            la estructura representada por el nodo del árbol de sintáxis abstracta.
-        """
-        self._line_number = line_number    
+    Los nodos no tienen diccionario de atributos: cada clase de la jerarquía 
+    declara en C{__slots__} los atributos que añade. Los atributos 
+    C{line_number}, C{span} y C{parent_node}, que se asignan durante el 
+    análisis sintáctico, se acceden directamente sin utilizar propiedades.
+    Los métodos C{check_semantics} y C{generate_code}, y los métodos 
+    auxiliares que se llaman con ellos en cada nodo, leen los atributos de 
+    los hijos directamente en lugar de utilizar las propiedades públicas, ya
+    que la llamada a la propiedad es una parte apreciable del tiempo de estas
+    fases. Los demás métodos utilizan las propiedades.
     
-    line_number = property(_get_line_number, _set_line_number)
+    @ivar line_number: Línea del flujo de caracteres de entrada donde se 
+        definió la estructura representada por el nodo del árbol de sintáxis 
+        abstracta.
     
-    def _get_parent_node(self):
-        """
-        Método para obtener el valor de la propiedad C{parent_node}.
-        
-        @rtype: C{LanguageNode}
-        @return: Referencia al nodo padre en el árbol de sintáxis abstracta.
-        """
-        return self._parent_node
+    @ivar span: Tupla C{(line, column, end)} con la línea y la columna 
+        (ambas comenzando en 1) del primer caracter de la estructura 
+        representada por el nodo y la posición del flujo de caracteres
+        de entrada siguiente a su último caracter. Será C{None} si el
+        análisis sintáctico se realizó sin calcular las posiciones o si
+        el nodo no corresponde a ninguna producción de la gramática.
     
-    def _set_parent_node(self, parent_node):
-        """
-        Método para cambiar el valor de la propiedad C{parent_node}.
-        
-        @type parent_node: C{LanguageNode}
-        @param parent_node: Referencia al nodo padre en el árbol de sintáxis abstracta.
-        """
-        self._parent_node = parent_node    
-        
-    parent_node = property(_get_parent_node, _set_parent_node)
+    @ivar parent_node: Referencia al nodo padre en el árbol de sintáxis 
+        abstracta.
+    """
+    
+    __slots__ = ('line_number', 'span', 'parent_node', '_scope')
     
     def _get_scope(self):
         """
@@ -73,8 +95,9 @@ class LanguageNode(object):
         Inicializa el nodo del árbol de sintáxis abstracta.
         """
         super(LanguageNode, self).__init__()
-        self._line_number = None
-        self._parent_node = None
+        self.line_number = None
+        self.span = None
+        self.parent_node = None
         self._scope = None
     
     def check_semantics(self, scope ,errors):
@@ -93,6 +116,10 @@ class LanguageNode(object):
             los errores semánticos encontrados durante la comprobación de la
             estructura del lenguaje representada por el nodo del árbol de 
             sintáxis abstracta.
+        
+        @return: Tarea de la comprobación semántica del nodo. Los nodos que no
+            tienen hijos pueden realizar la comprobación directamente y 
+            retornar C{None}.
         """
         raise NotImplementedError()
 
@@ -137,13 +164,14 @@ class LanguageNode(object):
         
         @type generator: C{DotGenerator}
         @param generator: Clase auxiliar utilizada en la generación del 
-            código Graphviz DOT.
+            código Graphviz DOT. Las tareas de los nodos hijos se deben 
+            obtener con su método C{visit}.
         
-        @rtype: C{str}
         @return: Identificador del nodo del grafo generado correspondiente
-            a este todo del árbol de sintáxis abstracta. Este identificador
-            podrá ser utilizado por otros nodos para añadir aristas al grafo
-            que tengan este nodo como uno de sus extremos. 
+            a este todo del árbol de sintáxis abstracta, o una tarea cuyo 
+            resultado es este identificador. El identificador podrá ser 
+            utilizado por otros nodos para añadir aristas al grafo que tengan
+            este nodo como uno de sus extremos. 
         """
         return generator.add_node(str(self.__class__.__name__))
 
@@ -156,6 +184,10 @@ class LanguageNode(object):
         @param generator: Clase auxiliar utilizada en la generación del 
             código C correspondiente a un programa Tiger.        
         
+        @return: Tarea de la generación de código del nodo. Los nodos que no
+            tienen hijos pueden generar el código directamente y retornar 
+            C{None}.
+        
         @raise CodeGenerationError: Esta excepción se lanzará cuando se produzca
             algún error durante la generación del código correspondiente al nodo.
             La excepción contendrá información acerca del error.
@@ -17,6 +17,8 @@ class LessThanOperatorNode(RelationalLogicalOperatorNode):
     cadenas de caracters del lenguaje Tiger.    
     """
     
+    __slots__ = ()
+    
     def __init__(self, left, right):
         """
         Inicializa la clase C{LessThanOperatorNode}.
@@ -5,6 +5,16 @@ Clase C{LetNode} del árbol de sintáxis abstracta.
 """
 
 from pytiger2c.ast.valuedexpressionnode import ValuedExpressionNode
+from pytiger2c.ast.aliastypedeclarationnode import AliasTypeDeclarationNode
+from pytiger2c.ast.recorddeclarationnode import RecordDeclarationNode
+from pytiger2c.ast.arraydeclarationnode import ArrayDeclarationNode
+from pytiger2c.ast.callabledeclarationnode import CallableDeclarationNode
+from pytiger2c.ast.variabledeclarationnode import VariableDeclarationNode
+from pytiger2c.ast.forstatementnode import ForStatementNode
+from pytiger2c.ast.functioncallnode import FunctionCallNode
+from pytiger2c.ast.traversal import Visitor
+from pytiger2c.dependencygraph import DependencyGraph
+from pytiger2c.recovery import must_stop
 from pytiger2c.scope import Scope, FakeScope
 
 
@@ -24,6 +34,8 @@ class LetNode(ValuedExpressionNode):
     expresiones.
     """
     
+    __slots__ = ('_type_declaration_groups', '_function_declaration_groups', '_variable_declarations', '_expressions')
+    
     def _get_type_declaration_groups(self):
         """
         Método para obtener el valor de la propiedad C{type_declaration_groups}.
@@ -135,6 +147,12 @@ class LetNode(ValuedExpressionNode):
         de las funciones: una primera vez para obtener los nombres de las funciones
         que se definen en cada grupo y una segunda vez para comprobar semánticamente
         el cuerpo de las funciones.
+        
+        Las definiciones mutuamente recursivas de tipos o de funciones en grupos
+        diferentes se detectan con grafos de dependencias entre las declaraciones
+        de tipos y entre las declaraciones de funciones, que se construyen luego
+        del primer recorrido y se consultan a través del ámbito falso utilizado
+        en el segundo recorrido.
         """
         self._scope = Scope(scope)
         all_types = set()
@@ -146,61 +164,59 @@ class LetNode(ValuedExpressionNode):
         
         # First pass through the nodes of the type declarations.
         for type_declaration_group in self._type_declaration_groups:
-            group_types = type_declaration_group.collect_definitions(self.scope, errors)
+            group_types = type_declaration_group.collect_definitions(self._scope, errors)
             groups_types.append(group_types)
             all_types.update(group_types)
             
-        if erros_before != len(errors):
+        if must_stop(errors, erros_before):
             return
             
         # Second pass through the nodes of the type declarations. The second pass
         # is divided in two parts: the first through the alias declaration and
         # the second through the rest of the declarations.
-        types_fake_scope = FakeScope(self.scope)
-        for index, type_declaration_group in enumerate(self._type_declaration_groups):
-            types_fake_scope.current_siblings = all_types - groups_types[index]
-            type_declaration_group.check_aliases_semantics(types_fake_scope, errors)
-        types_fake_scope.current_siblings = None
+        types_fake_scope = FakeScope(self._scope)
+        if len(self._type_declaration_groups) > 1:
+            types_fake_scope.type_graph = self._build_type_graph()
+        for type_declaration_group in self._type_declaration_groups:
+            yield type_declaration_group.check_aliases_semantics(types_fake_scope, errors)
         
-        if erros_before != len(errors):
+        if must_stop(errors, erros_before):
             return        
         
-        for index, type_declaration_group in enumerate(self._type_declaration_groups):
-            types_fake_scope.current_siblings = all_types - groups_types[index]
-            type_declaration_group.check_semantics(types_fake_scope, errors)
-        types_fake_scope.current_siblings = None
+        for type_declaration_group in self._type_declaration_groups:
+            yield type_declaration_group.check_semantics(types_fake_scope, errors)
         
-        if erros_before != len(errors):
+        if must_stop(errors, erros_before):
             return
             
         # First pass through the nodes of the function declarations.
         for func_declaration_group in self._function_declaration_groups:
-            group_functions = func_declaration_group.collect_definitions(self.scope, errors)
+            group_functions = func_declaration_group.collect_definitions(self._scope, errors)
             groups_functions.append(group_functions)
             all_functions.update(group_functions)
             
-        if erros_before != len(errors):
+        if must_stop(errors, erros_before):
             return            
             
         # The only pass through the nodes of the variable declarations.
         for variable_declaration in self._variable_declarations:
-            variable_declaration.check_semantics(self.scope, errors)
+            yield variable_declaration.check_semantics(self._scope, errors)
             
-        if erros_before != len(errors):
+        if must_stop(errors, erros_before):
             return             
             
         # Second pass through the nodes of the function declarations.
-        functions_fake_scope = FakeScope(self.scope)
-        for index, func_declaration_group in enumerate(self._function_declaration_groups):
-            functions_fake_scope.current_siblings = all_functions - groups_functions[index]
-            func_declaration_group.check_semantics(functions_fake_scope, errors)
-        functions_fake_scope.current_siblings = None
+        functions_fake_scope = FakeScope(self._scope)
+        if len(self._function_declaration_groups) > 1:
+            functions_fake_scope.function_graph = self._build_function_graph()
+        for func_declaration_group in self._function_declaration_groups:
+            yield func_declaration_group.check_semantics(functions_fake_scope, errors)
             
-        if erros_before != len(errors):
+        if must_stop(errors, erros_before):
             return            
         
         # The only pass through the expressions.
-        self._expressions.check_semantics(self.scope, errors)
+        yield self._expressions.check_semantics(self._scope, errors)
         
         # Setting the return value of the node.
         if self._expressions.has_return_value():
@@ -208,6 +224,112 @@ class LetNode(ValuedExpressionNode):
         else:
             self._return_type = None
 
+    def recheck_semantics(self, member, errors):
+        """
+        Comprueba semánticamente de nuevo una parte de esta estructura 
+        C{let-in-end}, ya comprobada sin errores, luego de sustituir alguno
+        de sus nodos descendientes. Este método es utilizado por la clase
+        C{IncrementalChecker}.
+        
+        Las declaraciones de funciones se comprueban nuevamente en el ámbito
+        falso utilizado en la comprobación de la estructura completa. Si
+        cambian las funciones que se llaman en el cuerpo de la declaración,
+        se actualiza el grafo de dependencias entre las funciones. La 
+        secuencia de expresiones se comprueba nuevamente en el ámbito de 
+        la estructura.
+        
+        @type member: C{LanguageNode}
+        @param member: Hijo de esta estructura que se debe comprobar: una 
+            declaración de función o procedimiento, una declaración de 
+            variable o la secuencia de expresiones.
+            
+        @type errors: C{list}
+        @param errors: Lista a la cual se deben añadir los mensajes de error.
+        
+        @return: Tarea cuyo resultado es C{True} si el resto de la estructura
+            y las expresiones que la contienen siguen siendo válidas. Si es 
+            C{False}, por ejemplo, porque cambió el tipo de una variable o el
+            valor de retorno de la estructura, se debe comprobar nuevamente la
+            estructura completa.
+        """
+        if member is self.expressions:
+            return_type = self.return_type
+            yield self.expressions.check_semantics(self.scope, errors)
+            if self.expressions.has_return_value():
+                self._return_type = self.expressions.return_type
+            else:
+                self._return_type = None
+            yield self.return_type is return_type
+        elif isinstance(member, CallableDeclarationNode) and member.scope is not None:
+            functions_fake_scope = member.scope.parent
+            graph = functions_fake_scope.function_graph
+            if graph is not None:
+                collector = _CallCollector()
+                collector.visit(member)
+                if collector.calls != graph.get_references(member.name):
+                    graph.replace_references(member.name, collector.calls)
+                    if graph.has_invalid_cycles():
+                        yield False
+                        return
+            functions_fake_scope.current_member = member.name
+            yield member.check_semantics(functions_fake_scope, errors)
+            functions_fake_scope.current_member = None
+            yield True
+        else:
+            yield False
+
+    def _build_type_graph(self):
+        """
+        Construye el grafo de dependencias entre las declaraciones de tipos
+        de la estructura C{let-in-end}.
+        
+        Las declaraciones se añaden en el orden en que se comprueban 
+        semánticamente: primero las declaraciones de alias de todos los
+        grupos y luego el resto de las declaraciones.
+        
+        @rtype: C{DependencyGraph}
+        @return: Grafo de dependencias entre las declaraciones de tipos.
+        """
+        graph = DependencyGraph()
+        aliases, others = [], []
+        for index, type_declaration_group in enumerate(self.type_declaration_groups):
+            for declaration in type_declaration_group.declarations:
+                if isinstance(declaration, AliasTypeDeclarationNode):
+                    aliases.append((index, declaration))
+                else:
+                    others.append((index, declaration))
+        for index, declaration in aliases + others:
+            graph.add_declaration(declaration.name, index)
+            if isinstance(declaration, AliasTypeDeclarationNode):
+                typenames = [declaration.alias_typename]
+            elif isinstance(declaration, RecordDeclarationNode):
+                typenames = declaration.fields_typenames
+            elif isinstance(declaration, ArrayDeclarationNode):
+                typenames = [declaration.values_typename]
+            for typename in typenames:
+                graph.add_reference(declaration.name, typename)
+        return graph
+    
+    def _build_function_graph(self):
+        """
+        Construye el grafo de dependencias entre las declaraciones de funciones
+        y procedimientos de la estructura C{let-in-end}. Cada declaración
+        depende de las funciones y procedimientos que se llaman en su cuerpo,
+        sin contar las llamadas a nombres redefinidos en un ámbito interior.
+        
+        @rtype: C{DependencyGraph}
+        @return: Grafo de dependencias entre las declaraciones de funciones.
+        """
+        graph = DependencyGraph()
+        for index, func_declaration_group in enumerate(self.function_declaration_groups):
+            for declaration in func_declaration_group.declarations:
+                graph.add_declaration(declaration.name, index)
+                collector = _CallCollector()
+                collector.visit(declaration)
+                for name in collector.calls:
+                    graph.add_reference(declaration.name, name)
+        return graph
+
     def generate_dot(self, generator):
         """
         Genera un grafo en formato Graphviz DOT correspondiente al árbol de 
@@ -219,17 +341,17 @@ class LetNode(ValuedExpressionNode):
         """
         me = generator.add_node(str(self.__class__.__name__))
         for type_declaration_group in self.type_declaration_groups:
-            type_declaration_group = type_declaration_group.generate_dot(generator)
+            type_declaration_group = yield generator.visit(type_declaration_group)
             generator.add_edge(me, type_declaration_group)
         for function_declaration_group in self.function_declaration_groups:
-            function_declaration_group = function_declaration_group.generate_dot(generator)
+            function_declaration_group = yield generator.visit(function_declaration_group)
             generator.add_edge(me, function_declaration_group)
         for variable_declaration in self.variable_declarations:
-            variable_declaration = variable_declaration.generate_dot(generator)
+            variable_declaration = yield generator.visit(variable_declaration)
             generator.add_edge(me, variable_declaration)
-        expressions = self.expressions.generate_dot(generator)
+        expressions = yield generator.visit(self.expressions)
         generator.add_edge(me, expressions)
-        return me
+        yield me
     
     def generate_code(self, generator):
         """
@@ -240,26 +362,95 @@ class LetNode(ValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        if self.scope.parent:
+        self._scope.generate_code(generator)
+        if self._scope.parent:
             statement = '{scope}->parent = {parent};'
-            statement = statement.format(scope=self.scope.code_name, 
-                                         parent=self.scope.parent.code_name)
+            statement = statement.format(scope=self._scope.code_name, 
+                                         parent=self._scope.parent.code_name)
             generator.add_statement(statement)
         
-        for type_declaration_group in self.type_declaration_groups:
-            type_declaration_group.generate_code(generator)
+        for type_declaration_group in self._type_declaration_groups:
+            yield type_declaration_group.generate_code(generator)
         
-        for variable_declaration in self.variable_declarations:
-            variable_declaration.generate_code(generator)
+        for variable_declaration in self._variable_declarations:
+            yield variable_declaration.generate_code(generator)
         
-        for function_declaration_group in self.function_declaration_groups:
-            function_declaration_group.generate_code(generator)
+        for function_declaration_group in self._function_declaration_groups:
+            yield function_declaration_group.generate_code(generator)
         
-        self.expressions.generate_code(generator)
+        yield self._expressions.generate_code(generator)
         
         if self.has_return_value():
-            self._code_name = self.expressions.code_name
-            
-            
-            
\ No newline at end of file
+            self._code_name = self._expressions.code_name
+
+
+class _CallCollector(Visitor):
+    """
+    Obtiene los nombres de las funciones y procedimientos que se llaman en
+    una declaración de función o procedimiento y que no están redefinidos,
+    como parámetros, variables o funciones, en un ámbito interior a ella.
+    """
+    
+    def __init__(self):
+        """
+        Inicializa el recorrido.
+        """
+        self.calls = set()
+        # Number of inner definitions of each name visible at the current node.
+        self._shadowed = {}
+    
+    def _define(self, names, count):
+        """
+        Añade o elimina definiciones interiores de los nombres dados.
+        """
+        shadowed = self._shadowed
+        for name in names:
+            shadowed[name] = shadowed.get(name, 0) + count
+    
+    def children(self, node):
+        """
+        Ver documentación del método C{children} en C{Visitor}.
+        
+        Los cuerpos de las funciones de una estructura C{let-in-end} se visitan
+        luego de sus declaraciones de variables, en el mismo orden en que se
+        comprueban semánticamente.
+        """
+        if isinstance(node, LetNode):
+            children = list(node.variable_declarations)
+            for func_declaration_group in node.function_declaration_groups:
+                children.extend(func_declaration_group.declarations)
+            children.append(node.expressions)
+            return children
+        return super(_CallCollector, self).children(node)
+    
+    def enter(self, node):
+        """
+        Ver documentación del método C{enter} en C{Visitor}.
+        """
+        if isinstance(node, FunctionCallNode):
+            if not self._shadowed.get(node.name):
+                self.calls.add(node.name)
+        elif isinstance(node, CallableDeclarationNode):
+            self._define(node.parameters_names, 1)
+        elif isinstance(node, ForStatementNode):
+            self._define([node.index_name], 1)
+        elif isinstance(node, LetNode):
+            for func_declaration_group in node.function_declaration_groups:
+                self._define([d.name for d in func_declaration_group.declarations], 1)
+        return True
+    
+    def exit(self, node):
+        """
+        Ver documentación del método C{exit} en C{Visitor}.
+        """
+        if isinstance(node, CallableDeclarationNode):
+            self._define(node.parameters_names, -1)
+        elif isinstance(node, ForStatementNode):
+            self._define([node.index_name], -1)
+        elif isinstance(node, VariableDeclarationNode):
+            # The variable is defined after the semantic check of its value.
+            self._define([node.name], 1)
+        elif isinstance(node, LetNode):
+            for func_declaration_group in node.function_declaration_groups:
+                self._define([d.name for d in func_declaration_group.declarations], -1)
+            self._define([d.name for d in node.variable_declarations], -1)
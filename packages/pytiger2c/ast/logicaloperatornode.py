@@ -12,6 +12,8 @@ class LogicalOperatorNode(BinaryOperatorNode):
     Clase C{LogicalOperatorNode} del árbol de sintáxis abstracta.
     """
     
+    __slots__ = ()
+    
     def __init__(self, left, right):
         """
         Inicializa la clase C{LogicalOperatorNode}.
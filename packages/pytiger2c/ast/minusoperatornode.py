@@ -16,6 +16,8 @@ class MinusOperatorNode(ArithmeticOperatorNode):
     del lenguaje Tiger.
     """
     
+    __slots__ = ()
+    
     def __init__(self, left, right):
         """
         Inicializa la clase C{MinusOperatorNode}.
@@ -44,25 +46,25 @@ class MinusOperatorNode(ArithmeticOperatorNode):
         
         errors_before = len(errors)
         
-        self.right.check_semantics(scope, errors)
+        yield self._right.check_semantics(scope, errors)
         
         if errors_before == len(errors):
-            if not self.right.has_return_value():
+            if not self._right.has_return_value():
                 message = 'Invalid use of minus operator with a non-valued right expression at line {line}'
                 errors.append(message.format(line=self.line_number)) 
-            elif self.right.return_type != IntegerType():
+            elif self._right.return_type is not IntegerType():
                 message = 'Invalid use of minus operator with a non-integer right value at line {line}'
                 errors.append(message.format(line=self.line_number))
 
         errors_before = len(errors)
         
-        self.left.check_semantics(scope, errors)
+        yield self._left.check_semantics(scope, errors)
         
         if errors_before == len(errors):
-            if not self.left.has_return_value():
+            if not self._left.has_return_value():
                 message = 'Invalid use of minus operator with a non-valued left expression at line {line}'
                 errors.append(message.format(line=self.line_number)) 
-            elif self.left.return_type != IntegerType():
+            elif self._left.return_type is not IntegerType():
                 message = 'Invalid use of minus operator with a non-integer left value at line {line}'
                 errors.append(message.format(line=self.line_number))
             
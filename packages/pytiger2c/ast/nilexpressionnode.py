@@ -16,6 +16,8 @@ class NilExpressionNode(ValuedExpressionNode):
     de retorno de esta expresión siempre será C{nil}.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """
         Inicializa la clase C{NilExpressionNode}.
@@ -44,7 +46,7 @@ class NilExpressionNode(ValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
+        self._scope.generate_code(generator)
         nil_code_type = NilType().code_type
         local_var = generator.define_local(nil_code_type)
         generator.add_statement('{0} = NULL;'.format(local_var))
@@ -12,6 +12,8 @@ class NonValuedExpressionNode(LanguageNode):
     Clase C{NonValuedExpressionNode} del árbol de sintáxis abstracta.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """
         Inicializa la clase C{NonValuedExpressionNode}.
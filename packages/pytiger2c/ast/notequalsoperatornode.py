@@ -14,6 +14,8 @@ class NotEqualsOperatorNode(EqualityLogicalOperatorNode):
     Representa el operador C{<>} entre dos expresiones del lenguaje Tiger.        
     """
     
+    __slots__ = ()
+    
     def __init__(self, left, right):
         """
         Inicializa la clase C{NotEqualsOperatorNode}.
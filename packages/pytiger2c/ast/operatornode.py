@@ -12,6 +12,8 @@ class OperatorNode(ValuedExpressionNode):
     Clase C{OperatorNode} del árbol de sintáxis abstracta.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """
         Inicializa la clase C{OperatorNode}.
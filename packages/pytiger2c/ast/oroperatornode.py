@@ -17,6 +17,8 @@ class OrOperatorNode(BinaryLogicalOperatorNode):
     de que el resultado de evaluar la expresión sea verdadero, 0 en otro caso.
     """
     
+    __slots__ = ()
+    
     def __init__(self, left, right):
         """
         Inicializa la clase C{OrOperatorNode}.
@@ -40,14 +42,14 @@ class OrOperatorNode(BinaryLogicalOperatorNode):
             algún error durante la generación del código correspondiente al nodo.
             La excepción contendrá información acerca del error.
         """
-        self.scope.generate_code(generator)
+        self._scope.generate_code(generator)
         result_var = generator.define_local(IntegerType().code_type)
-        self.left.generate_code(generator)
-        generator.add_statement('if ({left}) {{'.format(left=self.left.code_name))
+        yield self._left.generate_code(generator)
+        generator.add_statement('if ({left}) {{'.format(left=self._left.code_name))
         generator.add_statement('{result} = 1; }}'.format(result=result_var))
         generator.add_statement('else {')
-        self.right.generate_code(generator)
-        generator.add_statement('if ({right}) {{'.format(right=self.right.code_name))
+        yield self._right.generate_code(generator)
+        generator.add_statement('if ({right}) {{'.format(right=self._right.code_name))
         generator.add_statement('{result} = 1; }}'.format(result=result_var))
         generator.add_statement('else {')
         generator.add_statement('{result} = 0; }}'.format(result=result_var))
@@ -18,6 +18,8 @@ class ProcedureDeclarationNode(CallableDeclarationNode):
     y que sólo se llamará por sus efectos colaterales.
     """
     
+    __slots__ = ()
+    
     def __init__(self, name, parameters_names, parameters_typenames, body):
         """
         Inicializa la clase C{ProcedureDeclarationNode}.
@@ -63,20 +65,24 @@ class ProcedureDeclarationNode(CallableDeclarationNode):
         
         # Create and populate the scope with the parameters.
         self._scope = Scope(scope)
-        for parameter_name, parameter_type in zip(self.parameters_names, 
+        for parameter_name, parameter_type in zip(self._parameters_names, 
                                                   self.type.parameters_types):
-            self.scope.define_variable(parameter_name, VariableType(parameter_type))
+            try:
+                self._scope.define_variable(parameter_name, VariableType(parameter_type))
+            except ValueError:
+                # The header reported the repeated parameter.
+                pass
             
         # Check semantics of the body.        
-        self.body.check_semantics(self.scope, errors)
+        yield self._body.check_semantics(self._scope, errors)
         
         if errors_before != len(errors):
             return
         
-        if self.body.has_return_value():
+        if self._body.has_return_value():
             message = 'The body of the procedure {name} defined ' \
                       'at line {line} returns value'
-            errors.append(message.format(name=self.name, line=self.line_number))
+            errors.append(message.format(name=self._name, line=self.line_number))
 
     def generate_dot(self, generator):
         """
@@ -96,6 +102,6 @@ class ProcedureDeclarationNode(CallableDeclarationNode):
             generator.add_edge(me, param_name)
             param_typename = generator.add_node(param_typename)
             generator.add_edge(param_name, param_typename)
-        body = self.body.generate_dot(generator)
+        body = yield generator.visit(self.body)
         generator.add_edge(me, body)
-        return me
+        yield me
@@ -6,6 +6,8 @@ Clase C{RecordAccessNode} del árbol de sintáxis abstracta.
 
 from pytiger2c.ast.accessnode import AccessNode
 from pytiger2c.types.recordtype import RecordType
+from pytiger2c.types.errortype import ErrorType
+from pytiger2c.recovery import POISONED
 
 
 class RecordAccessNode(AccessNode):
@@ -20,6 +22,8 @@ class RecordAccessNode(AccessNode):
     correspondiente al campo que se quiere acceder. 
     """
     
+    __slots__ = ('_record', '_field_name')
+    
     def _get_field_name(self):
         """
         Método para obtener el valor de la propiedad C{field_name}.
@@ -74,18 +78,20 @@ class RecordAccessNode(AccessNode):
         
         errors_before = len(errors)
         
-        self.record.check_semantics(self.scope, errors)
+        yield self._record.check_semantics(self._scope, errors)
         
         if errors_before == len(errors):
-            if self.record.has_return_value():
-                record_type = self.record.return_type
+            if self._record.has_return_value():
+                record_type = self._record.return_type
                 if isinstance(record_type, RecordType):
-                    if self.field_name in record_type.fields_names:
-                        index = record_type.fields_names.index(self.field_name)
+                    if self._field_name in record_type.fields_names:
+                        index = record_type.fields_names.index(self._field_name)
                         self._return_type = record_type.fields_types[index]
+                        if self._return_type is ErrorType():
+                            errors.append(POISONED)
                     else:
                         message = 'Undefined field {field} on record access at line {line}'
-                        errors.append(message.format(field = self.field_name, 
+                        errors.append(message.format(field = self._field_name, 
                                                      line=self.line_number))
                 else:
                     message = 'Invalid record type on record access at line {line}'
@@ -104,11 +110,11 @@ class RecordAccessNode(AccessNode):
         de la clase C{LanguageNode}.
         """
         me = generator.add_node(str(self.__class__.__name__))
-        record = self.record.generate_dot(generator)
+        record = yield generator.visit(self.record)
         generator.add_edge(me, record)
         field_name = generator.add_node(self.field_name)
         generator.add_edge(me, field_name)
-        return me
+        yield me
     
     def generate_code(self, generator):
         """
@@ -122,12 +128,12 @@ class RecordAccessNode(AccessNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        self.record.generate_code(generator)
-        record_type = self.record.return_type
-        index = record_type.fields_names.index(self.field_name)
+        self._scope.generate_code(generator)
+        yield self._record.generate_code(generator)
+        record_type = self._record.return_type
+        index = record_type.fields_names.index(self._field_name)
         field_code_name = record_type.field_code_names[index]
         stmt = 'if({record} == NULL) {{ pytiger2c_error("{msg}"); }}'
-        stmt = stmt.format(record=self.record.code_name, msg='Getting a field of a nil record.')       
+        stmt = stmt.format(record=self._record.code_name, msg='Getting a field of a nil record.')       
         generator.add_statement(stmt)
-        self._code_name = '{record}->{field}'.format(record=self.record.code_name, field=field_code_name)
+        self._code_name = '{record}->{field}'.format(record=self._record.code_name, field=field_code_name)
@@ -6,6 +6,7 @@ Clase C{RecordDeclarationNode} del árbol de sintáxis abstracta.
 
 from pytiger2c.ast.typedeclarationnode import TypeDeclarationNode
 from pytiger2c.types.recordtype import RecordType
+from pytiger2c.types.errortype import ErrorType
 
 
 class RecordDeclarationNode(TypeDeclarationNode):
@@ -13,6 +14,8 @@ class RecordDeclarationNode(TypeDeclarationNode):
     Clase C{RecordDeclarationNode} del árbol de sintáxis abstracta.
     """
     
+    __slots__ = ('_fields_names', '_fields_typenames')
+    
     def _get_fields_names(self):
         """
         Método para obtener el valor de la propiedad C{fields_names}.
@@ -74,12 +77,13 @@ class RecordDeclarationNode(TypeDeclarationNode):
         fields_types = []
         for index, field_typename in enumerate(self.type.fields_typenames):
             try:
-                field_type = self.scope.get_type_definition(field_typename)
+                field_type = self._scope.get_type_definition(field_typename)
             except KeyError:
                 message = 'Undefined type {type} of the field #{index} ' \
                           'of the record {name} at line {line}'
                 errors.append(message.format(type=field_typename, index=index + 1, 
-                                             name=self.name, line=self.line_number))
+                                             name=self._name, line=self.line_number))
+                fields_types.append(ErrorType())
             else:
                 fields_types.append(field_type)
         self.type.fields_types = fields_types
@@ -112,7 +116,7 @@ class RecordDeclarationNode(TypeDeclarationNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
+        self._scope.generate_code(generator)
         code_name = self.type.code_name
         field_names = self.type.fields_names
         field_code_types = [i.code_type for i in self.type.fields_types]
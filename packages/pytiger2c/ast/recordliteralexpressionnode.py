@@ -7,6 +7,8 @@ Clase C{RecordLiteralExpressionNode} del árbol de sintáxis abstracta.
 from pytiger2c.ast.valuedexpressionnode import ValuedExpressionNode
 from pytiger2c.types.recordtype import RecordType
 from pytiger2c.types.niltype import NilType
+from pytiger2c.types.errortype import ErrorType
+from pytiger2c.recovery import POISONED
 
 
 class RecordLiteralExpressionNode(ValuedExpressionNode):
@@ -20,6 +22,8 @@ class RecordLiteralExpressionNode(ValuedExpressionNode):
     a los valores que se le quieren dar a cada campo del record.
     """
     
+    __slots__ = ('_type_name', '_fields_names', '_fields_values')
+    
     def _get_type_name(self):
         """
         Método para obtener el valor de la propiedad C{type_name}.
@@ -88,17 +92,19 @@ class RecordLiteralExpressionNode(ValuedExpressionNode):
         errors_before = len(errors)
 
         try:
-            self._return_type = self.scope.get_type_definition(self.type_name)
+            self._return_type = self._scope.get_type_definition(self._type_name)
         except KeyError:
             message = 'Undefined type {name} at line {line}'
             errors.append(message.format(name=self._type_name, line=self.line_number))
             
         if errors_before == len(errors):
-            if isinstance(self.return_type, RecordType):
+            if self._return_type is ErrorType():
+                errors.append(POISONED)
+            elif isinstance(self._return_type, RecordType):
                 fields_names_given = len(self._fields_names)
-                fields_names_original = len(self.return_type.fields_names)
+                fields_names_original = len(self._return_type.fields_names)
                 if fields_names_given == fields_names_original:
-                    self.check_parameters(errors)
+                    yield self.check_parameters(errors)
                 else:
                     message = 'Invalid number of fields in record literal at line {line}'
                     errors.append(message.format(line=self.line_number))
@@ -118,29 +124,32 @@ class RecordLiteralExpressionNode(ValuedExpressionNode):
         @param errors: Lista a la cual se deben añadir los mensajes de error de
             los errores semánticos encontrados durante esta comprobación.
         """
-        for index in xrange(len(self.fields_names)):
-            if self.fields_names[index] != self.return_type.fields_names[index]:
+        for index in xrange(len(self._fields_names)):
+            if self._fields_names[index] != self._return_type.fields_names[index]:
                 message = 'Invalid name {name} of the field #{index} of ' \
                           'the record literal at line {line}'
-                errors.append(message.format(name=self.fields_names[index], index=index + 1,
+                errors.append(message.format(name=self._fields_names[index], index=index + 1,
                                              line=self.line_number))
 
             errors_before = len(errors)
             
-            self.fields_values[index].check_semantics(self.scope, errors)
+            yield self._fields_values[index].check_semantics(self._scope, errors)
             
             if errors_before == len(errors): 
-                if not self.fields_values[index].has_return_value():
+                if self._return_type.fields_types[index] is ErrorType():
+                    # The declaration of the record reported the error.
+                    pass
+                elif not self._fields_values[index].has_return_value():
                     message = 'Invalid non valued expression for the field #{index} ' \
                               'of the record literal at line {line}'
                     errors.append(message.format(index=index + 1, line=self.line_number))
-                elif self.fields_values[index].return_type == NilType():
-                    if not isinstance(self.return_type.fields_types[index], RecordType):
+                elif self._fields_values[index].return_type is NilType():
+                    if not isinstance(self._return_type.fields_types[index], RecordType):
                         message = 'Invalid nil assignment to the field #{index} ' \
                                   'of the record literal at line {line}'
                         errors.append(message.format(index=index + 1, line=self.line_number))
-                elif (self.fields_values[index].return_type != 
-                      self.return_type.fields_types[index]):
+                elif (self._fields_values[index].return_type is not 
+                      self._return_type.fields_types[index]):
                     message = 'Invalid type for field #{index} of ' \
                               'the record literal at line {line}'
                     errors.append(message.format(index=index + 1, line=self.line_number))
@@ -160,9 +169,9 @@ class RecordLiteralExpressionNode(ValuedExpressionNode):
         for field_name, field_value in zip(self.fields_names, self.fields_values):
             field_name = generator.add_node(field_name)
             generator.add_edge(me, field_name)
-            field_value = field_value.generate_dot(generator)
+            field_value = yield generator.visit(field_value)
             generator.add_edge(field_name, field_value)
-        return me
+        yield me
     
     def generate_code(self, generator):
         """
@@ -173,19 +182,19 @@ class RecordLiteralExpressionNode(ValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
+        self._scope.generate_code(generator)
         
-        record_code_type = self.return_type.code_type
+        record_code_type = self._return_type.code_type
         local_var = generator.define_local(record_code_type)
         statement = '{local_var} = pytiger2c_malloc(sizeof({type}));'
         statement = statement.format(local_var = local_var, 
                                      type = record_code_type[:-1])
         generator.add_statement(statement)
         # Initialize the record.
-        for field_value in self.fields_values:
-            field_value.generate_code(generator)
-        for field_value, field_code_name in zip(self.fields_values, 
-                                                self.return_type.field_code_names):
+        for field_value in self._fields_values:
+            yield field_value.generate_code(generator)
+        for field_value, field_code_name in zip(self._fields_values, 
+                                                self._return_type.field_code_names):
             statement = '{local_var}->{field} = {value};'
             statement = statement.format(local_var = local_var, 
                                          field = field_code_name,
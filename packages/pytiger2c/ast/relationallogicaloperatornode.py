@@ -19,6 +19,8 @@ class RelationalLogicalOperatorNode(LogicalOperatorNode):
     que C{>=}.
     """
     
+    __slots__ = ('_code_operator',)
+    
     def __init__(self, left, right):
         """
         Inicializa la clase C{RelationalLogicalOperatorNode}.
@@ -52,11 +54,11 @@ class RelationalLogicalOperatorNode(LogicalOperatorNode):
         
         errors_before = len(errors)
         
-        self.right.check_semantics(scope, errors)
+        yield self._right.check_semantics(scope, errors)
         
         if errors_before == len(errors):
-            if self.right.has_return_value():
-                if self.right.return_type not in valid_types: 
+            if self._right.has_return_value():
+                if self._right.return_type not in valid_types: 
                     message = 'Invalid type of right operand in the binary ' \
                               'relational operator at line {line}'
                     errors.append(message.format(line=self.line_number))            
@@ -67,11 +69,11 @@ class RelationalLogicalOperatorNode(LogicalOperatorNode):
         
         errors_before = len(errors)
             
-        self.left.check_semantics(scope, errors)
+        yield self._left.check_semantics(scope, errors)
         
         if errors_before == len(errors):
-            if self.left.has_return_value():
-                if self.left.return_type not in valid_types: 
+            if self._left.has_return_value():
+                if self._left.return_type not in valid_types: 
                     message = 'Invalid type of left operand in the binary ' \
                               'relational operator at line {line}'
                     errors.append(message.format(line=self.line_number))            
@@ -80,7 +82,7 @@ class RelationalLogicalOperatorNode(LogicalOperatorNode):
                           'non-valued left expression at line {line}'
                 errors.append(message.format(line=self.line_number))
                 
-            if self.right.return_type != self.left.return_type:
+            if self._right.return_type is not self._left.return_type:
                 message = 'Types of left and right operands of the binary ' \
                           'relational operator at line {line} does not match'
                 errors.append(message.format(line=self.line_number))
@@ -100,17 +102,17 @@ class RelationalLogicalOperatorNode(LogicalOperatorNode):
             algún error durante la generación del código correspondiente al nodo.
             La excepción contendrá información acerca del error.
         """
-        self.scope.generate_code(generator)
-        self.left.generate_code(generator)
-        self.right.generate_code(generator)
+        self._scope.generate_code(generator)
+        yield self._left.generate_code(generator)
+        yield self._right.generate_code(generator)
         result_var = generator.define_local(IntegerType().code_type)
-        if isinstance(self.left.return_type, StringType):
+        if isinstance(self._left.return_type, StringType):
             stmt = '{result} = (pytiger2c_strcmp({left}, {right}) {op} 0);'
         else:
             stmt = '{result} = ({left} {op} {right});'
         stmt = stmt.format(result=result_var, 
                            op=self._code_operator,
-                           left=self.left.code_name, 
-                           right=self.right.code_name)
+                           left=self._left.code_name, 
+                           right=self._right.code_name)
         generator.add_statement(stmt)
         self._code_name = result_var
@@ -8,6 +8,7 @@ from pytiger2c.ast.variabledeclarationnode import VariableDeclarationNode
 from pytiger2c.types.niltype import NilType
 from pytiger2c.types.recordtype import RecordType
 from pytiger2c.types.variabletype import VariableType
+from pytiger2c.types.errortype import ErrorType
 
 
 class StaticVariableDeclarationNode(VariableDeclarationNode):
@@ -19,6 +20,8 @@ class StaticVariableDeclarationNode(VariableDeclarationNode):
     valor se le asignará a la variable, además del tipo que tendrá la misma.
     """
     
+    __slots__ = ('_type_name',)
+    
     def _get_type_name(self):
         """
         Método para obtener el valor de la propiedad C{type_name}
@@ -70,9 +73,10 @@ class StaticVariableDeclarationNode(VariableDeclarationNode):
         
         errors_before = len(errors)
         
-        self.value.check_semantics(self._scope, errors)
+        yield self._value.check_semantics(self._scope, errors)
         
         if errors_before != len(errors):
+            self._define_poisoned()
             return
         
         try:
@@ -83,24 +87,29 @@ class StaticVariableDeclarationNode(VariableDeclarationNode):
             errors.append(message.format(line=self.line_number))
             
         if errors_before != len(errors):
+            self._define_poisoned()
             return
                 
-        if not self.value.has_return_value():
+        if self.type is ErrorType():
+            # The declaration of the type reported the error.
+            pass
+        elif not self._value.has_return_value():
             message = 'Non valued expression assigned to a variable at line {line}'
             errors.append(message.format(line=self.line_number))
-        elif self.value.return_type == NilType():
+        elif self._value.return_type is NilType():
             if not isinstance(self.type, RecordType):
                 message = 'Invalid assignment of nil to a non record at line {line}'
                 errors.append(message.format(line=self.line_number))
-        elif self.value.return_type != self.type:
+        elif self._value.return_type is not self.type:
             message = 'Invalid assignment type variable at line {line}'
             errors.append(message.format(line=self.line_number))
         
         if errors_before != len(errors):
+            self._define_poisoned()
             return
         
         try:
-            self._scope.define_variable(self.name, self._type)
+            self._scope.define_variable(self._name, self._type)
         except ValueError:
             message = 'Invalid variable name at line {line}'
             errors.append(message.format(line=self.line_number))
@@ -117,8 +126,8 @@ class StaticVariableDeclarationNode(VariableDeclarationNode):
         me = generator.add_node(str(self.__class__.__name__))
         name = generator.add_node(self.name)
         type_name = generator.add_node(self.type_name)
-        value = self.value.generate_dot(generator)
+        value = yield generator.visit(self.value)
         generator.add_edge(me, name)
         generator.add_edge(me, type_name)
         generator.add_edge(me, value)
-        return me
+        yield me
@@ -16,6 +16,8 @@ class StringLiteralExpressionNode(ValuedExpressionNode):
     retorno de esta éxpresión siempre será C{StringType}.
     """
     
+    __slots__ = ('_string',)
+    
     def _get_string(self):
         """
         Método para obtener el valor de la propiedad C{string}.
@@ -56,7 +58,7 @@ class StringLiteralExpressionNode(ValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
+        self._scope.generate_code(generator)
         string_code_type = StringType().code_type
         local_var = generator.define_local(string_code_type)
         statement = '{local_var} = pytiger2c_malloc(sizeof({type}));'
@@ -65,10 +67,10 @@ class StringLiteralExpressionNode(ValuedExpressionNode):
         generator.add_statement(statement)
         statement = '{local_var}->data = "{value}";'
         statement = statement.format(local_var = local_var,
-                                     value = self.string)
+                                     value = self._string)
         generator.add_statement(statement)
         statement = '{local_var}->length = strlen("{value}");'
         statement = statement.format(local_var = local_var,
-                                     value = self.string)
+                                     value = self._string)
         generator.add_statement(statement)
         self._code_name = local_var
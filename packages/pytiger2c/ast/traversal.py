@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+
+"""
+Recorrido del árbol de sintáxis abstracta utilizando una pila explícita.
+
+Los programas generados automáticamente pueden contener cadenas muy largas
+de operadores, de expresiones C{if-then-else} o de expresiones C{let}
+anidadas. Si la comprobación semántica, la generación de código o la
+generación del grafo DOT se implementaran recursivamente, la profundidad de
+estos árboles estaría limitada por la pila de Python. En su lugar, los
+métodos C{check_semantics}, C{generate_code} y C{generate_dot} de los nodos
+son tareas: generadores que, en lugar de llamar directamente al método del
+nodo hijo, producen con C{yield} la tarea correspondiente al hijo. La
+función C{run} de este módulo ejecuta las tareas manteniendo una pila de
+generadores, por lo que la profundidad del árbol solamente está limitada
+por la memoria disponible. En el caso de C{generate_dot}, la tarea de cada
+hijo se obtiene con el método C{visit} de la clase C{DotGenerator}, que
+decide si el hijo se incluye en el grafo. Por ejemplo::
+
+    def generate_dot(self, generator):
+        me = generator.add_node(str(self.__class__.__name__))
+        left = yield generator.visit(self._left)
+        generator.add_edge(me, left)
+        yield me
+
+Las instrucciones anteriores a la primera tarea hija y posteriores a la
+última corresponden a la entrada y a la salida del nodo. Cuando una tarea
+produce un valor que no es un generador, el valor se le envía de vuelta
+inmediatamente, y el último de estos valores es el resultado de la tarea.
+De esta forma, los métodos de los nodos que no tienen hijos pueden ser
+funciones normales que retornan su resultado.
+
+Para los recorridos que no necesitan controlar el orden de los hijos se
+puede utilizar la clase C{Visitor}, que llama a los métodos C{enter} y
+C{exit} al entrar y al salir de cada nodo.
+"""
+
+import sys
+from types import GeneratorType
+
+from pytiger2c.ast.languagenode import LanguageNode, get_field_names
+
+
+def run(task):
+    """
+    Ejecuta una tarea del recorrido del árbol de sintáxis abstracta y todas
+    las tareas que esta produzca, utilizando una pila explícita.
+
+    Cada vez que la tarea que se está ejecutando produce un generador, este
+    se añade a la pila y se ejecuta hasta terminar; su resultado se envía
+    como el valor de la expresión C{yield} de la tarea que lo produjo. Las
+    excepciones lanzadas por una tarea se lanzan en la tarea que la produjo.
+
+    @type task: C{generator}
+    @param task: Tarea que se debe ejecutar. Si no es un generador, se
+        considera el resultado de una tarea ya ejecutada.
+
+    @return: Resultado de la tarea, es decir, el último valor que produjo
+        que no es un generador o C{None} si no produjo ninguno.
+    """
+    if type(task) is not GeneratorType:
+        return task
+    stack = [task]
+    results = [None]
+    value = None
+    error = None
+    while stack:
+        try:
+            if error is None:
+                item = stack[-1].send(value)
+            else:
+                error, exc_info = None, error
+                item = stack[-1].throw(*exc_info)
+        except StopIteration:
+            stack.pop()
+            value = results.pop()
+            continue
+        except Exception:
+            stack.pop()
+            results.pop()
+            if not stack:
+                raise
+            error = sys.exc_info()
+            continue
+        if type(item) is GeneratorType:
+            stack.append(item)
+            results.append(None)
+            value = None
+        else:
+            results[-1] = value = item
+    return value
+
+
+class Visitor(object):
+    """
+    Recorrido en profundidad del árbol de sintáxis abstracta utilizando una
+    pila explícita.
+
+    Las clases descendientes redefinen los métodos C{enter} y C{exit}, que se
+    llaman al entrar y al salir de cada nodo. Los hijos de cada nodo se
+    visitan en el orden en que se declaran sus atributos.
+    """
+
+    def visit(self, node):
+        """
+        Recorre el árbol de sintáxis abstracta del cual un nodo es raíz.
+
+        @type node: C{LanguageNode}
+        @param node: Nodo raíz del árbol.
+        """
+        stack = [(node, None)]
+        while stack:
+            node, children = stack[-1]
+            if children is None:
+                if self.enter(node) is False:
+                    children = iter(())
+                else:
+                    children = iter(self.children(node))
+                stack[-1] = (node, children)
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                self.exit(node)
+            else:
+                stack.append((child, None))
+
+    def children(self, node):
+        """
+        Retorna los nodos hijos de un nodo del árbol de sintáxis abstracta.
+
+        @type node: C{LanguageNode}
+        @param node: Nodo del árbol de sintáxis abstracta.
+
+        @rtype: C{list}
+        @return: Nodos hijos en el orden en que se declaran los atributos
+            que los contienen.
+        """
+        children = []
+        for name in get_field_names(type(node)):
+            value = getattr(node, name, None)
+            if isinstance(value, LanguageNode):
+                children.append(value)
+            elif isinstance(value, list):
+                children.extend([item for item in value if isinstance(item, LanguageNode)])
+        return children
+
+    def enter(self, node):
+        """
+        Método que se llama al entrar a un nodo, antes de visitar sus hijos.
+
+        @type node: C{LanguageNode}
+        @param node: Nodo del árbol de sintáxis abstracta.
+
+        @rtype: C{bool}
+        @return: Si retorna C{False}, no se visitan los hijos del nodo.
+        """
+        return True
+
+    def exit(self, node):
+        """
+        Método que se llama al salir de un nodo, después de visitar sus hijos.
+
+        @type node: C{LanguageNode}
+        @param node: Nodo del árbol de sintáxis abstracta.
+        """
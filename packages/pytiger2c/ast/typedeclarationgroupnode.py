@@ -6,6 +6,7 @@ Clase C{TypeDeclarationGroupNode} del árbol de sintáxis abstracta.
 
 from pytiger2c.ast.declarationgroupnode import DeclarationGroupNode
 from pytiger2c.ast.aliastypedeclarationnode import AliasTypeDeclarationNode
+from pytiger2c.recovery import must_stop
 
 
 class TypeDeclarationGroupNode(DeclarationGroupNode):
@@ -22,6 +23,8 @@ class TypeDeclarationGroupNode(DeclarationGroupNode):
     que conduce a situaciones ambiguas.
     """
     
+    __slots__ = ()
+    
     def __init__(self):
         """
         Inicializa la clase C{TypeDeclarationGroupNode}.
@@ -46,6 +49,7 @@ class TypeDeclarationGroupNode(DeclarationGroupNode):
         @return: Conjunto con los nombres de los tipos definidos en este grupo.                
         """
         definitions = set()
+        errors_before = len(errors)
         # Fill the types and alias dictionaries from the declaration lists.
         for declaration_node in self._declarations:
             try:
@@ -55,7 +59,9 @@ class TypeDeclarationGroupNode(DeclarationGroupNode):
                           'defined in this scope at line {line}'
                 errors.append(message.format(name=declaration_node.name,
                                              line=declaration_node.line_number))
-                return definitions
+                if must_stop(errors, errors_before):
+                    return definitions
+                continue
             definitions.add(declaration_node.name)
         # The resolution of the aliases takes place in the semantic 
         # check of the alias declaration node. 
@@ -76,13 +82,13 @@ class TypeDeclarationGroupNode(DeclarationGroupNode):
         """
         self._scope  = scope
         errors_before = len(errors)
-        for declaration in self.declarations:
+        for declaration in self._declarations:
             if isinstance(declaration, AliasTypeDeclarationNode):
-                self.scope.current_member = declaration.name
-                declaration.check_semantics(self.scope, errors)
-            if errors_before != len(errors):
+                self._scope.current_member = declaration.name
+                yield declaration.check_semantics(self._scope, errors)
+            if must_stop(errors, errors_before):
                 return
-        self.scope.current_member = None
+        self._scope.current_member = None
 
     def check_semantics(self, scope, errors):
         """
@@ -105,13 +111,13 @@ class TypeDeclarationGroupNode(DeclarationGroupNode):
         """
         self._scope  = scope
         errors_before = len(errors)
-        for declaration in self.declarations:
+        for declaration in self._declarations:
             if not isinstance(declaration, AliasTypeDeclarationNode):
-                self.scope.current_member = declaration.name
-                declaration.check_semantics(self.scope, errors)
-            if errors_before != len(errors):
+                self._scope.current_member = declaration.name
+                yield declaration.check_semantics(self._scope, errors)
+            if must_stop(errors, errors_before):
                 return
-        self.scope.current_member = None
+        self._scope.current_member = None
         
     def generate_code(self, generator):
         """
@@ -122,5 +128,5 @@ class TypeDeclarationGroupNode(DeclarationGroupNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        for declaration in self.declarations:
-            declaration.generate_code(generator)
+        for declaration in self._declarations:
+            yield declaration.generate_code(generator)
@@ -16,6 +16,8 @@ class TypeDeclarationNode(DeclarationNode):
     como tipos válidos de Tiger.
     """
     
+    __slots__ = ('_name', '_type')
+    
     def _get_name(self):
         """
         Método para obtener el valor de la propiedad C{name}.
@@ -17,6 +17,8 @@ class UnaryMinusOperatorNode(UnaryOperatorNode):
     devuelvan valores enteros. 
     """
     
+    __slots__ = ()
+    
     def __init__(self, expression):
         """
         Inicializa la clase C{UnaryMinusOperatorNode}.
@@ -45,11 +47,11 @@ class UnaryMinusOperatorNode(UnaryOperatorNode):
         
         errors_before = len(errors)
         
-        self.expression.check_semantics(scope, errors)
+        yield self._expression.check_semantics(scope, errors)
         
         if errors_before == len(errors):
-            if self.expression.has_return_value():
-                if self.expression.return_type != IntegerType():
+            if self._expression.has_return_value():
+                if self._expression.return_type is not IntegerType():
                     message = 'The expression of the unary minus operator at line {line} ' \
                               'does not return an integer value'
                     errors.append(message.format(line=self.line_number))
@@ -69,9 +71,9 @@ class UnaryMinusOperatorNode(UnaryOperatorNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        self.expression.generate_code(generator)
+        self._scope.generate_code(generator)
+        yield self._expression.generate_code(generator)
         local_var = generator.define_local(IntegerType().code_type)
-        stmt = '{var} = -1 * {expr};'.format(var=local_var, expr=self.expression.code_name)
+        stmt = '{var} = -1 * {expr};'.format(var=local_var, expr=self._expression.code_name)
         generator.add_statement(stmt)
         self._code_name = local_var
@@ -15,6 +15,8 @@ class UnaryOperatorNode(OperatorNode):
     abstracta que representan operadores unarios de Tiger.
     """
     
+    __slots__ = ('_expression',)
+    
     def _get_expression(self):
         """
         Método para obtener el valor de la propiedad C{expression}.
@@ -44,6 +46,6 @@ class UnaryOperatorNode(OperatorNode):
         de la clase C{LanguageNode}.
         """
         me = generator.add_node(str(self.__class__.__name__))
-        expression = self.expression.generate_dot(generator)
+        expression = yield generator.visit(self.expression)
         generator.add_edge(me, expression)
-        return me
+        yield me
@@ -20,6 +20,8 @@ class ValuedExpressionNode(LanguageNode):
     el caso excepcional en que la expresión no tenga ningún valor de retorno.
     """
     
+    __slots__ = ('_return_type', '_code_name')
+    
     def _get_return_type(self):
         """
         Método para obtener el valor de la propiedad C{return_type}.
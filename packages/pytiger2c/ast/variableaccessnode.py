@@ -5,6 +5,8 @@ Clase C{VariableAccessNode} del árbol de sintáxis abstracta.
 """
 
 from pytiger2c.ast.accessnode import AccessNode
+from pytiger2c.types.errortype import ErrorType
+from pytiger2c.recovery import POISONED
 
 
 class VariableAccessNode(AccessNode):
@@ -17,6 +19,8 @@ class VariableAccessNode(AccessNode):
     el nombre de la variable que representa.
     """
     
+    __slots__ = ('_name',)
+    
     def _get_name(self):
         """
         Método para obtener el valor de la propiedad C{name}.
@@ -54,14 +58,16 @@ class VariableAccessNode(AccessNode):
         """
         self._scope = scope
         try:
-            definition = self.scope.get_variable_definition(self.name)
+            definition = self._scope.get_variable_definition(self._name)
             self._return_type, self._read_only = definition.type, definition.read_only 
+            if self._return_type is ErrorType():
+                errors.append(POISONED)
         except ValueError:
             message = 'The name {name} used at line {line} is not a variable'
-            errors.append(message.format(name = self.name, line=self.line_number))
+            errors.append(message.format(name = self._name, line=self.line_number))
         except KeyError:
             message = 'Undefined variable {name} at line {line}'
-            errors.append(message.format(name = self.name, line=self.line_number))
+            errors.append(message.format(name = self._name, line=self.line_number))
 
     def generate_dot(self, generator):
         """
@@ -89,5 +95,5 @@ class VariableAccessNode(AccessNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        self._code_name = self.scope.get_variable_code(self.name)
+        self._scope.generate_code(generator)
+        self._code_name = self._scope.get_variable_code(self._name)
@@ -9,6 +9,9 @@ from pytiger2c.types.integertype import IntegerType
 from pytiger2c.types.stringtype import StringType
 from pytiger2c.types.recordtype import RecordType
 from pytiger2c.types.arraytype import ArrayType
+from pytiger2c.types.errortype import ErrorType
+from pytiger2c.types.variabletype import VariableType
+from pytiger2c.recovery import get_active_recovery
 
 
 class VariableDeclarationNode(DeclarationNode):
@@ -16,6 +19,8 @@ class VariableDeclarationNode(DeclarationNode):
     Clase C{VariableDeclarationNode} del árbol de sintáxis abstracta.
     """
     
+    __slots__ = ('_name', '_value', '_type')
+    
     def _get_name(self):
         """
         Método para obtener el valor de la propiedad C{name}
@@ -56,6 +61,21 @@ class VariableDeclarationNode(DeclarationNode):
         self._value = value
         self._type = None
     
+    def _define_poisoned(self):
+        """
+        Define la variable con el tipo C{ErrorType} luego de que su declaración
+        reporta errores, si hay un objeto C{ErrorRecovery} activo. De esta 
+        forma, los usos de la variable no reportan nuevos errores. Consulte la
+        documentación del módulo C{pytiger2c.recovery}.
+        """
+        if get_active_recovery() is not None:
+            self._type = VariableType(ErrorType())
+            try:
+                self.scope.define_variable(self.name, self._type)
+            except ValueError:
+                # The variable is already defined in this scope.
+                pass
+    
     def generate_code(self, generator):
         """
         Genera el código correspondiente a la estructura del lenguaje Tiger
@@ -65,8 +85,8 @@ class VariableDeclarationNode(DeclarationNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
-        var_code = self.scope.get_variable_code(self.name)
+        self._scope.generate_code(generator)
+        var_code = self._scope.get_variable_code(self._name)
         # Give a default value to the variables. This should be done before generating
         # code for the value of the variable because the value could be a function
         # call that returns the value of the variable being defined.
@@ -82,6 +102,6 @@ class VariableDeclarationNode(DeclarationNode):
             generator.add_statement(stmt)
         elif isinstance(self._type.type, RecordType):
             generator.add_statement('{0} = NULL;'.format(var_code))
-        self.value.generate_code(generator)
-        stmt = '{var} = {value};'.format(var=var_code, value=self.value.code_name)
+        yield self._value.generate_code(generator)
+        stmt = '{var} = {value};'.format(var=var_code, value=self._value.code_name)
         generator.add_statement(stmt)
@@ -17,6 +17,8 @@ class WhileStatementNode(NonValuedExpressionNode):
     es distinta de cero, entonces la expresión es ejecutada. 
     """
     
+    __slots__ = ('_condition', '_expression')
+    
     def _get_condition(self):
         """
         Método para obtener el valor de la propiedad C{condition}.
@@ -73,24 +75,24 @@ class WhileStatementNode(NonValuedExpressionNode):
         
         errors_before = len(errors)
         
-        self.condition.check_semantics(scope, errors)
+        yield self._condition.check_semantics(scope, errors)
         
         if errors_before == len(errors):
             # The condition return type must be IntegerType
-            if not self.condition.has_return_value():
+            if not self._condition.has_return_value():
                 message = 'while used with a non-return condition at line {line}'
                 errors.append(message.format(line=self.line_number))
-            elif self.condition.return_type != IntegerType():
+            elif self._condition.return_type is not IntegerType():
                 message = 'Invalid type of condition of the while statement at line {line}'
                 errors.append(message.format(line=self.line_number))
 
         errors_before = len(errors)
         
-        self.expression.check_semantics(scope, errors)
+        yield self._expression.check_semantics(scope, errors)
         
         if errors_before == len(errors):
             # The expression must not return value
-            if self.expression.has_return_value():
+            if self._expression.has_return_value():
                 message = 'while used with a expression with return value at line {line}'
                 errors.append(message.format(line=self.line_number))
 
@@ -104,11 +106,11 @@ class WhileStatementNode(NonValuedExpressionNode):
         de la clase C{LanguageNode}.
         """
         me = generator.add_node(str(self.__class__.__name__))
-        condition = self.condition.generate_dot(generator)
-        expression = self.expression.generate_dot(generator)
+        condition = yield generator.visit(self.condition)
+        expression = yield generator.visit(self.expression)
         generator.add_edge(me, condition)
         generator.add_edge(me, expression)
-        return me
+        yield me
     
     def generate_code(self, generator):
         """
@@ -119,19 +121,19 @@ class WhileStatementNode(NonValuedExpressionNode):
         este método consulte la documentación del método C{generate_code}
         de la clase C{LanguageNode}.
         """
-        self.scope.generate_code(generator)
+        self._scope.generate_code(generator)
         
-        self.condition.generate_code(generator)
-        condition_code_type = self.condition.return_type.code_type
+        yield self._condition.generate_code(generator)
+        condition_code_type = self._condition.return_type.code_type
         local_var = generator.define_local(condition_code_type)
         statement = '{var} = {cond};'.format(var=local_var, 
-                                             cond=self.condition.code_name)
+                                             cond=self._condition.code_name)
         generator.add_statement(statement)
         generator.add_statement('while({0})'.format(local_var))
         generator.add_statement('{')
-        self.expression.generate_code(generator)
-        self.condition.generate_code(generator)
+        yield self._expression.generate_code(generator)
+        yield self._condition.generate_code(generator)
         statement = '{var} = {cond};'.format(var=local_var,
-                                             cond=self.condition.code_name)
+                                             cond=self._condition.code_name)
         generator.add_statement(statement)
         generator.add_statement('}')
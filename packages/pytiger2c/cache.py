@@ -0,0 +1,557 @@
+# -*- coding: utf-8 -*-
+
+"""
+Cache en disco de los árboles de sintáxis abstracta comprobados.
+
+Al compilar varias veces el mismo programa Tiger, el análisis sintáctico y
+la comprobación semántica producen siempre el mismo resultado. La clase 
+C{ASTCache} almacena en un directorio el árbol de sintáxis abstracta de un
+programa después de comprobarlo semánticamente, junto con los ámbitos y los
+tipos que le asignó la comprobación, de forma que una compilación posterior
+del mismo programa puede omitir ambas fases y pasar directamente a la 
+generación de código.
+
+El árbol se serializa con C{cPickle}, pero cada instancia de las clases de
+los paquetes C{pytiger2c.ast} y C{pytiger2c.types} y de los módulos 
+C{pytiger2c.scope} y C{pytiger2c.dependencygraph} se sustituye por su 
+posición en una lista, y los atributos de las instancias se serializan 
+luego por lotes, en el orden en que se encontraron. De esta forma la 
+serialización no sigue recursivamente las referencias entre los nodos y se
+pueden almacenar árboles de cualquier profundidad. Al cargar un archivo 
+solamente se pueden crear instancias de esas clases y listas, tuplas, 
+diccionarios, conjuntos y valores básicos, por lo que un archivo del 
+directorio de la cache no puede ejecutar código ajeno al compilador. Los
+datos se comprimen con C{zlib}.
+
+Cada entrada de la cache se identifica por una llave calculada a partir del
+código fuente del programa y de la firma del compilador. La firma del
+compilador se calcula a partir de la versión de PyTiger2C y del contenido
+de los módulos del paquete, por lo que cualquier cambio en el compilador
+invalida las entradas escritas anteriormente. Los archivos de la cache
+tienen el mismo formato que el archivo de las tablas LALR: una línea de
+cabecera con un identificador del formato, la llave y una suma de
+comprobación, seguida por los datos serializados. Los archivos se escriben
+de forma atómica.
+
+El tamaño total de los archivos de la cache está acotado. Cuando se supera
+el tamaño máximo se eliminan las entradas utilizadas hace más tiempo,
+utilizando la fecha de modificación de los archivos, que se actualiza cada
+vez que se utiliza una entrada.
+"""
+
+import gc
+import os
+import sys
+import zlib
+import errno
+import operator
+import cPickle
+import hashlib
+import tempfile
+from itertools import repeat
+from cStringIO import StringIO
+
+import pytiger2c
+from pytiger2c.types.basictype import BasicType
+
+
+# Identifier of the format of the files. It should be changed every time
+# the layout of the files changes to discard the files already written.
+FORMAT = 'PYTIGER2C-AST-3'
+
+# Extension of the files of the entries of the cache.
+_EXTENSION = '.ast'
+
+# Default maximum size (in bytes) of the files of the cache.
+DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+# Compression level used by zlib. Higher levels barely reduce the size of
+# the files and make writing them several times slower.
+_COMPRESSION_LEVEL = 1
+
+# Signature of the compiler, calculated the first time it is used.
+_signature = None
+
+# Packages and modules of the classes whose instances are replaced by their
+# position in the list of instances of a file. They are the only classes,
+# besides the builtin ones below, created when a file is loaded.
+_INSTANCE_PACKAGES = ('pytiger2c.ast.', 'pytiger2c.types.')
+_INSTANCE_MODULES = ('pytiger2c.scope', 'pytiger2c.dependencygraph')
+
+# Builtin classes whose instances can be included in the attributes.
+_BUILTIN_CLASSES = {'set': set, 'frozenset': frozenset}
+
+# Layout of the attributes of the instances of each class, computed on
+# first use. See _get_layout.
+_layouts = {}
+
+
+def compiler_signature():
+    """
+    Calcula la firma del compilador utilizada en las llaves de la cache.
+
+    La firma se calcula a partir de la versión de PyTiger2C y del contenido
+    de los módulos del paquete C{pytiger2c}.
+
+    @rtype: C{str}
+    @return: Firma del compilador representada en hexadecimal.
+    """
+    global _signature
+    if _signature is None:
+        digest = hashlib.sha1()
+        digest.update(FORMAT)
+        digest.update(pytiger2c.__version__)
+        package_dir = os.path.dirname(os.path.abspath(pytiger2c.__file__))
+        for dirpath, dirnames, filenames in os.walk(package_dir):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                if filename.endswith('.py'):
+                    path = os.path.join(dirpath, filename)
+                    digest.update(os.path.relpath(path, package_dir))
+                    with open(path, 'rb') as fd:
+                        digest.update(fd.read())
+        _signature = digest.hexdigest()
+    return _signature
+
+
+def _is_instance_class(cls):
+    """
+    Indica si las instancias de una clase se sustituyen por su posición en
+    la lista de instancias de un archivo de la cache.
+    """
+    module = getattr(cls, '__module__', '')
+    return module in _INSTANCE_MODULES or module.startswith(_INSTANCE_PACKAGES)
+
+
+def _find_class(module, name):
+    """
+    Retorna una de las clases que se pueden crear al cargar un archivo de la
+    cache. Se utiliza como el atributo C{find_global} de C{cPickle.Unpickler}.
+    
+    @raise cPickle.UnpicklingError: Esta excepción se lanzará si el archivo 
+        hace referencia a cualquier otro objeto.
+    """
+    if module == '__builtin__' and name in _BUILTIN_CLASSES:
+        return _BUILTIN_CLASSES[name]
+    if module in _INSTANCE_MODULES or module.startswith(_INSTANCE_PACKAGES):
+        __import__(module)
+        cls = getattr(sys.modules[module], name, None)
+        if isinstance(cls, type) and cls.__module__ == module:
+            return cls
+    raise cPickle.UnpicklingError('Invalid class {0}.{1}'.format(module, name))
+
+
+def _get_layout(cls):
+    """
+    Retorna los nombres de los atributos declarados en C{__slots__} por una
+    clase y sus clases base y una función que retorna una tupla con los 
+    valores de estos atributos en una instancia. La función será C{None} si
+    las instancias de la clase tienen diccionario de atributos.
+    """
+    layout = _layouts.get(cls)
+    if layout is None:
+        names = []
+        for base in reversed(cls.__mro__):
+            names.extend(base.__dict__.get('__slots__', ()))
+        names = tuple(names)
+        if hasattr(cls, '__getstate__') or '__dict__' in dir(cls) or not names:
+            getter = None
+        elif len(names) == 1:
+            name = names[0]
+            getter = lambda instance: (getattr(instance, name),)
+        else:
+            getter = operator.attrgetter(*names)
+        layout = _layouts[cls] = (names, getter)
+    return layout
+
+
+def _get_state(instance):
+    """
+    Retorna los atributos de una instancia. Si la clase declara todos sus 
+    atributos en C{__slots__} y están asignados, se retorna una tupla con 
+    sus valores en el orden de C{_get_layout}. En otro caso se retorna un 
+    diccionario, que es el retornado por el método C{__getstate__} si la 
+    clase lo define.
+    """
+    names, getter = _get_layout(type(instance))
+    if getter is not None:
+        try:
+            return getter(instance)
+        except AttributeError:
+            # Some slot was never assigned.
+            pass
+    getstate = getattr(instance, '__getstate__', None)
+    if getstate is not None:
+        return getstate()
+    state = dict(getattr(instance, '__dict__', ()))
+    for name in names:
+        try:
+            state[name] = getattr(instance, name)
+        except AttributeError:
+            pass
+    return state
+
+
+def _set_state(instance, state):
+    """
+    Asigna a una instancia creada sin llamar a su inicializador los 
+    atributos retornados por la función C{_get_state}.
+    
+    @raise cPickle.UnpicklingError: Esta excepción se lanzará si los 
+        atributos no corresponden a la clase de la instancia.
+    """
+    names, getter = _get_layout(type(instance))
+    if type(state) is tuple:
+        if getter is None or len(state) != len(names):
+            raise cPickle.UnpicklingError('Invalid attributes')
+        map(setattr, repeat(instance, len(names)), names, state)
+    elif type(state) is not dict:
+        raise cPickle.UnpicklingError('Invalid attributes')
+    elif hasattr(instance, '__setstate__'):
+        instance.__setstate__(state)
+    else:
+        for name, value in state.iteritems():
+            setattr(instance, name, value)
+
+
+def _dump_tree(ast, output):
+    """
+    Serializa un árbol de sintáxis abstracta comprobado semánticamente, con
+    los ámbitos y los tipos que se alcanzan desde sus nodos.
+    
+    Cada instancia de las clases del compilador se serializa como su clase 
+    la primera vez que se encuentra y como su posición en la lista de 
+    instancias las veces siguientes. Luego se serializan, por lotes, las 
+    listas con los atributos de las instancias encontradas, hasta que no 
+    aparecen instancias nuevas. Los tipos básicos, que tienen una única 
+    instancia, se serializan como una llamada a su clase.
+    
+    @type ast: C{LanguageNode}
+    @param ast: Nodo raíz del árbol de sintáxis abstracta.
+    
+    @type output: C{file}
+    @param output: Archivo donde se escriben los datos serializados.
+    
+    @raise cPickle.PicklingError: Esta excepción se lanzará si algún atributo
+        contiene una instancia de otra clase.
+    """
+    instances = []
+    positions = {}
+    get_position = positions.get
+    checked_classes = set()
+    def persistent_id(obj):
+        # The pickler only calls this function for the objects that are not
+        # in its memo, so it is called once for the classes, the sets and the
+        # basic types, and every time an instance is referenced.
+        position = get_position(id(obj))
+        if position is not None:
+            return position
+        if isinstance(obj, (type, set, frozenset, BasicType)):
+            return None
+        cls = type(obj)
+        if cls not in checked_classes:
+            if not _is_instance_class(cls):
+                raise cPickle.PicklingError('Can not store instances of {0}'.format(cls))
+            checked_classes.add(cls)
+        positions[id(obj)] = len(instances)
+        instances.append(obj)
+        return cls
+    pickler = cPickle.Pickler(output, cPickle.HIGHEST_PROTOCOL)
+    pickler.inst_persistent_id = persistent_id
+    pickler.dump(ast)
+    stored = 0
+    while stored < len(instances):
+        batch = instances[stored:]
+        stored = len(instances)
+        pickler.dump([_get_state(instance) for instance in batch])
+
+
+class _Instances(dict):
+    """
+    Diccionario con las instancias creadas al cargar un archivo de la cache,
+    indexadas por su posición. Su método C{__getitem__} se utiliza como el 
+    atributo C{persistent_load} de C{cPickle.Unpickler}, de forma que las
+    referencias a las instancias ya creadas se resuelven sin llamar a una
+    función de Python.
+    """
+    
+    def __init__(self):
+        """
+        Inicializa el diccionario vacío.
+        """
+        super(_Instances, self).__init__()
+        self.created = []
+        self._classes = set()
+    
+    def __missing__(self, pid):
+        """
+        Crea una instancia, sin llamar a su inicializador, la primera vez que
+        se encuentra su clase.
+        """
+        if pid not in self._classes:
+            if not (isinstance(pid, type) and _is_instance_class(pid)):
+                raise cPickle.UnpicklingError('Invalid instance')
+            self._classes.add(pid)
+        instance = pid.__new__(pid)
+        self[len(self.created)] = instance
+        self.created.append(instance)
+        return instance
+
+
+def _load_tree(data):
+    """
+    Carga un árbol de sintáxis abstracta serializado con la función 
+    C{_dump_tree}.
+    
+    @type data: C{str}
+    @param data: Datos serializados.
+    
+    @rtype: C{LanguageNode}
+    @return: Nodo raíz del árbol de sintáxis abstracta.
+    
+    @raise cPickle.UnpicklingError: Esta excepción se lanzará si los datos 
+        no son válidos.
+    """
+    instances = _Instances()
+    created = instances.created
+    unpickler = cPickle.Unpickler(StringIO(data))
+    unpickler.find_global = _find_class
+    unpickler.persistent_load = instances.__getitem__
+    ast = unpickler.load()
+    loaded = 0
+    while loaded < len(created):
+        count = len(created)
+        states = unpickler.load()
+        if type(states) is not list or len(states) != count - loaded:
+            raise cPickle.UnpicklingError('Invalid attributes')
+        for instance, state in zip(created[loaded:count], states):
+            _set_state(instance, state)
+        loaded = count
+    return ast
+
+
+class ASTCache(object):
+    """
+    Cache en disco, con tamaño acotado, de los árboles de sintáxis abstracta
+    de programas Tiger que fueron comprobados semánticamente.
+    """
+
+    def _get_directory(self):
+        """
+        Método para obtener el valor de la propiedad C{directory}.
+        """
+        return self._directory
+
+    directory = property(_get_directory)
+
+    def _get_max_size(self):
+        """
+        Método para obtener el valor de la propiedad C{max_size}.
+        """
+        return self._max_size
+
+    max_size = property(_get_max_size)
+
+    def _get_hits(self):
+        """
+        Método para obtener el valor de la propiedad C{hits}.
+        """
+        return self._hits
+
+    hits = property(_get_hits)
+
+    def _get_misses(self):
+        """
+        Método para obtener el valor de la propiedad C{misses}.
+        """
+        return self._misses
+
+    misses = property(_get_misses)
+
+    def _get_evictions(self):
+        """
+        Método para obtener el valor de la propiedad C{evictions}.
+        """
+        return self._evictions
+
+    evictions = property(_get_evictions)
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        """
+        Inicializa la cache. Si el directorio no existe, se crea.
+
+        @type directory: C{str}
+        @param directory: Ruta del directorio donde se almacenan los archivos
+            de la cache.
+
+        @type max_size: C{int}
+        @param max_size: Tamaño máximo, en bytes, del total de los archivos
+            de la cache.
+
+        @raise OSError: Esta excepción se lanzará si no existe el directorio
+            y no es posible crearlo.
+        """
+        self._directory = os.path.abspath(directory)
+        self._max_size = max_size
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        try:
+            os.makedirs(self._directory)
+        except OSError, error:
+            if error.errno != errno.EEXIST or not os.path.isdir(self._directory):
+                raise
+
+    def key(self, source):
+        """
+        Calcula la llave de la entrada de la cache correspondiente a un
+        programa Tiger.
+
+        @type source: C{str}
+        @param source: Contenido del archivo que contiene el código fuente
+            del programa Tiger.
+
+        @rtype: C{str}
+        @return: Llave de la entrada representada en hexadecimal.
+        """
+        digest = hashlib.sha1()
+        digest.update(compiler_signature())
+        digest.update(source)
+        return digest.hexdigest()
+
+    def _path(self, key):
+        """
+        Retorna la ruta del archivo de la entrada correspondiente a una llave.
+        """
+        return os.path.join(self._directory, key + _EXTENSION)
+
+    def load(self, key):
+        """
+        Carga el árbol de sintáxis abstracta almacenado en una entrada de la
+        cache y la marca como la utilizada más recientemente.
+
+        @type key: C{str}
+        @param key: Llave de la entrada calculada con el método C{key}.
+
+        @rtype: C{LanguageNode}
+        @return: Árbol de sintáxis abstracta comprobado semánticamente, listo
+            para generar el código, o C{None} si la entrada no existe o está
+            corrupta.
+        """
+        ast = None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as fd:
+                header = fd.readline().split()
+                payload = fd.read()
+        except (IOError, OSError):
+            pass
+        else:
+            if (len(header) == 3 and header[0] == FORMAT and header[1] == key and
+                hashlib.md5(payload).hexdigest() == header[2]):
+                # The loaded nodes are not garbage, but the collector would
+                # traverse them repeatedly while they are created.
+                gc_enabled = gc.isenabled()
+                gc.disable()
+                try:
+                    ast = _load_tree(zlib.decompress(payload))
+                except Exception:
+                    ast = None
+                finally:
+                    if gc_enabled:
+                        gc.enable()
+        if ast is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+            try:
+                os.utime(path, None)
+            except OSError:
+                # The entry could have been evicted by another process.
+                pass
+        return ast
+
+    def store(self, key, ast):
+        """
+        Almacena en la cache el árbol de sintáxis abstracta de un programa
+        Tiger comprobado semánticamente y elimina las entradas utilizadas
+        hace más tiempo si se supera el tamaño máximo de la cache.
+
+        El árbol se debe almacenar antes de generar su código, ya que la
+        generación de código modifica los ámbitos y los tipos. Los errores al
+        serializar el árbol (por ejemplo, si algún atributo contiene un valor
+        que no se puede serializar) o al escribir el archivo no se reportan,
+        simplemente el árbol no se almacena.
+
+        @type key: C{str}
+        @param key: Llave de la entrada calculada con el método C{key}.
+
+        @type ast: C{LanguageNode}
+        @param ast: Árbol de sintáxis abstracta comprobado semánticamente.
+
+        @rtype: C{bool}
+        @return: Indica si el árbol se almacenó en la cache.
+        """
+        output = StringIO()
+        # The pickler creates many temporary objects and the collector would
+        # traverse the whole tree repeatedly.
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            _dump_tree(ast, output)
+        except (cPickle.PicklingError, TypeError):
+            return False
+        finally:
+            if gc_enabled:
+                gc.enable()
+        payload = zlib.compress(output.getvalue(), _COMPRESSION_LEVEL)
+        header = '{0} {1} {2}\n'.format(FORMAT, key, hashlib.md5(payload).hexdigest())
+        try:
+            fd, tmp_filename = tempfile.mkstemp(prefix=key + '.', dir=self._directory)
+        except (IOError, OSError):
+            return False
+        try:
+            with os.fdopen(fd, 'wb') as tmp_fd:
+                tmp_fd.write(header)
+                tmp_fd.write(payload)
+            os.chmod(tmp_filename, 0644)
+            path = self._path(key)
+            if sys.platform == 'win32' and os.path.exists(path):
+                # On Windows os.rename fails if the destination already exists.
+                os.unlink(path)
+            os.rename(tmp_filename, path)
+        except (IOError, OSError):
+            try:
+                os.unlink(tmp_filename)
+            except OSError:
+                pass
+            return False
+        self._evict()
+        return True
+
+    def _evict(self):
+        """
+        Elimina las entradas utilizadas hace más tiempo hasta que el tamaño
+        total de los archivos de la cache no supere el tamaño máximo.
+        """
+        entries = []
+        total_size = 0
+        for filename in os.listdir(self._directory):
+            if filename.endswith(_EXTENSION):
+                try:
+                    stat = os.stat(os.path.join(self._directory, filename))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, filename, stat.st_size))
+                total_size += stat.st_size
+        entries.sort(reverse=True)
+        while total_size > self._max_size and entries:
+            mtime, filename, size = entries.pop()
+            try:
+                os.unlink(os.path.join(self._directory, filename))
+            except OSError:
+                # The entry could have been evicted by another process.
+                pass
+            else:
+                self._evictions += 1
+            total_size -= size
@@ -0,0 +1,228 @@
+# -*- coding: utf-8 -*-
+
+"""
+Opciones y resultados de la compilación en memoria de los programas Tiger
+con la función C{compile_string} del paquete C{pytiger2c}.
+"""
+
+import re
+
+from pytiger2c.grammar import DEFAULT_LEXER, DEFAULT_PARSER
+
+
+# Line number included in the messages of the errors.
+_LINE_REGEX = re.compile(r'\bline (\d+)')
+
+
+class CompilationOptions(object):
+    """
+    Opciones de la compilación en memoria de un programa Tiger. Consulte la
+    documentación de las funciones C{syntactic_analysis} y C{check_semantics}
+    del paquete C{pytiger2c}.
+    """
+
+    def _get_lexer_name(self):
+        """
+        Método para obtener el valor de la propiedad C{lexer_name}.
+        """
+        return self._lexer_name
+
+    lexer_name = property(_get_lexer_name)
+
+    def _get_parser_name(self):
+        """
+        Método para obtener el valor de la propiedad C{parser_name}.
+        """
+        return self._parser_name
+
+    parser_name = property(_get_parser_name)
+
+    def _get_recover(self):
+        """
+        Método para obtener el valor de la propiedad C{recover}.
+        """
+        return self._recover
+
+    recover = property(_get_recover)
+
+    def _get_max_errors(self):
+        """
+        Método para obtener el valor de la propiedad C{max_errors}.
+        """
+        return self._max_errors
+
+    max_errors = property(_get_max_errors)
+
+    def _get_spans(self):
+        """
+        Método para obtener el valor de la propiedad C{spans}.
+        """
+        return self._spans
+
+    spans = property(_get_spans)
+
+    def __init__(self, lexer_name=DEFAULT_LEXER, parser_name=DEFAULT_PARSER,
+                 recover=False, max_errors=None, spans=False):
+        """
+        Inicializa la clase C{CompilationOptions}.
+
+        @type lexer_name: C{str}
+        @param lexer_name: Nombre del analizador léxico-gráfico que se debe
+            utilizar.
+
+        @type parser_name: C{str}
+        @param parser_name: Nombre del analizador sintáctico que se debe
+            utilizar.
+
+        @type recover: C{bool}
+        @param recover: Indica si el analizador sintáctico y la comprobación
+            semántica se deben recuperar de los errores para reportarlos todos.
+
+        @type max_errors: C{int}
+        @param max_errors: Cantidad máxima de errores semánticos que se
+            reportan si la comprobación semántica se recupera de los errores.
+
+        @type spans: C{bool}
+        @param spans: Indica si se deben calcular las posiciones de los nodos
+            del árbol de sintáxis abstracta. Solamente el analizador 
+            sintáctico C{compact} permite calcularlas.
+        """
+        super(CompilationOptions, self).__init__()
+        self._lexer_name = lexer_name
+        self._parser_name = parser_name
+        self._recover = recover
+        self._max_errors = max_errors
+        self._spans = spans
+
+
+class Diagnostic(object):
+    """
+    Error encontrado durante la compilación de un programa Tiger.
+    """
+
+    def _get_error(self):
+        """
+        Método para obtener el valor de la propiedad C{error}.
+        """
+        return self._error
+
+    error = property(_get_error)
+
+    def _get_message(self):
+        """
+        Método para obtener el valor de la propiedad C{message}.
+        """
+        return self._message
+
+    message = property(_get_message)
+
+    def _get_line(self):
+        """
+        Método para obtener el valor de la propiedad C{line}.
+        """
+        return self._line
+
+    line = property(_get_line)
+
+    def __init__(self, error, message):
+        """
+        Inicializa la clase C{Diagnostic}.
+
+        @type error: C{str}
+        @param error: Tipo de error, igual que el atributo C{error} de las
+            excepciones C{PyTiger2CError}, por ejemplo C{Semantic Error}.
+
+        @type message: C{str}
+        @param message: Descripción del error. La línea del programa en la que
+            se encontró el error, si se incluye en la descripción, se obtiene
+            con la propiedad C{line}.
+        """
+        super(Diagnostic, self).__init__()
+        self._error = error
+        self._message = message
+        match = _LINE_REGEX.search(message)
+        self._line = int(match.group(1)) if match else None
+
+    def __str__(self):
+        """
+        Retorna una cadena con el tipo de error y su descripción, en el mismo
+        formato que las excepciones C{PyTiger2CError}.
+        """
+        return '{error}: {message}.'.format(error=self._error, message=self._message)
+
+
+class CompilationResult(object):
+    """
+    Resultado de la compilación en memoria de un programa Tiger.
+    """
+
+    def _get_code(self):
+        """
+        Método para obtener el valor de la propiedad C{code}.
+
+        @rtype: C{str}
+        @return: Código C generado, codificado en UTF-8, o C{None} si el
+            programa tiene errores.
+        """
+        return self._code
+
+    code = property(_get_code)
+
+    def _get_ast(self):
+        """
+        Método para obtener el valor de la propiedad C{ast}.
+
+        @rtype: C{LanguageNode}
+        @return: Árbol de sintáxis abstracta del programa. Si el programa
+            tiene errores de sintáxis, es el árbol parcial obtenido con
+            recuperación de errores o C{None}.
+        """
+        return self._ast
+
+    ast = property(_get_ast)
+
+    def _get_diagnostics(self):
+        """
+        Método para obtener el valor de la propiedad C{diagnostics}.
+
+        @rtype: C{list}
+        @return: Lista de instancias de C{Diagnostic} con los errores
+            encontrados, vacía si la compilación terminó correctamente.
+        """
+        return self._diagnostics
+
+    diagnostics = property(_get_diagnostics)
+
+    def _get_phases(self):
+        """
+        Método para obtener el valor de la propiedad C{phases}.
+
+        @rtype: C{list}
+        @return: Lista de instancias de C{Phase} del módulo
+            C{pytiger2c.timing} con las mediciones de las fases realizadas.
+        """
+        return self._phases
+
+    phases = property(_get_phases)
+
+    def _get_succeeded(self):
+        """
+        Método para obtener el valor de la propiedad C{succeeded}.
+
+        @rtype: C{bool}
+        @return: C{True} si se generó el código C del programa.
+        """
+        return self._code is not None
+
+    succeeded = property(_get_succeeded)
+
+    def __init__(self, code, ast, diagnostics, phases):
+        """
+        Inicializa la clase C{CompilationResult}. Consulte la documentación
+        de las propiedades de la clase.
+        """
+        super(CompilationResult, self).__init__()
+        self._code = code
+        self._ast = ast
+        self._diagnostics = diagnostics
+        self._phases = phases
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+
+"""
+Grafo de dependencias entre las declaraciones de una estructura C{let-in-end}.
+
+En Tiger, los tipos y las funciones mutuamente recursivos deben declararse en
+un mismo grupo de declaraciones. Para comprobarlo se construye un grafo cuyos
+nodos son las declaraciones de tipos (o de funciones) de una estructura
+C{let-in-end} y cuyas aristas van de cada declaración a las declaraciones que
+esta utiliza. Dos declaraciones son mutuamente recursivas si pertenecen a la
+misma componente fuertemente conexa del grafo, por lo que una componente con
+declaraciones de más de un grupo es una definición mutuamente recursiva
+inválida. Las componentes se calculan con el algoritmo de Tarjan, en tiempo
+lineal en la cantidad de declaraciones y de referencias.
+"""
+
+
+class DependencyGraph(object):
+    """
+    Grafo de dependencias entre las declaraciones de tipos o de funciones de
+    una estructura C{let-in-end}.
+
+    Las declaraciones se deben añadir en el orden en que se comprueban
+    semánticamente. Cada definición mutuamente recursiva inválida se reporta
+    una sola vez, al comprobar la última de sus declaraciones: el método
+    C{closes_cycle} indica cuáles de las referencias de esta declaración
+    cierran el ciclo. Cuando es posible, se reportan las referencias a
+    declaraciones de otros grupos.
+    """
+
+    def __init__(self):
+        """
+        Inicializa el grafo sin declaraciones.
+        """
+        # Names of the declarations in the order they are checked and the
+        # index of the group of each declaration.
+        self._names = []
+        self._groups = {}
+        # Names referenced by each declaration.
+        self._references = {}
+        # Index of the component of each declaration after the analysis.
+        self._components = None
+        # Declarations whose references close an invalid cycle mapped to a
+        # tuple with the index of their component and a boolean indicating
+        # whether only the references to other groups close the cycle.
+        self._closing = None
+
+    def add_declaration(self, name, group):
+        """
+        Añade una declaración al grafo.
+
+        @type name: C{str}
+        @param name: Nombre del tipo o de la función declarada.
+
+        @type group: C{int}
+        @param group: Índice del grupo de declaraciones al que pertenece.
+        """
+        self._names.append(name)
+        self._groups[name] = group
+        self._references[name] = set()
+        self._components = None
+
+    def add_reference(self, name, referenced_name):
+        """
+        Añade una arista del grafo. Las referencias a nombres que no
+        corresponden a ninguna declaración del grafo se ignoran.
+
+        @type name: C{str}
+        @param name: Nombre de la declaración que contiene la referencia.
+
+        @type referenced_name: C{str}
+        @param referenced_name: Nombre utilizado en la declaración.
+        """
+        self._references[name].add(referenced_name)
+        self._components = None
+
+    def get_references(self, name):
+        """
+        Retorna los nombres utilizados en una declaración.
+
+        @type name: C{str}
+        @param name: Nombre de la declaración.
+
+        @rtype: C{set}
+        @return: Conjunto de los nombres añadidos con C{add_reference}, 
+            incluso los que no corresponden a declaraciones del grafo.
+        """
+        return self._references[name]
+
+    def replace_references(self, name, referenced_names):
+        """
+        Sustituye las aristas que parten de una declaración, por ejemplo,
+        cuando se modifica el cuerpo de una función ya comprobada.
+
+        @type name: C{str}
+        @param name: Nombre de la declaración.
+
+        @type referenced_names: C{set}
+        @param referenced_names: Nombres utilizados en la declaración.
+        """
+        self._references[name] = set(referenced_names)
+        self._components = None
+
+    def has_invalid_cycles(self):
+        """
+        Indica si el grafo contiene alguna definición mutuamente recursiva
+        con declaraciones de más de un grupo.
+
+        @rtype: C{bool}
+        @return: C{True} si alguna declaración cierra un ciclo inválido.
+        """
+        if self._components is None:
+            self._analyze()
+        return bool(self._closing)
+
+    def closes_cycle(self, name, referenced_name):
+        """
+        Indica si la referencia a un nombre desde una declaración cierra una
+        definición mutuamente recursiva con declaraciones de otros grupos.
+
+        @type name: C{str}
+        @param name: Nombre de la declaración que se está comprobando.
+
+        @type referenced_name: C{str}
+        @param referenced_name: Nombre que se busca desde la declaración.
+
+        @rtype: C{bool}
+        @return: C{True} si la referencia se debe reportar como un error.
+        """
+        if self._components is None:
+            self._analyze()
+        closing = self._closing.get(name)
+        if closing is None or referenced_name == name:
+            return False
+        component, cross_only = closing
+        if self._components.get(referenced_name) != component:
+            return False
+        return not cross_only or self._groups[referenced_name] != self._groups[name]
+
+    def _analyze(self):
+        """
+        Calcula las componentes fuertemente conexas del grafo con el
+        algoritmo de Tarjan, utilizando una pila explícita, y determina las
+        declaraciones que cierran definiciones mutuamente recursivas
+        inválidas.
+        """
+        groups = self._groups
+        edges = {}
+        for name in self._names:
+            edges[name] = [target for target in self._references[name] if target in groups]
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = {}
+        members = []
+        for root in self._names:
+            if root in index:
+                continue
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(edges[root]))]
+            while work:
+                node, targets = work[-1]
+                target = next(targets, None)
+                if target is not None:
+                    if target not in index:
+                        index[target] = lowlink[target] = len(index)
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(edges[target])))
+                    elif target in on_stack:
+                        lowlink[node] = min(lowlink[node], index[target])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        components[member] = len(members)
+                        component.append(member)
+                        if member == node:
+                            break
+                    members.append(component)
+        order = dict((name, position) for position, name in enumerate(self._names))
+        closing = {}
+        for number, component in enumerate(members):
+            if len(set(groups[name] for name in component)) > 1:
+                last = max(component, key=order.get)
+                cross_only = any(components.get(target) == number and
+                                 groups[target] != groups[last]
+                                 for target in edges[last])
+                closing[last] = (number, cross_only)
+        self._components = components
+        self._closing = closing
@@ -5,28 +5,77 @@ Clases utilizadas en la generación de un archivo Graphviz DOT con el
 árbol de sintáxis abstracta creado a partir de un programa Tiger.
 """
 
+from pytiger2c.ast.traversal import Visitor
+from pytiger2c.ast.callabledeclarationnode import CallableDeclarationNode
+
 
 class DotGenerator(object):
     """
-    Clase utilizada para la generación de grafos en formato Graphviz DOT. 
+    Clase utilizada para la generación de grafos en formato Graphviz DOT.
+
+    Los nodos y las aristas se escriben en el descriptor de fichero a medida
+    que se añaden, por lo que la memoria utilizada no depende del tamaño del
+    grafo. Para que los grafos de programas grandes se puedan visualizar con
+    Graphviz es posible limitar la profundidad y la cantidad de nodos del
+    árbol de sintáxis abstracta que se incluyen en el grafo, y agrupar los
+    nodos de cada función o procedimiento en un subgrafo.
     """
 
-    def __init__(self):
+    def __init__(self, output_fd, max_depth=None, max_nodes=None,
+                 collapse=False, subgraphs=False):
         """
         Esta clase es utilizada en la generación de código Graphivz DOT
         a partir de un árbol de sintáxis abstracta de un programa Tiger.
+        La cabecera del grafo se escribe inmediatamente.
+
+        @type output_fd: C{file}
+        @param output_fd: Descriptor de fichero donde se debe escribir el
+            código Graphviz DOT.
+
+        @type max_depth: C{int}
+        @param max_depth: Profundidad máxima de los nodos del árbol de sintáxis
+            abstracta que se incluyen en el grafo. La raíz tiene profundidad 0.
+            Si es C{None}, no se limita la profundidad.
+
+        @type max_nodes: C{int}
+        @param max_nodes: Cantidad de nodos del grafo a partir de la cual no se
+            incluyen más nodos del árbol de sintáxis abstracta. Los nodos que
+            se incluyen pueden añadir nodos con sus atributos al grafo, por lo
+            que el grafo puede tener algunos nodos más. Si es C{None}, no se
+            limita la cantidad de nodos.
+
+        @type collapse: C{bool}
+        @param collapse: Indica si cada subárbol que no se incluye por superar
+            la profundidad máxima se debe representar con un único nodo que
+            contiene la cantidad de nodos del subárbol. En caso contrario, el
+            subárbol se omite sin recorrerlo.
+
+        @type subgraphs: C{bool}
+        @param subgraphs: Indica si los nodos correspondientes a cada
+            declaración de función o procedimiento se deben agrupar en un
+            subgrafo.
         """
-        self._nodes = []
-        self._edges = []
+        self._output_fd = output_fd
+        self._max_depth = max_depth
+        self._max_nodes = max_nodes
+        self._collapse = collapse
+        self._subgraphs = subgraphs
         self._num_nodes = 0
-        
+        self._num_subgraphs = 0
+        self._depth = 0
+        self._indent = ' ' * 4
+        self._truncated = False
+        output_fd.write('graph AST {\n')
+        output_fd.write(self._indent)
+        output_fd.write('node [shape=record];\n\n')
+
     def add_node(self, label):
         """
         Añade un nuevo nodo al grafo actualmente en creación.
-        
+
         @type label: C{str}
         @param label: Nombre del nodo que se quiere añadir.
-        
+
         @rtype: C{str}
         @return: Identificador del nuevo nodo añadido. Este identificador
             puede ser utilizado para crear nuevas aristas, utilizando
@@ -36,45 +85,111 @@ class DotGenerator(object):
         self._num_nodes += 1
         name = 'node{number}'.format(number=self._num_nodes)
         code = '{name} [label="{label}"];'.format(name=name, label=label)
-        self._nodes.append(code)
+        self._write(code)
         return name
-        
+
     def add_edge(self, from_node, to_node):
         """
         Añade una arista no dirigida al grafo actualmente en creación.
-        
+
         @type from_node: C{str}
-        @param from_node: Cadena de caracteres que identifica un nodo 
+        @param from_node: Cadena de caracteres que identifica un nodo
             extremo de la arista.
-        
+
         @type to_node: C{str}
-        @param to_node: Cadena de caracteres que identifica un nodo 
-            extremo de la arista.
+        @param to_node: Cadena de caracteres que identifica un nodo
+            extremo de la arista. Si es C{None}, porque el nodo no se
+            incluyó en el grafo, la arista no se añade.
         """
-        template = '{from_node} -- {to_node};'
-        code = template.format(from_node=from_node, to_node=to_node)
-        self._edges.append(code)
-        
-    def write(self, output_fd):
+        if to_node is not None:
+            template = '{from_node} -- {to_node};'
+            code = template.format(from_node=from_node, to_node=to_node)
+            self._write(code)
+
+    def visit(self, node):
         """
-        Escribe el código Graphviz DOT en un descriptor de fichero.
-        
-        @type output_fd: C{file}
-        @param output_fd: Descriptor de fichero donde se debe escribir el
-            código Graphviz DOT resultante de la traducción del programa
-            Tiger descrito por el árbol de sintáxis abstracta.
+        Retorna la tarea que añade al grafo el subárbol de sintáxis abstracta
+        del cual un nodo es raíz. Los métodos C{generate_dot} de los nodos
+        utilizan este método para añadir sus hijos al grafo.
+
+        @type node: C{LanguageNode}
+        @param node: Nodo del árbol de sintáxis abstracta.
+
+        @return: Tarea cuyo resultado es el identificador del nodo del grafo
+            correspondiente al nodo del árbol, que se ejecuta con la función
+            C{run} del módulo C{pytiger2c.ast.traversal}. Si el nodo no se
+            incluye en el grafo, se retorna directamente el identificador del
+            nodo que representa el subárbol o C{None} si el subárbol se omite.
         """
-        indent = ' ' * 4
-        output_fd.write('graph AST {\n')
-        output_fd.write(indent)
-        output_fd.write('node [shape=record];\n\n')
-        for node_code in self._nodes:
-            output_fd.write(indent)
-            output_fd.write(node_code)
-            output_fd.write('\n')
-        output_fd.write('\n')
-        for edge_code in self._edges:
-            output_fd.write(indent)
-            output_fd.write(edge_code)
-            output_fd.write('\n')
-        output_fd.write('}\n')
+        if self._max_nodes is not None and self._num_nodes >= self._max_nodes:
+            self._truncated = True
+            return None
+        if self._max_depth is not None and self._depth > self._max_depth:
+            if not self._collapse:
+                return None
+            counter = _NodeCounter()
+            counter.visit(node)
+            label = '{name} ({count} nodes)'.format(name=node.__class__.__name__,
+                                                    count=counter.count)
+            self._num_nodes += 1
+            name = 'node{number}'.format(number=self._num_nodes)
+            self._write('{name} [label="{label}", style=dashed];'.format(name=name, label=label))
+            return name
+        if self._max_depth is None and not self._subgraphs:
+            # The depth only has to be tracked to limit it or add subgraphs.
+            return node.generate_dot(self)
+        return self._visit(node)
+
+    def _visit(self, node):
+        """
+        Tarea que añade al grafo el subárbol de un nodo que se incluye en el
+        grafo. Consulte la documentación del método C{visit}.
+        """
+        subgraph = self._subgraphs and isinstance(node, CallableDeclarationNode)
+        if subgraph:
+            self._num_subgraphs += 1
+            self._write('subgraph cluster{0} {{'.format(self._num_subgraphs))
+            self._indent += ' ' * 4
+            self._write('label="{0}";'.format(node.name))
+        self._depth += 1
+        me = yield node.generate_dot(self)
+        self._depth -= 1
+        if subgraph:
+            self._indent = self._indent[:-4]
+            self._write('}')
+        yield me
+
+    def _write(self, code):
+        """
+        Escribe una instrucción del grafo con la indentación actual.
+        """
+        self._output_fd.write(self._indent + code + '\n')
+
+    def close(self):
+        """
+        Termina el grafo. Si no se incluyeron todos los nodos del árbol de
+        sintáxis abstracta porque se alcanzó la cantidad máxima de nodos,
+        se añade un nodo indicándolo.
+        """
+        if self._truncated:
+            label = 'Truncated at {0} nodes'.format(self._max_nodes)
+            self._write('truncated [label="{0}", shape=plaintext];'.format(label))
+        self._output_fd.write('}\n')
+
+
+class _NodeCounter(Visitor):
+    """
+    Cuenta los nodos de un subárbol de sintáxis abstracta.
+    """
+
+    def __init__(self):
+        """
+        Inicializa el contador.
+        """
+        self.count = 0
+
+    def enter(self, node):
+        """
+        Cuenta el nodo.
+        """
+        self.count += 1
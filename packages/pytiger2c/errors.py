@@ -36,14 +36,51 @@ class SyntacticError(PyTiger2CError):
     Excepción lanzada durante el análisis léxico-gráfico y sintáctico.
     """
     
-    def __init__(self, message='An error occurred during the syntactic analysis'):
+    def __init__(self, message='An error occurred during the syntactic analysis', 
+                 messages=None, ast=None, semantic_error=None):
         """
-        Representa un error de sintáxis en un programa Tiger.
+        Representa uno o varios errores de sintáxis en un programa Tiger.
         
         @type message: C{str}
         @param message: Descripción del error.
+        
+        @type messages: C{list}
+        @param messages: Lista de los mensajes de error encontrados durante 
+            el análisis sintáctico con recuperación de errores. Si se especifica,
+            se ignora el valor del parámetro C{message}.
+            
+        @type ast: C{LanguageNode}
+        @param ast: Árbol de sintáxis abstracta parcial obtenido durante el
+            análisis sintáctico con recuperación de errores, formado por las
+            partes del programa que no contienen errores de sintáxis. Será 
+            C{None} si no se realizó recuperación de errores o si no fue 
+            posible obtener un árbol.
+        
+        @type semantic_error: C{SemanticError}
+        @param semantic_error: Errores semánticos encontrados al comprobar el
+            árbol de sintáxis abstracta parcial, que se reportan después de
+            los errores de sintáxis. Será C{None} si no se comprobó el árbol
+            o si no contiene errores semánticos.
         """
+        if messages is None:
+            messages = [message]
+        self.messages = messages
+        self.ast = ast
+        self.semantic_error = semantic_error
+        if len(self.messages) == 1:
+            message = self.messages[0]
+        else:
+            message = 'Various syntactic errors'
         super(SyntacticError, self).__init__('Syntactic Error', message)
+        
+    def __str__(self):
+        """
+        Retorna una cadena con el tipo de error ocurrido y una descripción del error.
+        """
+        messages = ['{error}: {message}.'.format(error=self.error, message=message) for message in self.messages]
+        if self.semantic_error is not None:
+            messages.append(str(self.semantic_error))
+        return '\n'.join(messages)
 
 
 class SemanticError(PyTiger2CError):
@@ -8,6 +8,40 @@ PLY utiliza los I{docstrings} para especificar las reglas de la gramática que
 especifican las acciones a realizar cuando se reduce una producción. Por esta razón,
 resulta difícil incluir los módulos contenidos en este paquete en la documentación 
 del API generada automáticamente.  
+
+El análisis léxico-gráfico se realiza por defecto con el analizador dirigido por
+tablas del módulo C{tablelexer}. El analizador construido con PLY en el módulo 
+C{lexer} se mantiene como alternativa y ambos se encuentran disponibles a través 
+del diccionario C{lexers}.
+
+La clase C{Parser} permite analizar varios programas simultáneamente desde
+hilos diferentes, ya que cada instancia tiene su propio analizador 
+léxico-gráfico y su propio estado durante el análisis.
+
+El análisis sintáctico se realiza por defecto con el analizador LR compacto 
+del módulo C{driver}, que utiliza las tablas LALR construidas por PLY 
+codificadas con números enteros y las acciones semánticas del módulo 
+C{actions}. El analizador sintáctico construido por PLY se mantiene como 
+alternativa y ambos se encuentran disponibles a través del diccionario 
+C{parsers}.
+
+Las tablas LALR del analizador sintáctico se almacenan en el directorio 
+C{cache} utilizando el módulo C{tables} y se construyen nuevamente de forma 
+automática cuando cambia la gramática. La función C{rebuild_tables} permite 
+construirlas y escribirlas explícitamente.
+
+La clase C{IncrementalParser} del módulo C{incremental} permite actualizar el
+árbol de sintáxis abstracta de un programa después de cada modificación
+analizando nuevamente solo la parte afectada, como necesita un editor.
+
+Los analizadores léxico-gráficos obtienen los identificadores y los literales
+de una tabla de símbolos (clase C{SymbolTable} del módulo C{symbols}), de
+forma que sus apariciones repetidas comparten una misma instancia. Cada
+instancia de C{Parser} tiene su propia tabla, disponible en la propiedad
+C{symbols}, que asigna además un identificador entero a cada símbolo.
 """
 
-from pytiger2c.grammar.parser import parser
\ No newline at end of file
+from pytiger2c.grammar.parser import parser, lexers, parsers, Parser, \
+    DEFAULT_LEXER, DEFAULT_PARSER, rebuild_tables, TABLES_FILE
+from pytiger2c.grammar.incremental import IncrementalParser
+from pytiger2c.grammar.symbols import SymbolTable
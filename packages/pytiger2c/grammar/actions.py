@@ -0,0 +1,316 @@
+# -*- coding: utf-8 -*-
+
+"""
+Acciones semánticas de la gramática de Tiger utilizadas por los analizadores
+sintácticos de los módulos C{pytiger2c.grammar.driver} y 
+C{pytiger2c.grammar.parser}.
+
+Cada función C{a_<nombre>} de este módulo es la acción semántica de la
+producción definida por la función C{p_<nombre>} del módulo 
+C{pytiger2c.grammar.parser}, que se limita a llamarla. En lugar de recibir
+un objeto C{YaccProduction} de PLY, cada función recibe como argumentos los
+símbolos de la parte derecha de la producción y retorna el valor del símbolo
+de la parte izquierda. Los terminales se reciben como instancias de 
+C{LexToken}, por lo que el valor y el número de línea de un terminal se 
+obtienen de sus atributos C{value} y C{lineno}. Los no terminales se reciben
+directamente con su valor.
+"""
+
+import itertools
+
+from pytiger2c.ast import *
+
+
+def a_program(expr):
+    # The driver checks that every comment was closed before accepting.
+    expr.parent_node = None
+    return expr
+
+def a_expr_nil(nil):
+    node = NilExpressionNode()
+    node.line_number = nil.lineno
+    return node
+
+def a_expr_int(intlit):
+    node = IntegerLiteralExpressionNode(intlit.value)
+    node.line_number = intlit.lineno
+    return node
+
+def a_expr_str(strlit):
+    node = StringLiteralExpressionNode(strlit.value)
+    node.line_number = strlit.lineno
+    return node
+
+def a_expr_lvalue(lvalue):
+    return lvalue
+
+def a_expr_array(ident, lbracket, count, rbracket, of, value):
+    node = ArrayLiteralExpressionNode(ident.value, count, value)
+    node.line_number = ident.lineno
+    count.parent_node = node
+    value.parent_node = node
+    return node
+
+def a_expr_record(ident, lbrace, field_list, rbrace):
+    node = RecordLiteralExpressionNode(ident.value, field_list[0], field_list[1])
+    node.line_number = ident.lineno
+    for expr in field_list[1]:
+        expr.parent_node = node
+    return node
+
+def a_expr_unary_minus(minus, expr):
+    node = UnaryMinusOperatorNode(expr)
+    node.line_number = minus.lineno
+    expr.parent_node = node
+    return node
+
+# Classes of the nodes of the binary operators indexed by the operator.
+_binary_operators = {
+    '+': PlusOperatorNode,
+    '-': MinusOperatorNode,
+    '*': TimesOperatorNode,
+    '/': DivideOperatorNode,
+    '=': EqualsOperatorNode,
+    '<>': NotEqualsOperatorNode,
+    '<': LessThanOperatorNode,
+    '<=': LessEqualsThanOperatorNode,
+    '>': GreaterThanOperatorNode,
+    '>=': GreaterEqualsThanOperatorNode,
+    '&': AndOperatorNode,
+    '|': OrOperatorNode,
+}
+
+def a_expr_bin_op(left, operator, right):
+    node = _binary_operators[operator.value](left, right)
+    node.line_number = operator.lineno
+    left.parent_node = node
+    right.parent_node = node
+    return node
+
+def a_expr_expr_seq(lparen, expr_seq, rparen):
+    expr_seq.line_number = lparen.lineno
+    return expr_seq
+
+def a_expr_assign(lvalue, assign, expr):
+    node = AssignmentNode(lvalue, expr)
+    node.line_number = assign.lineno
+    lvalue.parent_node = node
+    expr.parent_node = node
+    return node
+
+def a_expr_func(ident, lparen, expr_list, rparen):
+    node = FunctionCallNode(ident.value, expr_list)
+    node.line_number = ident.lineno
+    for expr in expr_list:
+        expr.parent_node = node
+    return node
+
+def a_expr_if(if_, condition, then, then_expr):
+    node = IfThenStatementNode(condition, then_expr)
+    node.line_number = if_.lineno
+    condition.parent_node = node
+    then_expr.parent_node = node
+    return node
+
+def a_expr_if_else(if_, condition, then, then_expr, else_, else_expr):
+    node = IfThenElseStatementNode(condition, then_expr, else_expr)
+    node.line_number = if_.lineno
+    condition.parent_node = node
+    then_expr.parent_node = node
+    else_expr.parent_node = node
+    return node
+
+def a_expr_while(while_, condition, do, expr):
+    node = WhileStatementNode(condition, expr)
+    node.line_number = while_.lineno
+    condition.parent_node = node
+    expr.parent_node = node
+    return node
+
+def a_expr_for(for_, ident, assign, lower, to, upper, do, expr):
+    node = ForStatementNode(ident.value, lower, upper, expr)
+    node.line_number = for_.lineno
+    lower.parent_node = node
+    upper.parent_node = node
+    expr.parent_node = node
+    return node
+
+def a_expr_break(break_):
+    node = BreakStatementNode()
+    node.line_number = break_.lineno
+    return node
+
+def a_expr_let(let, dec_group, in_, expr_seq, end):
+    node = LetNode(dec_group[0], dec_group[1], dec_group[2], expr_seq)
+    node.line_number = let.lineno
+    for dec in itertools.chain(dec_group[0], dec_group[1], dec_group[2]):
+        dec.parent_node = node
+    expr_seq.parent_node = node
+    return node
+
+def a_lvalue_id(ident):
+    node = VariableAccessNode(ident.value)
+    node.line_number = ident.lineno
+    return node
+
+def a_lvalue_record(lvalue, period, ident):
+    node = RecordAccessNode(lvalue, ident.value)
+    node.line_number = period.lineno
+    lvalue.parent_node = node
+    return node
+
+def a_lvalue_array(ident, lbracket, expr, rbracket):
+    variable = VariableAccessNode(ident.value)
+    variable.line_number = ident.lineno
+    node = ArrayAccessNode(variable, expr)
+    node.line_number = lbracket.lineno
+    variable.parent_node = node
+    expr.parent_node = node
+    return node
+
+# The variable access node is built from the identifier, which is not reduced
+# by any production, so the driver assigns its span from the first symbol.
+a_lvalue_array.first_node = 'array'
+
+def a_lvalue_array_lvalue(lvalue, lbracket, expr, rbracket):
+    node = ArrayAccessNode(lvalue, expr)
+    node.line_number = lbracket.lineno
+    lvalue.parent_node = node
+    expr.parent_node = node
+    return node
+
+def a_expr_seq_empty():
+    return ExpressionSequenceNode()
+
+def a_expr_seq_multiple(expr_seq, semicolon, expr):
+    expr_seq.expressions.append(expr)
+    expr.parent_node = expr_seq
+    return expr_seq
+
+def a_expr_seq_single(expr):
+    node = ExpressionSequenceNode()
+    node.expressions.append(expr)
+    expr.parent_node = node
+    return node
+
+def a_dec_group_empty():
+    return ([], [], [])
+
+def a_dec_group_multiple(dec_group, dec):
+    dec_group[0].extend(dec[0])
+    dec_group[1].extend(dec[1])
+    dec_group[2].extend(dec[2])
+    return dec_group
+
+def a_field_list_empty():
+    return ([], [])
+
+def a_field_list_single(field_assign):
+    return ([field_assign[0]], [field_assign[1]])
+
+def a_field_list_multiple(field_list, comma, field_assign):
+    field_list[0].append(field_assign[0])
+    field_list[1].append(field_assign[1])
+    return field_list
+
+def a_field_assign(ident, eq, expr):
+    return (ident.value, expr)
+
+def a_expr_list_empty():
+    return []
+
+def a_expr_list_multiple(expr_list, comma, expr):
+    expr_list.append(expr)
+    return expr_list
+
+def a_expr_list_single(expr):
+    return [expr]
+
+def a_dec_type_dec_group(type_dec_group):
+    return ([type_dec_group], [], [])
+
+def a_dec_var(var_dec):
+    return ([], [], [var_dec])
+
+def a_dec_func_dec_group(func_dec_group):
+    return ([], [func_dec_group], [])
+
+def a_func_dec_group_single(func_dec):
+    node = FunctionDeclarationGroupNode()
+    node.declarations.append(func_dec)
+    func_dec.parent_node = node
+    return node
+
+def a_func_dec_group_multiple(func_dec_group, func_dec):
+    func_dec_group.declarations.append(func_dec)
+    func_dec.parent_node = func_dec_group
+    return func_dec_group
+
+def a_type_dec_group_single(type_dec):
+    node = TypeDeclarationGroupNode()
+    node.declarations.append(type_dec)
+    type_dec.parent_node = node
+    return node
+
+def a_type_dec_group_multiple(type_dec_group, type_dec):
+    type_dec_group.declarations.append(type_dec)
+    type_dec.parent_node = type_dec_group
+    return type_dec_group
+
+def a_type_dec(type_, ident, eq, type_node):
+    type_node.name = ident.value
+    type_node.line_number = type_.lineno
+    return type_node
+
+def a_type_alias(ident):
+    return AliasTypeDeclarationNode(None, ident.value)
+
+def a_type_record(lbrace, field_types, rbrace):
+    return RecordDeclarationNode(None, field_types[0], field_types[1])
+
+def a_type_array(array, of, ident):
+    return ArrayDeclarationNode(None, ident.value)
+
+def a_field_types_empty():
+    return ([], [])
+
+def a_field_types_single(field_type):
+    return ([field_type[0]], [field_type[1]])
+
+def a_field_types_multiple(field_types, comma, field_type):
+    field_types[0].append(field_type[0])
+    field_types[1].append(field_type[1])
+    return field_types
+
+def a_field_type(ident, colon, type_ident):
+    return (ident.value, type_ident.value)
+
+def a_var_dec_without_type(var, ident, assign, expr):
+    node = InferredVariableDeclarationNode(ident.value, expr)
+    node.line_number = var.lineno
+    expr.parent_node = node
+    return node
+
+def a_var_dec_with_type(var, ident, colon, type_ident, assign, expr):
+    node = StaticVariableDeclarationNode(ident.value, expr, type_ident.value)
+    node.line_number = var.lineno
+    expr.parent_node = node
+    return node
+
+def a_func_dec_without_return(function, ident, lparen, field_types, rparen, eq, body):
+    node = ProcedureDeclarationNode(ident.value, field_types[0], field_types[1], body)
+    node.line_number = function.lineno
+    body.parent_node = node
+    return node
+
+def a_func_dec_with_return(function, ident, lparen, field_types, rparen, colon, type_ident, eq, body):
+    node = FunctionDeclarationNode(ident.value, field_types[0], field_types[1], body, type_ident.value)
+    node.line_number = function.lineno
+    body.parent_node = node
+    return node
+
+
+# Semantic actions indexed by the name of the corresponding
+# function of the grammar defined in the parser module.
+actions = dict([('p' + name[1:], value) for name, value in globals().items()
+                if name.startswith('a_')])
@@ -4,6 +4,6 @@ _lextokens    = {'THEN': 1, 'DO': 1, 'LBRACKET': 1, 'WHILE': 1, 'COLON': 1, 'INT
 _lexreflags   = 0
 _lexliterals  = ''
 _lexstateinfo = {'COMMENT': 'exclusive', 'INITIAL': 'inclusive'}
-_lexstatere   = {'COMMENT': [('(?P<t_ANY_comment_begin>/\\*)|(?P<t_COMMENT_comment_end>\\*/)|(?P<t_ANY_newline>\\r*\\n(\\r|\\n)*)', [None, ('t_ANY_comment_begin', 'comment_begin'), ('t_COMMENT_comment_end', 'comment_end'), ('t_ANY_newline', 'newline')])], 'INITIAL': [('(?P<t_ANY_comment_begin>/\\*)|(?P<t_ANY_newline>\\r*\\n(\\r|\\n)*)|(?P<t_ID>[a-zA-Z][a-zA-Z0-9_]*)|(?P<t_STRLIT>\\"((\\\\[nt])|(\\\\")|(\\\\\\\\)|(\\\\\\^[@A-Z[\\]^_])|(\\\\[0-9]{3})|(\\\\\\s+\\\\)|([^\\\\"]))*\\")|(?P<t_INTLIT>\\d+)|(?P<t_RBRACE>\\})|(?P<t_LE><=)|(?P<t_LBRACKET>\\[)|(?P<t_NE><>)|(?P<t_PLUS>\\+)|(?P<t_LPAREN>\\()|(?P<t_OR>\\|)|(?P<t_LBRACE>\\{)|(?P<t_PERIOD>\\.)|(?P<t_TIMES>\\*)|(?P<t_RBRACKET>\\])|(?P<t_GE>>=)|(?P<t_RPAREN>\\))|(?P<t_ASSIGN>:=)|(?P<t_LT><)|(?P<t_AND>&)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_EQ>=)|(?P<t_DIVIDE>/)|(?P<t_MINUS>-)|(?P<t_SEMICOLON>;)|(?P<t_GT>>)', [None, ('t_ANY_comment_begin', 'comment_begin'), ('t_ANY_newline', 'newline'), None, ('t_ID', 'ID'), ('t_STRLIT', 'STRLIT'), None, None, None, None, None, None, None, None, (None, 'INTLIT'), (None, 'RBRACE'), (None, 'LE'), (None, 'LBRACKET'), (None, 'NE'), (None, 'PLUS'), (None, 'LPAREN'), (None, 'OR'), (None, 'LBRACE'), (None, 'PERIOD'), (None, 'TIMES'), (None, 'RBRACKET'), (None, 'GE'), (None, 'RPAREN'), (None, 'ASSIGN'), (None, 'LT'), (None, 'AND'), (None, 'COLON'), (None, 'COMMA'), (None, 'EQ'), (None, 'DIVIDE'), (None, 'MINUS'), (None, 'SEMICOLON'), (None, 'GT')])]}
+_lexstatere   = {'COMMENT': [('(?P<t_ANY_comment_begin>/\\*)|(?P<t_COMMENT_comment_end>\\*/)|(?P<t_ANY_newline>\\r*\\n(\\r|\\n)*)', [None, ('t_ANY_comment_begin', 'comment_begin'), ('t_COMMENT_comment_end', 'comment_end'), ('t_ANY_newline', 'newline')])], 'INITIAL': [('(?P<t_ANY_comment_begin>/\\*)|(?P<t_ANY_newline>\\r*\\n(\\r|\\n)*)|(?P<t_ID>[a-zA-Z][a-zA-Z0-9_]*)|(?P<t_INTLIT>\\d+)|(?P<t_STRLIT>\\")|(?P<t_RBRACE>\\})|(?P<t_LE><=)|(?P<t_LBRACKET>\\[)|(?P<t_NE><>)|(?P<t_PLUS>\\+)|(?P<t_ASSIGN>:=)|(?P<t_LPAREN>\\()|(?P<t_OR>\\|)|(?P<t_LBRACE>\\{)|(?P<t_PERIOD>\\.)|(?P<t_TIMES>\\*)|(?P<t_RBRACKET>\\])|(?P<t_GE>>=)|(?P<t_RPAREN>\\))|(?P<t_LT><)|(?P<t_AND>&)|(?P<t_COLON>:)|(?P<t_COMMA>,)|(?P<t_DIVIDE>/)|(?P<t_MINUS>-)|(?P<t_SEMICOLON>;)|(?P<t_EQ>=)|(?P<t_GT>>)', [None, ('t_ANY_comment_begin', 'comment_begin'), ('t_ANY_newline', 'newline'), None, ('t_ID', 'ID'), ('t_INTLIT', 'INTLIT'), ('t_STRLIT', 'STRLIT'), (None, 'RBRACE'), (None, 'LE'), (None, 'LBRACKET'), (None, 'NE'), (None, 'PLUS'), (None, 'ASSIGN'), (None, 'LPAREN'), (None, 'OR'), (None, 'LBRACE'), (None, 'PERIOD'), (None, 'TIMES'), (None, 'RBRACKET'), (None, 'GE'), (None, 'RPAREN'), (None, 'LT'), (None, 'AND'), (None, 'COLON'), (None, 'COMMA'), (None, 'DIVIDE'), (None, 'MINUS'), (None, 'SEMICOLON'), (None, 'EQ'), (None, 'GT')])]}
 _lexstateignore = {'COMMENT': ' \t', 'INITIAL': ' \t'}
 _lexstateerrorf = {'COMMENT': 't_COMMENT_error', 'INITIAL': 't_error'}
@@ -1,93 +0,0 @@
-
-# /home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/cache/parser.py
-# This file is automatically generated. Do not edit.
-_tabversion = '3.2'
-
-_lr_method = 'LALR'
-
-_lr_signature = '\x861\xe3#\xea9\x87\xa0r-\xc7A<i\x07\x06'
-    
-_lr_action_items = {'DO':([2,3,4,9,11,12,15,19,41,42,46,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,83,84,86,100,104,105,106,123,],[-3,-4,-5,-30,-2,-28,40,-8,-31,-22,-21,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-7,-32,-23,-24,-29,116,-6,-25,-27,]),'THEN':([2,3,4,9,11,12,19,26,41,42,46,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,83,84,86,100,105,106,123,],[-3,-4,-5,-30,-2,-28,-8,53,-31,-22,-21,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-7,-32,-23,-24,-29,-6,-25,-27,]),'LBRACKET':([4,9,41,77,83,],[18,24,-31,-33,-32,]),'WHILE':([0,1,5,8,10,17,18,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,58,82,85,93,96,98,102,116,120,125,133,],[1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,]),'COLON':([90,109,117,],[101,119,124,]),'INTLIT':([0,1,5,8,10,17,18,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,58,82,85,93,96,98,102,116,120,125,133,],[2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,]),'MINUS':([0,1,2,3,4,5,8,9,10,11,12,14,15,17,18,19,22,24,25,26,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,50,52,53,58,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,82,83,84,85,86,93,95,96,97,98,100,102,104,105,106,111,116,120,123,125,128,132,133,134,],[5,5,-3,-4,-5,5,5,-30,5,-2,-28,38,38,5,5,-8,38,5,5,38,5,5,5,5,5,5,5,5,5,5,5,5,5,-31,38,38,5,5,-21,38,38,5,5,38,38,38,-12,38,-11,38,38,-9,38,-10,38,38,-33,38,38,-7,5,-32,-23,5,38,5,38,5,38,5,-29,5,38,38,38,38,5,5,38,5,38,38,5,38,]),'DIVIDE':([2,3,4,9,11,12,14,15,19,22,26,41,42,43,46,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,86,95,97,100,104,105,106,111,123,128,132,134,],[-3,-4,-5,-30,-2,-28,31,31,-8,31,31,-31,31,31,-21,31,31,31,31,31,-12,31,-11,31,31,31,31,31,31,31,-33,31,31,-7,-32,-23,31,31,31,-29,31,31,31,31,31,31,31,31,]),'STRLIT':([0,1,5,8,10,17,18,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,58,82,85,93,96,98,102,116,120,125,133,],[3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'LE':([2,3,4,9,11,12,14,15,19,22,26,41,42,43,46,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,86,95,97,100,104,105,106,111,123,128,132,134,],[-3,-4,-5,-30,-2,-28,29,29,-8,29,29,-31,29,29,-21,29,29,29,None,None,-12,None,-11,None,None,-9,None,-10,29,29,-33,29,29,-7,-32,-23,29,29,29,-29,29,29,29,29,29,29,29,29,]),'RPAREN':([2,3,4,8,9,11,12,19,21,22,25,41,42,46,51,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,80,83,84,86,97,99,100,105,106,107,108,123,126,127,],[-3,-4,-5,-34,-30,-2,-28,-8,46,-36,-43,-31,-22,-21,84,-45,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-35,-7,-32,-23,-24,-44,-57,-29,-6,-25,-58,117,-27,-59,-60,]),'SEMICOLON':([2,3,4,8,9,11,12,19,21,22,41,42,46,58,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,80,83,84,86,89,100,105,106,123,],[-3,-4,-5,-34,-30,-2,-28,-8,45,-36,-31,-22,-21,-34,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-35,-7,-32,-23,-24,45,-29,-6,-25,-27,]),'NE':([2,3,4,9,11,12,14,15,19,22,26,41,42,43,46,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,86,95,97,100,104,105,106,111,123,128,132,134,],[-3,-4,-5,-30,-2,-28,32,32,-8,32,32,-31,32,32,-21,32,32,32,None,None,-12,None,-11,None,None,-9,None,-10,32,32,-33,32,32,-7,-32,-23,32,32,32,-29,32,32,32,32,32,32,32,32,]),'TO':([2,3,4,9,11,12,19,41,42,46,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,80,83,84,86,100,105,106,123,],[-3,-4,-5,-30,-2,-28,-8,-31,-22,-21,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,93,-7,-32,-23,-24,-29,-6,-25,-27,]),'LT':([2,3,4,9,11,12,14,15,19,22,26,41,42,43,46,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,86,95,97,100,104,105,106,111,123,128,132,134,],[-3,-4,-5,-30,-2,-28,34,34,-8,34,34,-31,34,34,-21,34,34,34,None,None,-12,None,-11,None,None,-9,None,-10,34,34,-33,34,34,-7,-32,-23,34,34,34,-29,34,34,34,34,34,34,34,34,]),'PLUS':([2,3,4,9,11,12,14,15,19,22,26,41,42,43,46,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,86,95,97,100,104,105,106,111,123,128,132,134,],[-3,-4,-5,-30,-2,-28,36,36,-8,36,36,-31,36,36,-21,36,36,36,36,36,-12,36,-11,36,36,-9,36,-10,36,36,-33,36,36,-7,-32,-23,36,36,36,-29,36,36,36,36,36,36,36,36,]),'COMMA':([2,3,4,9,11,12,19,23,25,41,42,46,47,48,51,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,83,84,86,94,95,97,99,100,105,106,107,108,112,121,123,126,127,],[-3,-4,-5,-30,-2,-28,-8,-39,-43,-31,-22,-21,-40,81,85,-45,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-7,-32,-23,-24,-41,-42,-44,-57,-29,-6,-25,-58,118,-57,118,-27,-59,-60,]),'ARRAY':([103,],[114,]),'ASSIGN':([4,9,20,41,77,83,90,110,],[17,-30,44,-31,-33,-32,102,120,]),'$end':([2,3,4,6,9,11,12,14,19,41,42,46,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,83,84,86,100,105,106,123,],[-3,-4,-5,0,-30,-2,-28,-1,-8,-31,-22,-21,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-7,-32,-23,-24,-29,-6,-25,-27,]),'FUNCTION':([2,3,4,9,11,12,13,19,27,41,42,46,54,56,57,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,83,84,86,88,91,100,105,106,111,113,115,123,128,129,130,132,134,],[-3,-4,-5,-30,-2,-28,-37,-8,55,-31,-22,-21,-47,-49,-46,-51,55,-38,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-7,-32,-23,-24,-52,-50,-29,-6,-25,-61,-53,-54,-27,-62,-55,-56,-63,-64,]),'GT':([2,3,4,9,11,12,14,15,19,22,26,41,42,43,46,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,86,95,97,100,104,105,106,111,123,128,132,134,],[-3,-4,-5,-30,-2,-28,35,35,-8,35,35,-31,35,35,-21,35,35,35,None,None,-12,None,-11,None,None,-9,None,-10,35,35,-33,35,35,-7,-32,-23,35,35,35,-29,35,35,35,35,35,35,35,35,]),'END':([2,3,4,9,11,12,19,22,41,42,46,58,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,80,83,84,86,89,100,105,106,123,],[-3,-4,-5,-30,-2,-28,-8,-36,-31,-22,-21,-34,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-35,-7,-32,-23,-24,100,-29,-6,-25,-27,]),'RBRACE':([2,3,4,9,11,12,19,23,41,42,46,47,48,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,83,84,86,94,95,100,105,106,107,112,121,123,126,127,],[-3,-4,-5,-30,-2,-28,-8,-39,-31,-22,-21,-40,80,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-7,-32,-23,-24,-41,-42,-29,-6,-25,-58,-57,129,-27,-59,-60,]),'FOR':([0,1,5,8,10,17,18,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,58,82,85,93,96,98,102,116,120,125,133,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'PERIOD':([4,9,41,77,83,],[16,-30,-31,-33,-32,]),'ELSE':([2,3,4,9,11,12,19,41,42,46,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,83,84,86,100,105,106,123,],[-3,-4,-5,-30,-2,-28,-8,-31,-22,-21,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-7,-32,-23,98,-29,-6,-25,-27,]),'GE':([2,3,4,9,11,12,14,15,19,22,26,41,42,43,46,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,86,95,97,100,104,105,106,111,123,128,132,134,],[-3,-4,-5,-30,-2,-28,30,30,-8,30,30,-31,30,30,-21,30,30,30,None,None,-12,None,-11,None,None,-9,None,-10,30,30,-33,30,30,-7,-32,-23,30,30,30,-29,30,30,30,30,30,30,30,30,]),'LPAREN':([0,1,5,8,9,10,17,18,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,58,82,85,87,93,96,98,102,116,120,125,133,],[8,8,8,8,25,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,99,8,8,8,8,8,8,8,8,]),'IN':([2,3,4,9,11,12,13,19,27,41,42,46,54,56,57,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,83,84,86,88,91,100,105,106,111,113,115,123,128,129,130,132,134,],[-3,-4,-5,-30,-2,-28,-37,-8,58,-31,-22,-21,-47,-49,-46,-51,-48,-38,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-7,-32,-23,-24,-52,-50,-29,-6,-25,-61,-53,-54,-27,-62,-55,-56,-63,-64,]),'VAR':([2,3,4,9,11,12,13,19,27,41,42,46,54,56,57,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,83,84,86,88,91,100,105,106,111,113,115,123,128,129,130,132,134,],[-3,-4,-5,-30,-2,-28,-37,-8,59,-31,-22,-21,-47,-49,-46,-51,-48,-38,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-7,-32,-23,-24,-52,-50,-29,-6,-25,-61,-53,-54,-27,-62,-55,-56,-63,-64,]),'TIMES':([2,3,4,9,11,12,14,15,19,22,26,41,42,43,46,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,86,95,97,100,104,105,106,111,123,128,132,134,],[-3,-4,-5,-30,-2,-28,33,33,-8,33,33,-31,33,33,-21,33,33,33,33,33,-12,33,-11,33,33,33,33,33,33,33,-33,33,33,-7,-32,-23,33,33,33,-29,33,33,33,33,33,33,33,33,]),'EQ':([2,3,4,9,11,12,14,15,19,22,26,41,42,43,46,49,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,86,92,95,97,100,104,105,106,111,117,123,128,131,132,134,],[-3,-4,-5,-30,-2,-28,37,37,-8,37,37,-31,37,37,-21,82,37,37,37,None,None,-12,None,-11,None,None,-9,None,-10,37,37,-33,37,37,-7,-32,-23,37,103,37,37,-29,37,37,37,37,125,37,37,133,37,37,]),'ID':([0,1,5,7,8,10,16,17,18,23,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,55,58,59,63,81,82,85,93,96,98,99,101,102,103,112,116,118,119,120,122,124,125,133,],[9,9,9,20,9,9,41,9,9,49,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,87,9,90,92,49,9,9,9,9,9,109,110,9,115,109,9,109,127,9,130,131,9,9,]),'IF':([0,1,5,8,10,17,18,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,58,82,85,93,96,98,102,116,120,125,133,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'AND':([2,3,4,9,11,12,14,15,19,22,26,41,42,43,46,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,86,95,97,100,104,105,106,111,123,128,132,134,],[-3,-4,-5,-30,-2,-28,28,28,-8,28,28,-31,28,28,-21,28,28,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,28,28,-33,28,28,-7,-32,-23,28,28,28,-29,28,28,28,28,28,28,28,28,]),'LBRACE':([9,103,],[23,112,]),'NIL':([0,1,5,8,10,17,18,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,58,82,85,93,96,98,102,116,120,125,133,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,]),'OF':([83,114,],[96,122,]),'BREAK':([0,1,5,8,10,17,18,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,58,82,85,93,96,98,102,116,120,125,133,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'LET':([0,1,5,8,10,17,18,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,58,82,85,93,96,98,102,116,120,125,133,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'RBRACKET':([2,3,4,9,11,12,19,41,42,43,46,50,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,83,84,86,100,105,106,123,],[-3,-4,-5,-30,-2,-28,-8,-31,-22,77,-21,83,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-7,-32,-23,-24,-29,-6,-25,-27,]),'TYPE':([2,3,4,9,11,12,13,19,27,41,42,46,54,56,57,60,61,62,64,65,66,67,68,69,70,71,72,73,74,75,76,77,80,83,84,86,88,91,100,105,106,111,113,115,123,128,129,130,132,134,],[-3,-4,-5,-30,-2,-28,-37,-8,63,-31,-22,-21,-47,-49,63,-51,-48,-38,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,-26,-33,-7,-32,-23,-24,-52,-50,-29,-6,-25,-61,-53,-54,-27,-62,-55,-56,-63,-64,]),'OR':([2,3,4,9,11,12,14,15,19,22,26,41,42,43,46,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,83,84,86,95,97,100,104,105,106,111,123,128,132,134,],[-3,-4,-5,-30,-2,-28,39,39,-8,39,39,-31,39,39,-21,39,39,-19,-16,-18,-12,-14,-11,-15,-17,-9,-13,-10,-20,39,-33,39,39,-7,-32,-23,39,39,39,-29,39,39,39,39,39,39,39,39,]),}
-
-_lr_action = { }
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = { }
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'func_dec_group':([27,],[61,]),'func_dec':([27,61,],[56,91,]),'expr_seq':([8,58,],[21,89,]),'field_type':([99,112,118,],[107,107,126,]),'expr_list':([25,],[51,]),'lvalue':([0,1,5,8,10,17,18,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,58,82,85,93,96,98,102,116,120,125,133,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'var_dec':([27,],[54,]),'field_assign':([23,81,],[47,94,]),'field_list':([23,],[48,]),'field_types':([99,112,],[108,121,]),'program':([0,],[6,]),'expr':([0,1,5,8,10,17,18,24,25,28,29,30,31,32,33,34,35,36,37,38,39,40,44,45,53,58,82,85,93,96,98,102,116,120,125,133,],[14,15,19,22,26,42,43,50,52,64,65,66,67,68,69,70,71,72,73,74,75,76,78,79,86,22,95,97,104,105,106,111,123,128,132,134,]),'type_dec':([27,57,],[60,88,]),'type_dec_group':([27,],[57,]),'dec':([27,],[62,]),'type':([103,],[113,]),'dec_group':([13,],[27,]),}
-
-_lr_goto = { }
-for _k, _v in _lr_goto_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = { }
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> program","S'",1,None,None,None),
-  ('program -> expr','program',1,'p_program','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',58),
-  ('expr -> NIL','expr',1,'p_expr_nil','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',68),
-  ('expr -> INTLIT','expr',1,'p_expr_int','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',73),
-  ('expr -> STRLIT','expr',1,'p_expr_str','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',78),
-  ('expr -> lvalue','expr',1,'p_expr_lvalue','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',84),
-  ('expr -> ID LBRACKET expr RBRACKET OF expr','expr',6,'p_expr_array','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',89),
-  ('expr -> ID LBRACE field_list RBRACE','expr',4,'p_expr_record','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',97),
-  ('expr -> MINUS expr','expr',2,'p_expr_unary_minus','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',103),
-  ('expr -> expr PLUS expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',111),
-  ('expr -> expr MINUS expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',112),
-  ('expr -> expr TIMES expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',113),
-  ('expr -> expr DIVIDE expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',114),
-  ('expr -> expr EQ expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',115),
-  ('expr -> expr NE expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',116),
-  ('expr -> expr LT expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',117),
-  ('expr -> expr LE expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',118),
-  ('expr -> expr GT expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',119),
-  ('expr -> expr GE expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',120),
-  ('expr -> expr AND expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',121),
-  ('expr -> expr OR expr','expr',3,'p_expr_bin_op','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',122),
-  ('expr -> LPAREN expr_seq RPAREN','expr',3,'p_expr_expr_seq','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',154),
-  ('expr -> lvalue ASSIGN expr','expr',3,'p_expr_assign','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',160),
-  ('expr -> ID LPAREN expr_list RPAREN','expr',4,'p_expr_func','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',168),
-  ('expr -> IF expr THEN expr','expr',4,'p_expr_if','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',176),
-  ('expr -> IF expr THEN expr ELSE expr','expr',6,'p_expr_if_else','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',183),
-  ('expr -> WHILE expr DO expr','expr',4,'p_expr_while','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',191),
-  ('expr -> FOR ID ASSIGN expr TO expr DO expr','expr',8,'p_expr_for','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',198),
-  ('expr -> BREAK','expr',1,'p_expr_break','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',206),
-  ('expr -> LET dec_group IN expr_seq END','expr',5,'p_expr_let','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',212),
-  ('lvalue -> ID','lvalue',1,'p_lvalue_id','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',221),
-  ('lvalue -> lvalue PERIOD ID','lvalue',3,'p_lvalue_record','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',226),
-  ('lvalue -> ID LBRACKET expr RBRACKET','lvalue',4,'p_lvalue_array','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',232),
-  ('lvalue -> lvalue LBRACKET expr RBRACKET','lvalue',4,'p_lvalue_array_lvalue','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',240),
-  ('expr_seq -> <empty>','expr_seq',0,'p_expr_seq_empty','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',248),
-  ('expr_seq -> expr_seq SEMICOLON expr','expr_seq',3,'p_expr_seq_multiple','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',252),
-  ('expr_seq -> expr','expr_seq',1,'p_expr_seq_single','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',258),
-  ('dec_group -> <empty>','dec_group',0,'p_dec_group_empty','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',267),
-  ('dec_group -> dec_group dec','dec_group',2,'p_dec_group_multiple','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',271),
-  ('field_list -> <empty>','field_list',0,'p_field_list_empty','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',280),
-  ('field_list -> field_assign','field_list',1,'p_field_list_single','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',284),
-  ('field_list -> field_list COMMA field_assign','field_list',3,'p_field_list_multiple','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',288),
-  ('field_assign -> ID EQ expr','field_assign',3,'p_field_assign','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',294),
-  ('expr_list -> <empty>','expr_list',0,'p_expr_list_empty','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',299),
-  ('expr_list -> expr_list COMMA expr','expr_list',3,'p_expr_list_multiple','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',303),
-  ('expr_list -> expr','expr_list',1,'p_expr_list_single','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',308),
-  ('dec -> type_dec_group','dec',1,'p_dec_type_dec_group','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',316),
-  ('dec -> var_dec','dec',1,'p_dec_var','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',321),
-  ('dec -> func_dec_group','dec',1,'p_dec_func_dec_group','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',328),
-  ('func_dec_group -> func_dec','func_dec_group',1,'p_func_dec_group_single','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',333),
-  ('func_dec_group -> func_dec_group func_dec','func_dec_group',2,'p_func_dec_group_multiple','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',341),
-  ('type_dec_group -> type_dec','type_dec_group',1,'p_type_dec_group_single','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',348),
-  ('type_dec_group -> type_dec_group type_dec','type_dec_group',2,'p_type_dec_group_multiple','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',356),
-  ('type_dec -> TYPE ID EQ type','type_dec',4,'p_type_dec','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',363),
-  ('type -> ID','type',1,'p_type_alias','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',370),
-  ('type -> LBRACE field_types RBRACE','type',3,'p_type_record','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',375),
-  ('type -> ARRAY OF ID','type',3,'p_type_array','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',380),
-  ('field_types -> <empty>','field_types',0,'p_field_types_empty','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',385),
-  ('field_types -> field_type','field_types',1,'p_field_types_single','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',389),
-  ('field_types -> field_types COMMA field_type','field_types',3,'p_field_types_multiple','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',393),
-  ('field_type -> ID COLON ID','field_type',3,'p_field_type','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',401),
-  ('var_dec -> VAR ID ASSIGN expr','var_dec',4,'p_var_dec_without_type','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',406),
-  ('var_dec -> VAR ID COLON ID ASSIGN expr','var_dec',6,'p_var_dec_with_type','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',412),
-  ('func_dec -> FUNCTION ID LPAREN field_types RPAREN EQ expr','func_dec',7,'p_func_dec_without_return','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',419),
-  ('func_dec -> FUNCTION ID LPAREN field_types RPAREN COLON ID EQ expr','func_dec',9,'p_func_dec_with_return','/home/yasserglez/Workspace/PyTiger2C/packages/pytiger2c/grammar/parser.py',425),
-]
@@ -4,11 +4,192 @@
 Elementos utilizados durante el análisis léxico-gráfico y sintáctico.
 """
 
+import re
+import bisect
+
+from pytiger2c.errors import SyntacticError
+
+
+# Continuation bytes of the characters of a program encoded in UTF-8.
+_continuation_re = re.compile('[\x80-\xbf]')
+
+
+class LineIndex(object):
+    """
+    Índice de las posiciones donde comienza cada línea de un flujo de 
+    caracteres de entrada.
+    
+    El índice se construye recorriendo una sola vez el flujo de entrada y 
+    permite obtener la línea y la columna correspondientes a una posición 
+    del flujo de entrada realizando una búsqueda binaria.
+    
+    Si el flujo de entrada no es una instancia de C{unicode}, sino los bytes
+    del programa codificado en UTF-8 (por ejemplo, un archivo proyectado en
+    memoria), las posiciones son posiciones de bytes. En este caso el índice
+    guarda también las posiciones de los bytes de continuación de los
+    caracteres que no son ASCII, de forma que las columnas se cuentan en 
+    caracteres, igual que si el flujo de entrada se hubiera decodificado.
+    """
+    
+    def _get_data(self):
+        """
+        Método para obtener el valor de la propiedad C{data}.
+        """
+        return self._data
+    
+    data = property(_get_data)
+    
+    def __init__(self, data):
+        """
+        Construye el índice de las líneas de un flujo de caracteres de entrada.
+        
+        @type data: C{unicode}
+        @param data: Flujo de caracteres de entrada o bytes del programa
+            codificado en UTF-8.
+        """
+        super(LineIndex, self).__init__()
+        self._data = data
+        self._line_starts = [0]
+        find = data.find
+        index = find('\n')
+        while index >= 0:
+            index += 1
+            self._line_starts.append(index)
+            index = find('\n', index)
+        if isinstance(data, unicode):
+            self._continuations = None
+        else:
+            self._continuations = [match.start() for match in _continuation_re.finditer(data)]
+        
+    def line(self, pos):
+        """
+        Calcula el número de la línea correspondiente a una posición del 
+        flujo de entrada.
+        
+        @type pos: C{int}
+        @param pos: Posición del flujo de entrada.
+        
+        @rtype: C{int}
+        @return: Número de la línea, comenzando en 1.
+        """
+        return bisect.bisect_right(self._line_starts, pos)
+    
+    def position(self, pos):
+        """
+        Calcula el número de la línea y de la columna correspondientes a una
+        posición del flujo de entrada.
+        
+        @type pos: C{int}
+        @param pos: Posición del flujo de entrada.
+        
+        @rtype: C{tuple}
+        @return: Tupla con el número de la línea y el número de la columna,
+            ambos comenzando en 1.
+        """
+        line = bisect.bisect_right(self._line_starts, pos)
+        start = self._line_starts[line - 1]
+        column = pos - start + 1
+        continuations = self._continuations
+        if continuations:
+            column -= bisect.bisect_left(continuations, pos) - \
+                bisect.bisect_left(continuations, start)
+        return line, column
+
+    def replace(self, start, end, text):
+        """
+        Construye el índice de las líneas del flujo de entrada que se obtiene
+        al sustituir una parte de este flujo de entrada. Solamente se busca
+        el inicio de las líneas en el texto nuevo.
+
+        @type start: C{int}
+        @param start: Posición del primer caracter sustituido.
+
+        @type end: C{int}
+        @param end: Posición siguiente al último caracter sustituido.
+
+        @type text: C{unicode}
+        @param text: Texto que sustituye a los caracteres entre las
+            posiciones C{start} y C{end}.
+
+        @rtype: C{LineIndex}
+        @return: Índice de las líneas del nuevo flujo de entrada, que se 
+            puede obtener con su propiedad C{data}.
+        """
+        starts = self._line_starts
+        delta = len(text) - (end - start)
+        inserted = []
+        index = text.find('\n')
+        while index >= 0:
+            inserted.append(start + index + 1)
+            index = text.find('\n', index + 1)
+        line_index = LineIndex.__new__(LineIndex)
+        line_index._data = self._data[:start] + text + self._data[end:]
+        line_index._line_starts = starts[:bisect.bisect_right(starts, start)] + inserted + \
+            [line_start + delta for line_start in starts[bisect.bisect_right(starts, end):]]
+        continuations = self._continuations
+        if continuations is None:
+            line_index._continuations = None
+        else:
+            line_index._continuations = \
+                continuations[:bisect.bisect_left(continuations, start)] + \
+                [start + match.start() for match in _continuation_re.finditer(text)] + \
+                [pos + delta for pos in continuations[bisect.bisect_left(continuations, end):]]
+        return line_index
+
+    def offset(self, line, column):
+        """
+        Calcula la posición del flujo de entrada correspondiente a un número
+        de línea y un número de columna. Es la operación inversa del método
+        C{position}.
+
+        @type line: C{int}
+        @param line: Número de la línea, comenzando en 1.
+
+        @type column: C{int}
+        @param column: Número de la columna, comenzando en 1.
+
+        @rtype: C{int}
+        @return: Posición del flujo de entrada.
+        """
+        start = self._line_starts[line - 1]
+        pos = start + column - 1
+        continuations = self._continuations
+        if continuations:
+            # Skip the continuation bytes of the characters before the column.
+            first = bisect.bisect_left(continuations, start)
+            while True:
+                next_pos = start + column - 1 + \
+                    bisect.bisect_right(continuations, pos) - first
+                if next_pos == pos:
+                    break
+                pos = next_pos
+        return pos
+
+
+def get_line_index(lexer):
+    """
+    Retorna el índice de las líneas del flujo de entrada actual de un 
+    analizador léxico-gráfico. El índice se construye la primera vez que se
+    necesita y se guarda en el analizador léxico-gráfico hasta que cambie
+    su flujo de entrada.
+    
+    @type lexer: C{object}
+    @param lexer: Analizador léxico-gráfico.
+    
+    @rtype: C{LineIndex}
+    @return: Índice de las líneas del flujo de entrada del analizador.
+    """
+    index = getattr(lexer, 'line_index', None)
+    if index is None or index.data is not lexer.lexdata:
+        index = LineIndex(lexer.lexdata)
+        lexer.line_index = index
+    return index
+
 
 def compute_column(token):
     """
-    Calcula el número de la columna del token recibido como parámetro contando
-    hacia atrás en el flujo de entrada hasta encontrar el último salto de línea.
+    Calcula el número de la columna del token recibido como parámetro 
+    utilizando el índice de las líneas del flujo de entrada.
     
     @type token: C{LexToken}
     @param token: Token al que se le quiere calcular el número de columna. 
@@ -16,9 +197,118 @@ def compute_column(token):
     @return: Número de la columna del token.
     @rtype: C{int}    
     """
-    data = token.lexer.lexdata
-    last_newline = data.rfind('\n', 0, token.lexpos)
-    if last_newline < 0:
-        last_newline = 0
-    column = token.lexpos - last_newline
-    return column
+    line, column = get_line_index(token.lexer).position(token.lexpos)
+    # The columns of the first line were always counted starting at 0 
+    # in the error messages. This is kept to produce the same messages.
+    return column if line > 1 else column - 1
+
+
+# Characters that need special treatment inside a string literal.
+_string_special_re = re.compile(r'[\\"]')
+
+# Whitespaces followed by a backslash, closing a \s...\ sequence.
+_string_gap_re = re.compile(r'[ \t\n\r\f\v]+\\')
+
+_string_escapes = frozenset(['n', 't', '"', '\\'])
+
+_string_controls = frozenset('@ABCDEFGHIJKLMNOPQRSTUVWXYZ[]^_')
+
+_string_digits = frozenset('0123456789')
+
+_string_whitespaces = frozenset(' \t\n\r\f\v')
+
+
+def scan_string_literal(token):
+    """
+    Reconoce un literal de cadena de caracteres que comienza en la posición
+    del token recibido como parámetro y lo convierte en un literal de cadena 
+    de caracteres válido en C recorriendo el flujo de entrada una sola vez.
+    
+    Las secuencias de escape C{\\n}, C{\\t}, C{\\"} y C{\\\\} se mantienen sin
+    cambios, las secuencias C{\\^c} y C{\\ddd} se sustituyen por el caracter 
+    correspondiente en notación octal y las secuencias C{\\s...\\} se eliminan.
+    
+    Como resultado, el valor del token será el contenido del literal (sin las
+    comillas) y se actualizan la posición y el número de línea del analizador
+    léxico-gráfico asociado al token.
+    
+    @type token: C{LexToken}
+    @param token: Token cuya posición corresponde a las comillas dobles que 
+        abren el literal de cadena de caracteres.
+    
+    @rtype: C{LexToken}
+    @return: El mismo token recibido como parámetro.
+    
+    @raise SyntacticError: Esta excepción se lanzará si el literal no está 
+        bien formado o no está cerrado, o si contiene una secuencia C{\\ddd}
+        que no corresponde a un caracter ASCII.
+    """
+    lexer = token.lexer
+    data = lexer.lexdata
+    start = token.lexpos
+    pos = start + 1
+    chunks = []
+    invalid_code = False
+    while True:
+        match = _string_special_re.search(data, pos)
+        if match is None:
+            # The string literal was not closed.
+            _illegal_string_literal(token)
+        index = match.start()
+        if index > pos:
+            chunks.append(data[pos:index])
+        if data[index] == '"':
+            pos = index + 1
+            break
+        char = data[index + 1:index + 2]
+        if char in _string_escapes:
+            chunks.append(data[index:index + 2])
+            pos = index + 2
+        elif char == '^' and data[index + 2:index + 3] in _string_controls:
+            chunks.append('\\{0:03o}'.format(ord(data[index + 2]) - 64))
+            pos = index + 3
+        elif char in _string_digits:
+            digits = data[index + 1:index + 4]
+            if len(digits) != 3 or not _string_digits.issuperset(digits):
+                _illegal_string_literal(token)
+            code = int(digits)
+            if code > 255:
+                invalid_code = True
+            chunks.append('\\{0:03o}'.format(code))
+            pos = index + 4
+        elif char in _string_whitespaces:
+            match = _string_gap_re.match(data, index + 1)
+            if match is None:
+                _illegal_string_literal(token)
+            pos = match.end()
+        else:
+            _illegal_string_literal(token)
+    if invalid_code:
+        message = "Invalid string literal at line {line} column {column}"
+        line, column = lexer.lineno, compute_column(token)
+        raise SyntacticError(message.format(line=line, column=column))
+    lexer.lineno += data[start:pos].count('\n')
+    lexer.lexpos = pos
+    value = ''.join(chunks)
+    if isinstance(value, str):
+        # The input is a buffer of bytes encoded in UTF-8.
+        value = value.decode('utf-8')
+    token.value = value
+    return token
+
+
+def _illegal_string_literal(token):
+    """
+    Reporta un literal de cadena de caracteres mal formado de la misma forma 
+    que se reporta un caracter ilegal en el flujo de entrada: indicando las
+    comillas dobles que abren el literal.
+    
+    @type token: C{LexToken}
+    @param token: Token cuya posición corresponde a las comillas dobles que 
+        abren el literal de cadena de caracteres.
+    
+    @raise SyntacticError: Esta excepción se lanza siempre.
+    """
+    message = "Illegal character '{char}' at line {line} column {column}"
+    line, column = token.lexer.lineno, compute_column(token)
+    raise SyntacticError(message.format(char='"', line=line, column=column))
@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+
+"""
+Analizador sintáctico LR compacto para la gramática de Tiger.
+
+El analizador sintáctico construido por PLY busca las acciones en
+diccionarios indexados por los nombres de los tokens y crea un objeto
+C{YaccProduction} en cada reducción para pasar los símbolos de la parte
+derecha de la producción a la función que define la acción semántica. La
+clase C{LRDriver} de este módulo utiliza las mismas tablas LALR construidas
+por PLY, pero los estados y los símbolos se identifican con números enteros
+pequeños y las tablas C{action} y C{goto} se almacenan en arreglos del módulo
+C{array}. Las acciones semánticas se definen en el módulo
+C{pytiger2c.grammar.actions} y reciben directamente los símbolos de la parte
+derecha de la producción.
+
+Opcionalmente, el analizador puede recuperarse de los errores de sintáxis 
+en modo pánico para reportar todos los errores de un programa en un solo 
+análisis. Cuando se encuentra un error, se descartan los tokens de entrada
+hasta encontrar un token de sincronización (C{;}, C{end}, C{in}, C{)} o
+una de las palabras claves que comienzan una declaración) y 
+luego se descartan los estados de la pila hasta encontrar uno en el que el
+token de sincronización sea válido. Las producciones reducidas antes del 
+error se mantienen, por lo que se obtiene un árbol de sintáxis abstracta 
+parcial formado por las partes del programa que no contienen errores.
+"""
+
+import re
+from array import array
+
+from pytiger2c.errors import SyntacticError
+from pytiger2c.contrib.ply.lex import LexToken
+from pytiger2c.ast.languagenode import LanguageNode
+from pytiger2c.grammar.common import get_line_index
+
+
+# Code of the entries without action in the action table. Shifts are coded
+# as the positive number of the new state and reductions of production p
+# as -(p + 1), so accepting (reducing production 0) is coded as -1.
+_ERROR = 0
+
+# Name of the terminal that marks the end of the input.
+_END = '$end'
+
+# Rest of a malformed string literal up to its closing quote on the same
+# line. Escaped quotes and backslashes do not close the literal.
+_literal_end_re = re.compile(r'(?:[^"\\\n]|\\[^\n])*"')
+
+# Tokens used to synchronize the parser after a syntax error. The keywords
+# that begin a declaration are included to keep the following declarations
+# of a let expression after an error in a declaration.
+_SYNC_TOKENS = frozenset(['SEMICOLON', 'END', 'IN', 'RPAREN', 'VAR', 'FUNCTION', 'TYPE'])
+
+
+class LRDriver(object):
+    """
+    Analizador sintáctico LR dirigido por tablas de números enteros.
+
+    Las instancias de esta clase no guardan ningún estado durante el
+    análisis, por lo que una misma instancia puede utilizarse para analizar
+    varios programas simultáneamente desde hilos diferentes.
+    """
+
+    def __init__(self, lrparser, actions, error_func):
+        """
+        Inicializa el analizador sintáctico a partir de las tablas LALR de un
+        analizador sintáctico construido por PLY.
+
+        @type lrparser: C{LRParser}
+        @param lrparser: Analizador sintáctico construido por PLY.
+
+        @type actions: C{dict}
+        @param actions: Diccionario que contiene las acciones semánticas
+            indexadas por el nombre de la función de la gramática de PLY
+            que define cada producción.
+
+        @type error_func: C{function}
+        @param error_func: Función que se llama con el token inesperado
+            (o C{None} si se alcanzó el final de la entrada) cuando se
+            encuentra un error de sintáxis.
+        """
+        super(LRDriver, self).__init__()
+        terminals = set([_END])
+        nonterminals = set()
+        for row in lrparser.action.itervalues():
+            terminals.update(row.iterkeys())
+        for row in lrparser.goto.itervalues():
+            nonterminals.update(row.iterkeys())
+        self._terminals = dict([(name, i) for i, name in enumerate(sorted(terminals))])
+        nonterminal_ids = dict([(name, i) for i, name in enumerate(sorted(nonterminals))])
+        self._num_terminals = len(self._terminals)
+        self._num_nonterminals = len(nonterminal_ids)
+        num_states = max(lrparser.action.iterkeys()) + 1
+        # Build the action and goto tables as arrays indexed by the
+        # state multiplied by the number of symbols plus the symbol.
+        self._action = array('i', [_ERROR]) * (num_states * self._num_terminals)
+        for state, row in lrparser.action.iteritems():
+            base = state * self._num_terminals
+            for name, value in row.iteritems():
+                if value is None:
+                    # PLY marks errors caused by nonassociative operators with None.
+                    continue
+                self._action[base + self._terminals[name]] = \
+                    value if value > 0 else value - 1
+        self._goto = array('i', [0]) * (num_states * self._num_nonterminals)
+        for state, row in lrparser.goto.iteritems():
+            base = state * self._num_nonterminals
+            for name, value in row.iteritems():
+                self._goto[base + nonterminal_ids[name]] = value
+        # Information about the productions indexed by their number.
+        productions = lrparser.productions
+        self._lengths = array('i', [p.len for p in productions])
+        self._lhs = array('i', [nonterminal_ids.get(p.name, 0) for p in productions])
+        self._actions = [actions[p.func] if p.func else None for p in productions]
+        # Property of the node returned by the actions that also build the 
+        # node of the first symbol of the production, a terminal.
+        self._first_nodes = [getattr(a, 'first_node', None) for a in self._actions]
+        self._error_func = error_func
+
+    def parse(self, input=None, lexer=None, spans=False, errors=None):
+        """
+        Realiza el análisis sintáctico de los tokens reconocidos por el
+        analizador léxico-gráfico.
+
+        @type input: C{unicode}
+        @param input: Flujo de caracteres de entrada. Si es C{None}, se
+            analizan los tokens del flujo de entrada actual del analizador
+            léxico-gráfico.
+
+        @type lexer: C{object}
+        @param lexer: Analizador léxico-gráfico.
+
+        @type spans: C{bool}
+        @param spans: Indica si se debe asignar la propiedad C{span} de los
+            nodos del árbol de sintáxis abstracta.
+
+        @type errors: C{list}
+        @param errors: Si se especifica una lista, el analizador se recupera
+            de los errores léxico-gráficos y de sintáxis y añade a la lista 
+            los mensajes de error en lugar de lanzar una excepción.
+
+        @rtype: C{object}
+        @return: Valor del símbolo inicial de la gramática. Si el analizador
+            se recuperó de algún error, el valor corresponde a las partes del
+            programa que no contienen errores o es C{None} si no fue posible
+            recuperarse.
+
+        @raise SyntacticError: Esta excepción se lanzará si se encuentra
+            algún error de sintáxis y no se especificó la lista C{errors}.
+        """
+        if input is not None:
+            lexer.input(input)
+        if spans:
+            return self._parse_spans(lexer, errors)
+        action = self._action
+        actions = self._actions
+        goto = self._goto
+        terminals = self._terminals
+        num_terminals = self._num_terminals
+        num_nonterminals = self._num_nonterminals
+        lengths = self._lengths
+        lhs = self._lhs
+        end = terminals[_END]
+        get_token = lexer.token if errors is None else self._recovering_lexer(lexer, errors)
+        states = [0]
+        values = [None]
+        state = 0
+        resume = None
+        token = get_token()
+        terminal = end if token is None else terminals[token.type]
+        while True:
+            t = action[state * num_terminals + terminal]
+            if t > 0:
+                # Shift the token. Terminals are pushed as tokens.
+                state = t
+                states.append(state)
+                values.append(token)
+                token = get_token()
+                terminal = end if token is None else terminals[token.type]
+            elif t < -1:
+                production = -t - 1
+                length = lengths[production]
+                if length:
+                    value = actions[production](*values[-length:])
+                    del values[-length:]
+                    del states[-length:]
+                else:
+                    value = actions[production]()
+                state = goto[states[-1] * num_nonterminals + lhs[production]]
+                states.append(state)
+                values.append(value)
+            elif t == -1:
+                return self._accept(lexer, values[-1], errors)
+            else:
+                token, resume = self._recover(lexer, get_token, token, resume, 
+                                              errors, (states, values))
+                if resume is None:
+                    return None
+                state = states[-1]
+                terminal = end if token is None else terminals[token.type]
+
+    def _parse_spans(self, lexer, errors):
+        """
+        Realiza el análisis sintáctico de la misma forma que el método 
+        C{parse} y asigna la propiedad C{span} de cada nodo del árbol de
+        sintáxis abstracta retornado por una acción semántica.
+
+        Las posiciones de los símbolos se guardan en dos pilas paralelas a
+        la pila de estados. La posición final de cada token es la posición 
+        del analizador léxico-gráfico después de reconocerlo, por lo que no
+        es necesario recorrer nuevamente el flujo de entrada. La línea y la 
+        columna de cada nodo se obtienen del índice de las líneas del flujo
+        de entrada. Si la acción semántica construye además el nodo del 
+        primer símbolo de la producción (un terminal), indicado por el 
+        atributo C{first_node} de la función, este nodo recibe la posición 
+        de ese símbolo.
+
+        @type lexer: C{object}
+        @param lexer: Analizador léxico-gráfico.
+
+        @type errors: C{list}
+        @param errors: Lista de los mensajes de error o C{None} si no se 
+            debe realizar recuperación de errores.
+
+        @rtype: C{object}
+        @return: Valor del símbolo inicial de la gramática.
+
+        @raise SyntacticError: Esta excepción se lanzará si se encuentra
+            algún error de sintáxis y no se realiza recuperación de errores.
+        """
+        # NOTE: This loop is the same used in the parse method, keeping the
+        # positions of the symbols. Make sure changes get made in both places.
+        action = self._action
+        actions = self._actions
+        goto = self._goto
+        terminals = self._terminals
+        num_terminals = self._num_terminals
+        num_nonterminals = self._num_nonterminals
+        lengths = self._lengths
+        lhs = self._lhs
+        first_nodes = self._first_nodes
+        end = terminals[_END]
+        position = get_line_index(lexer).position
+        get_token = lexer.token if errors is None else self._recovering_lexer(lexer, errors)
+        states = [0]
+        values = [None]
+        starts = [0]
+        ends = [0]
+        state = 0
+        resume = None
+        token = get_token()
+        terminal = end if token is None else terminals[token.type]
+        while True:
+            t = action[state * num_terminals + terminal]
+            if t > 0:
+                state = t
+                states.append(state)
+                values.append(token)
+                starts.append(token.lexpos)
+                ends.append(lexer.lexpos)
+                token = get_token()
+                terminal = end if token is None else terminals[token.type]
+            elif t < -1:
+                production = -t - 1
+                length = lengths[production]
+                if length:
+                    value = actions[production](*values[-length:])
+                    start, stop = starts[-length], ends[-1]
+                    first_stop = ends[-length]
+                    del values[-length:]
+                    del states[-length:]
+                    del starts[-length:]
+                    del ends[-length:]
+                else:
+                    value = actions[production]()
+                    # Empty productions are placed after the previous symbol.
+                    start = stop = ends[-1]
+                if isinstance(value, LanguageNode):
+                    line, column = position(start)
+                    value.span = (line, column, stop)
+                    if first_nodes[production] is not None:
+                        getattr(value, first_nodes[production]).span = (line, column, first_stop)
+                state = goto[states[-1] * num_nonterminals + lhs[production]]
+                states.append(state)
+                values.append(value)
+                starts.append(start)
+                ends.append(stop)
+            elif t == -1:
+                return self._accept(lexer, values[-1], errors)
+            else:
+                token, resume = self._recover(lexer, get_token, token, resume, 
+                                              errors, (states, values, starts, ends))
+                if resume is None:
+                    return None
+                state = states[-1]
+                terminal = end if token is None else terminals[token.type]
+
+    def _accept(self, lexer, value, errors):
+        """
+        Termina el análisis sintáctico al aceptar el flujo de entrada. Este 
+        método realiza la comprobación que hace la función C{p_program} 
+        cuando se utiliza el analizador sintáctico construido por PLY.
+
+        @type lexer: C{object}
+        @param lexer: Analizador léxico-gráfico.
+
+        @type value: C{object}
+        @param value: Valor del símbolo inicial de la gramática.
+
+        @type errors: C{list}
+        @param errors: Lista de los mensajes de error o C{None} si no se 
+            debe realizar recuperación de errores.
+
+        @rtype: C{object}
+        @return: Valor del símbolo inicial de la gramática.
+
+        @raise SyntacticError: Esta excepción se lanzará si hay un comentario
+            sin cerrar y no se realiza recuperación de errores.
+        """
+        if lexer.current_state() != 'INITIAL':
+            message = "A comment was opened but not closed"
+            if errors is None:
+                raise SyntacticError(message)
+            errors.append(message)
+        return value
+
+    def _recovering_lexer(self, lexer, errors):
+        """
+        Crea una función que retorna el siguiente token del flujo de entrada
+        descartando los caracteres ilegales. Si el error corresponde a un 
+        literal de cadena de caracteres mal formado, se descarta hasta las
+        comillas que lo cierran en la misma línea o, si no las hay, hasta el
+        final de la línea, para no reconocer el contenido del literal como
+        tokens, y se retorna en su lugar un literal vacío. El salto de línea
+        no se descarta para que el número de línea del analizador 
+        léxico-gráfico se mantenga actualizado.
+
+        @type lexer: C{object}
+        @param lexer: Analizador léxico-gráfico.
+
+        @type errors: C{list}
+        @param errors: Lista a la que se añaden los mensajes de los errores
+            léxico-gráficos.
+
+        @rtype: C{function}
+        @return: Función que retorna el siguiente token del flujo de entrada
+            o C{None} si se llegó al final del flujo de entrada.
+        """
+        def get_token():
+            while True:
+                try:
+                    return lexer.token()
+                except SyntacticError, error:
+                    errors.extend(error.messages)
+                    # The lexers leave the position at the illegal character,
+                    # or at the opening quote of a malformed string literal.
+                    pos = lexer.lexpos
+                    if lexer.lexdata[pos:pos + 1] == '"':
+                        token = LexToken()
+                        token.type = 'STRLIT'
+                        token.value = lexer.symbols.intern('')
+                        token.lineno = lexer.lineno
+                        token.lexpos = pos
+                        match = _literal_end_re.match(lexer.lexdata, pos + 1)
+                        if match is not None:
+                            lexer.lexpos = match.end()
+                        else:
+                            end = lexer.lexdata.find('\n', pos)
+                            lexer.lexpos = end if end >= 0 else lexer.lexlen
+                        return token
+                    else:
+                        lexer.lexpos = pos + 1
+        return get_token
+
+    def _recover(self, lexer, get_token, token, resume, errors, stacks):
+        """
+        Se recupera de un error de sintáxis en modo pánico.
+
+        Se descartan los tokens de entrada hasta encontrar un token de 
+        sincronización y luego se descartan los estados de la pila (y los 
+        elementos correspondientes de las demás pilas) hasta encontrar un 
+        estado en el que el token de sincronización sea válido. Si no se 
+        encuentra ningún estado, se descarta el token de sincronización y 
+        se busca el siguiente.
+
+        Si se produce un error con el mismo token donde se reanudó el análisis 
+        después del error anterior, no se reporta un nuevo error y se descarta
+        el token para garantizar que el análisis avance.
+
+        @type lexer: C{object}
+        @param lexer: Analizador léxico-gráfico.
+
+        @type get_token: C{function}
+        @param get_token: Función que retorna el siguiente token.
+
+        @type token: C{LexToken}
+        @param token: Token inesperado o C{None} si se alcanzó el final del
+            flujo de entrada.
+
+        @type resume: C{object}
+        @param resume: Token donde se reanudó el análisis después del error 
+            anterior, C{_END} si fue al final de la entrada o C{None}.
+
+        @type errors: C{list}
+        @param errors: Lista de los mensajes de error o C{None} si no se 
+            debe realizar recuperación de errores.
+
+        @type stacks: C{tuple}
+        @param stacks: Pilas del analizador. La primera debe ser la pila de
+            estados.
+
+        @rtype: C{tuple}
+        @return: Tupla con el token donde se reanuda el análisis y el valor
+            que se debe pasar como parámetro C{resume} si se produce un nuevo
+            error. El segundo elemento será C{None} si no fue posible
+            recuperarse del error.
+
+        @raise SyntacticError: Esta excepción se lanzará si no se realiza
+            recuperación de errores.
+        """
+        if token is not None:
+            token.lexer = lexer
+        if errors is None:
+            self._error_func(token)
+            return token, None
+        action = self._action
+        terminals = self._terminals
+        num_terminals = self._num_terminals
+        states = stacks[0]
+        if (_END if token is None else token) is resume:
+            # No token was consumed since the last recovery.
+            if token is None:
+                return token, None
+            token = get_token()
+        else:
+            try:
+                self._error_func(token)
+            except SyntacticError, error:
+                errors.extend(error.messages)
+        while True:
+            while token is not None and token.type not in _SYNC_TOKENS:
+                token = get_token()
+            terminal = terminals[_END] if token is None else terminals[token.type]
+            depth = len(states)
+            while depth and action[states[depth - 1] * num_terminals + terminal] == _ERROR:
+                depth -= 1
+            if depth:
+                for stack in stacks:
+                    del stack[depth:]
+                return token, (_END if token is None else token)
+            elif token is None:
+                return token, None
+            token = get_token()
@@ -0,0 +1,824 @@
+# -*- coding: utf-8 -*-
+
+"""
+Análisis sintáctico incremental de programas Tiger.
+
+La clase C{IncrementalParser} de este módulo está pensada para un editor que
+necesita conocer constantemente si el programa que se está editando es
+correcto sintácticamente. Después de analizar un programa completo, se
+guardan los tokens reconocidos y el árbol de sintáxis abstracta (con las
+posiciones de los nodos) y cada modificación del programa se procesa de la
+siguiente forma:
+
+    1. Se reconocen nuevamente los tokens a partir del token anterior a la
+       modificación y hasta encontrar un token que coincida con uno de los
+       tokens que seguían a la modificación. A partir de ese token el resto
+       del programa no cambia, por lo que se mantienen los tokens anteriores
+       desplazando sus posiciones.
+    2. Se busca en el árbol de sintáxis abstracta el menor nodo que contiene
+       a todos los tokens modificados y que puede analizarse de forma
+       independiente: una expresión C{let}, una secuencia de expresiones entre
+       paréntesis o el cuerpo de una función. En el caso de las expresiones
+       C{let} y las secuencias, los tokens que las delimitan no pueden haber
+       sido modificados.
+    3. Se analizan solamente los tokens de ese nodo y el nuevo subárbol
+       sustituye al anterior. Las posiciones y los números de línea de los
+       demás nodos se actualizan de acuerdo con la modificación.
+
+Si no se encuentra ningún nodo que se pueda analizar de forma independiente,
+si el nuevo subárbol no es del mismo tipo que el anterior o si se encuentra
+algún error, se analiza el programa completo. De esta forma, el árbol de
+sintáxis abstracta y los errores reportados son siempre los mismos que se
+obtienen al analizar el programa completo con la clase C{Parser}.
+"""
+
+import bisect
+
+from pytiger2c.errors import SyntacticError
+from pytiger2c.ast import LetNode, ExpressionSequenceNode
+from pytiger2c.ast.languagenode import LanguageNode, get_field_names
+from pytiger2c.ast.callabledeclarationnode import CallableDeclarationNode
+from pytiger2c.grammar.parser import lexers, parsers, DEFAULT_LEXER
+from pytiger2c.grammar.common import LineIndex
+from pytiger2c.grammar.symbols import SymbolTable
+
+
+# Tokens that open and close the nested expressions.
+_OPENING_TOKENS = frozenset(['LET', 'LPAREN'])
+_CLOSING_TOKENS = frozenset(['END', 'RPAREN'])
+
+# Tokens that can follow the body of a function.
+_BODY_FOLLOWERS = frozenset(['FUNCTION', 'VAR', 'TYPE', 'IN'])
+
+
+def _children(node):
+    """
+    Retorna los hijos de un nodo del árbol de sintáxis abstracta.
+
+    @type node: C{LanguageNode}
+    @param node: Nodo del árbol de sintáxis abstracta.
+
+    @rtype: C{list}
+    @return: Lista de los nodos hijos.
+    """
+    children = []
+    for name in get_field_names(type(node)):
+        value = getattr(node, name, None)
+        if isinstance(value, LanguageNode):
+            children.append(value)
+        elif isinstance(value, list):
+            children.extend([item for item in value if isinstance(item, LanguageNode)])
+    return children
+
+
+def _replace_child(parent, old, new):
+    """
+    Sustituye un hijo de un nodo del árbol de sintáxis abstracta.
+
+    @type parent: C{LanguageNode}
+    @param parent: Nodo padre.
+
+    @type old: C{LanguageNode}
+    @param old: Hijo que se debe sustituir.
+
+    @type new: C{LanguageNode}
+    @param new: Nodo que sustituye al hijo.
+    """
+    for name in get_field_names(type(parent)):
+        value = getattr(parent, name, None)
+        if value is old:
+            setattr(parent, name, new)
+        elif isinstance(value, list):
+            for index, item in enumerate(value):
+                if item is old:
+                    value[index] = new
+    new.parent_node = old.parent_node
+
+
+class _TokenStream(object):
+    """
+    Flujo de tokens ya reconocidos que ofrece la interfaz de un analizador
+    léxico-gráfico utilizada por el analizador sintáctico.
+
+    El atributo C{index} contiene el índice del siguiente token y el atributo
+    C{exhausted} indica si se llegó al final del flujo.
+    """
+
+    def __init__(self, data, line_index, tokens, ends, start, stop, state, error):
+        """
+        Inicializa el flujo de tokens.
+
+        @type data: C{unicode}
+        @param data: Flujo de caracteres de entrada.
+
+        @type line_index: C{LineIndex}
+        @param line_index: Índice de las líneas del flujo de entrada.
+
+        @type tokens: C{list}
+        @param tokens: Tokens del flujo de entrada.
+
+        @type ends: C{list}
+        @param ends: Posición siguiente al último caracter de cada token.
+
+        @type start: C{int}
+        @param start: Índice del primer token que se debe retornar.
+
+        @type stop: C{int}
+        @param stop: Índice siguiente al último token que se debe retornar.
+
+        @type state: C{str}
+        @param state: Estado del analizador léxico-gráfico al final de los
+            tokens.
+
+        @type error: C{SyntacticError}
+        @param error: Error léxico-gráfico que se debe lanzar al final de los
+            tokens o C{None}.
+        """
+        super(_TokenStream, self).__init__()
+        self.lexdata = data
+        self.lexlen = len(data)
+        self.lexpos = ends[start - 1] if start else 0
+        self.lineno = tokens[start].lineno if start < stop else 1
+        self.line_index = line_index
+        self.index = start
+        self.exhausted = False
+        self._tokens = tokens
+        self._ends = ends
+        self._stop = stop
+        self._state = state
+        self._error = error
+
+    def token(self):
+        """
+        Retorna el siguiente token del flujo.
+
+        @rtype: C{LexToken}
+        @return: Siguiente token o C{None} si se llegó al final del flujo.
+
+        @raise SyntacticError: Esta excepción se lanzará al final del flujo
+            si se produjo un error léxico-gráfico al reconocer los tokens.
+        """
+        index = self.index
+        if index == self._stop:
+            self.exhausted = True
+            if self._error is not None:
+                raise self._error
+            return None
+        self.index = index + 1
+        token = self._tokens[index]
+        self.lexpos = self._ends[index]
+        self.lineno = token.lineno
+        if token.type == 'STRLIT':
+            # The lexer counts the new lines inside a string literal.
+            self.lineno += self.lexdata.count('\n', token.lexpos, self.lexpos)
+        return token
+
+    def current_state(self):
+        """
+        Retorna el estado del analizador léxico-gráfico al final del flujo.
+
+        @rtype: C{str}
+        @return: Estado del analizador léxico-gráfico.
+        """
+        return self._state
+
+
+class IncrementalParser(object):
+    """
+    Analizador sintáctico incremental de programas Tiger.
+
+    Cada instancia de esta clase mantiene el código fuente de un programa,
+    sus tokens y su árbol de sintáxis abstracta, que se actualizan con cada
+    modificación del programa. Las posiciones de las modificaciones son
+    posiciones de caracteres del código fuente.
+
+    Los árboles de sintáxis abstracta se construyen siempre calculando las
+    posiciones de los nodos (propiedad C{span}), que son necesarias para
+    localizar los nodos afectados por una modificación. Para que el costo de
+    una modificación no dependa del tamaño del programa, las posiciones de los
+    tokens y de los nodos que siguen a la modificación no se actualizan de
+    inmediato: los tokens guardan un desplazamiento común a partir del último
+    token modificado y los subárboles guardan los desplazamientos pendientes,
+    que se aplican cuando se visitan durante una modificación posterior o 
+    cuando se obtiene el árbol con la propiedad C{ast}. Los subárboles que no 
+    se analizan nuevamente se modifican directamente, por lo que el árbol 
+    retornado no se debe modificar fuera de esta clase.
+    """
+
+    def _get_data(self):
+        """
+        Método para obtener el valor de la propiedad C{data}.
+
+        @rtype: C{unicode}
+        @return: Código fuente actual del programa.
+        """
+        return self._data
+
+    data = property(_get_data)
+
+    def _get_ast(self):
+        """
+        Método para obtener el valor de la propiedad C{ast}.
+
+        @rtype: C{LanguageNode}
+        @return: Árbol de sintáxis abstracta del código fuente actual o
+            C{None} si el programa tiene errores de sintáxis.
+        """
+        return self.get_ast()
+
+    ast = property(_get_ast)
+
+    def _get_symbols(self):
+        """
+        Método para obtener el valor de la propiedad C{symbols}.
+
+        @rtype: C{SymbolTable}
+        @return: Tabla de símbolos donde se obtienen los identificadores y
+            los literales de los tokens. Consulte la documentación de la
+            clase C{Parser}.
+        """
+        return self._lexer.symbols
+
+    symbols = property(_get_symbols)
+
+    def __init__(self, lexer_name=DEFAULT_LEXER):
+        """
+        Inicializa el analizador sintáctico incremental. El análisis
+        sintáctico se realiza siempre con el analizador del módulo C{driver}.
+
+        @type lexer_name: C{str}
+        @param lexer_name: Nombre del analizador léxico-gráfico que se debe
+            utilizar. Consulte la documentación de la clase C{Parser}.
+        """
+        super(IncrementalParser, self).__init__()
+        self._lexer = lexers[lexer_name].clone()
+        self._lexer.symbols = SymbolTable()
+        self._parser = parsers['compact']
+        self._data = u''
+        self._line_index = LineIndex(self._data)
+        # The tokens from the gap on must be displaced by the gap deltas.
+        self._tokens = []
+        self._ends = []
+        self._gap = 0
+        self._gap_delta = 0
+        self._gap_line_delta = 0
+        self._state = 'INITIAL'
+        self._error = None
+        self._ast = None
+        # Displacements not applied yet indexed by the root of each subtree.
+        self._pending = {}
+        # Node whose tokens have a syntax error, its parent and whether
+        # it is the body of a function. Its subtree does not correspond to
+        # its tokens.
+        self._dirty = None
+        # Nodes that replaced subtrees since the last call to pop_changes or
+        # None if the whole tree was built again.
+        self._changes = None
+
+    def get_ast(self, positions=True):
+        """
+        Retorna el árbol de sintáxis abstracta del código fuente actual.
+
+        @type positions: C{bool}
+        @param positions: Indica si se deben aplicar los desplazamientos
+            pendientes de los nodos. Si es C{False}, las propiedades 
+            C{line_number} y C{span} de los nodos que siguen a las últimas
+            modificaciones pueden tener valores anteriores, pero el costo de
+            obtener el árbol no depende de su tamaño.
+
+        @rtype: C{LanguageNode}
+        @return: Árbol de sintáxis abstracta o C{None} si el programa tiene
+            errores de sintáxis.
+        """
+        if self._dirty is not None:
+            return None
+        if positions:
+            pending = self._pending
+            while pending:
+                node, transforms = pending.popitem()
+                self._apply(node, transforms)
+        return self._ast
+
+    def pop_changes(self):
+        """
+        Retorna los nodos que sustituyeron subárboles del árbol de sintáxis
+        abstracta desde la última llamada a este método. Los nodos que a su
+        vez fueron sustituidos por una modificación posterior también se
+        incluyen, aunque ya no formen parte del árbol. Este método permite
+        actualizar la información obtenida a partir del árbol, por ejemplo,
+        en la comprobación semántica incremental de la clase
+        C{IncrementalChecker}.
+
+        @rtype: C{list}
+        @return: Lista de los nodos en el orden en que se sustituyeron o
+            C{None} si el árbol se construyó nuevamente de forma completa.
+        """
+        changes, self._changes = self._changes, []
+        return changes
+
+    def parse(self, data):
+        """
+        Realiza el análisis léxico-gráfico y sintáctico completo de un
+        programa Tiger.
+
+        @type data: C{unicode}
+        @param data: Código fuente del programa Tiger.
+
+        @rtype: C{LanguageNode}
+        @return: Nodo raíz del árbol de sintáxis abstracta.
+
+        @raise SyntacticError: Esta excepción se lanzará si se encuentra algún
+            error de sintáxis durante el análisis del programa.
+        """
+        self._data = data
+        self._line_index = LineIndex(data)
+        self._tokens = []
+        self._ends = []
+        self._error = None
+        self._ast = None
+        self._pending = {}
+        self._dirty = None
+        self._changes = None
+        try:
+            for token, end in self._tokenize(0):
+                self._tokens.append(token)
+                self._ends.append(end)
+        except SyntacticError, error:
+            # The error is raised when the parser requests the next token.
+            self._error = error
+        self._gap = len(self._tokens)
+        self._gap_delta = 0
+        self._gap_line_delta = 0
+        self._state = self._lexer.current_state()
+        self._ast = self._parse_tokens(0, len(self._tokens), self._state, self._error)
+        return self._ast
+
+    def edit(self, start, end, text):
+        """
+        Sustituye una parte del código fuente del programa y actualiza el
+        árbol de sintáxis abstracta, que se puede obtener con la propiedad 
+        C{ast}.
+
+        Si el nodo analizado nuevamente tiene un error de sintáxis y se puede
+        garantizar que el análisis del programa completo reportaría el mismo 
+        error, se reporta el error sin analizar el programa completo y el nodo
+        se marca como modificado. Las modificaciones siguientes dentro de ese 
+        nodo se procesan también de forma incremental.
+
+        @type start: C{int}
+        @param start: Posición del primer caracter sustituido.
+
+        @type end: C{int}
+        @param end: Posición siguiente al último caracter sustituido. Si es
+            igual a C{start}, el texto se inserta en esa posición.
+
+        @type text: C{unicode}
+        @param text: Texto que sustituye a los caracteres entre las
+            posiciones C{start} y C{end}. Si es una cadena vacía, los
+            caracteres se eliminan.
+
+        @raise SyntacticError: Esta excepción se lanzará si el programa
+            modificado tiene algún error de sintáxis.
+
+        @raise ValueError: Esta excepción se lanzará si las posiciones no
+            corresponden a un rango válido del código fuente.
+        """
+        data = self._data
+        if not 0 <= start <= end <= len(data):
+            raise ValueError('Invalid edit range')
+        if self._ast is None:
+            self.parse(data[:start] + text + data[end:])
+            return
+        old_index = self._line_index
+        delta = len(text) - (end - start)
+        line_delta = text.count('\n') - data.count('\n', start, end)
+        # The tokens are relexed from the end of the last token that finishes
+        # before the edit, where the lexer is always in the INITIAL state.
+        first = self._bisect(start)
+        self._move_gap(first)
+        tokens, ends, gap_delta = self._tokens, self._ends, self._gap_delta
+        self._line_index = old_index.replace(start, end, text)
+        self._data = new_data = self._line_index.data
+        new_tokens, new_ends = [], []
+        resync = old = first
+        inserted_end = start + len(text)
+        try:
+            for token, token_end in self._tokenize(ends[first - 1] if first else 0):
+                if token.lexpos >= inserted_end:
+                    # Position that a following token had before the edit.
+                    position = token.lexpos - delta - gap_delta
+                    while old < len(tokens) and tokens[old].lexpos < position:
+                        old += 1
+                    if old < len(tokens) and tokens[old].lexpos == position and \
+                       position + gap_delta >= end and \
+                       ends[old] == token_end - delta - gap_delta and \
+                       tokens[old].type == token.type and tokens[old].value == token.value:
+                        # The rest of the program is the same as before.
+                        resync = old
+                        break
+                new_tokens.append(token)
+                new_ends.append(token_end)
+            else:
+                resync = len(tokens)
+                self._state = self._lexer.current_state()
+        except SyntacticError:
+            self.parse(new_data)
+            return
+        if self._state != 'INITIAL':
+            # A comment that is not closed must be reported.
+            self.parse(new_data)
+            return
+        target = None
+        if new_tokens or resync > first or self._dirty is not None:
+            target = self._find_target(first, resync, old_index)
+            if target is None:
+                self.parse(new_data)
+                return
+        # Replace the relexed tokens. The following tokens are displaced
+        # by the gap deltas, so they are not modified.
+        tokens[first:resync] = new_tokens
+        ends[first:resync] = new_ends
+        self._gap = first + len(new_tokens)
+        self._gap_delta += delta
+        self._gap_line_delta += line_delta
+        edit_line, edit_column = old_index.position(end)
+        transform = (edit_line, self._line_index.position(end + delta)[1] - edit_column,
+                     line_delta, delta)
+        if target is None:
+            # Only the positions of the tokens changed.
+            self._relocate(None, None, None, start, end, old_index, transform)
+            return
+        node, parent, node_start, node_stop, is_body = target
+        node_stop += len(new_tokens) - (resync - first)
+        self._move_gap(node_stop)
+        stream = _TokenStream(self._data, self._line_index, tokens, ends,
+                              node_start, node_stop, 'INITIAL', None)
+        try:
+            new_node = self._parser.parse(lexer=stream, spans=True)
+        except SyntacticError, error:
+            if not self._is_local_error(stream, node_start, is_body):
+                self.parse(new_data)
+                return
+            # Keep the node with the positions of its new tokens.
+            line, column = self._line_index.position(tokens[node_start].lexpos)
+            span = (line, column, ends[node_stop - 1])
+            self._relocate(node, node.span[2], span[2], start, end, old_index, transform)
+            self._discard(node)
+            node.span = span
+            self._dirty = (node, parent, is_body)
+            raise error
+        if not is_body and type(new_node) is not type(node):
+            # The delimiters of the node now belong to different expressions.
+            self.parse(new_data)
+            return
+        self._relocate(node, node.span[2], new_node.span[2], start, end, old_index, transform)
+        self._discard(node)
+        self._dirty = None
+        if parent is None:
+            self._ast = new_node
+            self._changes = None
+        else:
+            _replace_child(parent, node, new_node)
+            if self._changes is not None:
+                self._changes.append(new_node)
+
+    def _is_local_error(self, stream, start, is_body):
+        """
+        Comprueba si un error de sintáxis encontrado al analizar los tokens
+        de un nodo sería reportado también por el análisis del programa 
+        completo.
+
+        El error se produce en el primer token que no puede continuar una
+        expresión que comienza en el primer token del nodo. En el programa
+        completo se reporta el mismo error siempre que la expresión no pueda
+        terminar antes de ese token. Una expresión C{let} o una secuencia 
+        entre paréntesis solamente termina cuando se cierra, y el cuerpo de 
+        una función solamente puede ser seguido por las palabras claves que
+        comienzan una declaración o por C{in}, por lo que basta comprobar
+        que esto no ocurre fuera de las expresiones anidadas.
+
+        @type stream: C{_TokenStream}
+        @param stream: Flujo de tokens donde se produjo el error.
+
+        @type start: C{int}
+        @param start: Índice del primer token del nodo.
+
+        @type is_body: C{bool}
+        @param is_body: Indica si el nodo es el cuerpo de una función.
+
+        @rtype: C{bool}
+        @return: Valor booleano indicando si el error es el mismo que se 
+            reportaría al analizar el programa completo.
+        """
+        if stream.exhausted:
+            # The following tokens of the program could complete the node.
+            return False
+        tokens = self._tokens
+        depth = 0
+        for index in xrange(start, stream.index):
+            token_type = tokens[index].type
+            if index > start and depth <= 0 and \
+               (token_type in _BODY_FOLLOWERS if is_body else True):
+                return False
+            if token_type in _OPENING_TOKENS:
+                depth += 1
+            elif token_type in _CLOSING_TOKENS:
+                depth -= 1
+        return True
+
+    def _tokenize(self, pos):
+        """
+        Reconoce los tokens del código fuente a partir de una posición en la
+        que el analizador léxico-gráfico se encuentra en el estado C{INITIAL}.
+
+        @type pos: C{int}
+        @param pos: Posición donde comienza el análisis léxico-gráfico.
+
+        @rtype: C{generator}
+        @return: Generador de tuplas con cada token y la posición siguiente
+            a su último caracter.
+
+        @raise SyntacticError: Esta excepción se lanzará si se encuentra
+            un caracter ilegal.
+        """
+        lexer = self._lexer
+        lexer.input(self._data)
+        lexer.lexpos = pos
+        lexer.lineno = self._line_index.line(pos)
+        lexer.lexstatestack = []
+        lexer.begin('INITIAL')
+        next_token = lexer.token
+        while True:
+            token = next_token()
+            if token is None:
+                break
+            yield token, lexer.lexpos
+
+    def _parse_tokens(self, start, stop, state, error):
+        """
+        Realiza el análisis sintáctico de una parte de los tokens como si
+        fueran un programa completo. Los tokens deben estar antes del
+        desplazamiento común de los tokens.
+
+        @type start: C{int}
+        @param start: Índice del primer token que se debe analizar.
+
+        @type stop: C{int}
+        @param stop: Índice siguiente al último token que se debe analizar.
+
+        @type state: C{str}
+        @param state: Estado del analizador léxico-gráfico al final de los
+            tokens.
+
+        @type error: C{SyntacticError}
+        @param error: Error léxico-gráfico que se debe lanzar al final de los
+            tokens o C{None}.
+
+        @rtype: C{LanguageNode}
+        @return: Nodo raíz del árbol de sintáxis abstracta correspondiente
+            a los tokens.
+
+        @raise SyntacticError: Esta excepción se lanzará si se encuentra algún
+            error de sintáxis.
+        """
+        stream = _TokenStream(self._data, self._line_index, self._tokens,
+                              self._ends, start, stop, state, error)
+        return self._parser.parse(lexer=stream, spans=True)
+
+    def _move_gap(self, index):
+        """
+        Cambia el índice del primer token cuya posición y número de línea
+        se deben desplazar, desplazando los tokens necesarios.
+
+        @type index: C{int}
+        @param index: Nuevo índice del primer token desplazado.
+        """
+        gap, delta, line_delta = self._gap, self._gap_delta, self._gap_line_delta
+        tokens, ends = self._tokens, self._ends
+        if delta or line_delta:
+            if index < gap:
+                delta, line_delta = -delta, -line_delta
+            for i in xrange(min(gap, index), max(gap, index)):
+                tokens[i].lexpos += delta
+                tokens[i].lineno += line_delta
+                ends[i] += delta
+        self._gap = index
+
+    def _bisect(self, pos, right=False):
+        """
+        Busca el primer token que termina en una posición posterior (o igual
+        si C{right} es C{False}) a la posición indicada.
+
+        @type pos: C{int}
+        @param pos: Posición del código fuente.
+
+        @type right: C{bool}
+        @param right: Indica si se deben excluir los tokens que terminan
+            exactamente en la posición indicada.
+
+        @rtype: C{int}
+        @return: Índice del token o número de tokens si no existe.
+        """
+        ends, gap = self._ends, self._gap
+        search = bisect.bisect_right if right else bisect.bisect_left
+        if gap and (ends[gap - 1] > pos if right else ends[gap - 1] >= pos):
+            return search(ends, pos, 0, gap)
+        return search(ends, pos - self._gap_delta, gap)
+
+    def _token_range(self, node, index):
+        """
+        Calcula los índices de los tokens de un nodo del árbol de sintáxis 
+        abstracta a partir de su posición.
+
+        @type node: C{LanguageNode}
+        @param node: Nodo del árbol de sintáxis abstracta.
+
+        @type index: C{LineIndex}
+        @param index: Índice de las líneas correspondiente a la posición
+            del nodo.
+
+        @rtype: C{tuple}
+        @return: Tupla con el índice del primer token del nodo y el índice
+            siguiente a su último token.
+        """
+        line, column, stop = node.span
+        return self._bisect(index.offset(line, column), True), self._bisect(stop) + 1
+
+    def _find_target(self, first, last, index):
+        """
+        Busca el menor nodo del árbol de sintáxis abstracta que contiene a 
+        los tokens modificados y que se puede analizar de forma independiente.
+
+        @type first: C{int}
+        @param first: Índice del primer token modificado.
+
+        @type last: C{int}
+        @param last: Índice siguiente al último token modificado.
+
+        @type index: C{LineIndex}
+        @param index: Índice de las líneas del código fuente anterior a la 
+            modificación.
+
+        @rtype: C{tuple}
+        @return: Tupla con el nodo, su nodo padre, el índice de su primer
+            token, el índice siguiente a su último token y un valor booleano
+            que indica si el nodo es el cuerpo de una función. Será C{None}
+            si no se encuentra ningún nodo.
+        """
+        target = None
+        dirty = self._dirty[0] if self._dirty is not None else None
+        if dirty is not None:
+            dirty_start, dirty_stop = self._token_range(dirty, index)
+        parent, node = None, self._ast
+        self._flush(node)
+        while node is not None:
+            start, stop = self._token_range(node, index)
+            if dirty is not None and node is not dirty and \
+               not (start <= dirty_start and dirty_stop <= stop):
+                # The node must contain the tokens with the syntax error.
+                pass
+            elif isinstance(parent, CallableDeclarationNode) and parent.body is node:
+                # The body of a function is delimited by the = token and the
+                # token that begins the following declaration or the in token.
+                if start <= first and last <= stop:
+                    target = (node, parent, start, stop, True)
+            elif isinstance(node, LetNode) or \
+                 (isinstance(node, ExpressionSequenceNode) and 
+                  not (isinstance(parent, LetNode) and parent.expressions is node)):
+                # The let expressions and the sequences between parentheses
+                # are analyzed again only if their delimiters did not change.
+                if start < first and last < stop:
+                    target = (node, parent, start, stop, False)
+            if node is dirty:
+                # The children of the node do not correspond to its tokens.
+                break
+            parent, node = node, None
+            for child in _children(parent):
+                self._flush(child)
+                if child.span is not None:
+                    child_start, child_stop = self._token_range(child, index)
+                    if child_start <= first and last <= child_stop and child_start < child_stop:
+                        node = child
+                        break
+        return target
+
+    def _relocate(self, target, old_stop, new_stop, start, end, old_index, transform):
+        """
+        Actualiza las posiciones y los números de línea de los nodos del
+        árbol de sintáxis abstracta que contienen la modificación y guarda
+        el desplazamiento pendiente de los subárboles que la siguen.
+
+        @type target: C{LanguageNode}
+        @param target: Nodo que se analizó nuevamente o C{None}. Su subárbol
+            no se modifica.
+
+        @type old_stop: C{int}
+        @param old_stop: Posición donde terminaba el nodo analizado 
+            nuevamente o C{None}.
+
+        @type new_stop: C{int}
+        @param new_stop: Posición donde termina ahora el nodo analizado
+            nuevamente o C{None}. Los nodos que terminaban junto con el 
+            nodo terminan en esta posición.
+
+        @type start: C{int}
+        @param start: Posición del primer caracter modificado.
+
+        @type end: C{int}
+        @param end: Posición siguiente al último caracter modificado en el
+            código fuente anterior a la modificación.
+
+        @type old_index: C{LineIndex}
+        @param old_index: Índice de las líneas del código fuente anterior a 
+            la modificación.
+
+        @type transform: C{tuple}
+        @param transform: Desplazamiento de los nodos que siguen a la 
+            modificación. Consulte la documentación del método C{_apply}.
+        """
+        line_delta = transform[2]
+        first = self._bisect(start)
+        stack = [self._ast] if self._ast is not target else []
+        self._flush(self._ast)
+        while stack:
+            node = stack.pop()
+            line, column, stop = node.span
+            if old_index.offset(line, column) >= end:
+                self._pending[node] = [transform]
+            elif stop > start:
+                # The node contains the modification, so it begins before it.
+                children = _children(node)
+                for child in children:
+                    self._flush(child)
+                if line_delta and node.line_number is not None:
+                    for child in children:
+                        if child.span is not None and child.span[:2] == (line, column):
+                            # The line of the node is given by the token that
+                            # follows its first child (e.g. an operator).
+                            if child.span[2] > start or self._bisect(child.span[2]) + 1 >= first:
+                                node.line_number += line_delta
+                            break
+                if stop == old_stop:
+                    stop = new_stop
+                else:
+                    stop += transform[3]
+                node.span = (line, column, stop)
+                stack.extend([child for child in children 
+                              if child is not target and child.span is not None])
+
+    def _apply(self, node, transforms):
+        """
+        Aplica a un nodo sus desplazamientos pendientes y los guarda como
+        desplazamientos pendientes de sus hijos.
+
+        Cada desplazamiento es una tupla con la línea donde terminó una
+        modificación, el desplazamiento de las columnas de esa línea, el 
+        desplazamiento de los números de línea y el desplazamiento de las 
+        posiciones del código fuente.
+
+        @type node: C{LanguageNode}
+        @param node: Nodo del árbol de sintáxis abstracta.
+
+        @type transforms: C{list}
+        @param transforms: Desplazamientos pendientes del nodo en el orden
+            en que se deben aplicar.
+        """
+        span, line_number = node.span, node.line_number
+        for edit_line, column_delta, line_delta, delta in transforms:
+            if span is not None:
+                line, column, stop = span
+                if line == edit_line:
+                    column += column_delta
+                span = (line + line_delta, column, stop + delta)
+            if line_number is not None:
+                line_number += line_delta
+        node.span, node.line_number = span, line_number
+        pending = self._pending
+        for child in _children(node):
+            pending.setdefault(child, []).extend(transforms)
+
+    def _flush(self, node):
+        """
+        Aplica a un nodo sus desplazamientos pendientes.
+
+        @type node: C{LanguageNode}
+        @param node: Nodo del árbol de sintáxis abstracta.
+        """
+        transforms = self._pending.pop(node, None)
+        if transforms is not None:
+            self._apply(node, transforms)
+
+    def _discard(self, node):
+        """
+        Descarta los desplazamientos pendientes de un subárbol que fue 
+        sustituido.
+
+        @type node: C{LanguageNode}
+        @param node: Nodo raíz del subárbol.
+        """
+        pending = self._pending
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            pending.pop(node, None)
+            stack.extend(_children(node))
@@ -5,10 +5,10 @@ Análisis léxico-gráfico utilizando PLY.
 """
 
 import os
-import re
 
 from pytiger2c.contrib.ply import lex
-from pytiger2c.grammar.common import compute_column
+from pytiger2c.grammar.common import compute_column, scan_string_literal
+from pytiger2c.grammar.symbols import SymbolTable
 from pytiger2c.errors import SyntacticError
 
 
@@ -77,45 +77,28 @@ def t_ANY_newline(token):
 def t_ID(token):
     r'[a-zA-Z][a-zA-Z0-9_]*'
     # Check for _reserved words.
-    token.type = _reserved_map.get(token.value, 'ID')
+    token.type = _reserved_map.get(token.value)
+    if token.type is None:
+        token.type = 'ID'
+        token.value = token.lexer.symbols.intern(token.value)
     return token
 
-# Integer literals.
-t_INTLIT = r'\d+'
+# Integer literals. Their values are converted to integers and interned.
+def t_INTLIT(token):
+    r'\d+'
+    token.value = token.lexer.symbols.intern(int(token.value))
+    return token
 
-# String literals.
+# String literals. The regular expression only matches the opening double quote,
+# the rest of the literal is validated and converted into a valid C literal 
+# string in a single pass by scan_string_literal, which also updates the line 
+# counter and moves the position of the lexer to the end of the literal.
 def t_STRLIT(token):
-    r'\"((\\[nt])|(\\")|(\\\\)|(\\\^[@A-Z[\]^_])|(\\[0-9]{3})|(\\\s+\\)|([^\\"]))*\"'
-    # Converting the value of the token into a valid C literal string.
-    def _escape(number):
-        """
-        Recibe un entero representando el número correspondiente a un caracter ASCII y
-        devuelve la secuencia de caracteres necesaria para representar este caracter
-        en un literal de cadena de C. La secuencia de caracteres consiste en un 
-        backslash seguido de 3 dígitos octales.
-        
-        @type number: C{int}
-        @param number: Entero representando el caracter ASCII.
-        
-        @rtype: C{str}
-        @return: Representación válida del caracter en un literal de cadena de C.
-        """
-        if 0 <= number <= 255:
-            return r'\{0}'.format(oct(number)[-3:])
-        else:
-            message = "Invalid string literal at line {line} column {column}"
-            line, column = token.lexer.lineno, compute_column(token)
-            raise SyntacticError(message.format(line=line, column=column))
-    repl = lambda match: _escape(int(match.group(1)))
-    token.value = re.sub(r'\\([0-9]{3})', repl, token.value)
-    repl = lambda match: _escape(ord(match.group(1)) - 64)    
-    token.value = re.sub(r'\\\^([@A-Z[\\\]^_])', repl, token.value)
-    # Update the line counter here before stripping whitespaces.
-    token.lexer.lineno += token.value.count('\n')
-    # Strip whitespaces between \s.
-    token.value = re.sub(r'\\\s+\\', '', token.value)
-    # Strip the double quotes.
-    token.value = token.value[1:-1]
+    r'\"'
+    # Leave the position at the opening quote if the literal is malformed.
+    token.lexer.lexpos = token.lexpos
+    token = scan_string_literal(token)
+    token.value = token.lexer.symbols.intern(token.value)
     return token
     
 # Operators.
@@ -151,6 +134,8 @@ _cachedir = os.path.abspath(os.path.join(os.path.dirname(__file__), 'cache'))
 # Comment the previous line and uncomment the following when
 # the grammar is OK to enable running PLY in optimization mode.
 lexer = lex.lex(optimize=True, outputdir=_cachedir, lextab='lexer')
+# Identifiers and literals are interned in the symbol table of the lexer.
+lexer.symbols = SymbolTable()
 
 
 # The following is used to debug the lexer. It will tokenize input read from 
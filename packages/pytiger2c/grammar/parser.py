@@ -5,13 +5,22 @@ Análisis sintáctico utilizando PLY.
 """
 
 import os
-import itertools
+import sys
+import mmap
+import copy
+import codecs
+import threading
 
 from pytiger2c.contrib.ply import yacc
+from pytiger2c.grammar import lexer as ply_lexer
+from pytiger2c.grammar import tablelexer
+from pytiger2c.grammar import tables
+from pytiger2c.grammar import actions
+from pytiger2c.grammar.driver import LRDriver
 from pytiger2c.grammar.common import compute_column
-from pytiger2c.grammar.lexer import lexer, tokens
+from pytiger2c.grammar.symbols import SymbolTable
+from pytiger2c.grammar.lexer import tokens
 from pytiger2c.errors import SyntacticError
-from pytiger2c.ast import *
 
 
 # Precedence rules.
@@ -38,10 +47,28 @@ precedence = (
     ('right', 'UMINUS'),
 )
 
+def _reduce(symbols, action):
+    """
+    Realiza la acción semántica de una producción con la función C{a_<nombre>}
+    del módulo C{pytiger2c.grammar.actions} que utiliza el analizador 
+    sintáctico C{compact}, de modo que ambos analizadores construyen el árbol
+    de sintáxis abstracta con las mismas acciones.
+    
+    @type symbols: C{YaccProduction}
+    @param symbols: Símbolos de la producción. Los terminales se pasan a la
+        acción semántica como instancias de C{LexToken} y los no terminales 
+        con su valor.
+    
+    @type action: C{function}
+    @param action: Acción semántica de la producción.
+    """
+    symbols[0] = action(*[symbol.value if isinstance(symbol, yacc.YaccSymbol) else symbol 
+                          for symbol in symbols.slice[1:]])
+
 def p_error(token):
     if token:
         message = "Unexpected token '{token}' at line {line} column {column}"
-        line, column = lexer.lineno, compute_column(token)
+        line, column = token.lexer.lineno, compute_column(token)
         raise SyntacticError(message.format(token=token.type, line=line, column=column))
     else:
         message = "Unexpected end of the input file"
@@ -56,54 +83,43 @@ def p_error(token):
 # will be considered the starting symbol of the grammar. 
 def p_program(symbols):
     "program : expr"
-    if lexer.current_state() != 'INITIAL':
+    if symbols.lexer.current_state() != 'INITIAL':
         message = "A comment was opened but not closed"
         raise SyntacticError(message)
-    else:
-        symbols[0] = symbols[1]
-        symbols[0].parent_node = None
+    _reduce(symbols, actions.a_program)
 
 # Literals.
 def p_expr_nil(symbols):
     "expr : NIL"
-    symbols[0] = NilExpressionNode()
-    symbols[0].line_number = symbols.lineno(1)
+    _reduce(symbols, actions.a_expr_nil)
 
 def p_expr_int(symbols):
     "expr : INTLIT"
-    symbols[0] = IntegerLiteralExpressionNode(int(symbols[1]))
-    symbols[0].line_number = symbols.lineno(1)
+    _reduce(symbols, actions.a_expr_int)
 
 def p_expr_str(symbols):
     "expr : STRLIT"
-    symbols[0] = StringLiteralExpressionNode(symbols[1])
-    symbols[0].line_number = symbols.lineno(1)
-    
+    _reduce(symbols, actions.a_expr_str)
+
 # Left values of an assignment. Variables, record fields and elements of arrays.
 def p_expr_lvalue(symbols):
     "expr : lvalue"
-    symbols[0] = symbols[1]
-    
+    _reduce(symbols, actions.a_expr_lvalue)
+
 # Creating a new array.
 def p_expr_array(symbols):
     "expr : ID LBRACKET expr RBRACKET OF expr"
-    symbols[0] = ArrayLiteralExpressionNode(symbols[1], symbols[3], symbols[6])
-    symbols[0].line_number = symbols.lineno(1)
-    symbols[3].parent_node = symbols[0]
-    symbols[6].parent_node = symbols[0] 
+    _reduce(symbols, actions.a_expr_array)
 
 # Creating a new record.
 def p_expr_record(symbols):
     "expr : ID LBRACE field_list RBRACE"
-    symbols[0] = RecordLiteralExpressionNode(symbols[1], symbols[3][0], symbols[3][1]) 
-    symbols[0].line_number = symbols.lineno(1)
-    
+    _reduce(symbols, actions.a_expr_record)
+
 # Unary minus. 
 def p_expr_unary_minus(symbols):
     "expr : MINUS expr %prec UMINUS"
-    symbols[0] = UnaryMinusOperatorNode(symbols[2])
-    symbols[0].line_number = symbols.lineno(1)
-    symbols[2].parent_node = symbols[0]
+    _reduce(symbols, actions.a_expr_unary_minus)
 
 # Binary operators.
 def p_expr_bin_op(symbols):
@@ -121,327 +137,424 @@ def p_expr_bin_op(symbols):
          | expr AND expr
          | expr OR expr
     """
-    if symbols[2] == "+":
-        symbols[0] = PlusOperatorNode(symbols[1], symbols[3])
-    elif symbols[2] == "-":
-        symbols[0] = MinusOperatorNode(symbols[1], symbols[3])
-    elif symbols[2] == "*":
-        symbols[0] = TimesOperatorNode(symbols[1], symbols[3])
-    elif symbols[2] == "/":
-        symbols[0] = DivideOperatorNode(symbols[1], symbols[3])
-    elif symbols[2] == "=":
-        symbols[0] = EqualsOperatorNode(symbols[1], symbols[3])
-    elif symbols[2] == "<>":
-        symbols[0] = NotEqualsOperatorNode(symbols[1], symbols[3])
-    elif symbols[2] == "<":
-        symbols[0] = LessThanOperatorNode(symbols[1], symbols[3])
-    elif symbols[2] == "<=":
-        symbols[0] = LessEqualsThanOperatorNode(symbols[1], symbols[3])
-    elif symbols[2] == ">":
-        symbols[0] = GreaterThanOperatorNode(symbols[1], symbols[3])
-    elif symbols[2] == ">=":
-        symbols[0] = GreaterEqualsThanOperatorNode(symbols[1], symbols[3])
-    elif symbols[2] == "&":
-        symbols[0] = AndOperatorNode(symbols[1], symbols[3])
-    elif symbols[2] == "|":
-        symbols[0] = OrOperatorNode(symbols[1], symbols[3])
-    symbols[0].line_number = symbols.lineno(2)
-    symbols[1].parent_node = symbols[0]
-    symbols[3].parent_node = symbols[0]
+    _reduce(symbols, actions.a_expr_bin_op)
 
 # A group of expressions enclosed by parenthesis separated by semicolons.
 def p_expr_expr_seq(symbols):
     "expr : LPAREN expr_seq RPAREN"
-    symbols[0] = symbols[2]
-    symbols[0].line_number = symbols.lineno(1)
+    _reduce(symbols, actions.a_expr_expr_seq)
 
 # Assignment.
 def p_expr_assign(symbols):
     "expr : lvalue ASSIGN expr"
-    symbols[0] = AssignmentNode(symbols[1], symbols[3])
-    symbols[0].line_number = symbols.lineno(2)
-    symbols[1].parent_node = symbols[0]
-    symbols[3].parent_node = symbols[0]    
+    _reduce(symbols, actions.a_expr_assign)
 
 # Function call.
 def p_expr_func(symbols):
     "expr : ID LPAREN expr_list RPAREN"
-    symbols[0] = FunctionCallNode(symbols[1], symbols[3])
-    symbols[0].line_number = symbols.lineno(1)
-    for node in symbols[3]: 
-        node.parent_node = symbols[0]    
+    _reduce(symbols, actions.a_expr_func)
 
 # Flow control structures.
 def p_expr_if(symbols):
     "expr : IF expr THEN expr"
-    symbols[0] = IfThenStatementNode(symbols[2], symbols[4])
-    symbols[0].line_number = symbols.lineno(1)
-    symbols[2].parent_node = symbols[0]
-    symbols[4].parent_node = symbols[0]       
+    _reduce(symbols, actions.a_expr_if)
 
 def p_expr_if_else(symbols):
     "expr : IF expr THEN expr ELSE expr"
-    symbols[0] = IfThenElseStatementNode(symbols[2], symbols[4], symbols[6])
-    symbols[0].line_number = symbols.lineno(1)
-    symbols[2].parent_node = symbols[0]
-    symbols[4].parent_node = symbols[0]
-    symbols[6].parent_node = symbols[0]        
+    _reduce(symbols, actions.a_expr_if_else)
 
 def p_expr_while(symbols):
     "expr : WHILE expr DO expr"
-    symbols[0] = WhileStatementNode(symbols[2], symbols[4])
-    symbols[0].line_number = symbols.lineno(1)
-    symbols[2].parent_node = symbols[0]
-    symbols[4].parent_node = symbols[0]    
-    
+    _reduce(symbols, actions.a_expr_while)
+
 def p_expr_for(symbols):
     "expr : FOR ID ASSIGN expr TO expr DO expr"
-    symbols[0] = ForStatementNode(symbols[2], symbols[4], symbols[6], symbols[8])
-    symbols[0].line_number = symbols.lineno(1)
-    symbols[4].parent_node = symbols[0]
-    symbols[6].parent_node = symbols[0]
-    symbols[8].parent_node = symbols[0]
+    _reduce(symbols, actions.a_expr_for)
 
 def p_expr_break(symbols):
     "expr : BREAK"
-    symbols[0] = BreakStatementNode()
-    symbols[0].line_number = symbols.lineno(1)
+    _reduce(symbols, actions.a_expr_break)
 
 # The let block.
 def p_expr_let(symbols):
-    "expr : LET dec_group IN expr_seq END"    
-    symbols[0] = LetNode(symbols[2][0], symbols[2][1], symbols[2][2], symbols[4])
-    symbols[0].line_number = symbols.lineno(1)
-    for node in itertools.chain(symbols[2][0], symbols[2][1], symbols[2][2]):
-        node.parent_node = symbols[0]
-    symbols[4].parent_node = symbols[0]
-    
+    "expr : LET dec_group IN expr_seq END"
+    _reduce(symbols, actions.a_expr_let)
+
 # What is a left value of an assignment expression?
 def p_lvalue_id(symbols):
     "lvalue : ID %prec LVALUE_ID"
-    symbols[0] = VariableAccessNode(symbols[1])
-    symbols[0].line_number = symbols.lineno(1)
-    
+    _reduce(symbols, actions.a_lvalue_id)
+
 def p_lvalue_record(symbols):
     "lvalue : lvalue PERIOD ID"
-    symbols[0] = RecordAccessNode(symbols[1], symbols[3])
-    symbols[0].line_number = symbols.lineno(2)
-    symbols[1].parent_node = symbols[0] 
-    
+    _reduce(symbols, actions.a_lvalue_record)
+
 def p_lvalue_array(symbols):
     "lvalue : ID LBRACKET expr RBRACKET"
-    variable = VariableAccessNode(symbols[1])
-    symbols[0] = ArrayAccessNode(variable, symbols[3])
-    symbols[0].line_number = symbols.lineno(2)
-    variable.parent_node = symbols[0]
-    symbols[3].parent_node = symbols[0]
-    
+    _reduce(symbols, actions.a_lvalue_array)
+
 def p_lvalue_array_lvalue(symbols):
     "lvalue : lvalue LBRACKET expr RBRACKET"
-    symbols[0] = ArrayAccessNode(symbols[1], symbols[3])
-    symbols[0].line_number = symbols.lineno(2)
-    symbols[1].parent_node = symbols[0]
-    symbols[3].parent_node = symbols[0]
-    
+    _reduce(symbols, actions.a_lvalue_array_lvalue)
+
 # A group of expressions separated by semicolons.
 def p_expr_seq_empty(symbols):
     "expr_seq : "
-    symbols[0] = ExpressionSequenceNode()
-    
+    _reduce(symbols, actions.a_expr_seq_empty)
+
 def p_expr_seq_multiple(symbols):
     "expr_seq : expr_seq SEMICOLON expr"
-    symbols[0] = symbols[1]
-    symbols[0].expressions.append(symbols[3])
-    symbols[3].parent_node = symbols[0] 
+    _reduce(symbols, actions.a_expr_seq_multiple)
 
 def p_expr_seq_single(symbols):
     "expr_seq : expr"
-    symbols[0] = ExpressionSequenceNode()
-    symbols[0].expressions.append(symbols[1])
-    symbols[1].parent_node = symbols[0]
-    
+    _reduce(symbols, actions.a_expr_seq_single)
+
 # A group of declarations. No "special" characters between declarations!
 
 # A let expression with nothing between the in and end is valid.
 def p_dec_group_empty(symbols):
     "dec_group : "
-    symbols[0] = ([], [], []) 
-    
+    _reduce(symbols, actions.a_dec_group_empty)
+
 def p_dec_group_multiple(symbols):
     "dec_group : dec_group dec"
-    symbols[0] = symbols[1]
-    symbols[0][0].extend(symbols[2][0])
-    symbols[0][1].extend(symbols[2][1])
-    symbols[0][2].extend(symbols[2][2])
-    
+    _reduce(symbols, actions.a_dec_group_multiple)
+
 # A list of field names, the equals character and an expression 
 # to assign values for each one of the fields of a record.
 def p_field_list_empty(symbols):
     "field_list : "
-    symbols[0] = ([], [])
+    _reduce(symbols, actions.a_field_list_empty)
 
 def p_field_list_single(symbols):
     "field_list : field_assign"
-    symbols[0] = ([symbols[1][0]], [symbols[1][1]])
+    _reduce(symbols, actions.a_field_list_single)
 
 def p_field_list_multiple(symbols):
     "field_list : field_list COMMA field_assign"
-    symbols[0] = symbols[1]
-    symbols[0][0].append(symbols[3][0])
-    symbols[0][1].append(symbols[3][1])
-    
+    _reduce(symbols, actions.a_field_list_multiple)
+
 def p_field_assign(symbols):
     "field_assign : ID EQ expr"
-    symbols[0] = (symbols[1], symbols[3])
+    _reduce(symbols, actions.a_field_assign)
 
 # A group of expressions separated by commas.
 def p_expr_list_empty(symbols):
     "expr_list : "
-    symbols[0] = []
-    
+    _reduce(symbols, actions.a_expr_list_empty)
+
 def p_expr_list_multiple(symbols):
     "expr_list : expr_list COMMA expr"
-    symbols[0] = symbols[1]
-    symbols[0].append(symbols[3])
-    
+    _reduce(symbols, actions.a_expr_list_multiple)
+
 def p_expr_list_single(symbols):
     "expr_list : expr"
-    symbols[0] = []
-    symbols[0].append(symbols[1])   
+    _reduce(symbols, actions.a_expr_list_single)
 
 # What is a declaration? A block of continuous type declarations. 
 # Mutually recursive type declarations must be defined without any 
 # variable or function declaration in between.
 def p_dec_type_dec_group(symbols):
     "dec : type_dec_group"
-    symbols[0] = ([symbols[1]], [], [])
+    _reduce(symbols, actions.a_dec_type_dec_group)
 
 # What is a declaration? A variable declaration.
 def p_dec_var(symbols):
     "dec : var_dec"
-    symbols[0] = ([], [], [symbols[1]])
+    _reduce(symbols, actions.a_dec_var)
 
 # What is a declaration? A block of continuous functions declarations. 
 # Mutually recursive function declarations must be defined without any 
 # variable or type declaration in between. 
 def p_dec_func_dec_group(symbols):
     "dec : func_dec_group"
-    symbols[0] = ([], [symbols[1]], [])
+    _reduce(symbols, actions.a_dec_func_dec_group)
 
 # What is a group of function declarations? A function declaration.
 def p_func_dec_group_single(symbols):
     "func_dec_group : func_dec"
-    symbols[0] = FunctionDeclarationGroupNode()
-    symbols[0].declarations.append(symbols[1])
-    symbols[1].parent_node = symbols[0]  
-    
+    _reduce(symbols, actions.a_func_dec_group_single)
+
 # What is a group of function declarations? A group of function 
 # declarations followed by a function declaration.
 def p_func_dec_group_multiple(symbols):
     "func_dec_group : func_dec_group func_dec"
-    symbols[0] = symbols[1]
-    symbols[0].declarations.append(symbols[2])
-    symbols[2].parent_node = symbols[0]
+    _reduce(symbols, actions.a_func_dec_group_multiple)
 
 # What is a group of type declarations? A type declaration.
 def p_type_dec_group_single(symbols):
     "type_dec_group : type_dec"
-    symbols[0] = TypeDeclarationGroupNode()
-    symbols[0].declarations.append(symbols[1])
-    symbols[1].parent_node = symbols[0]
+    _reduce(symbols, actions.a_type_dec_group_single)
 
 # What is a group of type declarations? A group 
 # of type declarations followed by a type declaration.
 def p_type_dec_group_multiple(symbols):
     "type_dec_group : type_dec_group type_dec"
-    symbols[0] = symbols[1]
-    symbols[0].declarations.append(symbols[2])
-    symbols[2].parent_node = symbols[0]
+    _reduce(symbols, actions.a_type_dec_group_multiple)
 
 # Type declarations.
 def p_type_dec(symbols):
     "type_dec : TYPE ID EQ type"
-    symbols[0] = symbols[4]
-    symbols[0].name = symbols[2]
-    symbols[0].line_number = symbols.lineno(1)
+    _reduce(symbols, actions.a_type_dec)
 
 # What is a valid type? An alias for a previously defined type.
 def p_type_alias(symbols):
     "type : ID"
-    symbols[0] = AliasTypeDeclarationNode(None, symbols[1])
+    _reduce(symbols, actions.a_type_alias)
 
 # What is a valid type? The definition of the fields of a record.
 def p_type_record(symbols):
     "type : LBRACE field_types RBRACE"
-    symbols[0] = RecordDeclarationNode(None, symbols[2][0], symbols[2][1])
-    
+    _reduce(symbols, actions.a_type_record)
+
 # What is a valid type? An array definition.
 def p_type_array(symbols):
     "type : ARRAY OF ID"
-    symbols[0] = ArrayDeclarationNode(None, symbols[3])
+    _reduce(symbols, actions.a_type_array)
 
 # A list of field types declaration separated by commas.
 def p_field_types_empty(symbols):
     "field_types : "
-    symbols[0] = ([], [])
+    _reduce(symbols, actions.a_field_types_empty)
 
 def p_field_types_single(symbols):
     "field_types : field_type"
-    symbols[0] = ([symbols[1][0]], [symbols[1][1]])
+    _reduce(symbols, actions.a_field_types_single)
 
 def p_field_types_multiple(symbols):
     "field_types : field_types COMMA field_type"
-    symbols[0] = symbols[1]
-    symbols[0][0].append(symbols[3][0])
-    symbols[0][1].append(symbols[3][1])
+    _reduce(symbols, actions.a_field_types_multiple)
 
 # Declaration of the type of a field. An identifier for the
 # field followed by a colon and the type of the field.
 def p_field_type(symbols):
     "field_type : ID COLON ID"
-    symbols[0] = (symbols[1], symbols[3])
+    _reduce(symbols, actions.a_field_type)
 
 # Variable declaration.
 def p_var_dec_without_type(symbols):
     "var_dec : VAR ID ASSIGN expr"
-    symbols[0] = InferredVariableDeclarationNode(symbols[2], symbols[4])
-    symbols[0].line_number = symbols.lineno(1)
-    symbols[4].parent_node = symbols[0]
+    _reduce(symbols, actions.a_var_dec_without_type)
 
 def p_var_dec_with_type(symbols):
     "var_dec : VAR ID COLON ID ASSIGN expr"
-    symbols[0] = StaticVariableDeclarationNode(symbols[2], symbols[6], symbols[4])
-    symbols[0].line_number = symbols.lineno(1)
-    symbols[6].parent_node = symbols[0]
+    _reduce(symbols, actions.a_var_dec_with_type)
 
 # Function declaration.
 def p_func_dec_without_return(symbols):
     "func_dec : FUNCTION ID LPAREN field_types RPAREN EQ expr"
-    symbols[0] = ProcedureDeclarationNode(symbols[2], symbols[4][0], symbols[4][1], symbols[7])
-    symbols[0].line_number = symbols.lineno(1)
-    symbols[7].parent_node = symbols[0]
+    _reduce(symbols, actions.a_func_dec_without_return)
 
 def p_func_dec_with_return(symbols):
     "func_dec : FUNCTION ID LPAREN field_types RPAREN COLON ID EQ expr"
-    symbols[0] = FunctionDeclarationNode(symbols[2], symbols[4][0], symbols[4][1], symbols[9], symbols[7])
-    symbols[0].line_number = symbols.lineno(1)
-    symbols[9].parent_node = symbols[0]
+    _reduce(symbols, actions.a_func_dec_with_return)
 
 
 _cachedir = os.path.abspath(os.path.join(os.path.dirname(__file__), 'cache'))
 # parser = yacc.yacc(debug=True, outputdir=_cachedir, tabmodule='parser',
 #                    debugfile=os.path.join(_cachedir, 'parser.txt'))
 # Comment the previous line and uncomment the following when
-# the grammar is OK to enable running PLY in optimization mode.
-parser = yacc.yacc(debug=False, write_tables=False, optimize=True, outputdir=_cachedir, 
-                   tabmodule='parser', debugfile=os.path.join(_cachedir, 'parser.txt'))
+# the grammar is OK to load the LALR tables from the cache.
+TABLES_FILE = os.path.join(_cachedir, 'parser.tables')
+parser = tables.load_parser(sys.modules[__name__], TABLES_FILE)
+
+# Parsers indexed by name. The compact LR driver uses the same 
+# LALR tables built by PLY and the semantic actions of the actions module.
+parsers = {
+    'compact': LRDriver(parser, actions.actions, p_error),
+    'ply': parser,
+}
+
+DEFAULT_PARSER = 'compact'
+
+
+def rebuild_tables():
+    """
+    Construye nuevamente las tablas LALR del analizador sintáctico y las 
+    escribe en el archivo C{TABLES_FILE}, aunque el archivo contenga unas 
+    tablas válidas para la gramática actual.
+    
+    Las instancias de la clase C{Parser} creadas a partir de este momento
+    utilizarán las nuevas tablas.
+    
+    @raise IOError: Esta excepción se lanzará si no es posible escribir
+        el archivo.
+    """
+    global parser
+    parser = tables.load_parser(sys.modules[__name__], TABLES_FILE, rebuild=True)
+    parsers['compact'] = LRDriver(parser, actions.actions, p_error)
+    parsers['ply'] = parser
+
+
+# Lexers that can be used by the parser indexed by name.
+lexers = {
+    'table': tablelexer.lexer,
+    'ply': ply_lexer.lexer,
+}
+
+DEFAULT_LEXER = 'table'
+
+
+class Parser(object):
+    """
+    Analizador sintáctico reentrante de programas Tiger.
+    
+    Cada instancia de esta clase posee su propia copia del analizador 
+    léxico-gráfico y del analizador sintáctico, de forma 
+    tal que el estado de un análisis (número de línea, estado del analizador 
+    léxico-gráfico, pilas del analizador sintáctico) no se comparte con otras 
+    instancias. Esto permite analizar varios programas Tiger simultáneamente 
+    desde hilos diferentes utilizando una instancia de esta clase por hilo. 
+    Los análisis realizados con una misma instancia desde varios hilos se 
+    realizan uno a continuación de otro.
+    """
+    
+    def _get_lexer(self):
+        """
+        Método para obtener el valor de la propiedad C{lexer}.
+        """
+        return self._lexer
+    
+    lexer = property(_get_lexer)
+    
+    def _get_symbols(self):
+        """
+        Método para obtener el valor de la propiedad C{symbols}.
+        
+        @rtype: C{SymbolTable}
+        @return: Tabla de símbolos donde se obtienen los identificadores y
+            los literales de los árboles de sintáxis abstracta construidos
+            por esta instancia. La tabla se conserva entre un análisis y 
+            otro, por lo que los identificadores de los símbolos no cambian.
+        """
+        return self._lexer.symbols
+    
+    symbols = property(_get_symbols)
+    
+    def __init__(self, lexer_name=DEFAULT_LEXER, parser_name=DEFAULT_PARSER):
+        """
+        Inicializa el analizador sintáctico.
+        
+        @type lexer_name: C{str}
+        @param lexer_name: Nombre del analizador léxico-gráfico que se debe 
+            utilizar: C{table} para el analizador dirigido por tablas (valor 
+            por defecto) o C{ply} para el analizador construido con PLY.
+            
+        @type parser_name: C{str}
+        @param parser_name: Nombre del analizador sintáctico que se debe
+            utilizar: C{compact} para el analizador del módulo C{driver} 
+            (valor por defecto) o C{ply} para el analizador construido con PLY.
+        """
+        super(Parser, self).__init__()
+        self._lexer = lexers[lexer_name].clone()
+        self._lexer.symbols = SymbolTable()
+        self._parser = copy.copy(parsers[parser_name])
+        self._lock = threading.Lock()
+        
+    def parse(self, data, spans=False, recover=False):
+        """
+        Realiza el análisis léxico-gráfico y sintáctico de un programa Tiger.
+        
+        Antes de comenzar el análisis se reinician el número de línea y el 
+        estado del analizador léxico-gráfico, por lo que el resultado no 
+        depende de los análisis realizados anteriormente con esta instancia.
+        
+        @type data: C{unicode}
+        @param data: Código fuente del programa Tiger.
+        
+        @type spans: C{bool}
+        @param spans: Indica si se debe asignar la propiedad C{span} de los
+            nodos del árbol de sintáxis abstracta. Solamente el analizador 
+            sintáctico C{compact} permite calcular las posiciones.
+        
+        @type recover: C{bool}
+        @param recover: Indica si el analizador se debe recuperar de los 
+            errores para reportar todos los errores del programa. Solamente 
+            el analizador sintáctico C{compact} permite recuperarse de los 
+            errores. Consulte la documentación del módulo C{driver}.
+        
+        @rtype: C{LanguageNode}
+        @return: Nodo raíz del árbol de sintáxis abstracta correspondiente
+            al programa Tiger.
+        
+        @raise SyntacticError: Esta excepción se lanzará si se encuentra algún 
+            error de sintáxis durante el análisis del programa. Si el analizador
+            se recuperó de los errores, la excepción contendrá los mensajes de
+            todos los errores encontrados y el árbol de sintáxis abstracta 
+            parcial formado por las partes del programa sin errores.
+        
+        @raise ValueError: Esta excepción se lanzará si se solicita calcular
+            las posiciones de los nodos o recuperarse de los errores y el 
+            analizador sintáctico no lo permite.
+        """
+        with self._lock:
+            self._lexer.lineno = 1
+            self._lexer.lexstatestack = []
+            self._lexer.begin('INITIAL')
+            if not spans and not recover:
+                return self._parser.parse(data, lexer=self._lexer)
+            elif not isinstance(self._parser, LRDriver):
+                raise ValueError('The parser can not compute spans or recover from errors')
+            elif not recover:
+                return self._parser.parse(data, lexer=self._lexer, spans=spans)
+            errors = []
+            ast = self._parser.parse(data, lexer=self._lexer, spans=spans, errors=errors)
+            if errors:
+                raise SyntacticError(messages=errors, ast=ast)
+            return ast
+    
+    def parse_file(self, filename, spans=False, recover=False):
+        """
+        Realiza el análisis léxico-gráfico y sintáctico de un programa Tiger 
+        almacenado en un archivo codificado en UTF-8.
+        
+        Si se utiliza el analizador léxico-gráfico dirigido por tablas, el 
+        archivo se proyecta en memoria con el módulo C{mmap} y se analiza 
+        directamente sin leerlo ni decodificarlo completo, por lo que la 
+        memoria utilizada no depende del tamaño del archivo. En el caso 
+        contrario, el archivo se lee y se decodifica antes de analizarlo.
+        
+        @type filename: C{str}
+        @param filename: Ruta del archivo que contiene el programa Tiger.
+        
+        @type spans: C{bool}
+        @param spans: Indica si se debe asignar la propiedad C{span} de los
+            nodos del árbol de sintáxis abstracta. Consulte la documentación
+            del método C{parse}.
+        
+        @type recover: C{bool}
+        @param recover: Indica si el analizador se debe recuperar de los 
+            errores. Consulte la documentación del método C{parse}.
+        
+        @rtype: C{LanguageNode}
+        @return: Nodo raíz del árbol de sintáxis abstracta correspondiente
+            al programa Tiger.
+        
+        @raise IOError: Esta excepción se lanzará si no es posible leer el 
+            archivo.
+        
+        @raise SyntacticError: Esta excepción se lanzará si se encuentra algún 
+            error de sintáxis durante el análisis del programa.
+        """
+        if not isinstance(self._lexer, tablelexer.TableLexer):
+            with codecs.open(filename, encoding='utf-8', mode='rb') as fd:
+                return self.parse(fd.read(), spans, recover)
+        with open(filename, 'rb') as fd:
+            if os.fstat(fd.fileno()).st_size == 0:
+                # Empty files can not be mapped.
+                return self.parse('', spans, recover)
+            data = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return self.parse(data, spans, recover)
+        finally:
+            data.close()
 
 
 # The following is used to debug the parser. It will parse input read from 
 # standard input or from a file specified on the command line. 
 if __name__ == '__main__':
     # This code was taken from the body of the lex.runmain() function.
-    import sys
     try:
         filename = sys.argv[1]
         with open(filename) as fd:
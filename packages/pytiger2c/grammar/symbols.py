@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+Tabla de símbolos utilizada por los analizadores léxico-gráficos.
+
+Los programas Tiger, y en especial los generados automáticamente, repiten
+los mismos identificadores y literales muchas veces. Los analizadores
+léxico-gráficos utilizan una tabla de símbolos para que todas las
+apariciones de un mismo identificador o literal compartan una única
+instancia (I{hash-consing}). De esta forma el árbol de sintáxis abstracta
+ocupa menos memoria y las comparaciones de nombres, por ejemplo al buscar
+una definición en los diccionarios de un ámbito, se resuelven comparando
+referencias. Además, la tabla asigna a cada símbolo un identificador entero
+que puede utilizarse en lugar del símbolo en otras tablas.
+"""
+
+
+class SymbolTable(object):
+    """
+    Tabla que asigna a cada identificador o literal una instancia canónica y
+    un identificador entero.
+
+    Los valores iguales corresponden al mismo símbolo aunque sean de tipos
+    diferentes, por ejemplo, la cadena C{'a'} y la cadena C{u'a'}.
+    """
+
+    def __init__(self):
+        """
+        Inicializa la tabla de símbolos vacía.
+        """
+        # Dictionary mapping each value to its id.
+        self._ids = {}
+        # Canonical instance of each symbol indexed by its id.
+        self._symbols = []
+
+    def __len__(self):
+        """
+        Retorna la cantidad de símbolos de la tabla.
+        """
+        return len(self._symbols)
+
+    def __contains__(self, value):
+        """
+        Indica si un valor pertenece a la tabla.
+        """
+        return value in self._ids
+
+    def get_id(self, value):
+        """
+        Retorna el identificador del símbolo correspondiente a un valor,
+        añadiéndolo a la tabla si no pertenece a ella.
+
+        @type value: C{str}, C{unicode}, C{int} o C{long}
+        @param value: Identificador o literal.
+
+        @rtype: C{int}
+        @return: Identificador del símbolo. Los identificadores se asignan
+            consecutivamente comenzando en 0.
+        """
+        symbol_id = self._ids.get(value)
+        if symbol_id is None:
+            if type(value) is str:
+                # Share the strings interned by Python, for example, the
+                # names of the standard types and functions in RootScope.
+                value = intern(value)
+            symbol_id = self._ids[value] = len(self._symbols)
+            self._symbols.append(value)
+        return symbol_id
+
+    def intern(self, value):
+        """
+        Retorna la instancia canónica del símbolo correspondiente a un valor,
+        añadiéndolo a la tabla si no pertenece a ella.
+
+        @type value: C{str}, C{unicode}, C{int} o C{long}
+        @param value: Identificador o literal.
+
+        @return: Instancia canónica, igual al valor recibido. Puede ser de
+            un tipo diferente si el símbolo se añadió con otro tipo, por
+            ejemplo, C{str} en lugar de C{unicode}.
+        """
+        return self._symbols[self.get_id(value)]
+
+    def get_symbol(self, symbol_id):
+        """
+        Retorna la instancia canónica del símbolo con un identificador.
+
+        @type symbol_id: C{int}
+        @param symbol_id: Identificador del símbolo.
+
+        @return: Instancia canónica del símbolo.
+
+        @raise IndexError: Esta excepción se lanzará si no existe ningún
+            símbolo con el identificador.
+        """
+        return self._symbols[symbol_id]
@@ -0,0 +1,349 @@
+# -*- coding: utf-8 -*-
+
+"""
+Análisis léxico-gráfico utilizando un autómata dirigido por tablas.
+
+Este analizador léxico-gráfico reconoce exactamente los mismos tokens que el
+analizador construido con PLY en el módulo C{pytiger2c.grammar.lexer}, pero
+en lugar de probar una a una las alternativas de una expresión regular que
+agrupa todas las reglas, decide qué token se debe reconocer a partir de una
+tabla indexada por el primer caracter del token. Solamente se utilizan
+expresiones regulares pequeñas para consumir identificadores, enteros y
+saltos de línea. Los literales de cadenas de caracteres se reconocen con la
+función C{scan_string_literal} del módulo C{pytiger2c.grammar.common}.
+
+El analizador léxico-gráfico construido con PLY se mantiene como alternativa
+y puede seleccionarse utilizando el nombre C{ply} en el diccionario
+C{lexers} del paquete C{pytiger2c.grammar}.
+
+Además de cadenas de caracteres, este analizador léxico-gráfico puede
+reconocer los tokens de un I{buffer} de bytes codificados en UTF-8, por
+ejemplo, un archivo proyectado en memoria con el módulo C{mmap}. En este caso
+el flujo de entrada no se decodifica completo: los identificadores y los
+enteros se obtienen como cadenas de bytes (solamente pueden contener
+caracteres ASCII) y solamente se decodifica el contenido de los literales de
+cadenas de caracteres. Las posiciones de los tokens son posiciones en bytes.
+
+Los valores de los identificadores y de los literales de cadenas de
+caracteres se obtienen de la tabla de símbolos del analizador (atributo
+C{symbols}), por lo que todas las apariciones de un mismo identificador o
+literal comparten una instancia. Los literales enteros se convierten en
+enteros antes de añadirlos a la tabla.
+"""
+
+import re
+import copy
+
+from pytiger2c.contrib.ply import lex
+from pytiger2c.contrib.ply.lex import LexToken
+from pytiger2c.grammar.common import scan_string_literal
+from pytiger2c.grammar.symbols import SymbolTable
+from pytiger2c.grammar.lexer import tokens, t_error, _reserved_map
+
+
+# Actions of the dispatch table. Each character that can begin a token
+# (or that must be skipped) is mapped to one of these actions.
+_IGNORE, _NEWLINE, _ID, _INTLIT, _STRLIT, _SINGLE, _DOUBLE, _SLASH = range(8)
+
+# Tokens formed by a single character.
+_single_tokens = {
+    '+': 'PLUS', '-': 'MINUS', '*': 'TIMES', '=': 'EQ', '&': 'AND', '|': 'OR',
+    '.': 'PERIOD', ',': 'COMMA', ';': 'SEMICOLON', '(': 'LPAREN', ')': 'RPAREN',
+    '[': 'LBRACKET', ']': 'RBRACKET', '{': 'LBRACE', '}': 'RBRACE',
+}
+
+# Tokens whose first character may be followed by a second character forming
+# a longer token. The values are tuples with the token of a single character
+# and a dictionary mapping the second character to the resulting token.
+_double_tokens = {
+    '<': ('LT', {'=': 'LE', '>': 'NE'}),
+    '>': ('GT', {'=': 'GE'}),
+    ':': ('COLON', {'=': 'ASSIGN'}),
+}
+
+# Build the dispatch table indexed by the first character of each token.
+_dispatch = {}
+for char in ' \t':
+    _dispatch[char] = _IGNORE
+for char in '\r\n':
+    _dispatch[char] = _NEWLINE
+for char in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ':
+    _dispatch[char] = _ID
+for char in '0123456789':
+    _dispatch[char] = _INTLIT
+for char in _single_tokens:
+    _dispatch[char] = _SINGLE
+for char in _double_tokens:
+    _dispatch[char] = _DOUBLE
+_dispatch['"'] = _STRLIT
+_dispatch['/'] = _SLASH
+
+_id_re = re.compile(r'[a-zA-Z][a-zA-Z0-9_]*')
+_intlit_re = re.compile(r'[0-9]+')
+_newline_re = re.compile(r'\r*\n(\r|\n)*')
+_comment_re = re.compile(r'/\*|\*/')
+
+
+class TableLexer(object):
+    """
+    Analizador léxico-gráfico de Tiger dirigido por tablas.
+
+    Esta clase ofrece la misma interfaz que los analizadores léxico-gráficos
+    construidos por PLY (los métodos C{input}, C{token}, C{clone},
+    C{current_state} y los atributos C{lineno}, C{lexpos} y C{lexdata}),
+    por lo que puede ser utilizada directamente por el analizador sintáctico.
+    El atributo C{symbols} contiene la tabla de símbolos utilizada para
+    obtener los valores de los identificadores y de los literales.
+    """
+
+    def __init__(self):
+        """
+        Inicializa el analizador léxico-gráfico.
+        """
+        super(TableLexer, self).__init__()
+        self.lexdata = None
+        self.lexpos = 0
+        self.lexlen = 0
+        self.lineno = 1
+        self.lexstate = 'INITIAL'
+        self.lexstatestack = []
+        self.symbols = SymbolTable()
+
+    def input(self, data):
+        """
+        Cambia el flujo de caracteres de entrada del analizador.
+
+        @type data: C{unicode}
+        @param data: Cadena de caracteres que se debe analizar o I{buffer}
+            de bytes codificados en UTF-8 (por ejemplo, un objeto C{mmap}).
+        """
+        self.lexdata = data
+        self.lexpos = 0
+        self.lexlen = len(data)
+
+    def clone(self):
+        """
+        Crea una copia del analizador léxico-gráfico en su estado actual.
+
+        @rtype: C{TableLexer}
+        @return: Copia independiente del analizador léxico-gráfico.
+        """
+        lexer = copy.copy(self)
+        lexer.lexstatestack = list(self.lexstatestack)
+        return lexer
+
+    def begin(self, state):
+        """
+        Cambia el estado actual del analizador léxico-gráfico.
+
+        @type state: C{str}
+        @param state: Nuevo estado, C{INITIAL} o C{COMMENT}.
+        """
+        if state not in ('INITIAL', 'COMMENT'):
+            raise ValueError('Undefined state')
+        self.lexstate = state
+
+    def push_state(self, state):
+        """
+        Cambia el estado actual del analizador léxico-gráfico guardando
+        el estado anterior en la pila de estados.
+
+        @type state: C{str}
+        @param state: Nuevo estado, C{INITIAL} o C{COMMENT}.
+        """
+        self.lexstatestack.append(self.lexstate)
+        self.begin(state)
+
+    def pop_state(self):
+        """
+        Restaura el último estado guardado en la pila de estados.
+        """
+        self.begin(self.lexstatestack.pop())
+
+    def current_state(self):
+        """
+        Retorna el estado actual del analizador léxico-gráfico.
+
+        @rtype: C{str}
+        @return: Estado actual del analizador léxico-gráfico. El estado
+            C{COMMENT} indica que se encuentra dentro de un comentario.
+        """
+        return self.lexstate
+
+    def token(self):
+        """
+        Reconoce el siguiente token del flujo de caracteres de entrada.
+
+        @rtype: C{LexToken}
+        @return: Siguiente token del flujo de entrada o C{None} si se
+            llegó al final del flujo de entrada.
+
+        @raise SyntacticError: Esta excepción se lanzará si se encuentra
+            un caracter que no puede comenzar ningún token.
+        """
+        data = self.lexdata
+        pos = self.lexpos
+        length = self.lexlen
+        if self.lexstate == 'COMMENT':
+            pos = self._skip_comment(pos)
+        while pos < length:
+            char = data[pos]
+            action = _dispatch.get(char)
+            if action == _IGNORE:
+                pos += 1
+                continue
+            elif action == _SINGLE:
+                token = LexToken()
+                token.type = _single_tokens[char]
+                token.value = char
+                token.lineno = self.lineno
+                token.lexpos = pos
+                self.lexpos = pos + 1
+                return token
+            elif action == _ID:
+                end = _id_re.match(data, pos).end()
+                value = data[pos:end]
+                token = LexToken()
+                token.type = _reserved_map.get(value)
+                if token.type is None:
+                    token.type = 'ID'
+                    value = self.symbols.intern(value)
+                token.value = value
+                token.lineno = self.lineno
+                token.lexpos = pos
+                self.lexpos = end
+                return token
+            elif action == _NEWLINE:
+                match = _newline_re.match(data, pos)
+                if match is None:
+                    # A carriage return not followed by a new line.
+                    break
+                self.lineno += data[pos:match.end()].count('\n')
+                pos = match.end()
+                continue
+            elif action == _INTLIT:
+                end = _intlit_re.match(data, pos).end()
+                token = LexToken()
+                token.type = 'INTLIT'
+                token.value = self.symbols.intern(int(data[pos:end]))
+                token.lineno = self.lineno
+                token.lexpos = pos
+                self.lexpos = end
+                return token
+            elif action == _DOUBLE:
+                single_type, double_types = _double_tokens[char]
+                double_type = double_types.get(data[pos + 1:pos + 2])
+                token = LexToken()
+                if double_type is None:
+                    token.type = single_type
+                    token.value = char
+                else:
+                    token.type = double_type
+                    token.value = data[pos:pos + 2]
+                token.lineno = self.lineno
+                token.lexpos = pos
+                self.lexpos = pos + len(token.value)
+                return token
+            elif action == _SLASH:
+                if data[pos + 1:pos + 2] == '*':
+                    self.push_state('COMMENT')
+                    pos = self._skip_comment(pos + 2)
+                    continue
+                token = LexToken()
+                token.type = 'DIVIDE'
+                token.value = char
+                token.lineno = self.lineno
+                token.lexpos = pos
+                self.lexpos = pos + 1
+                return token
+            elif action == _STRLIT:
+                token = LexToken()
+                token.type = 'STRLIT'
+                token.lineno = self.lineno
+                token.lexpos = pos
+                token.lexer = self
+                # Leave the position at the literal if it is malformed.
+                self.lexpos = pos
+                token = scan_string_literal(token)
+                token.value = self.symbols.intern(token.value)
+                return token
+            else:
+                break
+        self.lexpos = pos
+        if pos < length:
+            self._error(pos)
+        return None
+
+    def _skip_comment(self, pos):
+        """
+        Descarta los caracteres de entrada mientras el analizador se
+        encuentre en el estado C{COMMENT}, teniendo en cuenta que los
+        comentarios pueden estar anidados.
+
+        @type pos: C{int}
+        @param pos: Posición del flujo de entrada a partir de la cual se
+            deben descartar caracteres.
+
+        @rtype: C{int}
+        @return: Posición del flujo de entrada donde termina el comentario
+            o la longitud del flujo de entrada si el comentario no se cerró.
+        """
+        data = self.lexdata
+        while self.lexstate == 'COMMENT':
+            match = _comment_re.search(data, pos)
+            if match is None:
+                self.lineno += data[pos:].count('\n')
+                return self.lexlen
+            self.lineno += data[pos:match.start()].count('\n')
+            if match.group() == '/*':
+                self.push_state('COMMENT')
+            else:
+                self.pop_state()
+            pos = match.end()
+        return pos
+
+    def _error(self, pos):
+        """
+        Reporta un caracter ilegal en el flujo de entrada utilizando la misma
+        regla de error que el analizador léxico-gráfico construido con PLY.
+
+        @type pos: C{int}
+        @param pos: Posición del caracter ilegal en el flujo de entrada.
+
+        @raise SyntacticError: Esta excepción se lanza siempre.
+        """
+        value = self.lexdata[pos:pos + 1]
+        if isinstance(value, str) and value >= '\x80':
+            # Decode the complete UTF-8 sequence of a non-ASCII character.
+            value = self.lexdata[pos:pos + 4].decode('utf-8', 'replace')[:1]
+        token = LexToken()
+        token.type = 'error'
+        token.value = value
+        token.lineno = self.lineno
+        token.lexpos = pos
+        token.lexer = self
+        t_error(token)
+
+    def __iter__(self):
+        """
+        Permite iterar por los tokens del flujo de entrada.
+        """
+        return self
+
+    def next(self):
+        """
+        Retorna el siguiente token del flujo de entrada durante una iteración.
+        """
+        token = self.token()
+        if token is None:
+            raise StopIteration
+        return token
+
+
+lexer = TableLexer()
+
+
+# The following is used to debug the lexer. It will tokenize input read from
+# standard input or from a file specified on the command line.
+if __name__ == '__main__':
+    lex.runmain(lexer=lexer)
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+
+"""
+Cache en disco de las tablas LALR del analizador sintáctico.
+
+Construir las tablas LALR de la gramática de Tiger con PLY es costoso y, si
+no existe un módulo de tablas válido, PLY las construye nuevamente cada vez
+que se importa el analizador sintáctico. Este módulo almacena las tablas en
+un archivo binario serializado con C{pickle} y las carga en lugar de
+construirlas mientras la gramática no cambie.
+
+El archivo comienza con una línea de cabecera que contiene un identificador
+del formato, la firma de la gramática y una suma de comprobación del resto
+del archivo. La firma se calcula a partir de la versión de las tablas de PLY
+y de la firma de la gramática calculada por PLY (símbolo inicial, reglas de
+precedencia, tokens y producciones), por lo que cualquier cambio en la
+gramática provoca que las tablas se construyan y se escriban nuevamente. Si
+la suma de comprobación no coincide, el archivo se considera corrupto y
+también se construyen las tablas nuevamente.
+
+El archivo se escribe de forma atómica: primero se escribe un archivo
+temporal en el mismo directorio y luego se renombra, por lo que varios
+procesos pueden cargar o escribir las tablas simultáneamente sin que
+ninguno lea un archivo incompleto.
+"""
+
+import os
+import sys
+import hashlib
+import tempfile
+
+try:
+    import cPickle as pickle
+except ImportError:
+    import pickle
+
+from pytiger2c.contrib.ply import yacc
+
+
+# Identifier of the format of the file. It should be changed every time
+# the layout of the file changes to discard the files already written.
+FORMAT = 'PYTIGER2C-LRTABLES-1'
+
+# PLY always tries to read a table module before building the tables.
+# This module does not exist, so it will always build them.
+_MISSING_TABMODULE = 'pytiger2c.grammar.cache.missing'
+
+
+def grammar_signature(pinfo):
+    """
+    Calcula la firma de la gramática utilizada para identificar las tablas.
+
+    @type pinfo: C{ParserReflect}
+    @param pinfo: Información de la gramática obtenida por PLY.
+
+    @rtype: C{str}
+    @return: Firma de la gramática representada en hexadecimal.
+    """
+    digest = hashlib.md5()
+    digest.update(FORMAT)
+    digest.update(yacc.__tabversion__)
+    digest.update(pinfo.signature())
+    return digest.hexdigest()
+
+
+def read_tables(filename, signature):
+    """
+    Lee las tablas LALR almacenadas en un archivo.
+
+    @type filename: C{str}
+    @param filename: Ruta del archivo que contiene las tablas.
+
+    @type signature: C{str}
+    @param signature: Firma de la gramática actual.
+
+    @rtype: C{LRTable}
+    @return: Tablas LALR leídas del archivo o C{None} si el archivo no
+        existe, fue escrito para otra gramática o está corrupto.
+    """
+    try:
+        with open(filename, 'rb') as fd:
+            header = fd.readline().split()
+            payload = fd.read()
+    except (IOError, OSError):
+        return None
+    if len(header) != 3 or header[0] != FORMAT or header[1] != signature:
+        return None
+    if hashlib.md5(payload).hexdigest() != header[2]:
+        return None
+    try:
+        lr_method, lr_action, lr_goto, productions = pickle.loads(payload)
+    except Exception:
+        return None
+    lr = yacc.LRTable()
+    lr.lr_method = lr_method
+    lr.lr_action = lr_action
+    lr.lr_goto = lr_goto
+    lr.lr_productions = [yacc.MiniProduction(*p) for p in productions]
+    return lr
+
+
+def write_tables(filename, signature, parser):
+    """
+    Escribe de forma atómica las tablas LALR de un analizador sintáctico.
+
+    @type filename: C{str}
+    @param filename: Ruta del archivo donde se deben escribir las tablas.
+
+    @type signature: C{str}
+    @param signature: Firma de la gramática del analizador sintáctico.
+
+    @type parser: C{LRParser}
+    @param parser: Analizador sintáctico construido por PLY.
+
+    @raise IOError: Esta excepción se lanzará si no es posible escribir
+        el archivo.
+    """
+    productions = [(p.str, p.name, p.len, p.func, p.file, p.line)
+                   for p in parser.productions]
+    payload = pickle.dumps(('LALR', parser.action, parser.goto, productions),
+                           pickle.HIGHEST_PROTOCOL)
+    header = '{0} {1} {2}\n'.format(FORMAT, signature, hashlib.md5(payload).hexdigest())
+    dirname, basename = os.path.split(filename)
+    fd, tmp_filename = tempfile.mkstemp(prefix=basename + '.', dir=dirname)
+    try:
+        with os.fdopen(fd, 'wb') as tmp_fd:
+            tmp_fd.write(header)
+            tmp_fd.write(payload)
+        # The temporary file is created readable only by its owner.
+        os.chmod(tmp_filename, 0644)
+        if sys.platform == 'win32' and os.path.exists(filename):
+            # On Windows os.rename fails if the destination already exists.
+            os.unlink(filename)
+        os.rename(tmp_filename, filename)
+    except:
+        os.unlink(tmp_filename)
+        raise
+
+
+def load_parser(module, filename, rebuild=False):
+    """
+    Crea el analizador sintáctico definido en un módulo utilizando las
+    tablas LALR almacenadas en un archivo.
+
+    Si el archivo no existe, corresponde a otra versión de la gramática o
+    está corrupto, las tablas se construyen con PLY y se intenta escribir
+    el archivo nuevamente. Si no es posible escribirlo (por ejemplo, porque
+    el directorio no tiene permisos de escritura) se utilizan las tablas
+    construidas sin reportar ningún error.
+
+    @type module: C{module}
+    @param module: Módulo que contiene la definición de la gramática de
+        acuerdo con las convenciones de PLY.
+
+    @type filename: C{str}
+    @param filename: Ruta del archivo que contiene las tablas.
+
+    @type rebuild: C{bool}
+    @param rebuild: Indica si se deben construir y escribir las tablas
+        aunque el archivo contenga unas tablas válidas. En este caso los
+        errores al escribir el archivo sí se reportan.
+
+    @rtype: C{LRParser}
+    @return: Analizador sintáctico construido por PLY.
+
+    @raise YaccError: Esta excepción se lanzará si la gramática definida
+        en el módulo no es válida.
+    """
+    pdict = dict([(name, getattr(module, name)) for name in dir(module)])
+    pinfo = yacc.ParserReflect(pdict, log=yacc.PlyLogger(sys.stderr))
+    pinfo.get_all()
+    if pinfo.error:
+        raise yacc.YaccError('Unable to build parser')
+    signature = grammar_signature(pinfo)
+    lr = None if rebuild else read_tables(filename, signature)
+    if lr is not None:
+        lr.bind_callables(pinfo.pdict)
+        return yacc.LRParser(lr, pinfo.error_func)
+    parser = yacc.yacc(module=module, debug=False, write_tables=False,
+                       optimize=True, tabmodule=_MISSING_TABMODULE)
+    try:
+        write_tables(filename, signature, parser)
+    except (IOError, OSError):
+        if rebuild:
+            raise
+    return parser
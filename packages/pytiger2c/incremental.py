@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+
+"""
+Comprobación semántica incremental de los programas Tiger que se modifican
+con un analizador sintáctico incremental.
+
+La clase C{IncrementalParser} del paquete C{pytiger2c.grammar} actualiza el
+árbol de sintáxis abstracta sustituyendo solamente los subárboles afectados
+por cada modificación, por lo que el resto de los nodos conserva los
+resultados de la comprobación semántica anterior. La clase C{IncrementalChecker}
+de este módulo comprueba nuevamente solamente las partes de las estructuras
+C{let-in-end} que contienen los subárboles sustituidos: las declaraciones de
+funciones y las secuencias de expresiones, que se comprueban en los ámbitos
+ya construidos. Una parte modificada afecta a las demás si cambia su huella
+(I{fingerprint}): las funciones que se llaman en el cuerpo de una declaración
+de función, o el tipo de retorno de una estructura C{let-in-end}. En estos
+casos se comprueba nuevamente la parte que contiene a la estructura
+C{let-in-end}, hasta llegar a la raíz del árbol. De esta forma, después de
+modificar el cuerpo de una función de un programa grande, solamente se
+comprueba esa función.
+
+El alcance de la comprobación incremental es limitado. Las declaraciones de
+variables y de tipos no tienen huella: el analizador sintáctico incremental
+solamente sustituye estructuras C{let-in-end}, secuencias de expresiones
+entre paréntesis y cuerpos de funciones, por lo que una modificación en una
+de estas declaraciones sustituye a toda la estructura C{let-in-end} que la
+contiene y se comprueba la parte que contiene a esta estructura. Si la 
+estructura no está contenida en otra, por ejemplo, en las declaraciones del
+nivel superior del programa, se comprueba el árbol completo. Tampoco se
+comprueba de forma incremental ningún árbol que no se obtenga de un objeto
+C{IncrementalParser}: las funciones C{check_semantics} y C{tiger2c} del 
+paquete C{pytiger2c} comprueban siempre el árbol completo.
+
+Los resultados siempre coinciden con los de la función C{check_semantics} del
+paquete C{pytiger2c}: si la comprobación incremental encuentra algún error,
+el árbol se comprueba nuevamente de forma completa para reportar los mismos
+errores que la comprobación de todo el programa.
+"""
+
+from pytiger2c.ast.traversal import run, Visitor
+from pytiger2c.ast.letnode import LetNode
+from pytiger2c.ast.functiondeclarationgroupnode import FunctionDeclarationGroupNode
+from pytiger2c.ast.variabledeclarationnode import VariableDeclarationNode
+from pytiger2c.ast.languagenode import get_field_names
+from pytiger2c.scope import RootScope
+from pytiger2c.errors import SemanticError
+
+
+# Attributes assigned by the semantic check and their initial values.
+_CHECKED_ATTRIBUTES = (('_scope', None), ('_return_type', None), ('_code_name', None),
+                       ('_has_return_value', False), ('_read_only', False), ('_type', None))
+
+# Checked attributes declared by each node class, computed on demand.
+_checked_attributes = {}
+
+
+class IncrementalChecker(object):
+    """
+    Comprobación semántica incremental del árbol de sintáxis abstracta de
+    un analizador sintáctico incremental.
+
+    Cada instancia de esta clase conserva el último árbol comprobado sin
+    errores y, en cada comprobación, obtiene del analizador sintáctico los
+    nodos que sustituyeron subárboles desde la comprobación anterior.
+    """
+
+    def _get_rechecked(self):
+        """
+        Método para obtener el valor de la propiedad C{rechecked}.
+
+        @rtype: C{int}
+        @return: Cantidad de partes de estructuras C{let-in-end} comprobadas
+            en la última comprobación o C{None} si se comprobó el árbol
+            completo.
+        """
+        return self._rechecked
+
+    rechecked = property(_get_rechecked)
+
+    def __init__(self, parser):
+        """
+        Inicializa la comprobación semántica incremental.
+
+        @type parser: C{IncrementalParser}
+        @param parser: Analizador sintáctico incremental cuyo árbol de
+            sintáxis abstracta se debe comprobar. Los nodos sustituidos se
+            obtienen con el método C{pop_changes}, por lo que ningún otro
+            objeto debe llamar a este método.
+        """
+        super(IncrementalChecker, self).__init__()
+        self._parser = parser
+        self._ast = None
+        self._rechecked = None
+
+    def check(self):
+        """
+        Realiza la comprobación semántica del árbol de sintáxis abstracta
+        actual del analizador sintáctico.
+
+        El árbol comprobado se obtiene con la propiedad C{ast} del analizador
+        sintáctico. Para que el costo de las comprobaciones incrementales no
+        dependa del tamaño del programa, las posiciones de los nodos 
+        solamente se actualizan antes de comprobar el árbol completo.
+
+        @rtype: C{bool}
+        @return: C{True} si se realizó la comprobación o C{False} si el
+            programa tiene errores de sintáxis. Los nodos sustituidos
+            mientras el programa tiene errores de sintáxis se comprueban
+            en la siguiente comprobación.
+
+        @raise SemanticError: Esta excepción se lanzará si se encuentra un
+            error semántico en el árbol de sintáxis abstracta. La excepción
+            contendrá los mismos errores que la función C{check_semantics}
+            del paquete C{pytiger2c}.
+        """
+        ast = self._parser.get_ast(positions=False)
+        if ast is None:
+            return False
+        changes = self._parser.pop_changes()
+        if ast is self._ast and changes is not None:
+            members = self._find_members(ast, changes)
+            if members is not None and self._recheck(members):
+                self._rechecked = len(members)
+                return True
+        ast = self._parser.ast
+        if changes is not None:
+            # Some nodes keep the results of a previous check.
+            _ResultsCleaner().visit(ast)
+        self._ast = None
+        self._rechecked = None
+        errors = []
+        run(ast.check_semantics(RootScope(), errors))
+        if errors:
+            raise SemanticError(errors)
+        self._ast = ast
+        return True
+
+    def _find_members(self, ast, changes):
+        """
+        Obtiene las partes de las estructuras C{let-in-end} que contienen los
+        nodos sustituidos que aún forman parte del árbol.
+
+        @rtype: C{list}
+        @return: Lista de tuplas con cada estructura C{let-in-end} y la parte
+            que se debe comprobar nuevamente, sin incluir las partes contenidas
+            en otras de la lista, o C{None} si se debe comprobar el árbol
+            completo.
+        """
+        members = {}
+        for node in changes:
+            if _is_attached(node, ast):
+                member = _find_member(node)
+                if member is None:
+                    return None
+                members[member[1]] = member
+        result = []
+        for let, member in members.itervalues():
+            ancestor = let
+            while ancestor is not None and ancestor not in members:
+                ancestor = ancestor.parent_node
+            if ancestor is None:
+                result.append((let, member))
+        return result
+
+    def _recheck(self, members):
+        """
+        Comprueba nuevamente las partes de las estructuras C{let-in-end}.
+        Cuando una parte afecta al resto de su estructura, se comprueba la
+        parte que contiene a la estructura.
+
+        @rtype: C{bool}
+        @return: C{True} si las partes se comprobaron sin errores o C{False}
+            si se debe comprobar el árbol completo.
+        """
+        errors = []
+        pending = list(members)
+        while pending:
+            let, member = pending.pop()
+            valid = run(let.recheck_semantics(member, errors))
+            if errors:
+                return False
+            if not valid:
+                outer = _find_member(let)
+                if outer is None:
+                    return False
+                pending.append(outer)
+        return True
+
+
+def _find_member(node):
+    """
+    Obtiene la parte de la estructura C{let-in-end} más cercana que contiene
+    a un nodo.
+
+    @rtype: C{tuple}
+    @return: Tupla con la estructura C{let-in-end} y su hijo que contiene al
+        nodo, o C{None} si el nodo no está contenido en ninguna estructura.
+        Las declaraciones de funciones se obtienen en lugar de su grupo.
+    """
+    child, parent = node, node.parent_node
+    while parent is not None:
+        if isinstance(parent, LetNode):
+            return parent, child
+        if isinstance(parent, FunctionDeclarationGroupNode):
+            return parent.parent_node, child
+        child, parent = parent, parent.parent_node
+    return None
+
+
+def _is_attached(node, root):
+    """
+    Indica si un nodo forma parte del árbol de sintáxis abstracta, es decir,
+    si cada uno de sus ancestros aún lo contiene.
+    """
+    while node is not root:
+        parent = node.parent_node
+        if parent is None:
+            return False
+        for name in get_field_names(type(parent)):
+            value = getattr(parent, name, None)
+            if value is node:
+                break
+            if isinstance(value, list) and any(item is node for item in value):
+                break
+        else:
+            return False
+        node = parent
+    return True
+
+
+class _ResultsCleaner(Visitor):
+    """
+    Restaura los valores iniciales de los atributos asignados por la
+    comprobación semántica, para que la comprobación del árbol completo
+    reporte los mismos errores que la de un árbol nuevo.
+    """
+
+    def enter(self, node):
+        """
+        Restaura los atributos del nodo.
+        """
+        node_class = type(node)
+        attributes = _checked_attributes.get(node_class)
+        if attributes is None:
+            slots = set()
+            for cls in node_class.__mro__:
+                slots.update(cls.__dict__.get('__slots__', ()))
+            if not issubclass(node_class, VariableDeclarationNode):
+                # The other declarations create their types when they are
+                # built and the semantic check completes them.
+                slots.discard('_type')
+            attributes = tuple([(name, value) for name, value in _CHECKED_ATTRIBUTES
+                                if name in slots])
+            _checked_attributes[node_class] = attributes
+        for name, value in attributes:
+            setattr(node, name, value)
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+Recuperación de los errores semánticos.
+
+Por defecto, la comprobación semántica de una estructura C{let-in-end} o de un
+grupo de declaraciones se detiene en la primera declaración con errores, 
+porque los errores de las declaraciones siguientes pueden ser consecuencia de
+este. Así, cada compilación reporta los errores de una sola declaración y el
+programa se debe compilar nuevamente para obtener los siguientes.
+
+Mientras un objeto C{ErrorRecovery} está activo, la comprobación continúa
+luego de las declaraciones con errores. Para no reportar errores que son 
+consecuencia de otros, los tipos, variables, campos, parámetros y valores de
+retorno cuya declaración tiene errores se definen con el tipo C{ErrorType}
+(I{poisoned}). Las expresiones cuyo valor tiene este tipo no reportan nuevos
+errores: en su lugar añaden la marca C{POISONED} a la lista de errores, de 
+forma que los nodos padres no realicen las comprobaciones que dependen de su
+valor, igual que si hubieran reportado un error. Las marcas se eliminan de 
+la lista de errores al finalizar la comprobación semántica con la función
+C{get_messages}. De esta forma, una compilación reporta todos los errores
+independientes del programa, hasta una cantidad máxima configurable.
+
+El objeto C{ErrorRecovery} activo se almacena por hilo, por lo que varios
+hilos pueden comprobar programas distintos al mismo tiempo, con o sin
+recuperación. Los procesos creados con C{fork} heredan el objeto activo del
+hilo que los crea.
+"""
+
+import threading
+
+
+# Mark appended to the list of errors by the expressions whose value has the
+# error type. It is not a message and it is not reported.
+POISONED = None
+
+# Recovery used by the semantic check in each thread.
+_state = threading.local()
+
+
+def get_active_recovery():
+    """
+    Retorna el objeto C{ErrorRecovery} activo en este hilo.
+
+    @rtype: C{ErrorRecovery}
+    @return: Objeto activo o C{None} si la comprobación semántica se debe
+        detener en la primera declaración con errores.
+    """
+    return getattr(_state, 'recovery', None)
+
+
+def must_stop(errors, errors_before):
+    """
+    Indica si la comprobación de una secuencia de declaraciones se debe
+    detener después de comprobar una de ellas o uno de sus recorridos.
+
+    @type errors: C{list}
+    @param errors: Lista de los errores encontrados durante la comprobación.
+
+    @type errors_before: C{int}
+    @param errors_before: Cantidad de elementos de la lista de errores antes
+        de comprobar las declaraciones.
+
+    @rtype: C{bool}
+    @return: C{True} si la comprobación añadió errores y no hay ningún objeto
+        C{ErrorRecovery} activo o ya se alcanzó su cantidad máxima de errores.
+    """
+    if errors_before == len(errors):
+        return False
+    recovery = getattr(_state, 'recovery', None)
+    return recovery is None or recovery.is_exhausted(errors)
+
+
+def get_messages(errors, max_errors=None):
+    """
+    Retorna los mensajes de error de una lista de errores, sin las marcas 
+    C{POISONED}.
+
+    @type errors: C{list}
+    @param errors: Lista de los errores encontrados durante la comprobación.
+
+    @type max_errors: C{int}
+    @param max_errors: Cantidad máxima de mensajes que se retornan. Si es 
+        C{None}, se retornan todos los mensajes.
+
+    @rtype: C{list}
+    @return: Lista de los mensajes de error en el orden en que se reportaron.
+    """
+    messages = [error for error in errors if error is not POISONED]
+    if max_errors is not None:
+        del messages[max_errors:]
+    return messages
+
+
+class ErrorRecovery(object):
+    """
+    Recuperación de los errores semánticos.
+
+    Los objetos de esta clase se activan con la instrucción C{with}. Mientras
+    un objeto está activo, la comprobación semántica de las estructuras
+    C{let-in-end} y de los grupos de declaraciones que se realiza en el
+    mismo hilo continúa luego de las declaraciones con errores.
+    """
+
+    def _get_max_errors(self):
+        """
+        Método para obtener el valor de la propiedad C{max_errors}.
+        """
+        return self._max_errors
+
+    max_errors = property(_get_max_errors)
+
+    def __init__(self, max_errors=None):
+        """
+        Inicializa la clase C{ErrorRecovery}.
+
+        @type max_errors: C{int}
+        @param max_errors: Cantidad de errores a partir de la cual la 
+            comprobación se detiene como si no hubiera recuperación. Si no 
+            se especifica, se reportan todos los errores.
+        """
+        self._max_errors = max_errors
+        self._previous = None
+
+    def __enter__(self):
+        """
+        Activa el objeto en este hilo.
+        """
+        self._previous = getattr(_state, 'recovery', None)
+        _state.recovery = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Desactiva el objeto y activa nuevamente el objeto que estaba activo
+        en este hilo.
+        """
+        _state.recovery = self._previous
+        self._previous = None
+
+    def is_exhausted(self, errors):
+        """
+        Indica si ya se alcanzó la cantidad máxima de errores.
+
+        @type errors: C{list}
+        @param errors: Lista de los errores encontrados durante la comprobación.
+
+        @rtype: C{bool}
+        @return: C{True} si la lista contiene al menos C{max_errors} mensajes.
+        """
+        if self._max_errors is None:
+            return False
+        return len(errors) - errors.count(POISONED) >= self._max_errors
@@ -9,6 +9,10 @@ from pytiger2c.types.integertype import IntegerType
 from pytiger2c.types.stringtype import StringType
 
 
+# Kinds of the lookups saved in the cache of the scopes.
+_TYPE, _FUNCTION, _VARIABLE, _CODE = 'type', 'function', 'variable', 'code'
+
+
 class Scope(object):
     """
     Clase C{Scope} que representa un ámbito de ejecución de Tiger.
@@ -16,8 +20,28 @@ class Scope(object):
     Esta clase gestiona los tipos, variables y funciones disponibles
     en un ámbito de ejecución en Tiger. Además mantiene una referencia
     a un ámbito padre donde se encuentra contenido este ámbito.
+    
+    Las definiciones se buscan en los ancestros sin utilizar recursión, por 
+    lo que la profundidad del anidamiento de los ámbitos no está limitada por
+    la pila de Python. Los ámbitos que redirigen las búsquedas a su padre 
+    realizando alguna comprobación adicional se indican con el atributo de 
+    clase C{_redirects_lookups}.
+    
+    El resultado de cada búsqueda se guarda en una cache de cada uno de los
+    ámbitos recorridos, de forma que las búsquedas siguientes del mismo 
+    nombre desde estos ámbitos o sus descendientes no recorren nuevamente 
+    los ancestros. Cada nombre tiene un número de versión, compartido por 
+    todos los ámbitos de un programa, que se incrementa cada vez que se 
+    define el nombre en algún ámbito. Las entradas de la cache guardan la 
+    versión del nombre con que se crearon y se descartan si una definición 
+    posterior pudiera ocultar la definición encontrada. Las búsquedas de 
+    tipos y funciones no se guardan en la cache más allá de un ámbito que
+    redirige las búsquedas, ya que sus comprobaciones se deben realizar en
+    cada búsqueda.
     """
     
+    _redirects_lookups = False
+    
     def _get_parent(self):
         """
         Método para obtener el valor de la propiedad C{parent}.
@@ -63,6 +87,20 @@ class Scope(object):
         self._members = {}
         self._code_name = None
         self._code_type = None
+        # Versions of the names shared by all the scopes of the program and
+        # the cache of the lookups made from this scope. The keys of the 
+        # cache are tuples with the kind of the lookup and the name.
+        self._versions = parent._versions if (parent is not None) else {}
+        self._resolved = {}
+
+    def __getstate__(self):
+        """
+        Retorna el estado del ámbito que se debe serializar con C{pickle}. La
+        cache de las búsquedas no se serializa.
+        """
+        state = self.__dict__.copy()
+        state['_resolved'] = {}
+        return state
 
     def generate_code(self, generator):
         """
@@ -73,20 +111,42 @@ class Scope(object):
         @param generator: Clase auxiliar utilizada en la generación del 
             código C correspondiente a un programa Tiger.
         """
-        if self._code_type is None:
-            names = self._members.keys()
-            members = self._members.values()
-            type_names = self._types.keys()
-            types = self._types.itervalues()
-            parent_code_type = None
-            if self.parent:
-                self.parent.generate_code(generator)
-                parent_code_type = self.parent.code_type
-            code_name, code_type = \
-                generator.define_scope(names, members, type_names, 
-                                       types, parent_code_type)
-            self._code_name = code_name
-            self._code_type = code_type
+        # The structures of the ancestors must be defined first. They are
+        # collected without recursion to allow deeply nested scopes.
+        pending = []
+        scope = self
+        while scope is not None and scope._code_type is None:
+            pending.append(scope)
+            scope = scope._parent
+        for scope in reversed(pending):
+            scope._define_code(generator)
+
+    def _define_code(self, generator):
+        """
+        Genera la estructura del lenguaje C de este ámbito de ejecución. La 
+        estructura del ámbito padre debe estar definida.
+        
+        @type generator: C{CodeGenerator}
+        @param generator: Clase auxiliar utilizada en la generación del 
+            código C correspondiente a un programa Tiger.
+        """
+        # The members and the types are sorted by name to generate the same
+        # code regardless of the order in which the dictionaries were built, 
+        # for example, when the abstract syntax tree was loaded from a cache.
+        members = sorted(self._members.iteritems())
+        types = sorted(self._types.iteritems())
+        names = [name for name, member in members]
+        members = [member for name, member in members]
+        type_names = [type_name for type_name, tiger_type in types]
+        types = [tiger_type for type_name, tiger_type in types]
+        parent_code_type = None
+        if self.parent:
+            parent_code_type = self.parent.code_type
+        code_name, code_type = \
+            generator.define_scope(names, members, type_names, 
+                                   types, parent_code_type)
+        self._code_name = code_name
+        self._code_type = code_type
     
     def get_variable_code(self, name):
         """
@@ -105,20 +165,88 @@ class Scope(object):
         @return: Cadena de caracteres correspondiente al código C necesario 
             para acceder a la variable.            
         """
-        parent_path_code = ''
-        current = self
-        while not name in current._members:
-            if isinstance(current, FakeScope):
-                current = current.parent
-            else:
-                parent_path_code += 'parent->'
-                current = current.parent
-        var_code_name = current._members[name].code_name
+        key = (_CODE, name)
+        version = self._versions.get(name, 0)
+        entry = self._resolved.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        depth, variable_type = self.resolve_variable(name)
         variable_code = '{scope_code_name}->{parent_path_code}{var_code_name}'
         variable_code = variable_code.format(scope_code_name=self._code_name, 
-                                             parent_path_code=parent_path_code,
-                                             var_code_name=var_code_name)
+                                             parent_path_code='parent->' * depth,
+                                             var_code_name=variable_type.code_name)
+        self._resolved[key] = (version, variable_code)
         return variable_code
+    
+    def resolve_variable(self, name):
+        """
+        Retorna la ubicación de una variable definida en este ámbito o en 
+        alguno superior.
+        
+        @type name: C{str}
+        @param name: Cadena de caracteres correspondiente al nombre de la 
+            variable.
+        
+        @rtype: C{tuple}
+        @return: Tupla con la cantidad de estructuras de ámbitos padres que 
+            se deben recorrer desde la estructura de este ámbito para acceder 
+            a la variable y la instancia de C{VariableType} correspondiente a
+            la declaración de la variable. Después de generar el código de 
+            los ámbitos, la propiedad C{code_name} de esta instancia es el 
+            nombre del campo de la estructura que contiene la variable.
+        
+        @raise KeyError: Se lanza una excepción C{KeyError} si la variable 
+            no está definida en este ámbito o en alguno superior.
+        """
+        scope = self._resolve(_VARIABLE, name)
+        return self._depth - scope._depth, scope._members[name]
+    
+    def _resolve(self, kind, name):
+        """
+        Busca el ámbito que contiene la definición de un nombre, comenzando 
+        por este ámbito y recorriendo sus ancestros, y guarda el resultado en
+        la cache de los ámbitos recorridos.
+        
+        @type kind: C{str}
+        @param kind: Tipo de búsqueda: C{_TYPE}, C{_FUNCTION} o C{_VARIABLE}.
+            Solamente las búsquedas de variables continúan a través de los 
+            ámbitos que redirigen las búsquedas.
+        
+        @type name: C{str}
+        @param name: Nombre que se debe buscar.
+        
+        @rtype: C{Scope}
+        @return: Ámbito que contiene la definición del nombre. Si el nombre no
+            está definido se retorna el ámbito raíz y si la búsqueda se debe
+            redirigir se retorna el ámbito que la redirige.
+        """
+        key = (kind, name)
+        version = self._versions.get(name, 0)
+        entry = self._resolved.get(key)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        redirect = kind is not _VARIABLE
+        path = [self]
+        scope = self
+        while True:
+            definitions = scope._types if kind is _TYPE else scope._members
+            if name in definitions:
+                break
+            scope = scope._parent
+            if scope is None:
+                # The name is not defined. Return the root scope.
+                return path[-1]
+            if redirect and scope._redirects_lookups:
+                return scope
+            entry = scope._resolved.get(key)
+            if entry is not None and entry[0] == version:
+                scope = entry[1]
+                break
+            path.append(scope)
+        entry = (version, scope)
+        for visited in path:
+            visited._resolved[key] = entry
+        return scope
         
     def define_type(self, name, tiger_type):
         """
@@ -143,6 +271,7 @@ class Scope(object):
         """
         if not name in self._types:
             self._types[name] = tiger_type
+            self._versions[name] = self._versions.get(name, 0) + 1
         else:
             raise ValueError('Type already defined in this scope')
         
@@ -165,10 +294,10 @@ class Scope(object):
         @raise KeyError: Se lanza una excepción C{KeyError} si el tipo no 
             está definido en este ámbito o en alguno superior.
         """
-        if name in self._types:
-            return self._types[name]
-        else:
-            return self._parent.get_type_definition(name)
+        scope = self._resolve(_TYPE, name)
+        if scope._redirects_lookups:
+            return scope.get_type_definition(name)
+        return scope._types[name]
     
     def define_function(self, name, function_type):
         """
@@ -193,6 +322,7 @@ class Scope(object):
         if not name in self._members:
             function_type.scope_depth = self._depth
             self._members[name] = function_type
+            self._versions[name] = self._versions.get(name, 0) + 1
         else:
             raise ValueError('Function already defined in this scope')
     
@@ -215,14 +345,14 @@ class Scope(object):
             un miembro en algún ámbito con el nombre dado pero no es una
             función.
         """
-        if name in self._members:
-            function_type = self._members[name]
-            if isinstance(function_type, FunctionType):
-                return function_type
-            else:
-                raise ValueError('The member of the scope is not a function')
+        scope = self._resolve(_FUNCTION, name)
+        if scope._redirects_lookups:
+            return scope.get_function_definition(name)
+        function_type = scope._members[name]
+        if isinstance(function_type, FunctionType):
+            return function_type
         else:
-            return self.parent.get_function_definition(name)
+            raise ValueError('The member of the scope is not a function')
     
     def define_variable(self, name, tiger_type):
         """
@@ -246,6 +376,7 @@ class Scope(object):
         """
         if not (name in self._members):
             self._members[name] = tiger_type
+            self._versions[name] = self._versions.get(name, 0) + 1
         else:
             raise ValueError('Variable already defined in this scope')
         
@@ -269,14 +400,12 @@ class Scope(object):
             un miembro en algún ámbito con el nombre dado pero no es una
             variable.             
         """
-        if name in self._members:
-            variable_type = self._members[name]
-            if isinstance(variable_type, FunctionType):
-                raise ValueError('The member of the scope is not a variable')
-            else:
-                return variable_type
+        scope = self._resolve(_VARIABLE, name)
+        variable_type = scope._members[name]
+        if isinstance(variable_type, FunctionType):
+            raise ValueError('The member of the scope is not a variable')
         else:
-            return self.parent.get_variable_definition(name)
+            return variable_type
         
 
 class RootScope(Scope):
@@ -312,11 +441,28 @@ class RootScope(Scope):
         self.define_type('int', IntegerType())
         self.define_type('string', StringType())
     
+    # Types of the functions of the standard library. They are created only
+    # once and shared by all the root scopes because they are never modified.
+    _standard_functions = None
+    
     def _init_functions(self):
         """
         Inicializa las funciónes de la biblioteca standard del lenguaje Tiger
         definidas implícitamente el ámbito raíz.
         """
+        if RootScope._standard_functions is None:
+            RootScope._standard_functions = self._create_standard_functions()
+        self._members.update(RootScope._standard_functions)
+        
+    def _create_standard_functions(self):
+        """
+        Crea los tipos de las funciones de la biblioteca standard del 
+        lenguaje Tiger.
+        
+        @rtype: C{dict}
+        @return: Diccionario con los tipos de las funciones indexados por 
+            el nombre de cada función.
+        """
         int_type = IntegerType()
         string_type = StringType()
         
@@ -343,17 +489,19 @@ class RootScope(Scope):
         exit_type = FunctionType(None, [int_type], [''])
         exit_type.code_name = 'tiger_exit'
 
-        self._members['print'] = print_type
-        self._members['printi'] = printi_type
-        self._members['flush'] = flush_type
-        self._members['getchar'] = getchar_type
-        self._members['ord'] = ord_type
-        self._members['chr'] = chr_type
-        self._members['size'] = size_type
-        self._members['substring'] = substring_type
-        self._members['concat'] = concat_type
-        self._members['not'] = not_type
-        self._members['exit'] = exit_type
+        functions = {}
+        functions['print'] = print_type
+        functions['printi'] = printi_type
+        functions['flush'] = flush_type
+        functions['getchar'] = getchar_type
+        functions['ord'] = ord_type
+        functions['chr'] = chr_type
+        functions['size'] = size_type
+        functions['substring'] = substring_type
+        functions['concat'] = concat_type
+        functions['not'] = not_type
+        functions['exit'] = exit_type
+        return functions
         
     def get_type_definition(self, name):
         """
@@ -402,6 +550,8 @@ class FakeScope(Scope):
     a través del ámbito padre.
     """    
     
+    _redirects_lookups = True
+    
     def _get_current_member(self):
         """
         Método para obtener el valor de la propiedad C{current_member}.        
@@ -416,41 +566,33 @@ class FakeScope(Scope):
         
     current_member = property(_get_current_member, _set_current_member)
     
-    def _get_current_siblings(self):
+    def _get_type_graph(self):
         """
-        Método para obtener el valor de la propiedad C{current_siblings}.        
+        Método para obtener el valor de la propiedad C{type_graph}.        
         """
-        return self._current_siblings
+        return self._type_graph
     
-    def _set_current_siblings(self, siblings):
+    def _set_type_graph(self, graph):
         """
-        Método para cambiar el valor de la propiedad C{current_siblings}.
+        Método para cambiar el valor de la propiedad C{type_graph}.
         """
-        self._current_siblings = siblings
+        self._type_graph = graph
         
-    current_siblings = property(_get_current_siblings, _set_current_siblings)
+    type_graph = property(_get_type_graph, _set_type_graph)
     
-    def _get_relationships(self):
+    def _get_function_graph(self):
         """
-        Método para obtener el valor de la propiedad C{relationships}.        
+        Método para obtener el valor de la propiedad C{function_graph}.        
         """
-        return self._relationships
-    
-    relationships = property(_get_relationships)
+        return self._function_graph
     
-    def _get_max_recursion_depth(self):
+    def _set_function_graph(self, graph):
         """
-        Método para obtener el valor de la propiedad C{max_recursion_depth}.
+        Método para cambiar el valor de la propiedad C{function_graph}.
         """
-        return self._max_recursion_depth
-    
-    def _set_max_recursion_depth(self, value):
-        """
-        Método para cambiar el valor de la propiedad C{max_recursion_depth}.
-        """
-        self._max_recursion_depth = value
-    
-    max_recursion_depth = property(_get_max_recursion_depth, _set_max_recursion_depth)
+        self._function_graph = graph
+        
+    function_graph = property(_get_function_graph, _set_function_graph)
     
     def __init__(self, parent):
         """
@@ -461,20 +603,15 @@ class FakeScope(Scope):
         super(FakeScope, self).__init__(parent)
         self._depth = parent.depth
         self._current_member = None
-        self._current_siblings = None
-        self._relationships = {}
-        self._max_recursion_depth = 5
+        self._type_graph = None
+        self._function_graph = None
         
-    def generate_code(self, generator):
+    def _define_code(self, generator):
         """
-        Genera una estructura del lenguaje C que contiene las definiciones
-        de las variables incluídas en este ámbito de ejecución.
-        
-        @type generator: C{CodeGenerator}
-        @param generator: Clase auxiliar utilizada en la generación del 
-            código C correspondiente a un programa Tiger.        
+        Para obtener información acerca de los parámetros recibidos por
+        este método consulte la documentación del método C{_define_code}
+        en la clase C{Scope}.
         """
-        self.parent.generate_code(generator)
         self._code_name = self.parent.code_name
         self._code_type = self.parent.code_type
 
@@ -528,7 +665,7 @@ class FakeScope(Scope):
         tipos mutuamente recursivos, consulte la documentación del método
         C{check_mutual_recursion} para más información.
         """
-        self.check_mutual_recursion(name)
+        self.check_mutual_recursion(self._type_graph, name)
         return self.parent.get_type_definition(name)
 
     def get_function_definition(self, name):
@@ -542,10 +679,10 @@ class FakeScope(Scope):
         documentación del método C{check_mutual_recursion} para más 
         información.        
         """
-        self.check_mutual_recursion(name)
+        self.check_mutual_recursion(self._function_graph, name)
         return self.parent.get_function_definition(name)
         
-    def check_mutual_recursion(self, name):
+    def check_mutual_recursion(self, graph, name):
         """
         Este método es utilizado por los métodos C{get_function_definition} y
         C{get_type_definition} para comprobar que el tipo, función o procedimiento
@@ -553,13 +690,15 @@ class FakeScope(Scope):
         recursiva en función de un tipo, función o procedimiento de otro grupo
         de definiciones.
         
-        Si el miembro C{name} se encuentra definido en un grupo de definiciones
-        hermano del grupo actual se comprobará que no exista una definición
-        mutuamente recursiva. En caso de que todavía no se tenga suficiente
-        información para afirmar o negar que exista una definición mutuamente
-        recursiva se actualizará el diccionario de relaciones para que la 
-        definición mutuamente recursiva, si existe, sea detectada cuando
-        se compruebe la definición del otro tipo, función o procedimiento.
+        La comprobación se realiza consultando el grafo de dependencias entre
+        las declaraciones de la estructura C{let-in-end}, que se construye
+        antes de comprobar semánticamente las declaraciones. Consulte la
+        documentación de la clase C{DependencyGraph} para más información.
+        
+        @type graph: C{DependencyGraph}
+        @param graph: Grafo de dependencias de las declaraciones de tipos o de
+            funciones, según el tipo de miembro que se busca. Si es C{None},
+            no se realiza la comprobación.
         
         @type name: C{str}
         @param name: Nombre del tipo, función o procedimiento para el cual
@@ -570,18 +709,6 @@ class FakeScope(Scope):
             mutuamente recursiva con otro miembro de un grupo de definiciones
             diferente.
         """
-        if self.current_member != None and self.current_siblings != None:
-            if name in self.current_siblings:
-                name_relationships = list(self._relationships.get(name, set()))
-                current_member = 0
-                while (len(name_relationships) > 0 
-                       and current_member < self.max_recursion_depth):
-                    if self.current_member in name_relationships:
-                        raise KeyError('Mutually recursive type or function definition')
-                    next_member = name_relationships[0]
-                    name_relationships.remove(next_member)
-                    name_relationships.extend(self._relationships.get(next_member, set()))
-                    current_member += 1
-            current_relationships = self.relationships.get(self.current_member, set())
-            current_relationships.add(name)
-            self.relationships[self.current_member] = current_relationships
+        if self._current_member is not None and graph is not None:
+            if graph.closes_cycle(self._current_member, name):
+                raise KeyError('Mutually recursive type or function definition')
@@ -0,0 +1,661 @@
+# -*- coding: utf-8 -*-
+
+"""
+Exportación y carga de árboles de sintáxis abstracta.
+
+El grafo generado con la clase C{DotGenerator} solamente contiene el nombre
+de la clase de cada nodo. Este módulo permite exportar el árbol de sintáxis
+abstracta completo, incluyendo los atributos de los nodos (nombres, literales,
+etc.), los números de línea y las posiciones, para que pueda ser utilizado
+por otras herramientas sin analizar nuevamente el programa Tiger.
+
+El árbol se exporta como una secuencia de registros, uno por cada nodo, en
+un recorrido en orden posterior: los registros de los hijos de un nodo se
+escriben antes que el registro del nodo y el último registro corresponde a
+la raíz del árbol. Cada registro tiene un identificador (su posición en la
+secuencia), el nombre de la clase del nodo, el número de línea, la posición
+del nodo, los atributos que no son nodos y los identificadores de los nodos
+hijos. Los registros se escriben a medida que se recorre el árbol y pueden
+leerse uno a uno, por lo que tanto la exportación como el procesamiento de
+los registros se realizan en tiempo lineal y sin construir ninguna
+estructura intermedia.
+
+Los registros se pueden escribir en dos formatos:
+
+    1. JSON delimitado por líneas: la primera línea es un objeto JSON que
+       identifica el formato y cada una de las siguientes líneas es un
+       objeto JSON con los campos C{id}, C{type}, C{line}, C{span},
+       C{values} y C{children}, y opcionalmente C{detached}.
+    2. Binario: una línea de cabecera seguida por los registros codificados
+       con enteros de longitud variable. Los nombres de las clases, de sus
+       atributos y las cadenas de caracteres se escriben solamente la primera
+       vez que aparecen y luego se referencian por su índice.
+
+Los atributos que se calculan durante la comprobación semántica o que son
+constantes para una clase de nodos no se exportan, por lo que se puede
+exportar un árbol antes o después de la comprobación semántica y el árbol
+cargado siempre corresponde a un árbol recién construido por el analizador
+sintáctico.
+"""
+
+import json
+import inspect
+
+import pytiger2c.ast
+from pytiger2c.ast.languagenode import LanguageNode, get_field_names
+
+
+# First line of the files in the JSON format.
+JSON_HEADER = '{"format":"pytiger2c-ast","version":1}\n'
+
+# First line of the files in the binary format.
+BINARY_HEADER = 'PYTIGER2C-AST-BINARY 1\n'
+
+# Attributes of the nodes that are not exported because they are computed
+# by the semantic check or assigned by the constructors of the nodes.
+_NON_EXPORTED_FIELDS = frozenset(['line_number', 'span', '_return_type', '_code_name',
+                                  '_read_only', '_type', '_has_return_value',
+                                  '_operator', '_code_operator'])
+
+# Flags of the records in the binary format.
+_FLAG_LINE, _FLAG_SPAN, _FLAG_DETACHED = 1, 2, 4
+
+# Tags of the values in the binary format.
+_NONE, _INTEGER, _STR, _UNICODE, _STRING_REF, _LIST, _NODE = range(7)
+
+# Size of the blocks read from the binary files.
+_BLOCK_SIZE = 64 * 1024
+
+# Exported fields and arguments of the constructor of each class of nodes,
+# computed on first use.
+_schemas = {}
+
+
+def _get_schema(node_class):
+    """
+    Retorna los nombres de los atributos exportados de una clase de nodos y
+    los nombres de los argumentos de su constructor.
+
+    Los nombres de los atributos exportados no incluyen el guión bajo
+    inicial. Cada argumento del constructor corresponde al atributo con
+    el mismo nombre.
+    """
+    schema = _schemas.get(node_class)
+    if schema is None:
+        fields = tuple([name[1:] for name in get_field_names(node_class)
+                        if name not in _NON_EXPORTED_FIELDS])
+        arguments = tuple(inspect.getargspec(node_class.__init__).args[1:])
+        for argument in arguments:
+            if argument not in fields:
+                raise ValueError('Argument {0} of {1} is not an exported field'
+                                 .format(argument, node_class.__name__))
+        schema = _schemas[node_class] = (fields, arguments)
+    return schema
+
+
+def _get_node_class(type_name):
+    """
+    Retorna la clase de nodos del árbol de sintáxis abstracta con un nombre.
+    """
+    node_class = getattr(pytiger2c.ast, type_name, None)
+    if not isinstance(node_class, type) or not issubclass(node_class, LanguageNode):
+        raise ValueError('Invalid node type {0}'.format(type_name))
+    return node_class
+
+
+class ASTRecord(object):
+    """
+    Registro correspondiente a un nodo del árbol de sintáxis abstracta.
+
+    @ivar id: Posición del registro en la secuencia de registros del árbol,
+        comenzando en 0.
+
+    @ivar type_name: Nombre de la clase del nodo.
+
+    @ivar line_number: Número de línea del nodo o C{None}.
+
+    @ivar span: Tupla C{(line, column, end)} con la posición del nodo o
+        C{None}. Consulte la documentación de la clase C{LanguageNode}.
+
+    @ivar detached: Indica si el atributo C{parent_node} del nodo es C{None}
+        aunque el nodo no sea la raíz del árbol.
+
+    @ivar values: Diccionario con los valores de los atributos del nodo que
+        no contienen nodos, indexados por el nombre del atributo sin el guión
+        bajo inicial. Los valores pueden ser C{None}, enteros, cadenas de
+        caracteres o listas de estos.
+
+    @ivar children: Diccionario con los identificadores de los registros de
+        los nodos hijos indexados por el nombre del atributo que los contiene.
+        Si el atributo contiene una lista de nodos, el valor es una lista con
+        los identificadores de sus registros.
+    """
+
+    __slots__ = ('id', 'type_name', 'line_number', 'span', 'detached', 'values', 'children')
+
+    def __init__(self, id, type_name, line_number, span, detached, values, children):
+        """
+        Inicializa el registro. Consulte la documentación de la clase para
+        conocer el significado de cada argumento.
+        """
+        self.id = id
+        self.type_name = type_name
+        self.line_number = line_number
+        self.span = span
+        self.detached = detached
+        self.values = values
+        self.children = children
+
+
+def iter_records(ast):
+    """
+    Recorre en orden posterior un árbol de sintáxis abstracta, utilizando
+    una pila explícita, y retorna los registros correspondientes a sus nodos.
+
+    @type ast: C{LanguageNode}
+    @param ast: Nodo raíz del árbol de sintáxis abstracta.
+
+    @rtype: C{iterator}
+    @return: Iterador sobre las instancias de C{ASTRecord} correspondientes a
+        los nodos del árbol. El último registro corresponde a la raíz.
+
+    @raise ValueError: Esta excepción se lanzará si algún atributo del árbol
+        contiene un valor que no se puede exportar.
+    """
+    next_id = 0
+    # Each frame contains a node, its children and the ids of the records
+    # of the children already written.
+    stack = [(ast, _get_children(ast), [])]
+    while stack:
+        node, children, ids = stack[-1]
+        if len(ids) < len(children):
+            child = children[len(ids)]
+            stack.append((child, _get_children(child), []))
+            continue
+        stack.pop()
+        record = _make_record(node, next_id, ids, node is not ast)
+        if stack:
+            stack[-1][2].append(next_id)
+        next_id += 1
+        yield record
+
+
+def _get_children(node):
+    """
+    Retorna la lista de los nodos hijos de un nodo, en el orden de sus
+    atributos exportados.
+    """
+    children = []
+    for name in _get_schema(type(node))[0]:
+        value = getattr(node, '_' + name)
+        if isinstance(value, LanguageNode):
+            children.append(value)
+        elif isinstance(value, list):
+            children.extend([item for item in value if isinstance(item, LanguageNode)])
+    return children
+
+
+def _make_record(node, record_id, ids, has_parent):
+    """
+    Crea el registro de un nodo a partir de los identificadores de los
+    registros de sus hijos.
+    """
+    values, children = {}, {}
+    ids = iter(ids)
+    for name in _get_schema(type(node))[0]:
+        value = getattr(node, '_' + name)
+        if isinstance(value, LanguageNode):
+            children[name] = next(ids)
+        elif isinstance(value, list):
+            value = list(value)
+            nodes = [item for item in value if isinstance(item, LanguageNode)]
+            if not nodes:
+                values[name] = [_check_value(item) for item in value]
+            elif len(nodes) == len(value):
+                children[name] = [next(ids) for item in value]
+            else:
+                raise ValueError('Invalid list of nodes and values in {0}'.format(name))
+        else:
+            values[name] = _check_value(value)
+    detached = has_parent and node.parent_node is None
+    return ASTRecord(record_id, type(node).__name__, node.line_number,
+                     node.span, detached, values, children)
+
+
+def _check_value(value):
+    """
+    Comprueba que el valor de un atributo de un nodo se puede exportar.
+    """
+    if value is None or isinstance(value, (int, long, basestring)) and not isinstance(value, bool):
+        return value
+    raise ValueError('Invalid value {0!r} in the abstract syntax tree'.format(value))
+
+
+def write_json(ast, output_fd):
+    """
+    Exporta un árbol de sintáxis abstracta en el formato JSON delimitado
+    por líneas.
+
+    @type ast: C{LanguageNode}
+    @param ast: Nodo raíz del árbol de sintáxis abstracta.
+
+    @type output_fd: C{file}
+    @param output_fd: Descriptor de fichero donde se deben escribir los
+        registros del árbol.
+    """
+    dumps = json.JSONEncoder(sort_keys=True, separators=(',', ':')).encode
+    output_fd.write(JSON_HEADER)
+    for record in iter_records(ast):
+        obj = {
+            'id': record.id,
+            'type': record.type_name,
+            'line': record.line_number,
+            'span': record.span,
+            'values': record.values,
+            'children': record.children,
+        }
+        if record.detached:
+            obj['detached'] = True
+        output_fd.write(dumps(obj))
+        output_fd.write('\n')
+
+
+def write_binary(ast, output_fd):
+    """
+    Exporta un árbol de sintáxis abstracta en el formato binario.
+
+    @type ast: C{LanguageNode}
+    @param ast: Nodo raíz del árbol de sintáxis abstracta.
+
+    @type output_fd: C{file}
+    @param output_fd: Descriptor de fichero, abierto en modo binario, donde
+        se deben escribir los registros del árbol.
+    """
+    output_fd.write(BINARY_HEADER)
+    types, strings = {}, {}
+    for record in iter_records(ast):
+        data = []
+        type_info = types.get(record.type_name)
+        if type_info is None:
+            # The first record of each class defines its exported fields.
+            fields = _get_schema(_get_node_class(record.type_name))[0]
+            type_info = types[record.type_name] = (len(types), fields)
+            _write_varint(data, type_info[0])
+            _write_bytes(data, record.type_name)
+            _write_varint(data, len(fields))
+            for name in fields:
+                _write_bytes(data, name)
+        else:
+            _write_varint(data, type_info[0])
+        flags = 0
+        if record.line_number is not None:
+            flags |= _FLAG_LINE
+        if record.span is not None:
+            flags |= _FLAG_SPAN
+        if record.detached:
+            flags |= _FLAG_DETACHED
+        data.append(chr(flags))
+        if record.line_number is not None:
+            _write_varint(data, record.line_number)
+        if record.span is not None:
+            for position in record.span:
+                _write_varint(data, position)
+        for name in type_info[1]:
+            if name in record.children:
+                _write_reference(data, record.id, record.children[name])
+            else:
+                _write_value(data, record.values[name], strings)
+        output_fd.write(''.join(data))
+
+
+def _write_varint(data, number):
+    """
+    Codifica un entero no negativo con una cantidad variable de bytes, 7 bits 
+    por byte comenzando por los menos significativos.
+    """
+    while number > 0x7F:
+        data.append(chr(0x80 | (number & 0x7F)))
+        number >>= 7
+    data.append(chr(number))
+
+
+def _write_bytes(data, string):
+    """
+    Codifica una cadena de caracteres precedida por su longitud.
+    """
+    _write_varint(data, len(string))
+    data.append(string)
+
+
+def _write_reference(data, record_id, reference):
+    """
+    Codifica los identificadores de los registros de los hijos de un nodo
+    como la distancia hasta el registro del nodo.
+    """
+    if isinstance(reference, list):
+        data.append(chr(_LIST))
+        _write_varint(data, len(reference))
+        for child_id in reference:
+            data.append(chr(_NODE))
+            _write_varint(data, record_id - child_id)
+    else:
+        data.append(chr(_NODE))
+        _write_varint(data, record_id - reference)
+
+
+def _write_value(data, value, strings):
+    """
+    Codifica el valor de un atributo que no contiene nodos. Las cadenas de
+    caracteres se añaden a la tabla de cadenas la primera vez que aparecen.
+    """
+    if value is None:
+        data.append(chr(_NONE))
+    elif isinstance(value, (int, long)):
+        data.append(chr(_INTEGER))
+        # Zigzag encoding of the integer to encode negative integers.
+        _write_varint(data, (value << 1) if value >= 0 else ((-value << 1) - 1))
+    elif isinstance(value, basestring):
+        key = (type(value), value)
+        index = strings.get(key)
+        if index is not None:
+            data.append(chr(_STRING_REF))
+            _write_varint(data, index)
+        else:
+            strings[key] = len(strings)
+            if isinstance(value, unicode):
+                data.append(chr(_UNICODE))
+                _write_bytes(data, value.encode('utf-8'))
+            else:
+                data.append(chr(_STR))
+                _write_bytes(data, value)
+    else:
+        data.append(chr(_LIST))
+        _write_varint(data, len(value))
+        for item in value:
+            _write_value(data, item, strings)
+
+
+def read_records(input_fd):
+    """
+    Lee los registros de un árbol de sintáxis abstracta exportado en 
+    cualquiera de los dos formatos. El formato se determina a partir de
+    la primera línea.
+
+    @type input_fd: C{file}
+    @param input_fd: Descriptor de fichero, abierto en modo binario, del
+        cual se deben leer los registros.
+
+    @rtype: C{iterator}
+    @return: Iterador sobre las instancias de C{ASTRecord} leídas.
+
+    @raise ValueError: Esta excepción se lanzará si el contenido del archivo
+        no corresponde a ninguno de los formatos.
+    """
+    header = input_fd.readline()
+    if header.strip() == JSON_HEADER.strip():
+        return _read_json_records(input_fd)
+    elif header == BINARY_HEADER:
+        return _BinaryReader(input_fd).read_records()
+    else:
+        raise ValueError('Unknown abstract syntax tree format')
+
+
+def _read_json_records(input_fd):
+    """
+    Lee los registros en el formato JSON delimitado por líneas.
+    """
+    decode = json.JSONDecoder().decode
+    for record_id, line in enumerate(input_fd):
+        obj = decode(line)
+        if obj.get('id') != record_id:
+            raise ValueError('Invalid record id at line {0}'.format(record_id + 2))
+        span = obj.get('span')
+        yield ASTRecord(record_id, str(obj['type']), obj.get('line'),
+                        tuple(span) if span is not None else None,
+                        obj.get('detached', False), obj['values'], obj['children'])
+
+
+class _BinaryReader(object):
+    """
+    Decodificador de los registros en el formato binario. Los datos se leen 
+    del descriptor de fichero por bloques y cada registro se decodifica de
+    los datos ya leídos. Si el registro continúa después de estos, se leen
+    más datos y se decodifica nuevamente.
+    """
+
+    def __init__(self, input_fd):
+        """
+        Inicializa el decodificador.
+        """
+        self._input_fd = input_fd
+        self._data = ''
+        self._position = 0
+        self._types = []
+        self._strings = []
+
+    def _read_more(self):
+        """
+        Lee más datos, conservando los datos a partir de la posición actual.
+        Retorna C{False} si se alcanzó el final del archivo.
+        """
+        pending = len(self._data) - self._position
+        block = self._input_fd.read(max(_BLOCK_SIZE, pending))
+        if not block:
+            return False
+        self._data = self._data[self._position:] + block
+        self._position = 0
+        return True
+
+    def read_records(self):
+        """
+        Retorna un iterador sobre los registros decodificados.
+        """
+        record_id = 0
+        while self._position < len(self._data) or self._read_more():
+            try:
+                record, position, new_types, new_strings = self._decode_record(record_id)
+            except IndexError:
+                # The record continues after the data already read.
+                if not self._read_more():
+                    raise ValueError('Unexpected end of the abstract syntax tree file')
+                continue
+            self._position = position
+            self._types.extend(new_types)
+            self._strings.extend(new_strings)
+            yield record
+            record_id += 1
+
+    def _decode_record(self, record_id):
+        """
+        Decodifica el registro que comienza en la posición actual. Retorna el
+        registro, la posición siguiente y las clases y cadenas de caracteres
+        que define el registro. Lanza la excepción C{IndexError} si el 
+        registro continúa después de los datos leídos.
+        """
+        data, position = self._data, self._position
+        types = self._types
+        new_types, new_strings = [], []
+        type_index, position = _decode_varint(data, position)
+        if type_index == len(types):
+            type_name, position = _decode_bytes(data, position)
+            count, position = _decode_varint(data, position)
+            fields = []
+            for index in xrange(count):
+                name, position = _decode_bytes(data, position)
+                fields.append(name)
+            new_types.append((type_name, fields))
+        elif type_index > len(types):
+            raise ValueError('Invalid type reference {0}'.format(type_index))
+        else:
+            type_name, fields = types[type_index]
+        flags = ord(data[position])
+        position += 1
+        line_number = span = None
+        if flags & _FLAG_LINE:
+            line_number, position = _decode_varint(data, position)
+        if flags & _FLAG_SPAN:
+            line, position = _decode_varint(data, position)
+            column, position = _decode_varint(data, position)
+            end, position = _decode_varint(data, position)
+            span = (line, column, end)
+        values, children = {}, {}
+        for name in fields:
+            tag = ord(data[position])
+            if tag == _NODE:
+                # Most fields contain a single node.
+                distance, position = _decode_varint(data, position + 1)
+                if not 0 < distance <= record_id:
+                    raise ValueError('Invalid node reference in record {0}'.format(record_id))
+                children[name] = record_id - distance
+                continue
+            is_reference, value, position = self._decode_value(data, position, record_id,
+                                                               new_strings)
+            if is_reference:
+                children[name] = value
+            else:
+                values[name] = value
+        record = ASTRecord(record_id, type_name, line_number, span,
+                           bool(flags & _FLAG_DETACHED), values, children)
+        return record, position, new_types, new_strings
+
+    def _decode_value(self, data, position, record_id, new_strings):
+        """
+        Decodifica un valor. Retorna un valor booleano que indica si el valor
+        contiene identificadores de registros, el valor y la posición 
+        siguiente. Las cadenas de caracteres nuevas se añaden a la lista dada.
+        """
+        tag = ord(data[position])
+        position += 1
+        if tag == _NONE:
+            return False, None, position
+        elif tag == _INTEGER:
+            number, position = _decode_varint(data, position)
+            return False, (number >> 1) if not number & 1 else -((number + 1) >> 1), position
+        elif tag == _STR or tag == _UNICODE:
+            string, position = _decode_bytes(data, position)
+            if tag == _UNICODE:
+                string = string.decode('utf-8')
+            new_strings.append(string)
+            return False, string, position
+        elif tag == _STRING_REF:
+            index, position = _decode_varint(data, position)
+            if index < len(self._strings):
+                return False, self._strings[index], position
+            elif index < len(self._strings) + len(new_strings):
+                return False, new_strings[index - len(self._strings)], position
+            raise ValueError('Invalid string reference {0}'.format(index))
+        elif tag == _NODE:
+            distance, position = _decode_varint(data, position)
+            if not 0 < distance <= record_id:
+                raise ValueError('Invalid node reference in record {0}'.format(record_id))
+            return True, record_id - distance, position
+        elif tag == _LIST:
+            size, position = _decode_varint(data, position)
+            items = []
+            for index in xrange(size):
+                is_reference, value, position = self._decode_value(data, position, record_id,
+                                                                   new_strings)
+                items.append((is_reference, value))
+            is_reference = bool(items) and all([item[0] for item in items])
+            return is_reference, [item[1] for item in items], position
+        else:
+            raise ValueError('Invalid value tag {0}'.format(tag))
+
+
+def _decode_varint(data, position):
+    """
+    Decodifica un entero no negativo con una cantidad variable de bytes. 
+    Retorna el entero y la posición siguiente.
+    """
+    byte = ord(data[position])
+    if byte < 0x80:
+        return byte, position + 1
+    number, shift = 0, 0
+    while byte >= 0x80:
+        number |= (byte & 0x7F) << shift
+        shift += 7
+        position += 1
+        byte = ord(data[position])
+    return number | (byte << shift), position + 1
+
+
+def _decode_bytes(data, position):
+    """
+    Decodifica una cadena de caracteres precedida por su longitud. Retorna
+    la cadena y la posición siguiente.
+    """
+    size, position = _decode_varint(data, position)
+    if position + size > len(data):
+        raise IndexError('The string continues after the data read')
+    return data[position:position + size], position + size
+
+
+def load_ast(input_fd):
+    """
+    Construye un árbol de sintáxis abstracta a partir de sus registros 
+    exportados en cualquiera de los dos formatos.
+
+    Los nodos se construyen a medida que se leen los registros, por lo que
+    solamente se mantienen en memoria, además de los nodos, los registros
+    de los nodos que aún no tienen padre.
+
+    @type input_fd: C{file}
+    @param input_fd: Descriptor de fichero, abierto en modo binario, del
+        cual se deben leer los registros.
+
+    @rtype: C{LanguageNode}
+    @return: Nodo raíz del árbol de sintáxis abstracta.
+
+    @raise ValueError: Esta excepción se lanzará si el contenido del archivo
+        no corresponde a ninguno de los formatos o no describe un árbol.
+    """
+    # Nodes without parent indexed by the id of their records.
+    pending = {}
+    # Class, arguments of the constructor and exported fields of each type.
+    classes = {}
+    for record in read_records(input_fd):
+        class_info = classes.get(record.type_name)
+        if class_info is None:
+            node_class = _get_node_class(record.type_name)
+            fields, arguments = _get_schema(node_class)
+            class_info = classes[record.type_name] = (node_class, arguments, frozenset(fields))
+        node_class, arguments, fields = class_info
+        # The records are not used after building their nodes.
+        values = record.values
+        # Children whose parent_node attribute is the node.
+        children = []
+        for name, reference in record.children.iteritems():
+            if isinstance(reference, list):
+                taken = [_take_node(pending, child_id) for child_id in reference]
+                values[name] = [child for child, detached in taken]
+                children.extend([child for child, detached in taken if not detached])
+            else:
+                child, detached = _take_node(pending, reference)
+                values[name] = child
+                if not detached:
+                    children.append(child)
+        if values.viewkeys() != fields:
+            raise ValueError('Invalid fields in record {0}'.format(record.id))
+        node = node_class(*[values.pop(name) for name in arguments])
+        for name, value in values.iteritems():
+            setattr(node, '_' + name, value)
+        node.line_number = record.line_number
+        node.span = record.span
+        for child in children:
+            child.parent_node = node
+        pending[record.id] = (node, record.detached)
+    if len(pending) != 1:
+        raise ValueError('The records do not describe a tree')
+    return pending.popitem()[1][0]
+
+
+def _take_node(pending, record_id):
+    """
+    Retorna el nodo sin padre correspondiente a un registro, junto con el 
+    valor del campo C{detached} del registro, y lo elimina de los nodos sin
+    padre.
+    """
+    try:
+        return pending.pop(record_id)
+    except KeyError:
+        raise ValueError('Invalid reference to the record {0}'.format(record_id))
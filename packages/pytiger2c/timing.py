@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+
+"""
+Medición del tiempo y la memoria utilizados en cada fase de la compilación.
+
+Las funciones del paquete C{pytiger2c} que realizan las fases de la
+compilación (análisis sintáctico, comprobación semántica, generación de
+código y escritura del código C) miden cada fase con la clase C{measure} de
+este módulo y el script C{pytiger2c.py} ejecuta los programas externos
+C{indent} y C{gcc} con la función C{call}. Las mediciones se notifican a los
+objetos C{PhaseListener} registrados con la función C{add_listener} o
+activados con la instrucción C{with} en el mismo hilo, por lo que varios
+hilos pueden compilar programas al mismo tiempo sin mezclar sus mediciones.
+Si no hay ningún objeto registrado, no se realiza ninguna medición.
+
+De cada fase se mide el tiempo real, el tiempo de CPU (de usuario y del
+sistema) y la memoria máxima. El tiempo de CPU incluye el de los procesos
+hijos que terminan durante la fase. Python 2 no incluye el módulo C{tracemalloc}, por
+lo que la memoria máxima es la marca de agua del tamaño del conjunto
+residente del proceso (C{ru_maxrss} del módulo C{resource}) al terminar la
+fase. Este valor nunca disminuye, por lo que cada fase reporta el máximo
+alcanzado por el proceso hasta ese momento y no la memoria utilizada por la
+propia fase. El tiempo de CPU y la memoria máxima de las fases externas son los
+del proceso del programa externo, obtenidos con C{os.wait4}.
+
+La clase C{TimeReport} almacena las mediciones y las escribe como texto o
+en formato JSON.
+"""
+
+import os
+import time
+import errno
+import json
+import threading
+import subprocess
+
+try:
+    import resource
+except ImportError:
+    # The resource module is only available on Unix.
+    resource = None
+
+
+# Objects notified of the start and the end of each phase, per thread.
+_state = threading.local()
+
+
+def _get_listeners():
+    """
+    Retorna la lista de los objetos registrados en este hilo.
+    """
+    listeners = getattr(_state, 'listeners', None)
+    if listeners is None:
+        listeners = _state.listeners = []
+    return listeners
+
+
+def add_listener(listener):
+    """
+    Registra un objeto para notificarle las fases medidas en este hilo.
+
+    @type listener: C{PhaseListener}
+    @param listener: Objeto que se debe notificar.
+    """
+    _get_listeners().append(listener)
+
+
+def remove_listener(listener):
+    """
+    Elimina un objeto registrado en este hilo con la función C{add_listener}.
+
+    @type listener: C{PhaseListener}
+    @param listener: Objeto que se debe dejar de notificar.
+    """
+    _get_listeners().remove(listener)
+
+
+def call(name, args):
+    """
+    Ejecuta un programa externo y mide su ejecución como una fase externa.
+
+    @type name: C{str}
+    @param name: Nombre de la fase.
+
+    @type args: C{list}
+    @param args: Programa y argumentos, igual que en la función
+        C{subprocess.call}.
+
+    @rtype: C{int}
+    @return: Código de salida del programa, igual que en la función
+        C{subprocess.call}.
+    """
+    with measure(name, external=True) as phase:
+        process = subprocess.Popen(args)
+        if hasattr(os, 'wait4'):
+            # Wait for this process only to get its own resource usage.
+            while True:
+                try:
+                    _, status, usage = os.wait4(process.pid, 0)
+                    break
+                except OSError, error:
+                    if error.errno != errno.EINTR:
+                        raise
+            if os.WIFSIGNALED(status):
+                process.returncode = -os.WTERMSIG(status)
+            else:
+                process.returncode = os.WEXITSTATUS(status)
+            phase.set_usage(usage.ru_utime + usage.ru_stime, usage.ru_maxrss)
+        else:
+            process.wait()
+    return process.returncode
+
+
+def _get_cpu_time():
+    """
+    Retorna el tiempo de CPU, de usuario y del sistema, utilizado por este
+    proceso y por sus procesos hijos terminados.
+    """
+    return sum(os.times()[:4])
+
+
+def _get_peak_memory():
+    """
+    Retorna la marca de agua del tamaño del conjunto residente de este
+    proceso, o C{None} si no es posible obtenerla en esta plataforma.
+    """
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class Phase(object):
+    """
+    Medición de una fase de la compilación.
+    """
+
+    def _get_name(self):
+        """
+        Método para obtener el valor de la propiedad C{name}.
+        """
+        return self._name
+
+    name = property(_get_name)
+
+    def _get_external(self):
+        """
+        Método para obtener el valor de la propiedad C{external}.
+        """
+        return self._external
+
+    external = property(_get_external)
+
+    def _get_wall_time(self):
+        """
+        Método para obtener el valor de la propiedad C{wall_time}.
+        """
+        return self._wall_time
+
+    wall_time = property(_get_wall_time)
+
+    def _get_cpu_time(self):
+        """
+        Método para obtener el valor de la propiedad C{cpu_time}.
+        """
+        return self._cpu_time
+
+    cpu_time = property(_get_cpu_time)
+
+    def _get_peak_memory(self):
+        """
+        Método para obtener el valor de la propiedad C{peak_memory}.
+        """
+        return self._peak_memory
+
+    peak_memory = property(_get_peak_memory)
+
+    def __init__(self, name, external, wall_time, cpu_time, peak_memory):
+        """
+        Inicializa la clase C{Phase}.
+
+        @type name: C{str}
+        @param name: Nombre de la fase.
+
+        @type external: C{bool}
+        @param external: Indica si la fase se realizó en un programa externo.
+
+        @type wall_time: C{float}
+        @param wall_time: Tiempo real de la fase en segundos.
+
+        @type cpu_time: C{float}
+        @param cpu_time: Tiempo de CPU de la fase en segundos.
+
+        @type peak_memory: C{int}
+        @param peak_memory: Marca de agua del tamaño del conjunto residente
+            del proceso al terminar la fase, o del programa externo, en
+            kilobytes, o C{None} si no es posible obtenerla en esta
+            plataforma.
+        """
+        super(Phase, self).__init__()
+        self._name = name
+        self._external = external
+        self._wall_time = wall_time
+        self._cpu_time = cpu_time
+        self._peak_memory = peak_memory
+
+    def to_dict(self):
+        """
+        Retorna un diccionario con los valores de la medición.
+
+        @rtype: C{dict}
+        @return: Diccionario con las propiedades de la fase.
+        """
+        return {
+            'name': self._name,
+            'external': self._external,
+            'wall_time': self._wall_time,
+            'cpu_time': self._cpu_time,
+            'peak_memory': self._peak_memory,
+        }
+
+
+class measure(object):
+    """
+    Mide una fase de la compilación con la instrucción C{with}:
+
+        with measure('semantic_check'):
+            run(ast.check_semantics(scope, errors))
+
+    La fase se notifica a los objetos registrados aunque termine lanzando una
+    excepción.
+    """
+
+    def __init__(self, name, external=False):
+        """
+        Inicializa la medición.
+
+        @type name: C{str}
+        @param name: Nombre de la fase.
+
+        @type external: C{bool}
+        @param external: Indica si la fase se realiza en un programa externo,
+            en cuyo caso el tiempo de CPU y la memoria máxima del programa
+            se deben especificar con el método C{set_usage}. Consulte la
+            documentación de la función C{call}.
+        """
+        self._name = name
+        self._external = external
+        self._listeners = None
+        self._usage = None
+
+    def set_usage(self, cpu_time, peak_memory):
+        """
+        Especifica el tiempo de CPU y la memoria máxima del programa externo
+        de la fase, que sustituyen a los del proceso.
+
+        @type cpu_time: C{float}
+        @param cpu_time: Tiempo de CPU del programa en segundos.
+
+        @type peak_memory: C{int}
+        @param peak_memory: Marca de agua del tamaño del conjunto residente
+            del programa en kilobytes.
+        """
+        self._usage = (cpu_time, peak_memory)
+
+    def __enter__(self):
+        """
+        Notifica el inicio de la fase y comienza la medición.
+        """
+        listeners = _get_listeners()
+        if listeners:
+            self._listeners = list(listeners)
+            for listener in self._listeners:
+                listener.phase_started(self._name)
+            self._cpu_time = _get_cpu_time()
+            self._wall_time = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Termina la medición y notifica la fase.
+        """
+        if self._listeners is not None:
+            wall_time = time.time() - self._wall_time
+            if self._usage is not None:
+                cpu_time, peak_memory = self._usage
+            elif self._external:
+                # The usage of the program is unknown, the other children of
+                # this process are included in the CPU time.
+                cpu_time, peak_memory = _get_cpu_time() - self._cpu_time, None
+            else:
+                cpu_time, peak_memory = _get_cpu_time() - self._cpu_time, _get_peak_memory()
+            phase = Phase(self._name, self._external, wall_time, cpu_time, peak_memory)
+            for listener in self._listeners:
+                listener.phase_finished(phase)
+            self._listeners = None
+
+
+class PhaseListener(object):
+    """
+    Clase base de los objetos que reciben las mediciones de las fases.
+
+    Los objetos de esta clase se activan con la instrucción C{with} o con la
+    función C{add_listener}. Las fases medidas en el hilo en que se activó el
+    objeto se notifican en el orden en que se realizan, a través de los 
+    métodos C{phase_started} y C{phase_finished}.
+    """
+
+    def __enter__(self):
+        """
+        Registra el objeto.
+        """
+        add_listener(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Elimina el registro del objeto.
+        """
+        remove_listener(self)
+
+    def phase_started(self, name):
+        """
+        Notifica el inicio de una fase. Por defecto no se realiza ninguna
+        acción.
+
+        @type name: C{str}
+        @param name: Nombre de la fase.
+        """
+
+    def phase_finished(self, phase):
+        """
+        Notifica el final de una fase. Por defecto no se realiza ninguna
+        acción.
+
+        @type phase: C{Phase}
+        @param phase: Medición de la fase.
+        """
+
+
+class TimeReport(PhaseListener):
+    """
+    Almacena las mediciones de las fases de la compilación para escribirlas
+    como texto o en formato JSON.
+    """
+
+    def _get_phases(self):
+        """
+        Método para obtener el valor de la propiedad C{phases}.
+        """
+        return self._phases
+
+    phases = property(_get_phases)
+
+    def __init__(self):
+        """
+        Inicializa la clase C{TimeReport} sin mediciones.
+        """
+        super(TimeReport, self).__init__()
+        self._phases = []
+
+    def phase_finished(self, phase):
+        """
+        Almacena la medición de la fase.
+        """
+        self._phases.append(phase)
+
+    def format_text(self):
+        """
+        Retorna una tabla con una fila por cada fase y una fila con el total
+        de los tiempos.
+
+        @rtype: C{str}
+        @return: Tabla con las mediciones.
+        """
+        row = '{0:<20} {1:>10} {2:>10} {3:>12}'
+        lines = [row.format('Phase', 'Wall (s)', 'CPU (s)', 'Max RSS (KB)')]
+        for phase in self._phases:
+            name = phase.name + (' *' if phase.external else '')
+            peak_memory = phase.peak_memory if phase.peak_memory is not None else '-'
+            lines.append(row.format(name, '%.3f' % phase.wall_time,
+                                    '%.3f' % phase.cpu_time, peak_memory))
+        wall_time, cpu_time = self._get_totals()
+        lines.append(row.format('total', '%.3f' % wall_time, '%.3f' % cpu_time, ''))
+        lines.append('Max RSS: high-water mark of the process at the end of the phase')
+        if any(phase.external for phase in self._phases):
+            lines.append('* external program, CPU time and max RSS of the program')
+        return '\n'.join(lines)
+
+    def format_json(self):
+        """
+        Retorna un objeto JSON con la lista de las fases y el total de los
+        tiempos.
+
+        @rtype: C{str}
+        @return: Objeto JSON con las mediciones.
+        """
+        wall_time, cpu_time = self._get_totals()
+        report = {
+            'phases': [phase.to_dict() for phase in self._phases],
+            'total': {'wall_time': wall_time, 'cpu_time': cpu_time},
+        }
+        return json.dumps(report, sort_keys=True)
+
+    def _get_totals(self):
+        """
+        Retorna la suma de los tiempos reales y de CPU de las fases.
+        """
+        wall_time = sum(phase.wall_time for phase in self._phases)
+        cpu_time = sum(phase.cpu_time for phase in self._phases)
+        return wall_time, cpu_time
@@ -8,6 +8,26 @@ definidos en el lenguaje Tiger.
 from pytiger2c.types.tigertype import TigerType
 
 
+class _CanonicalType(type):
+    """
+    Metaclase de los tipos básicos. Cada clase de tipo básico tiene una única
+    instancia, que se crea la primera vez que se llama a la clase y se
+    retorna en las llamadas siguientes.
+    """
+    
+    def __call__(cls):
+        """
+        Retorna la instancia canónica de la clase.
+        """
+        # The instance is looked up in the dictionary of the class itself
+        # because the subclasses must not share the instance of BasicType.
+        instance = cls.__dict__.get('_instance')
+        if instance is None:
+            instance = super(_CanonicalType, cls).__call__()
+            cls._instance = instance
+        return instance
+
+
 class BasicType(TigerType):
     """
     Clase de la jerarquía de tipos de Tiger representando los tipos básicos
@@ -15,37 +35,25 @@ class BasicType(TigerType):
     
     Esta clase representa los tipos definidos en la librería estándar de Tiger.
     Estos tipos son C{nil}, C{int} y C{string}.
+    
+    Cada tipo básico tiene una única instancia: al llamar a la clase de un 
+    tipo básico, por ejemplo C{IntegerType()}, se obtiene siempre la misma
+    instancia, incluso al copiar o deserializar un objeto que la contiene. 
+    Por esto los tipos básicos, al igual que los demás tipos de Tiger, se
+    comparan por identidad.
     """
     
+    __metaclass__ = _CanonicalType
+    
     def __init__(self):
         """
         Inicializa la clase representando los tipos básicos del Lenguaje Tiger.
         """
         super(BasicType, self).__init__()
     
-    def __eq__(self, other):
-        """
-        Implementación por defecto de la comparación entre los tipos básicos del
-        lenguaje Tiger.  
-        Dos tipos básicos serán iguales si ambos son instancia de la misma clase.
-        
-        @type other: C{TigerType}
-        @param other: Otro tipo de Tiger con el que efectuar la comparación.
-        
-        @rtype: C{bool}
-        @return: Retorna C{True} si los ambos son iguales.
-        """
-        return isinstance(other, self.__class__)
-    
-    def __ne__(self, other):
+    def __reduce__(self):
         """
-        Esta comparación se define como la negación del resultado obtenido por C{__eq__}.
-        Ver documentación del método C{__eq__} para más información.
-        
-        @type other: C{TigerType}
-        @param other: Otro tipo de Tiger con el que efectuar la comparación.
-        
-        @rtype: C{bool}
-        @return: Retorna C{True} si los ambos no son iguales.        
+        Permite que las copias de un tipo básico obtenidas con los módulos 
+        C{copy} y C{pickle} sean la instancia canónica del tipo.
         """
-        return not self.__eq__(other)    
+        return (self.__class__, ())
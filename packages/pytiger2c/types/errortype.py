@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+"""
+Clase de la jerarquía de tipos de Tiger representando el tipo de las 
+declaraciones y expresiones con errores semánticos.
+"""
+
+from pytiger2c.types.basictype import BasicType
+
+
+class ErrorType(BasicType):
+    """
+    Clase de la jerarquía de tipos de Tiger representando el tipo de las 
+    declaraciones y expresiones con errores semánticos.
+    
+    Cuando la comprobación semántica se recupera de los errores, los tipos,
+    variables, campos y parámetros cuya declaración tiene errores se definen
+    con este tipo. Las expresiones que lo utilizan no reportan nuevos errores,
+    porque serían consecuencia del error ya reportado. Consulte la 
+    documentación del módulo C{pytiger2c.recovery}.
+    
+    Este tipo no existe en el programa C generado, porque no se genera código
+    para los programas con errores semánticos.
+    """
+
+    def __init__(self):
+        """
+        Inicializa la clase representando el tipo de las declaraciones y
+        expresiones con errores semánticos.
+        """
+        super(ErrorType, self).__init__()
@@ -10,6 +10,10 @@ class TigerType(object):
     
     Todas las clases representando tipos válidos del lenguaje Tiger deben
     heredar de la clase base C{TigerType}. 
+    
+    Los tipos se comparan por identidad: cada declaración de un tipo record
+    o array crea un tipo diferente y los tipos básicos tienen una única 
+    instancia (consulte la documentación de la clase C{BasicType}).
     """
     
     def _get_code_type(self):
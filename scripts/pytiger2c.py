@@ -8,15 +8,17 @@ Script para ejecutar PyTiger2C desde la linea de comandos.
 import os
 import sys
 import optparse
-import subprocess
 
 # Add the directory containing the packages in the source distribution to the path.
 # This should be removed when Tiger2C is installed.
 PACKAGES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, 'packages'))
 sys.path.insert(0, PACKAGES_DIR)
 
-from pytiger2c import __version__, __authors__, tiger2c, tiger2dot
+from pytiger2c import __version__, __authors__, tiger2c, tiger2dot, tiger2ast
 from pytiger2c.errors import PyTiger2CError
+from pytiger2c.cache import ASTCache, DEFAULT_MAX_SIZE
+from pytiger2c.grammar import rebuild_tables, TABLES_FILE
+from pytiger2c.timing import TimeReport, add_listener, call
 
 
 EXIT_SUCCESS, EXIT_FAILURE = 0, 1
@@ -34,7 +36,8 @@ def _parse_args(argv):
         que almacena la información acerca de las opciones especificadas
         y el segundo elemento es una lista con el resto de los argumentos.
     """
-    usage = '%prog <tiger-file> --output <output-file> [--output-type <output-type>]'
+    usage = '%prog <tiger-file> --output <output-file> [--output-type <output-type>]\n' \
+        '       %prog --rebuild-tables'
     version = '%%prog (PyTiger2C) %s\n' % __version__
     authors = '\n'.join(['Copyright (C) 2009, 2010 %s' % a for a in __authors__])
     desc = 'Translates a Tiger program received as argument into a C program ' \
@@ -47,12 +50,69 @@ def _parse_args(argv):
     parser.add_option('-o', '--output', action='store', dest='output', metavar='FILE', 
                       help='write the output to FILE')
     parser.add_option('-t', '--output-type', action='store', dest='output_type', metavar='TYPE',
-                      type='choice', choices=('ast', 'c', 'binary'),
-                      help="output type: 'ast', 'c' or 'binary' (default '%default')")
+                      type='choice', choices=('ast', 'ast-json', 'ast-binary', 'c', 'binary'),
+                      help="output type: 'ast' (Graphviz DOT), 'ast-json', 'ast-binary', "
+                      "'c' or 'binary' (default '%default')")
+    parser.add_option('-l', '--lexer', action='store', dest='lexer', metavar='LEXER',
+                      type='choice', choices=('table', 'ply'),
+                      help="lexer: 'table' or 'ply' (default '%default')")
+    parser.add_option('-p', '--parser', action='store', dest='parser', metavar='PARSER',
+                      type='choice', choices=('compact', 'ply'),
+                      help="parser: 'compact' or 'ply' (default '%default')")
+    parser.add_option('-a', '--all-errors', action='store_true', dest='all_errors',
+                      help='recover from syntax and semantic errors to report all of them')
+    parser.add_option('--max-errors', action='store', dest='max_errors', metavar='NUM',
+                      type='int', help='report at most NUM semantic errors with --all-errors')
+    parser.add_option('--dot-max-depth', action='store', dest='dot_max_depth', metavar='DEPTH',
+                      type='int', help='include in the ast output only the nodes up to DEPTH')
+    parser.add_option('--dot-max-nodes', action='store', dest='dot_max_nodes', metavar='NUM',
+                      type='int', help='stop adding nodes to the ast output after NUM nodes')
+    parser.add_option('--dot-collapse', action='store_true', dest='dot_collapse',
+                      help='show the subtrees deeper than --dot-max-depth as a single node')
+    parser.add_option('--dot-subgraphs', action='store_true', dest='dot_subgraphs',
+                      help='group the nodes of each function in a subgraph of the ast output')
+    parser.add_option('-c', '--cache-dir', action='store', dest='cache_dir', metavar='DIR',
+                      help='cache the checked abstract syntax trees in DIR')
+    parser.add_option('--cache-size', action='store', dest='cache_size', metavar='MB',
+                      type='int', help='maximum size of the cache in megabytes (default %default)')
+    parser.add_option('--cache-stats', action='store_true', dest='cache_stats',
+                      help='print the hits and misses of the cache')
+    parser.add_option('--time-report', action='store', dest='time_report', metavar='FORMAT',
+                      type='choice', choices=('text', 'json'),
+                      help="print the time and memory used by each phase: 'text' or 'json'")
+    parser.add_option('--rebuild-tables', action='store_true', dest='rebuild_tables',
+                      help='rebuild the cached LALR tables of the parser and exit')
     parser.set_default('output_type', 'binary')
+    parser.set_default('lexer', 'table')
+    parser.set_default('parser', 'compact')
+    parser.set_default('all_errors', False)
+    parser.set_default('max_errors', None)
+    parser.set_default('dot_max_depth', None)
+    parser.set_default('dot_max_nodes', None)
+    parser.set_default('dot_collapse', False)
+    parser.set_default('dot_subgraphs', False)
+    parser.set_default('cache_dir', None)
+    parser.set_default('cache_size', DEFAULT_MAX_SIZE // (1024 * 1024))
+    parser.set_default('cache_stats', False)
+    parser.set_default('time_report', None)
+    parser.set_default('rebuild_tables', False)
     options, args = parser.parse_args(args=argv[1:])
     optparse.check_choice(parser.get_option('--output-type'), '--output-type', options.output_type)
-    if not options.output:
+    if options.rebuild_tables:
+        return options, args
+    elif options.all_errors and options.parser != 'compact':
+        parser.error('option --all-errors requires the compact parser')
+    elif options.max_errors is not None and not options.all_errors:
+        parser.error('option --max-errors requires the --all-errors option')
+    elif options.max_errors is not None and options.max_errors <= 0:
+        parser.error('option --max-errors must be a positive number')
+    elif options.dot_collapse and options.dot_max_depth is None:
+        parser.error('option --dot-collapse requires the --dot-max-depth option')
+    elif options.cache_stats and not options.cache_dir:
+        parser.error('option --cache-stats requires the --cache-dir option')
+    elif options.cache_size <= 0:
+        parser.error('option --cache-size must be a positive number')
+    elif not options.output:
         parser.error('missing required --output option')
     elif len(args) != 1:
         parser.error('invalid number of arguments')
@@ -72,16 +132,43 @@ def main(argv):
         del programa y 1 en el caso contrario.
     """
     options, args = _parse_args(argv)
+    if options.rebuild_tables:
+        try:
+            rebuild_tables()
+        except (IOError, OSError), error:
+            print >> sys.stderr, error
+            sys.exit(EXIT_FAILURE)
+        print 'LALR tables written to %s' % TABLES_FILE
+        sys.exit(EXIT_SUCCESS)
     tiger_filename = os.path.abspath(args[0])
     output_filename = os.path.abspath(options.output)
+    report = None
+    if options.time_report:
+        report = TimeReport()
+        add_listener(report)
+    cache = None
+    if options.cache_dir:
+        try:
+            cache = ASTCache(options.cache_dir, options.cache_size * 1024 * 1024)
+        except OSError, error:
+            print >> sys.stderr, error
+            sys.exit(EXIT_FAILURE)
     try:
         if options.output_type == 'ast':
-            tiger2dot(tiger_filename, output_filename)
+            tiger2dot(tiger_filename, output_filename, options.lexer, options.parser,
+                      options.all_errors, options.dot_max_depth, options.dot_max_nodes,
+                      options.dot_collapse, options.dot_subgraphs)
+        elif options.output_type in ('ast-json', 'ast-binary'):
+            tiger2ast(tiger_filename, output_filename, options.lexer, options.parser,
+                      options.all_errors, options.output_type == 'ast-binary',
+                      options.parser == 'compact')
         elif options.output_type == 'c':
-            tiger2c(tiger_filename, output_filename)
+            tiger2c(tiger_filename, output_filename, options.lexer, options.parser,
+                    options.all_errors, cache, options.max_errors)
             # Translation completed. Beautify the code using GNU Indent.
             INDENT_CMD = ['indent', '-gnu', '-l100', '-o', output_filename, output_filename]
-            if subprocess.call(INDENT_CMD) != EXIT_SUCCESS:
+            status = call('indent', INDENT_CMD)
+            if status != EXIT_SUCCESS:
                 # Leave the c file for debugging.
                 sys.exit(EXIT_FAILURE)            
         elif options.output_type == 'binary':
@@ -89,10 +176,12 @@ def main(argv):
             index = basename.rfind('.')
             c_filename = '%s.c' % (basename[:index] if index > 0 else basename)
             c_filename = os.path.join(os.path.dirname(tiger_filename), c_filename)
-            tiger2c(tiger_filename, c_filename)
+            tiger2c(tiger_filename, c_filename, options.lexer, options.parser,
+                    options.all_errors, cache, options.max_errors)
             # Translation completed. Compile using GCC.
             GCC_CMD = ['gcc', c_filename, '-o', output_filename, '-std=c99', '-lgc']
-            if subprocess.call(GCC_CMD) != EXIT_SUCCESS:
+            status = call('gcc', GCC_CMD)
+            if status != EXIT_SUCCESS:
                 # Leave the temporal c file for debugging.
                 sys.exit(EXIT_FAILURE)
             os.unlink(c_filename)
@@ -101,6 +190,15 @@ def main(argv):
         sys.exit(EXIT_FAILURE)
     else:
         sys.exit(EXIT_SUCCESS)    
+    finally:
+        if options.cache_stats:
+            print >> sys.stderr, 'AST cache: {0} hits, {1} misses, {2} evictions' \
+                .format(cache.hits, cache.misses, cache.evictions)
+        if report is not None:
+            if options.time_report == 'json':
+                print >> sys.stderr, report.format_json()
+            else:
+                print >> sys.stderr, report.format_text()
 
 
 if __name__ == '__main__':
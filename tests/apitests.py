@@ -0,0 +1,1037 @@
+# -*- coding: utf-8 -*-
+
+"""
+Pruebas de las funciones y clases del API de PyTiger2C.
+
+A diferencia de las pruebas del script C{runtests.py}, que compilan los
+programas Tiger de los directorios C{success} y C{fail} ejecutando el script
+C{pytiger2c.py}, estas pruebas utilizan directamente los módulos del paquete.
+"""
+
+import os
+import re
+import sys
+import json
+import zlib
+import shutil
+import hashlib
+import tempfile
+import codecs
+import unittest
+import threading
+from cStringIO import StringIO
+
+# Add the directory containing the packages in the source distribution to the path.
+PACKAGES_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, 'packages'))
+SUCCESS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), 'success'))
+sys.path.insert(0, PACKAGES_DIR)
+
+from pytiger2c import syntactic_analysis, syntactic_analysis_file, check_semantics, generate_code
+from pytiger2c import tiger2c, tiger2ast, tiger2dot, compile_string
+from pytiger2c.grammar import Parser, IncrementalParser, SymbolTable, lexers
+from pytiger2c.ast import VariableAccessNode, IntegerLiteralExpressionNode, \
+    StringLiteralExpressionNode
+from pytiger2c.ast.traversal import Visitor
+from pytiger2c.incremental import IncrementalChecker
+from pytiger2c.recovery import ErrorRecovery, get_active_recovery
+from pytiger2c.compilation import CompilationOptions
+from pytiger2c.cache import ASTCache, FORMAT
+from pytiger2c.timing import TimeReport, measure, call
+from pytiger2c.serialization import write_json, write_binary, load_ast, iter_records
+from pytiger2c.errors import SyntacticError, SemanticError
+
+
+def _compile(ast):
+    """
+    Comprueba semánticamente un árbol de sintáxis abstracta y retorna el 
+    código C generado.
+    """
+    check_semantics(ast)
+    output = StringIO()
+    generate_code(ast, codecs.getwriter('utf-8')(output))
+    return output.getvalue()
+
+
+class SpansTestCase(unittest.TestCase):
+    """
+    Pruebas de las posiciones de los nodos del árbol de sintáxis abstracta.
+    """
+
+    PROGRAM = 'let\n  var a := int_array [2] of 0\nin\n  a[1] := 5\nend\n'
+
+    def setUp(self):
+        """
+        Crea el directorio temporal de la prueba.
+        """
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Elimina el directorio temporal de la prueba.
+        """
+        shutil.rmtree(self._tmp_dir)
+
+    def test_no_spans_by_default(self):
+        """
+        Las posiciones no se calculan si no se solicitan.
+        """
+        ast = syntactic_analysis(StringIO(self.PROGRAM))
+        self.assertEqual(ast.span, None)
+
+    def test_spans(self):
+        """
+        Cada nodo recibe la línea y la columna de su primer caracter y la
+        posición siguiente a su último caracter.
+        """
+        ast = syntactic_analysis(StringIO(self.PROGRAM), spans=True)
+        self.assertEqual(ast.span, (1, 1, len(self.PROGRAM) - 1))
+        assignment = ast.expressions.expressions[0]
+        start = self.PROGRAM.index('a[1]')
+        self.assertEqual(assignment.span, (4, 3, start + len('a[1] := 5')))
+        self.assertEqual(assignment.lvalue.span, (4, 3, start + len('a[1]')))
+
+    def test_array_variable_span(self):
+        """
+        El nodo de la variable de un acceso a un array formado por un
+        identificador recibe la posición del identificador.
+        """
+        ast = syntactic_analysis(StringIO(self.PROGRAM), spans=True)
+        variable = ast.expressions.expressions[0].lvalue.array
+        start = self.PROGRAM.index('a[1]')
+        self.assertEqual(variable.span, (4, 3, start + 1))
+        self.assertEqual(variable.line_number, 4)
+
+    def test_spans_in_ast_export(self):
+        """
+        El árbol exportado con la función C{tiger2ast} incluye las posiciones.
+        """
+        tiger_filename = os.path.join(self._tmp_dir, 'program.tig')
+        ast_filename = os.path.join(self._tmp_dir, 'program.json')
+        with open(tiger_filename, 'w') as fd:
+            fd.write(self.PROGRAM)
+        tiger2ast(tiger_filename, ast_filename, binary=False)
+        with open(ast_filename) as fd:
+            records = [json.loads(line) for line in fd.readlines()[1:]]
+        self.assertTrue(records)
+        for record in records:
+            self.assertNotEqual(record['span'], None, record['type'])
+
+    def test_non_ascii_columns(self):
+        """
+        Las columnas se cuentan en caracteres aunque el programa se analice
+        como bytes codificados en UTF-8, como al proyectar el archivo en 
+        memoria.
+        """
+        program = u'let\n  var s := "\xe9\xe9" var x := 1 + in\n  s\nend\n'.encode('utf-8')
+        tiger_filename = os.path.join(self._tmp_dir, 'program.tig')
+        with open(tiger_filename, 'w') as fd:
+            fd.write(program)
+        message = "Unexpected token 'IN' at line 2 column 30"
+        for lexer_name in ('table', 'ply'):
+            try:
+                syntactic_analysis_file(tiger_filename, lexer_name)
+            except SyntacticError, error:
+                self.assertEqual(error.messages, [message])
+            else:
+                self.fail('The program has a syntax error')
+        try:
+            syntactic_analysis(StringIO(program))
+        except SyntacticError, error:
+            self.assertEqual(error.messages, [message])
+        else:
+            self.fail('The program has a syntax error')
+        program = program.replace(' 1 + in', ' 1 in')
+        ast = syntactic_analysis(StringIO(program), spans=True)
+        variable = ast.variable_declarations[1]
+        self.assertEqual(variable.span[:2], (2, 17))
+
+
+class ErrorRecoveryTestCase(unittest.TestCase):
+    """
+    Pruebas de la recuperación de los errores semánticos.
+    """
+
+    PROGRAM = ('let\n'
+               '  var a : int := "one"\n'
+               'in\n'
+               '  printi("two")\n'
+               'end\n')
+
+    def _check(self, recover):
+        """
+        Retorna los mensajes de los errores semánticos del programa.
+        """
+        ast = syntactic_analysis(StringIO(self.PROGRAM))
+        try:
+            check_semantics(ast, recover=recover)
+        except SemanticError, error:
+            return error.messages
+        return []
+
+    def test_recovery(self):
+        """
+        La comprobación se detiene en el primer error, excepto si se recupera
+        de los errores.
+        """
+        self.assertEqual(len(self._check(False)), 1)
+        self.assertEqual(len(self._check(True)), 2)
+
+    def test_nested_recovery(self):
+        """
+        Al desactivar un objeto se activa nuevamente el objeto anterior.
+        """
+        with ErrorRecovery() as outer:
+            with ErrorRecovery(1):
+                pass
+            self.assertTrue(get_active_recovery() is outer)
+        self.assertTrue(get_active_recovery() is None)
+
+    def test_other_thread(self):
+        """
+        El objeto activo en un hilo no modifica la comprobación de los demás.
+        """
+        activated, checked = threading.Event(), threading.Event()
+        def recover():
+            with ErrorRecovery():
+                activated.set()
+                checked.wait()
+        thread = threading.Thread(target=recover)
+        thread.start()
+        try:
+            activated.wait()
+            self.assertTrue(get_active_recovery() is None)
+            messages = self._check(False)
+        finally:
+            checked.set()
+            thread.join()
+        self.assertEqual(len(messages), 1)
+        self.assertTrue(all(isinstance(message, str) for message in messages))
+
+
+
+class TimeReportTestCase(unittest.TestCase):
+    """
+    Pruebas de la medición de las fases de la compilación.
+    """
+
+    def test_phases(self):
+        """
+        Las fases se notifican en el orden en que terminan.
+        """
+        with TimeReport() as report:
+            with measure('outer'):
+                with measure('inner'):
+                    pass
+        with measure('ignored'):
+            pass
+        self.assertEqual([phase.name for phase in report.phases], ['inner', 'outer'])
+        self.assertFalse(report.phases[0].external)
+
+    def test_external_program(self):
+        """
+        Las fases de los programas externos se miden con la función C{call}.
+        """
+        with TimeReport() as report:
+            self.assertEqual(call('true', ['true']), 0)
+            self.assertEqual(call('false', ['false']), 1)
+        self.assertEqual([phase.name for phase in report.phases], ['true', 'false'])
+        self.assertTrue(all(phase.external for phase in report.phases))
+
+    def test_other_threads(self):
+        """
+        Cada objeto solamente recibe las fases medidas en su hilo.
+        """
+        names = ['thread-%d' % index for index in range(4)]
+        reports = {}
+        started = threading.Event()
+        def compile_phases(name):
+            with TimeReport() as report:
+                started.wait()
+                for _ in range(50):
+                    with measure(name):
+                        pass
+            reports[name] = report
+        threads = [threading.Thread(target=compile_phases, args=(name,)) for name in names]
+        for thread in threads:
+            thread.start()
+        started.set()
+        with measure('main'):
+            pass
+        for thread in threads:
+            thread.join()
+        for name in names:
+            self.assertEqual([phase.name for phase in reports[name].phases], [name] * 50)
+
+
+
+class CompileStringTestCase(unittest.TestCase):
+    """
+    Pruebas de la compilación en memoria con la función C{compile_string}.
+    """
+
+    PROGRAM = ('let\n'
+               '  function f(n: int): int = if n = 0 then 1 else n * f(n - 1)\n'
+               'in\n'
+               '  printi(f(5))\n'
+               'end\n')
+
+    INVALID_PROGRAM = ('let\n'
+                       '  type a = b\n'
+                       '  type b = a\n'
+                       '  var c : int := "c"\n'
+                       '  function d(): int = "d"\n'
+                       'in\n'
+                       '  printi(e)\n'
+                       'end\n')
+
+    def _summary(self, source, options):
+        """
+        Retorna los datos de la compilación que no dependen del tiempo.
+        """
+        result = compile_string(source, options)
+        return ([str(diagnostic) for diagnostic in result.diagnostics], result.code,
+                [phase.name for phase in result.phases])
+
+    def test_result(self):
+        """
+        El resultado incluye el código C o los errores de la compilación y 
+        las fases realizadas.
+        """
+        diagnostics, code, phases = self._summary(self.PROGRAM, None)
+        self.assertEqual(diagnostics, [])
+        self.assertTrue(code)
+        self.assertEqual(phases, ['syntactic_analysis', 'semantic_check', 
+                                  'code_generation', 'code_output'])
+        diagnostics, code, phases = self._summary(self.INVALID_PROGRAM, None)
+        self.assertEqual(len(diagnostics), 1)
+        self.assertEqual(code, None)
+        diagnostics, code, phases = self._summary(self.INVALID_PROGRAM, 
+                                                  CompilationOptions(recover=True))
+        self.assertEqual(len(diagnostics), 4)
+        self.assertEqual(phases, ['syntactic_analysis', 'semantic_check'])
+
+    def test_syntactic_and_semantic_errors(self):
+        """
+        Si se recupera de los errores, también se reportan los errores
+        semánticos de las partes del programa sin errores de sintáxis.
+        """
+        source = 'let\n  var a : int := "s"\n  var b := 1 +\nin\n  printi(a)\nend\n'
+        diagnostics = self._summary(source, CompilationOptions())[0]
+        self.assertEqual(diagnostics, ["Syntactic Error: Unexpected token 'IN' at line 4 column 1."])
+        result = compile_string(source, CompilationOptions(recover=True))
+        self.assertEqual([(diagnostic.error, diagnostic.line) for diagnostic in result.diagnostics],
+                         [('Syntactic Error', 4), ('Semantic Error', 2)])
+        self.assertFalse(result.succeeded)
+
+    def test_threads(self):
+        """
+        Varios hilos pueden compilar programas al mismo tiempo, con opciones
+        distintas, obteniendo los mismos resultados que al compilarlos de
+        forma secuencial.
+        """
+        compilations = [
+            (self.PROGRAM, CompilationOptions()),
+            (self.INVALID_PROGRAM, CompilationOptions()),
+            (self.INVALID_PROGRAM, CompilationOptions(recover=True)),
+            (self.INVALID_PROGRAM, CompilationOptions(recover=True, max_errors=2)),
+            (self.PROGRAM, CompilationOptions(spans=True)),
+        ]
+        expected = [self._summary(source, options) for source, options in compilations]
+        results = [[] for _ in compilations]
+        started = threading.Event()
+        def compile_program(index):
+            source, options = compilations[index]
+            started.wait()
+            for _ in range(10):
+                results[index].append(self._summary(source, options))
+        threads = [threading.Thread(target=compile_program, args=(index,))
+                   for index in range(len(compilations))]
+        for thread in threads:
+            thread.start()
+        started.set()
+        for thread in threads:
+            thread.join()
+        for index in range(len(compilations)):
+            self.assertEqual(results[index], [expected[index]] * 10)
+
+
+class DeepNestingTestCase(unittest.TestCase):
+    """
+    Pruebas de los programas con miles de niveles de anidamiento del 
+    directorio C{success}, que el script C{runtests.py} compila y ejecuta.
+    """
+
+    PROGRAMS = ('deep_nested_if.tig', 'deep_nested_let.tig', 'long_operator_chain.tig')
+
+    def setUp(self):
+        """
+        Crea el directorio temporal de la prueba.
+        """
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Elimina el directorio temporal de la prueba.
+        """
+        shutil.rmtree(self._tmp_dir)
+
+    def test_dot(self):
+        """
+        El árbol de los programas se escribe en el formato DOT.
+        """
+        dot_filename = os.path.join(self._tmp_dir, 'program.dot')
+        for program in self.PROGRAMS:
+            tiger2dot(os.path.join(SUCCESS_DIR, program), dot_filename)
+            with open(dot_filename) as fd:
+                dot = fd.read()
+            self.assertTrue(dot.startswith('graph AST {'), program)
+            self.assertTrue(dot.count(' -- ') >= 2000, program)
+
+
+class DotTestCase(unittest.TestCase):
+    """
+    Pruebas de las opciones de la función C{tiger2dot} que limitan el tamaño
+    del grafo y agrupan los nodos de las funciones.
+    """
+
+    PROGRAM = os.path.join(SUCCESS_DIR, 'appel_queens.tig')
+
+    def setUp(self):
+        """
+        Crea el directorio temporal de la prueba.
+        """
+        self._tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Elimina el directorio temporal de la prueba.
+        """
+        shutil.rmtree(self._tmp_dir)
+
+    def _dot(self, **options):
+        """
+        Escribe el grafo del programa con las opciones dadas, comprueba que
+        es un grafo DOT válido y lo retorna.
+        """
+        dot_filename = os.path.join(self._tmp_dir, 'program.dot')
+        tiger2dot(self.PROGRAM, dot_filename, **options)
+        with open(dot_filename) as fd:
+            dot = fd.read()
+        self._check_dot(dot)
+        return dot
+
+    def _check_dot(self, dot):
+        """
+        Comprueba que las llaves de los subgrafos están balanceadas y que las
+        aristas unen nodos declarados en el grafo.
+        """
+        lines = dot.splitlines()
+        self.assertEqual(lines[0], 'graph AST {')
+        self.assertEqual(lines[-1], '}')
+        depth = 0
+        nodes = set()
+        edges = []
+        for line in lines[1:-1]:
+            line = line.strip()
+            if not line or line == 'node [shape=record];':
+                continue
+            if re.match(r'^subgraph cluster\d+ \{$', line):
+                depth += 1
+            elif line == '}':
+                depth -= 1
+                self.assertTrue(depth >= 0)
+            elif ' -- ' in line:
+                edges.extend(re.match(r'^(\w+) -- (\w+);$', line).groups())
+            elif line.startswith('label='):
+                self.assertTrue(depth > 0)
+                self.assertTrue(re.match(r'^label="[^"]*";$', line))
+            else:
+                match = re.match(r'^(\w+) \[label="[^"]*"(, [a-z]+=[a-z]+)?\];$', line)
+                self.assertTrue(match, line)
+                nodes.add(match.group(1))
+        self.assertEqual(depth, 0)
+        self.assertTrue(set(edges) <= nodes)
+
+    def _nodes(self, dot):
+        """
+        Retorna los nodos del grafo que representan nodos del árbol o sus 
+        atributos.
+        """
+        return re.findall(r'^ *node\d+ \[label="([^"]*)"', dot, re.M)
+
+    def test_max_nodes(self):
+        """
+        Al alcanzar la cantidad máxima de nodos no se incluyen más nodos del
+        árbol y se añade un nodo indicándolo.
+        """
+        dot = self._dot()
+        self.assertTrue(len(self._nodes(dot)) > 100)
+        self.assertFalse('Truncated' in dot)
+        dot = self._dot(max_nodes=20)
+        # The attributes of the last node can add a few more nodes.
+        self.assertTrue(20 <= len(self._nodes(dot)) <= 23)
+        self.assertTrue('truncated [label="Truncated at 20 nodes", shape=plaintext];' in dot)
+        dot = self._dot(max_nodes=1000)
+        self.assertFalse('Truncated' in dot)
+
+    def test_max_depth(self):
+        """
+        Los subárboles que superan la profundidad máxima se omiten o, con la
+        opción C{collapse}, se representan con un nodo con la cantidad de 
+        nodos del subárbol.
+        """
+        max_depth = 3
+        visitor = Visitor()
+        expected = []
+        stack = [(syntactic_analysis_file(self.PROGRAM), 0)]
+        while stack:
+            node, depth = stack.pop()
+            if depth > max_depth:
+                count = 0
+                subtree = [node]
+                while subtree:
+                    count += 1
+                    subtree.extend(visitor.children(subtree.pop()))
+                expected.append('{0} ({1} nodes)'.format(node.__class__.__name__, count))
+            else:
+                stack.extend((child, depth + 1) for child in visitor.children(node))
+        self.assertTrue(expected)
+        full_dot = self._dot()
+        dot = self._dot(max_depth=max_depth)
+        self.assertFalse('dashed' in dot)
+        self.assertTrue(len(self._nodes(dot)) < len(self._nodes(full_dot)))
+        dot = self._dot(max_depth=max_depth, collapse=True)
+        collapsed = re.findall(r'\[label="([^"]*)", style=dashed\];', dot)
+        self.assertEqual(sorted(collapsed), sorted(expected))
+        self.assertTrue('ForStatementNode (22 nodes)' in collapsed)
+
+    def test_subgraphs(self):
+        """
+        Los nodos de cada función se agrupan en un subgrafo.
+        """
+        dot = self._dot(subgraphs=True)
+        clusters = re.findall(r'^( *)subgraph cluster(\d+) \{\n(.*?)\n\1\}$', dot, re.M | re.S)
+        self.assertEqual([number for _, number, _ in clusters], ['1', '2'])
+        printboard, try_ = [body.split('\n') for _, _, body in clusters]
+        self.assertEqual(printboard[:2], ['        label="printboard";',
+                                          '        node7 [label="ProcedureDeclarationNode"];'])
+        self.assertEqual(try_[0], '        label="try";')
+        self.assertTrue('ForStatementNode' in '\n'.join(printboard))
+        self.assertTrue('label="c"' in '\n'.join(try_))
+        self.assertFalse('label="c"' in '\n'.join(printboard))
+        # The subgraphs only group the nodes, they do not add or omit any.
+        self.assertEqual(len(self._nodes(dot)), len(self._nodes(self._dot())))
+
+    def test_combined_options(self):
+        """
+        Al combinar todas las opciones se obtiene un grafo DOT válido.
+        """
+        for max_nodes in (20, 40, None):
+            dot = self._dot(max_depth=4, max_nodes=max_nodes, collapse=True, subgraphs=True)
+            self.assertTrue('subgraph cluster1 {' in dot, max_nodes)
+            self.assertTrue('style=dashed' in dot, max_nodes)
+            self.assertEqual('Truncated' in dot, max_nodes is not None, max_nodes)
+
+
+class ASTCacheTestCase(unittest.TestCase):
+    """
+    Pruebas de la cache de árboles de sintáxis abstracta.
+    """
+
+    PROGRAM = 'let\n  var a := 5\nin\n  printi(a * 2)\nend\n'
+
+    OTHER_PROGRAM = 'let\n  var s := "other"\nin\n  print(s)\nend\n'
+
+    def setUp(self):
+        """
+        Crea el directorio temporal de la prueba.
+        """
+        self._tmp_dir = tempfile.mkdtemp()
+        self._cache_dir = os.path.join(self._tmp_dir, 'cache')
+
+    def tearDown(self):
+        """
+        Elimina el directorio temporal de la prueba.
+        """
+        shutil.rmtree(self._tmp_dir)
+
+    def _write(self, name, source):
+        """
+        Escribe un programa Tiger en el directorio temporal y retorna su ruta.
+        """
+        tiger_filename = os.path.join(self._tmp_dir, name)
+        with open(tiger_filename, 'w') as fd:
+            fd.write(source)
+        return tiger_filename
+
+    def _translate(self, tiger_filename, cache):
+        """
+        Traduce un programa Tiger a C utilizando la cache y retorna el código.
+        """
+        c_filename = os.path.join(self._tmp_dir, 'program.c')
+        tiger2c(tiger_filename, c_filename, cache=cache)
+        with open(c_filename) as fd:
+            return fd.read()
+
+    def test_hits_and_misses(self):
+        """
+        La primera compilación de un programa almacena su árbol y las 
+        siguientes lo cargan de la cache y generan el mismo código.
+        """
+        tiger_filename = self._write('program.tig', self.PROGRAM)
+        code = self._translate(tiger_filename, None)
+        cache = ASTCache(self._cache_dir)
+        self.assertEqual(self._translate(tiger_filename, cache), code)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        for _ in range(2):
+            self.assertEqual(self._translate(tiger_filename, cache), code)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+        self.assertEqual(cache.evictions, 0)
+
+    def test_success_programs(self):
+        """
+        El código generado a partir de los árboles cargados de la cache es el
+        mismo que se genera sin utilizar la cache.
+        """
+        cache = ASTCache(self._cache_dir)
+        for program in sorted(os.listdir(SUCCESS_DIR)):
+            if not program.endswith('.tig'):
+                continue
+            tiger_filename = os.path.join(SUCCESS_DIR, program)
+            code = self._translate(tiger_filename, None)
+            self._translate(tiger_filename, cache)
+            hits = cache.hits
+            self.assertEqual(self._translate(tiger_filename, cache), code, program)
+            self.assertEqual(cache.hits, hits + 1, program)
+
+    def test_skips_semantic_check(self):
+        """
+        Al cargar un árbol de la cache se omiten el análisis sintáctico y la
+        comprobación semántica.
+        """
+        tiger_filename = self._write('program.tig', self.PROGRAM)
+        cache = ASTCache(self._cache_dir)
+        self._translate(tiger_filename, cache)
+        with TimeReport() as report:
+            self._translate(tiger_filename, cache)
+        names = [phase.name for phase in report.phases]
+        self.assertTrue('code_generation' in names)
+        self.assertFalse('syntactic_analysis' in names)
+        self.assertFalse('semantic_check' in names)
+        self.assertEqual(cache.hits, 1)
+
+    def test_deep_tree(self):
+        """
+        Los árboles con miles de niveles de anidamiento se almacenan.
+        """
+        tiger_filename = os.path.join(SUCCESS_DIR, 'deep_nested_if.tig')
+        cache = ASTCache(self._cache_dir)
+        code = self._translate(tiger_filename, cache)
+        self.assertEqual(self._translate(tiger_filename, cache), code)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_eviction(self):
+        """
+        Al superar el tamaño máximo se elimina la entrada utilizada hace más 
+        tiempo.
+        """
+        tiger_filename = self._write('program.tig', self.PROGRAM)
+        other_filename = self._write('other.tig', self.OTHER_PROGRAM)
+        cache = ASTCache(self._cache_dir)
+        self._translate(tiger_filename, cache)
+        size = os.path.getsize(os.path.join(self._cache_dir, os.listdir(self._cache_dir)[0]))
+        # Only the most recently used entry fits in the cache.
+        cache = ASTCache(self._cache_dir, size + size // 2)
+        self._translate(other_filename, cache)
+        self.assertEqual(cache.evictions, 1)
+        self.assertEqual(len(os.listdir(self._cache_dir)), 1)
+        self._translate(tiger_filename, cache)
+        self._translate(other_filename, cache)
+        self.assertEqual((cache.hits, cache.misses, cache.evictions), (0, 3, 3))
+
+    def test_untrusted_file(self):
+        """
+        Los archivos de la cache no pueden ejecutar código al cargarlos.
+        """
+        tiger_filename = self._write('program.tig', self.PROGRAM)
+        marker_filename = os.path.join(self._tmp_dir, 'marker')
+        cache = ASTCache(self._cache_dir)
+        with open(tiger_filename) as fd:
+            key = cache.key(fd.read())
+        # Pickle that creates the marker file when it is loaded.
+        payload = zlib.compress("c__builtin__\nopen\n(S'{0}'\nS'w'\ntR."
+                                .format(marker_filename))
+        with open(os.path.join(self._cache_dir, key + '.ast'), 'wb') as fd:
+            fd.write('{0} {1} {2}\n'.format(FORMAT, key, hashlib.md5(payload).hexdigest()))
+            fd.write(payload)
+        self.assertEqual(cache.load(key), None)
+        self.assertEqual(cache.misses, 1)
+        self.assertFalse(os.path.exists(marker_filename))
+
+
+class IncrementalParserTestCase(unittest.TestCase):
+    """
+    Pruebas del análisis sintáctico incremental.
+    """
+
+    PROGRAM = (u'let\n  var n := 2\n  function f(a : int) : int = (a + 1)\n'
+               u'  function g(a : int) : int = f(a) * n\nin\n  printi(g(3))\nend\n')
+
+    def _export(self, ast):
+        """
+        Retorna el árbol de sintáxis abstracta en el formato JSON.
+        """
+        output = StringIO()
+        write_json(ast, output)
+        return output.getvalue()
+
+    def _full_parse(self, data):
+        """
+        Analiza un programa completo calculando las posiciones de los nodos.
+        """
+        return syntactic_analysis(StringIO(data.encode('utf-8')), spans=True)
+
+    def test_same_tree(self):
+        """
+        El árbol de cada modificación coincide con el del programa completo.
+        """
+        parser = IncrementalParser()
+        parser.parse(self.PROGRAM)
+        index = self.PROGRAM.index('a + 1')
+        for start, end, text in ((index + 4, index + 5, u'2 * a'), (index, index, u'\n\n'),
+                                 (index + 2, index + 3, u'(1; 2)')):
+            parser.edit(start, end, text)
+            self.assertEqual(self._export(parser.ast), self._export(self._full_parse(parser.data)))
+
+    def test_changes(self):
+        """
+        Los nodos que no se modifican se conservan y los nuevos se obtienen
+        con el método C{pop_changes}.
+        """
+        parser = IncrementalParser()
+        ast = parser.parse(self.PROGRAM)
+        self.assertEqual(parser.pop_changes(), None)
+        call = ast.expressions.expressions[0]
+        index = self.PROGRAM.index('a + 1')
+        parser.edit(index + 4, index + 5, u'2')
+        self.assertTrue(parser.ast is ast)
+        self.assertTrue(ast.expressions.expressions[0] is call)
+        changes = parser.pop_changes()
+        self.assertEqual(len(changes), 1)
+        self.assertEqual(changes[0].parent_node.name, 'f')
+        self.assertEqual(parser.pop_changes(), [])
+
+    def test_syntax_error(self):
+        """
+        Los errores de sintáxis son los mismos del programa completo y el
+        árbol se obtiene nuevamente al corregirlos.
+        """
+        parser = IncrementalParser()
+        parser.parse(self.PROGRAM)
+        index = self.PROGRAM.index('a + 1')
+        try:
+            parser.edit(index + 4, index + 5, u')')
+        except SyntacticError, error:
+            try:
+                self._full_parse(parser.data)
+            except SyntacticError, full_error:
+                self.assertEqual(str(error), str(full_error))
+            else:
+                self.fail('SyntacticError not raised by the full parse')
+        else:
+            self.fail('SyntacticError not raised')
+        self.assertEqual(parser.ast, None)
+        parser.edit(index + 4, index + 5, u'1')
+        self.assertEqual(self._export(parser.ast), self._export(self._full_parse(self.PROGRAM)))
+
+
+class IncrementalCheckerTestCase(unittest.TestCase):
+    """
+    Pruebas de la comprobación semántica incremental.
+    """
+
+    PROGRAM = IncrementalParserTestCase.PROGRAM
+
+    def setUp(self):
+        """
+        Analiza y comprueba el programa de la prueba.
+        """
+        self._parser = IncrementalParser()
+        self._parser.parse(self.PROGRAM)
+        self._checker = IncrementalChecker(self._parser)
+        self.assertTrue(self._checker.check())
+        self.assertEqual(self._checker.rechecked, None)
+        self._index = self.PROGRAM.index('a + 1')
+
+    def _code(self):
+        """
+        Retorna el código C generado para el árbol del analizador.
+        """
+        output = StringIO()
+        generate_code(self._parser.ast, codecs.getwriter('utf-8')(output))
+        return output.getvalue()
+
+    def test_function_body(self):
+        """
+        Al modificar el cuerpo de una función solamente se comprueba esa 
+        función y se genera el mismo código que al compilar el programa.
+        """
+        self._parser.edit(self._index + 4, self._index + 5, u'2')
+        self.assertTrue(self._checker.check())
+        self.assertEqual(self._checker.rechecked, 1)
+        data = self._parser.data.encode('utf-8')
+        self.assertEqual(self._code(), _compile(syntactic_analysis(StringIO(data))))
+
+    def test_variable_declaration(self):
+        """
+        Al modificar una declaración de variable del nivel superior se 
+        comprueba el árbol completo.
+        """
+        index = self.PROGRAM.index('2\n')
+        self._parser.edit(index, index + 1, u'5')
+        self.assertTrue(self._checker.check())
+        self.assertEqual(self._checker.rechecked, None)
+
+    def test_semantic_error(self):
+        """
+        Los errores semánticos son los mismos de la función C{check_semantics}.
+        """
+        self._parser.edit(self._index + 4, self._index + 5, u'"s"')
+        data = self._parser.data.encode('utf-8')
+        try:
+            self._checker.check()
+        except SemanticError, error:
+            try:
+                check_semantics(syntactic_analysis(StringIO(data)))
+            except SemanticError, full_error:
+                self.assertEqual(str(error), str(full_error))
+            else:
+                self.fail('SemanticError not raised by check_semantics')
+        else:
+            self.fail('SemanticError not raised')
+
+    def test_syntax_error(self):
+        """
+        La comprobación no se realiza mientras el programa tiene errores de
+        sintáxis.
+        """
+        self.assertRaises(SyntacticError, self._parser.edit, 
+                          self._index + 4, self._index + 5, u')')
+        self.assertFalse(self._checker.check())
+        self._parser.edit(self._index + 4, self._index + 5, u'3')
+        self.assertTrue(self._checker.check())
+        self.assertEqual(self._checker.rechecked, 1)
+
+
+class SerializationTestCase(unittest.TestCase):
+    """
+    Pruebas de la exportación y la carga de árboles de sintáxis abstracta.
+    """
+
+    PROGRAMS = ('appel_queens.tig', 'binary_search_tree.tig', 'linked_list.tig',
+                'simple_comments.tig', 'escape_chars_in_string_literal.tig',
+                'deep_nested_let.tig')
+
+    def _round_trip(self, ast, writer):
+        """
+        Exporta un árbol, lo carga y retorna el árbol cargado junto con las
+        dos exportaciones.
+        """
+        output = StringIO()
+        writer(ast, output)
+        loaded = load_ast(StringIO(output.getvalue()))
+        loaded_output = StringIO()
+        writer(loaded, loaded_output)
+        return loaded, output.getvalue(), loaded_output.getvalue()
+
+    def test_round_trip(self):
+        """
+        El árbol cargado se exporta igual que el original, incluyendo las 
+        posiciones de los nodos, y se genera el mismo código.
+        """
+        for program in self.PROGRAMS:
+            tiger_filename = os.path.join(SUCCESS_DIR, program)
+            code = _compile(syntactic_analysis_file(tiger_filename))
+            for writer in (write_json, write_binary):
+                ast = syntactic_analysis_file(tiger_filename, spans=True)
+                loaded, data, loaded_data = self._round_trip(ast, writer)
+                self.assertEqual(loaded_data, data, program)
+                self.assertEqual(loaded.span, ast.span, program)
+                self.assertEqual(_compile(loaded), code, program)
+
+    def test_detached(self):
+        """
+        Los nodos cuyo atributo C{parent_node} es C{None} se cargan sin padre.
+        """
+        ast = syntactic_analysis(StringIO('let\n  var a := 5\nin\n  printi(a * 2)\nend\n'))
+        call = ast.expressions.expressions[0]
+        call.parent_node = None
+        for writer in (write_json, write_binary):
+            loaded, data, loaded_data = self._round_trip(ast, writer)
+            self.assertEqual(loaded_data, data)
+            loaded_call = loaded.expressions.expressions[0]
+            self.assertEqual(loaded_call.parent_node, None)
+            self.assertTrue(loaded.expressions.parent_node is loaded)
+            self.assertTrue(loaded_call.parameters[0].parent_node is loaded_call)
+
+
+class SymbolTableTestCase(unittest.TestCase):
+    """
+    Pruebas de la tabla de símbolos y de su uso en los analizadores 
+    léxico-gráficos.
+    """
+
+    PROGRAM = (u'let\n  var counter := 123456\n  var text := "repeated text"\nin\n'
+               u'  counter := counter + 123456;\n  print("repeated text");\n'
+               u'  printi(counter)\nend\n')
+
+    def _values(self, ast):
+        """
+        Retorna los nombres de las variables accedidas, los enteros literales
+        y las cadenas de caracteres literales de un árbol.
+        """
+        names, integers, strings = [], [], []
+        visitor = Visitor()
+        stack = [ast]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, VariableAccessNode):
+                names.append(node.name)
+            elif isinstance(node, IntegerLiteralExpressionNode):
+                integers.append(node.integer)
+            elif isinstance(node, StringLiteralExpressionNode):
+                strings.append(node.string)
+            stack.extend(visitor.children(node))
+        return names, integers, strings
+
+    def _assert_shared(self, values, count):
+        """
+        Comprueba la cantidad de valores y que todos son la misma instancia.
+        """
+        self.assertEqual(len(values), count)
+        for value in values:
+            self.assertTrue(value is values[0], value)
+
+    def test_ids(self):
+        """
+        Los identificadores se asignan consecutivamente y cada uno 
+        corresponde a un único símbolo.
+        """
+        table = SymbolTable()
+        values = ['counter', 123456, 'repeated text', 7]
+        ids = [table.get_id(value) for value in values]
+        self.assertEqual(ids, range(len(values)))
+        self.assertEqual(len(table), len(values))
+        for value, symbol_id in zip(values, ids):
+            self.assertTrue(value in table)
+            self.assertEqual(table.get_id(value), symbol_id)
+            self.assertEqual(table.get_symbol(symbol_id), value)
+            self.assertTrue(table.intern(value) is table.get_symbol(symbol_id))
+        # Equal values that are different instances share the symbol.
+        number = int('123456')
+        self.assertFalse(number is values[1])
+        self.assertTrue(table.intern(number) is values[1])
+        self.assertEqual(len(table), len(values))
+        self.assertFalse('other' in table)
+        self.assertRaises(IndexError, table.get_symbol, len(values))
+
+    def test_str_and_unicode(self):
+        """
+        Una cadena C{str} y una cadena C{unicode} iguales son el mismo 
+        símbolo.
+        """
+        table = SymbolTable()
+        symbol_id = table.get_id('counter')
+        self.assertEqual(table.get_id(u'counter'), symbol_id)
+        self.assertTrue(u'counter' in table)
+        self.assertTrue(type(table.intern(u'counter')) is str)
+        self.assertEqual(len(table), 1)
+        symbol_id = table.get_id(u'text')
+        self.assertEqual(table.get_id('text'), symbol_id)
+        self.assertTrue(type(table.intern('text')) is unicode)
+        self.assertEqual(len(table), 2)
+
+    def test_lexers(self):
+        """
+        Ambos analizadores léxico-gráficos retornan la misma instancia para
+        todas las apariciones de un identificador o un literal y añaden los
+        mismos símbolos a la tabla.
+        """
+        symbols = {}
+        for lexer_name in sorted(lexers):
+            parser = Parser(lexer_name)
+            names, integers, strings = self._values(parser.parse(self.PROGRAM))
+            self._assert_shared(names, 3)
+            self._assert_shared(integers, 2)
+            self._assert_shared(strings, 2)
+            self.assertTrue(parser.symbols.intern(u'counter') is names[0])
+            self.assertTrue(parser.symbols.intern(123456) is integers[0])
+            self.assertTrue(parser.symbols.intern(u'repeated text') is strings[0])
+            symbols[lexer_name] = [parser.symbols.get_symbol(symbol_id)
+                                   for symbol_id in range(len(parser.symbols))]
+        self.assertEqual(symbols['ply'], symbols['table'])
+
+    def test_incremental(self):
+        """
+        Los tokens que reconoce el analizador incremental después de una 
+        modificación retornan las instancias de la tabla de símbolos.
+        """
+        parser = IncrementalParser()
+        names, integers, strings = self._values(parser.parse(self.PROGRAM))
+        index = self.PROGRAM.index('printi(counter)')
+        parser.edit(index, index, u'print("repeated text");\n  printi(counter + 123456);\n  ')
+        new_names, new_integers, new_strings = self._values(parser.ast)
+        self._assert_shared(new_names + names, 7)
+        self._assert_shared(new_integers + integers, 5)
+        self._assert_shared(new_strings + strings, 5)
+
+    def test_parser_tables(self):
+        """
+        Cada instancia de C{Parser} y de C{IncrementalParser} tiene su propia
+        tabla de símbolos.
+        """
+        parser, other_parser = Parser(), Parser()
+        incremental_parser = IncrementalParser()
+        self.assertFalse(parser.symbols is other_parser.symbols)
+        self.assertFalse(parser.symbols is incremental_parser.symbols)
+        parser.parse(self.PROGRAM)
+        self.assertTrue(u'counter' in parser.symbols)
+        self.assertFalse(u'counter' in other_parser.symbols)
+        self.assertFalse(u'counter' in incremental_parser.symbols)
+        count = len(parser.symbols)
+        incremental_parser.parse(u'let var other := 1 in other end')
+        self.assertEqual(len(parser.symbols), count)
+        self.assertFalse(u'other' in parser.symbols)
+        self.assertTrue(u'other' in incremental_parser.symbols)
+
+
+class ParsersTestCase(unittest.TestCase):
+    """
+    Pruebas de la equivalencia de los analizadores sintácticos con los 
+    programas del directorio C{success}.
+    """
+
+    def _records(self, tiger_filename, **options):
+        """
+        Retorna los registros del árbol de un programa sin las posiciones de
+        los nodos.
+        """
+        ast = syntactic_analysis_file(tiger_filename, **options)
+        return [(record.type_name, record.line_number, record.detached, record.values,
+                 record.children) for record in iter_records(ast)]
+
+    def test_same_tree(self):
+        """
+        El analizador C{compact}, con o sin posiciones, construye el mismo 
+        árbol que el analizador C{ply}.
+        """
+        for program in sorted(os.listdir(SUCCESS_DIR)):
+            if program.endswith('.tig'):
+                tiger_filename = os.path.join(SUCCESS_DIR, program)
+                expected = self._records(tiger_filename, parser_name='ply')
+                self.assertEqual(self._records(tiger_filename), expected, program)
+                self.assertEqual(self._records(tiger_filename, spans=True), expected, program)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,6 +8,8 @@ import os
 import unittest
 import subprocess
 
+import apitests
+
 
 SRC_DIR = os.path.join(os.path.dirname(__file__), os.pardir)
 
@@ -25,6 +27,9 @@ FAIL_DIR = os.path.abspath(os.path.join(TESTS_DIR, 'fail'))
 class TigerTestCase(unittest.TestCase):
     """
     Clase base para ambos tipos de pruebas.
+    
+    Si existe un archivo .opt junto al programa Tiger, las opciones que 
+    contiene se añaden a la línea de comandos de PyTiger2C.
     """
     
     def __init__(self, parent_dir, tiger_file):
@@ -35,6 +40,11 @@ class TigerTestCase(unittest.TestCase):
         self._tiger_file = os.path.join(parent_dir, tiger_file)
         self._exec_file = os.path.join(parent_dir, tiger_file[:-4])
         self._pytiger2c_cmd = PYTIGER2C_CMD + [self._tiger_file, '--output', self._exec_file]
+        opt_file = os.path.join(parent_dir, tiger_file[:-4] + '.opt')
+        if os.path.isfile(opt_file):
+            # Additional command line options of PyTiger2C for this test.
+            with open(opt_file) as fd:
+                self._pytiger2c_cmd += fd.read().split()
         self._in_file = os.path.join(parent_dir, tiger_file[:-4] + '.in')
         if not os.path.isfile(self._in_file):
             self._in_file = None
@@ -142,6 +152,7 @@ def main():
         for tiger_file in [f for f in os.listdir(FAIL_DIR) if f.endswith('.tig')]:
             test_case = FailTigerTestCase(FAIL_DIR, tiger_file)
             suite.addTest(test_case)        
+    suite.addTests(unittest.defaultTestLoader.loadTestsFromModule(apitests))
     runner.run(suite)
 
 
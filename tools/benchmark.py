@@ -0,0 +1,630 @@
+# -*- coding: utf-8 -*-
+
+"""
+Mide el rendimiento del análisis léxico-gráfico y sintáctico de PyTiger2C
+sobre programas Tiger grandes generados automáticamente.
+
+Los programas se generan con formas diferentes para observar cómo escala
+cada parte del análisis: secuencias largas de expresiones, expresiones
+profundamente anidadas, muchas declaraciones de funciones, muchos literales
+de cadenas de caracteres y cadenas largas de operadores. El análisis
+léxico-gráfico y el análisis sintáctico se miden por separado: los tokens
+que recibe el analizador sintáctico se reconocen antes de comenzar la
+medición. Para cada medición se reportan los tokens por segundo, los nodos
+del árbol de sintáxis abstracta por segundo y el incremento de la memoria
+máxima utilizada por el proceso, en forma de tabla o en formato JSON. Para
+el análisis sintáctico se reporta además la memoria promedio que ocupa cada
+nodo del árbol de sintáxis abstracta construido. Opcionalmente se mide
+también la comprobación semántica de los árboles construidos. La forma C{types} genera programas con muchas declaraciones de
+tipos records y arrays y muchas expresiones cuyos tipos se deben comparar,
+para medir el costo de las comparaciones de tipos durante la comprobación
+semántica.
+
+Cada medición se realiza en un proceso hijo para que la memoria máxima
+reportada corresponda solamente a esa medición. En los sistemas que no
+permiten crear procesos con C{os.fork} las mediciones se realizan en el
+mismo proceso y no se reporta la memoria utilizada.
+"""
+
+import os
+import gc
+import sys
+import time
+import json
+import cPickle
+import optparse
+import traceback
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), os.pardir)
+
+PACKAGES_DIR = os.path.abspath(os.path.join(SRC_DIR, 'packages'))
+
+sys.path.insert(0, PACKAGES_DIR)
+
+from pytiger2c.ast.languagenode import LanguageNode, get_field_names
+from pytiger2c.grammar import lexers, parsers, DEFAULT_LEXER
+from pytiger2c.ast.traversal import run
+from pytiger2c.scope import RootScope
+
+
+EXIT_SUCCESS, EXIT_FAILURE = 0, 1
+
+
+_FUNCTION_TEMPLATE = u"""
+    /* Function number {index}. */
+    function f{index}(a: int, b: string) : int =
+        let
+            var s := "line\\t{index}\\n\\065\\^A"
+            var i := a * {index} + (a - 1) / 2
+        in
+            if i >= {index} & size(b) <> 0 then
+                (print(s); i := i - 1)
+            else
+                i := i + 1;
+            i
+        end
+"""
+
+_TYPES_TEMPLATE = u"""
+    /* Types number {index}. */
+    type r{index} = {{value: int, name: string, next: r{index}}}
+    type a{index} = array of r{index}
+    var x{index} := r{index} {{value = {index}, name = "r{index}", next = nil}}
+    var v{index} : a{index} := a{index} [{index} + 1] of x{index}
+    function g{index}(p: r{index}, q: a{index}) : int =
+        if p <> nil & p.next = nil & q[0] = p & q[0].value >= p.value - 1 then
+            (p.next := q[0]; p.value + q[0].value * size(concat(p.name, "!")))
+        else
+            -p.value
+"""
+
+
+def generate_sequence(size):
+    """
+    Genera un programa Tiger formado por una secuencia larga de expresiones.
+
+    @type size: C{int}
+    @param size: Número de expresiones de la secuencia.
+
+    @rtype: C{unicode}
+    @return: Código fuente del programa Tiger generado.
+    """
+    parts = [u'let\n    var i := 0\nin\n    (']
+    for index in xrange(size):
+        parts.append(u'\n        i := i + {0};'.format(index))
+    parts.append(u'\n        printi(i))\nend\n')
+    return u''.join(parts)
+
+
+def generate_nesting(size):
+    """
+    Genera un programa Tiger formado por expresiones C{let} y C{if}
+    anidadas.
+
+    @type size: C{int}
+    @param size: Profundidad del anidamiento.
+
+    @rtype: C{unicode}
+    @return: Código fuente del programa Tiger generado.
+    """
+    parts = []
+    for index in xrange(size):
+        parts.append(u'let var v{0} := {0} in if v{0} > 0 then (\n'.format(index))
+    parts.append(u'printi(0)\n')
+    parts.append(u') else () end\n' * size)
+    return u''.join(parts)
+
+
+def generate_functions(size):
+    """
+    Genera un programa Tiger con el número de funciones indicado.
+
+    @type size: C{int}
+    @param size: Número de funciones que se deben declarar en el
+        programa generado.
+
+    @rtype: C{unicode}
+    @return: Código fuente del programa Tiger generado.
+    """
+    parts = [u'let']
+    for index in xrange(size):
+        parts.append(_FUNCTION_TEMPLATE.format(index=index))
+    parts.append(u'in\n    printi(f0(1, "a"))\nend\n')
+    return u''.join(parts)
+
+
+def generate_strings(size):
+    """
+    Genera un programa Tiger que declara una tabla grande de literales de
+    cadenas de caracteres con secuencias de escape.
+
+    @type size: C{int}
+    @param size: Número de literales de cadenas de caracteres.
+
+    @rtype: C{unicode}
+    @return: Código fuente del programa Tiger generado.
+    """
+    parts = [u'let\n']
+    for index in xrange(size):
+        parts.append(u'    var s{0} := "String number {0} with \\"escapes\\"\\t\\n'
+                     u'\\065\\^G and a \\\n        \\gap."\n'.format(index))
+    parts.append(u'in\n    print(s0)\nend\n')
+    return u''.join(parts)
+
+
+def generate_operators(size):
+    """
+    Genera un programa Tiger formado por una cadena larga de operadores
+    aritméticos, de comparación y lógicos.
+
+    @type size: C{int}
+    @param size: Número de operadores de la cadena.
+
+    @rtype: C{unicode}
+    @return: Código fuente del programa Tiger generado.
+    """
+    # The comparison operators are not associative, so each pair of them is
+    # separated by a logical operator.
+    operators = [u'+', u'<', u'*', u'&', u'-', u'>=', u'/', u'|', u'=', u'&', u'<>', u'|']
+    parts = [u'let\n    var a := 1\nin\n    printi(a']
+    for index in xrange(size):
+        parts.append(u' {0} {1}'.format(operators[index % len(operators)], index + 1))
+        if index % 16 == 15:
+            parts.append(u'\n       ')
+    parts.append(u')\nend\n')
+    return u''.join(parts)
+
+
+def generate_types(size):
+    """
+    Genera un programa Tiger con muchas declaraciones de tipos records y
+    arrays, variables de estos tipos y funciones que los utilizan.
+
+    @type size: C{int}
+    @param size: Número de grupos de declaraciones del programa.
+
+    @rtype: C{unicode}
+    @return: Código fuente del programa Tiger generado.
+    """
+    parts = [u'let']
+    for index in xrange(size):
+        parts.append(_TYPES_TEMPLATE.format(index=index))
+    parts.append(u'in\n    printi(g0(x0, v0))\nend\n')
+    return u''.join(parts)
+
+
+# Generators of each shape of program and the size used by default.
+SHAPES = {
+    'sequence': (generate_sequence, 50000),
+    'nesting': (generate_nesting, 5000),
+    'functions': (generate_functions, 2000),
+    'strings': (generate_strings, 20000),
+    'operators': (generate_operators, 100000),
+    'types': (generate_types, 2000),
+}
+
+
+class TokenReplay(object):
+    """
+    Analizador léxico-gráfico que retorna tokens reconocidos previamente,
+    de forma tal que el tiempo medido para el análisis sintáctico no
+    incluya el análisis léxico-gráfico.
+    """
+
+    def __init__(self, tokens):
+        """
+        Inicializa el analizador léxico-gráfico.
+
+        @type tokens: C{list}
+        @param tokens: Lista de los tokens que se deben retornar.
+        """
+        super(TokenReplay, self).__init__()
+        self._next = iter(tokens).next
+        self.lineno = 1
+        self.lexpos = 0
+
+    def token(self):
+        """
+        Retorna el siguiente token.
+
+        @rtype: C{LexToken}
+        @return: Siguiente token o C{None} si no quedan tokens.
+        """
+        try:
+            return self._next()
+        except StopIteration:
+            return None
+
+    def current_state(self):
+        """
+        Retorna el estado del analizador léxico-gráfico, que es siempre
+        C{INITIAL} al final de los tokens.
+        """
+        return 'INITIAL'
+
+
+def tokenize(lexer, data):
+    """
+    Reconoce todos los tokens de un programa Tiger.
+
+    @type lexer: C{object}
+    @param lexer: Analizador léxico-gráfico que se debe utilizar. Se
+        utiliza una copia para no modificar su estado.
+
+    @type data: C{unicode}
+    @param data: Código fuente del programa Tiger.
+
+    @rtype: C{list}
+    @return: Lista de los tokens del programa.
+    """
+    lexer = lexer.clone()
+    lexer.lineno = 1
+    lexer.input(data)
+    return list(iter(lexer.token, None))
+
+
+def measure_tree(ast):
+    """
+    Cuenta los nodos de un árbol de sintáxis abstracta y calcula la memoria
+    que ocupan. La memoria de cada nodo incluye el objeto del nodo, su 
+    diccionario de atributos si lo tiene y las listas de nodos hijos que 
+    contiene. El árbol se recorre utilizando una pila para permitir árboles
+    de cualquier profundidad.
+
+    @type ast: C{LanguageNode}
+    @param ast: Nodo raíz del árbol de sintáxis abstracta.
+
+    @rtype: C{tuple}
+    @return: Tupla con el número de nodos del árbol y la memoria (en bytes)
+        que ocupan.
+    """
+    num_nodes, num_bytes = 0, 0
+    stack = [ast]
+    while stack:
+        node = stack.pop()
+        num_nodes += 1
+        num_bytes += sys.getsizeof(node)
+        attributes = getattr(node, '__dict__', None)
+        if attributes is not None:
+            num_bytes += sys.getsizeof(attributes)
+        for name in get_field_names(type(node)):
+            value = getattr(node, name, None)
+            if isinstance(value, LanguageNode):
+                stack.append(value)
+            elif isinstance(value, list):
+                num_bytes += sys.getsizeof(value)
+                stack.extend(item for item in value if isinstance(item, LanguageNode))
+    return num_nodes, num_bytes
+
+
+def benchmark_lexer(lexer, data, repeat):
+    """
+    Mide el tiempo que demora un analizador léxico-gráfico en reconocer
+    todos los tokens de un programa Tiger.
+
+    @type lexer: C{object}
+    @param lexer: Analizador léxico-gráfico que se debe medir.
+
+    @type data: C{unicode}
+    @param data: Código fuente del programa Tiger.
+
+    @type repeat: C{int}
+    @param repeat: Número de veces que se repite la medición. Se reporta
+        el menor de los tiempos medidos.
+
+    @rtype: C{dict}
+    @return: Diccionario con el número de tokens reconocidos y el menor
+        tiempo (en segundos) que se demoró el analizador en reconocerlos.
+    """
+    best_time, num_tokens = None, 0
+    for i in xrange(repeat):
+        lexer = lexer.clone()
+        lexer.lineno = 1
+        lexer.input(data)
+        token = lexer.token
+        num_tokens = 0
+        start = time.time()
+        while token() is not None:
+            num_tokens += 1
+        elapsed = time.time() - start
+        if best_time is None or elapsed < best_time:
+            best_time = elapsed
+    return {'tokens': num_tokens, 'nodes': None, 'node_bytes': None, 'time': best_time}
+
+
+def benchmark_parser(parser, tokens, repeat):
+    """
+    Mide el tiempo que demora un analizador sintáctico en construir el árbol
+    de sintáxis abstracta de un programa Tiger a partir de sus tokens, que
+    se reconocen antes de comenzar la medición.
+
+    @type parser: C{object}
+    @param parser: Analizador sintáctico que se debe medir.
+
+    @type tokens: C{list}
+    @param tokens: Lista de los tokens del programa Tiger.
+
+    @type repeat: C{int}
+    @param repeat: Número de veces que se repite la medición. Se reporta
+        el menor de los tiempos medidos.
+
+    @rtype: C{dict}
+    @return: Diccionario con el número de tokens analizados, el número de
+        nodos del árbol de sintáxis abstracta, la memoria promedio (en bytes)
+        que ocupa cada nodo y el menor tiempo (en segundos) que se demoró el
+        analizador en construirlo.
+    """
+    best_time, num_nodes, num_bytes = None, 0, 0
+    for i in xrange(repeat):
+        lexer = TokenReplay(tokens)
+        start = time.time()
+        ast = parser.parse(lexer=lexer)
+        elapsed = time.time() - start
+        if best_time is None or elapsed < best_time:
+            best_time = elapsed
+        num_nodes, num_bytes = measure_tree(ast)
+        # Free the tree before the next repetition.
+        del ast
+        gc.collect()
+    return {'tokens': len(tokens), 'nodes': num_nodes, 'node_bytes': float(num_bytes) / num_nodes,
+            'time': best_time}
+
+
+def benchmark_checker(tokens, repeat):
+    """
+    Mide el tiempo que demora la comprobación semántica del árbol de
+    sintáxis abstracta de un programa Tiger. El árbol se construye antes de
+    cada medición a partir de los tokens del programa.
+
+    @type tokens: C{list}
+    @param tokens: Lista de los tokens del programa Tiger.
+
+    @type repeat: C{int}
+    @param repeat: Número de veces que se repite la medición. Se reporta
+        el menor de los tiempos medidos.
+
+    @rtype: C{dict}
+    @return: Diccionario con el número de tokens del programa, el número de
+        nodos del árbol de sintáxis abstracta y el menor tiempo (en segundos)
+        que se demoró la comprobación semántica.
+
+    @raise RuntimeError: Esta excepción se lanzará si el programa tiene
+        errores semánticos.
+    """
+    best_time, num_nodes = None, 0
+    for i in xrange(repeat):
+        ast = parsers['compact'].parse(lexer=TokenReplay(tokens))
+        num_nodes = measure_tree(ast)[0]
+        errors = []
+        start = time.time()
+        run(ast.check_semantics(RootScope(), errors))
+        elapsed = time.time() - start
+        if errors:
+            raise RuntimeError('\n'.join(errors))
+        if best_time is None or elapsed < best_time:
+            best_time = elapsed
+        # Free the tree before the next repetition.
+        del ast
+        gc.collect()
+    return {'tokens': len(tokens), 'nodes': num_nodes, 'node_bytes': None, 'time': best_time}
+
+
+def measure(function, *args):
+    """
+    Ejecuta una función en un proceso hijo y calcula el incremento de la
+    memoria máxima utilizada por el proceso durante su ejecución.
+
+    @type function: C{function}
+    @param function: Función que se debe ejecutar. Debe retornar un
+        diccionario con los resultados de la medición.
+
+    @rtype: C{dict}
+    @return: Diccionario retornado por la función con la memoria máxima
+        (en KiB) asociada a la llave C{memory}. La memoria será C{None} si
+        no se puede calcular en este sistema.
+
+    @raise RuntimeError: Esta excepción se lanzará si la función lanza una
+        excepción en el proceso hijo.
+    """
+    if resource is None or not hasattr(os, 'fork'):
+        result = function(*args)
+        result['memory'] = None
+        return result
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            try:
+                result = function(*args)
+                memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - before
+                if sys.platform == 'darwin':
+                    # The maximum resident set size is given in bytes.
+                    memory //= 1024
+                result['memory'] = memory
+                message = (True, result)
+            except Exception:
+                message = (False, traceback.format_exc())
+            with os.fdopen(write_fd, 'wb') as fd:
+                cPickle.dump(message, fd, cPickle.HIGHEST_PROTOCOL)
+        finally:
+            os._exit(EXIT_SUCCESS)
+    os.close(write_fd)
+    with os.fdopen(read_fd, 'rb') as fd:
+        data = fd.read()
+    os.waitpid(pid, 0)
+    if not data:
+        raise RuntimeError('The measure process ended unexpectedly')
+    success, result = cPickle.loads(data)
+    if not success:
+        raise RuntimeError(result)
+    return result
+
+
+def run_benchmarks(programs, lexer_names, parser_names, repeat, check=False):
+    """
+    Realiza las mediciones de los analizadores indicados sobre cada uno de
+    los programas.
+
+    @type programs: C{list}
+    @param programs: Lista de tuplas con el nombre de cada programa y su
+        código fuente.
+
+    @type lexer_names: C{list}
+    @param lexer_names: Nombres de los analizadores léxico-gráficos que se
+        deben medir.
+
+    @type parser_names: C{list}
+    @param parser_names: Nombres de los analizadores sintácticos que se
+        deben medir. Sus tokens se reconocen con el analizador
+        léxico-gráfico por defecto.
+
+    @type repeat: C{int}
+    @param repeat: Número de veces que se repite cada medición.
+
+    @type check: C{bool}
+    @param check: Indica si se debe medir también la comprobación semántica.
+
+    @rtype: C{list}
+    @return: Lista de diccionarios con los resultados de cada medición.
+    """
+    results = []
+    for program, data in programs:
+        measures = []
+        for name in lexer_names:
+            measures.append(('lex', name, benchmark_lexer, (lexers[name], data, repeat)))
+        if parser_names or check:
+            tokens = tokenize(lexers[DEFAULT_LEXER], data)
+            for name in parser_names:
+                measures.append(('parse', name, benchmark_parser, (parsers[name], tokens, repeat)))
+            if check:
+                measures.append(('check', 'semantics', benchmark_checker, (tokens, repeat)))
+        for phase, name, function, args in measures:
+            result = measure(function, *args)
+            result.update(program=program, size=len(data), phase=phase, name=name)
+            elapsed = result['time']
+            result['tokens_per_second'] = result['tokens'] / elapsed if elapsed else None
+            if result['nodes'] is not None and elapsed:
+                result['nodes_per_second'] = result['nodes'] / elapsed
+            else:
+                result['nodes_per_second'] = None
+            results.append(result)
+    return results
+
+
+def format_table(results):
+    """
+    Construye una tabla con los resultados de las mediciones.
+
+    @type results: C{list}
+    @param results: Lista de diccionarios con los resultados de cada
+        medición.
+
+    @rtype: C{str}
+    @return: Tabla con una fila por cada medición.
+    """
+    header = ('program', 'bytes', 'phase', 'name', 'tokens', 'nodes', 'time (s)',
+              'tokens/s', 'nodes/s', 'memory (KiB)', 'bytes/node')
+    rows = [header]
+    for result in results:
+        rows.append((result['program'], result['size'], result['phase'], result['name'],
+                     result['tokens'], result['nodes'],
+                     '{0:.3f}'.format(result['time']),
+                     result['tokens_per_second'], result['nodes_per_second'],
+                     result['memory'], result['node_bytes']))
+    cells = []
+    for row in rows:
+        row_cells = []
+        for value in row:
+            if value is None:
+                row_cells.append('-')
+            elif isinstance(value, float):
+                row_cells.append('{0:.0f}'.format(value))
+            else:
+                row_cells.append(str(value))
+        cells.append(row_cells)
+    widths = [max(len(row[i]) for row in cells) for i in xrange(len(header))]
+    lines = []
+    for row in cells:
+        # The first column is aligned to the left, the others to the right.
+        line = [row[0].ljust(widths[0])]
+        line.extend(cell.rjust(width) for cell, width in zip(row[1:], widths[1:]))
+        lines.append('  '.join(line))
+    return '\n'.join(lines)
+
+
+def main(argv):
+    """
+    Función principal del script.
+
+    @type argv: C{list}
+    @param argv: Lista de argumentos del programa.
+
+    @rtype: C{int}
+    @return: Retorna 0 si no ocurrió ningún error durante la ejecución
+        del programa y 1 en el caso contrario.
+    """
+    parser = optparse.OptionParser(usage='%prog [options] [tiger-file...]',
+                                   prog=os.path.basename(argv[0]))
+    parser.add_option('-s', '--shape', action='append', dest='shapes',
+                      choices=sorted(SHAPES.keys()), metavar='SHAPE',
+                      help='shape of the generated programs: {0} (default all, '
+                      'ignored if files are given)'.format(', '.join(sorted(SHAPES.keys()))))
+    parser.add_option('-S', '--scale', action='store', dest='scale', type='float',
+                      metavar='X', help='factor applied to the default size of each shape '
+                      '(default %default)')
+    parser.add_option('-l', '--lexer', action='append', dest='lexers',
+                      choices=sorted(lexers.keys()), metavar='NAME',
+                      help='lexer to measure (default all)')
+    parser.add_option('-p', '--parser', action='append', dest='parsers',
+                      choices=sorted(parsers.keys()), metavar='NAME',
+                      help='parser to measure (default all)')
+    parser.add_option('-c', '--check', action='store_true', dest='check',
+                      help='also measure the semantic checking of the parsed trees')
+    parser.add_option('-r', '--repeat', action='store', dest='repeat', type='int',
+                      metavar='N', help='number of repetitions of each measure (default %default)')
+    parser.add_option('-j', '--json', action='store_true', dest='json',
+                      help='write the results in JSON format')
+    parser.set_default('scale', 1.0)
+    parser.set_default('repeat', 3)
+    parser.set_default('json', False)
+    parser.set_default('check', False)
+    options, args = parser.parse_args(args=argv[1:])
+    if options.scale <= 0 or options.repeat <= 0:
+        parser.error('the scale and the number of repetitions must be positive')
+    programs = []
+    if args:
+        for filename in args:
+            try:
+                with open(filename) as fd:
+                    programs.append((os.path.basename(filename), fd.read().decode('utf-8')))
+            except (IOError, UnicodeError), error:
+                print >> sys.stderr, '{0}: {1}'.format(filename, error)
+                return EXIT_FAILURE
+    else:
+        for shape in options.shapes or sorted(SHAPES.keys()):
+            generator, size = SHAPES[shape]
+            programs.append((shape, generator(max(1, int(size * options.scale)))))
+    lexer_names = options.lexers or sorted(lexers.keys())
+    parser_names = options.parsers or sorted(parsers.keys())
+    try:
+        results = run_benchmarks(programs, lexer_names, parser_names, options.repeat,
+                                 options.check)
+    except RuntimeError, error:
+        print >> sys.stderr, error
+        return EXIT_FAILURE
+    if options.json:
+        print json.dumps(results, indent=2, sort_keys=True, separators=(',', ': '))
+    else:
+        print format_table(results)
+    return EXIT_SUCCESS
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
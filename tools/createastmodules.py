@@ -83,6 +83,8 @@ class {node_class}({parent_class}):
     Clase C{{{node_class}}} del árbol de sintáxis abstracta.
     \"\"\"
     
+    __slots__ = ()
+    
     def __init__(self):
         \"\"\"
         Inicializa la clase C{{{node_class}}}.